@@ -0,0 +1,133 @@
+"""Redis-backed access principal cache implementing AccessPrincipalCache.
+
+Each organization's entries live in one Redis hash so that an ACL
+membership sync can invalidate them all with a single ``DEL``. Every
+entry carries its write time and is treated as a miss once older than
+the TTL, so a missed invalidation is bounded even while the hash itself
+keeps being refreshed by new writes.
+
+Invalidation also bumps a per-organization generation counter. Writers
+read it before resolving and store through a Lua script that compares it
+atomically, so a closure resolved before an invalidation is never written
+after it.
+"""
+
+import json
+import logging
+import time
+from collections.abc import Sequence
+from typing import Optional
+from uuid import UUID
+
+from airweave.core.protocols.cache import AccessPrincipalCache
+
+logger = logging.getLogger(__name__)
+
+ACCESS_PRINCIPALS_KEY_PREFIX = "acl:principals"
+ACCESS_PRINCIPALS_GENERATION_PREFIX = "acl:principals:gen"
+ACCESS_PRINCIPALS_TTL = 300
+# Must outlive any in-flight resolution; a reset counter could admit stale writes
+ACCESS_PRINCIPALS_GENERATION_TTL = 86_400
+
+# Store one entry only while the organization's generation is unchanged.
+# KEYS: hash, generation. ARGV: field, payload, ttl, expected generation.
+LUA_SET_IF_GENERATION = """
+local current = tonumber(redis.call('GET', KEYS[2]) or '0')
+if current ~= tonumber(ARGV[4]) then
+    return 0
+end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[3]))
+return 1
+"""
+
+
+class RedisAccessPrincipalCache(AccessPrincipalCache):
+    """Redis-backed cache of resolved group closures.
+
+    All methods are fail-safe — errors are logged and treated as misses so
+    the broker falls through to the database.
+    """
+
+    def __init__(self, redis_client, ttl_seconds: int = ACCESS_PRINCIPALS_TTL) -> None:
+        """Initialize RedisAccessPrincipalCache."""
+        self._redis = redis_client
+        self._ttl = ttl_seconds
+
+    @staticmethod
+    def _key(organization_id: UUID) -> str:
+        return f"{ACCESS_PRINCIPALS_KEY_PREFIX}:{organization_id}"
+
+    @staticmethod
+    def _generation_key(organization_id: UUID) -> str:
+        return f"{ACCESS_PRINCIPALS_GENERATION_PREFIX}:{organization_id}"
+
+    @staticmethod
+    def _field(principal: str, scope: str) -> str:
+        return f"{scope}|{principal}"
+
+    async def get_groups(
+        self, organization_id: UUID, principal: str, scope: str
+    ) -> Optional[list[str]]:
+        """Return the cached group IDs or None on miss."""
+        try:
+            data = await self._redis.hget(self._key(organization_id), self._field(principal, scope))
+            if not data:
+                return None
+            entry = json.loads(data)
+            if time.time() - entry["t"] > self._ttl:
+                return None
+            return list(entry["g"])
+        except Exception as e:
+            logger.debug("Access principal cache read error (org %s): %s", organization_id, e)
+            return None
+
+    async def generation(self, organization_id: UUID) -> Optional[int]:
+        """Return the organization's invalidation count, or None if it cannot be read."""
+        try:
+            value = await self._redis.get(self._generation_key(organization_id))
+            return int(value or 0)
+        except Exception as e:
+            logger.debug("Access principal cache generation error (org %s): %s", organization_id, e)
+            return None
+
+    async def set_groups(
+        self,
+        organization_id: UUID,
+        principal: str,
+        scope: str,
+        group_ids: Sequence[str],
+        generation: int,
+    ) -> None:
+        """Cache the resolved group IDs and refresh the organization hash TTL.
+
+        Skipped if the organization was invalidated since ``generation`` was read.
+        """
+        try:
+            payload = json.dumps({"t": time.time(), "g": list(group_ids)})
+            await self._redis.eval(
+                LUA_SET_IF_GENERATION,
+                2,
+                self._key(organization_id),
+                self._generation_key(organization_id),
+                self._field(principal, scope),
+                payload,
+                self._ttl,
+                generation,
+            )
+        except Exception as e:
+            logger.debug("Access principal cache write error (org %s): %s", organization_id, e)
+
+    async def invalidate_organization(self, organization_id: UUID) -> None:
+        """Drop every cached entry for an organization and bump its generation."""
+        try:
+            generation_key = self._generation_key(organization_id)
+            pipe = self._redis.pipeline(transaction=True)
+            pipe.incr(generation_key)
+            pipe.expire(generation_key, ACCESS_PRINCIPALS_GENERATION_TTL)
+            pipe.delete(self._key(organization_id))
+            await pipe.execute()
+        except Exception as e:
+            logger.debug(
+                "Access principal cache invalidation error (org %s): %s", organization_id, e
+            )
@@ -0,0 +1,157 @@
+"""Embedding cache adapters implementing the EmbeddingCache protocol.
+
+Vectors are stored as packed float32 (4 bytes per dimension) rather than
+Python float lists, so a 3072-dim vector costs ~12KB instead of ~100KB of
+boxed floats. Provider embeddings are float32 on the wire anyway, so the
+round trip does not lose meaningful precision.
+
+- InMemoryEmbeddingCache: bounded per-process LRU
+- RedisEmbeddingCache: shared tier across worker pods (fail-safe)
+- TieredEmbeddingCache: memory first, then Redis, backfilling memory on hit
+"""
+
+import base64
+import logging
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from typing import Optional
+
+from airweave.core.protocols.cache import EmbeddingCache
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_KEY_PREFIX = "embedding"
+EMBEDDING_TTL = 7 * 24 * 3600
+
+
+def _pack(vector: list[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _unpack(data: bytes) -> list[float]:
+    values = array("f")
+    values.frombytes(data)
+    return values.tolist()
+
+
+class InMemoryEmbeddingCache(EmbeddingCache):
+    """Bounded LRU of packed vectors, local to this process."""
+
+    def __init__(self, max_entries: int) -> None:
+        """Initialize InMemoryEmbeddingCache.
+
+        Args:
+            max_entries: Maximum number of vectors kept before evicting
+                the least recently used entry.
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of cached vectors."""
+        return len(self._entries)
+
+    async def get_many(self, keys: Sequence[str]) -> list[Optional[list[float]]]:
+        """Return cached vectors aligned with ``keys`` (None on miss)."""
+        results: list[Optional[list[float]]] = []
+        for key in keys:
+            data = self._entries.get(key)
+            if data is None:
+                results.append(None)
+                continue
+            self._entries.move_to_end(key)
+            results.append(_unpack(data))
+        return results
+
+    async def set_many(self, items: Mapping[str, list[float]]) -> None:
+        """Store vectors, evicting least recently used entries over capacity."""
+        if self._max_entries <= 0:
+            return
+        for key, vector in items.items():
+            self._entries[key] = _pack(vector)
+            self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+class RedisEmbeddingCache(EmbeddingCache):
+    """Redis-backed embedding cache shared by all workers.
+
+    The shared client decodes responses to ``str``, so packed vectors are
+    base64-encoded. All methods are fail-safe — errors are logged and
+    treated as misses so the caller falls through to the embedder.
+    """
+
+    def __init__(self, redis_client, ttl_seconds: int = EMBEDDING_TTL) -> None:
+        """Initialize RedisEmbeddingCache."""
+        self._redis = redis_client
+        self._ttl = ttl_seconds
+
+    async def get_many(self, keys: Sequence[str]) -> list[Optional[list[float]]]:
+        """Return cached vectors aligned with ``keys`` (None on miss)."""
+        if not keys:
+            return []
+        try:
+            raw = await self._redis.mget([f"{EMBEDDING_KEY_PREFIX}:{key}" for key in keys])
+        except Exception as e:
+            logger.debug("Embedding cache read error: %s", e)
+            return [None] * len(keys)
+        return [_unpack(base64.b64decode(data)) if data else None for data in raw]
+
+    async def set_many(self, items: Mapping[str, list[float]]) -> None:
+        """Store vectors with TTL in a single pipeline round trip."""
+        if not items:
+            return
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for key, vector in items.items():
+                payload = base64.b64encode(_pack(vector)).decode("ascii")
+                pipe.setex(f"{EMBEDDING_KEY_PREFIX}:{key}", self._ttl, payload)
+            await pipe.execute()
+        except Exception as e:
+            logger.debug("Embedding cache write error: %s", e)
+
+
+class TieredEmbeddingCache(EmbeddingCache):
+    """In-process LRU in front of an optional shared tier.
+
+    Reads check memory first and only ask the shared tier for the keys
+    memory missed; shared-tier hits are copied into memory. Writes go to
+    both tiers.
+    """
+
+    def __init__(
+        self,
+        memory: InMemoryEmbeddingCache,
+        shared: Optional[EmbeddingCache] = None,
+    ) -> None:
+        """Initialize TieredEmbeddingCache."""
+        self._memory = memory
+        self._shared = shared
+
+    async def get_many(self, keys: Sequence[str]) -> list[Optional[list[float]]]:
+        """Return cached vectors aligned with ``keys`` (None on miss)."""
+        results = await self._memory.get_many(keys)
+        if self._shared is None:
+            return results
+
+        missing = [i for i, vector in enumerate(results) if vector is None]
+        if not missing:
+            return results
+
+        shared_results = await self._shared.get_many([keys[i] for i in missing])
+        backfill: dict[str, list[float]] = {}
+        for i, vector in zip(missing, shared_results, strict=True):
+            if vector is not None:
+                results[i] = vector
+                backfill[keys[i]] = vector
+        if backfill:
+            await self._memory.set_many(backfill)
+        return results
+
+    async def set_many(self, items: Mapping[str, list[float]]) -> None:
+        """Store vectors in every tier."""
+        await self._memory.set_many(items)
+        if self._shared is not None:
+            await self._shared.set_many(items)
@@ -1,10 +1,11 @@
-"""In-memory fake context cache for testing."""
+"""In-memory fake caches for testing."""
 
+from collections.abc import Sequence
 from typing import Optional
 from uuid import UUID
 
 from airweave import schemas
-from airweave.core.protocols.cache import ContextCache
+from airweave.core.protocols.cache import AccessPrincipalCache, ContextCache
 
 
 class FakeContextCache(ContextCache):
@@ -62,3 +63,38 @@ class FakeContextCache(ContextCache):
             f"Expected invalidation ({entity_type}, {key}) not found. "
             f"Invalidations: {self._invalidations}"
         )
+
+
+class FakeAccessPrincipalCache(AccessPrincipalCache):
+    """Dict-backed fake for the access principal cache. Records invalidations."""
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[UUID, str, str], list[str]] = {}
+        self._generations: dict[UUID, int] = {}
+        self.invalidated: list[UUID] = []
+
+    async def get_groups(
+        self, organization_id: UUID, principal: str, scope: str
+    ) -> Optional[list[str]]:
+        groups = self._entries.get((organization_id, principal, scope))
+        return list(groups) if groups is not None else None
+
+    async def generation(self, organization_id: UUID) -> Optional[int]:
+        return self._generations.get(organization_id, 0)
+
+    async def set_groups(
+        self,
+        organization_id: UUID,
+        principal: str,
+        scope: str,
+        group_ids: Sequence[str],
+        generation: int,
+    ) -> None:
+        if generation != self._generations.get(organization_id, 0):
+            return
+        self._entries[(organization_id, principal, scope)] = list(group_ids)
+
+    async def invalidate_organization(self, organization_id: UUID) -> None:
+        self._entries = {k: v for k, v in self._entries.items() if k[0] != organization_id}
+        self._generations[organization_id] = self._generations.get(organization_id, 0) + 1
+        self.invalidated.append(organization_id)
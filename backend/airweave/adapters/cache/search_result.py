@@ -0,0 +1,192 @@
+"""Search result cache adapters implementing the SearchResultCache protocol.
+
+Payloads are opaque strings (serialized by ``airweave.search.result_cache``)
+so the adapters never need to know about search schemas.
+
+- InMemorySearchResultCache: bounded per-process LRU with TTL
+- RedisSearchResultCache: shared tier across API pods (fail-safe), and the
+  home of per-collection data versions, which sync workers bump
+- TieredSearchResultCache: memory first, then Redis, backfilling memory on hit
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from airweave.core.protocols.cache import SearchResultCache
+
+logger = logging.getLogger(__name__)
+
+SEARCH_RESULT_KEY_PREFIX = "search:result"
+SEARCH_VERSION_KEY_PREFIX = "search:version"
+SEARCH_RESULT_TTL = 300
+SEARCH_RESULT_MAX_ENTRY_BYTES = 512 * 1024
+
+
+class InMemorySearchResultCache(SearchResultCache):
+    """Bounded LRU of search payloads, local to this process.
+
+    Also keeps process-local data versions, which are only meaningful when
+    syncs run in the same process (tests, single-process deployments).
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: int = SEARCH_RESULT_TTL,
+        max_entry_bytes: int = SEARCH_RESULT_MAX_ENTRY_BYTES,
+    ) -> None:
+        """Initialize InMemorySearchResultCache.
+
+        Args:
+            max_entries: Maximum number of payloads kept before evicting
+                the least recently used entry.
+            ttl_seconds: Seconds a payload stays valid after it was stored.
+            max_entry_bytes: Payloads larger than this are not cached.
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._max_entry_bytes = max_entry_bytes
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._versions: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Number of cached payloads (including expired ones not yet evicted)."""
+        return len(self._entries)
+
+    async def get_data_version(self, collection_readable_id: str) -> Optional[int]:
+        """Return the process-local data version (0 if never bumped)."""
+        return self._versions.get(collection_readable_id, 0)
+
+    async def bump_data_version(self, collection_readable_id: str) -> None:
+        """Advance the process-local data version."""
+        self._versions[collection_readable_id] = self._versions.get(collection_readable_id, 0) + 1
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached payload or None on miss or expiry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return payload
+
+    async def set(self, key: str, payload: str) -> None:
+        """Store a payload, evicting least recently used entries over capacity."""
+        if self._max_entries <= 0 or len(payload.encode()) > self._max_entry_bytes:
+            return
+        self._entries[key] = (time.monotonic() + self._ttl, payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+class RedisSearchResultCache(SearchResultCache):
+    """Redis-backed search result cache shared by all API pods.
+
+    Data versions are plain counters (``INCR``) without a TTL, so a bump
+    from a sync worker is seen by every pod on its next lookup. All
+    methods are fail-safe — errors are logged and treated as misses.
+    """
+
+    def __init__(
+        self,
+        redis_client,
+        ttl_seconds: int = SEARCH_RESULT_TTL,
+        max_entry_bytes: int = SEARCH_RESULT_MAX_ENTRY_BYTES,
+    ) -> None:
+        """Initialize RedisSearchResultCache."""
+        self._redis = redis_client
+        self._ttl = ttl_seconds
+        self._max_entry_bytes = max_entry_bytes
+
+    @staticmethod
+    def _version_key(collection_readable_id: str) -> str:
+        return f"{SEARCH_VERSION_KEY_PREFIX}:{collection_readable_id}"
+
+    async def get_data_version(self, collection_readable_id: str) -> Optional[int]:
+        """Return the shared data version, or None when Redis is unavailable."""
+        try:
+            raw = await self._redis.get(self._version_key(collection_readable_id))
+        except Exception as e:
+            logger.debug(
+                "Search cache version read error (collection %s): %s", collection_readable_id, e
+            )
+            return None
+        return int(raw) if raw else 0
+
+    async def bump_data_version(self, collection_readable_id: str) -> None:
+        """Increment the shared data version."""
+        try:
+            await self._redis.incr(self._version_key(collection_readable_id))
+        except Exception as e:
+            logger.warning(
+                "Search cache version bump failed (collection %s): %s", collection_readable_id, e
+            )
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached payload or None on miss."""
+        try:
+            return await self._redis.get(f"{SEARCH_RESULT_KEY_PREFIX}:{key}")
+        except Exception as e:
+            logger.debug("Search cache read error: %s", e)
+            return None
+
+    async def set(self, key: str, payload: str) -> None:
+        """Store a payload with TTL unless it exceeds the size limit."""
+        if len(payload.encode()) > self._max_entry_bytes:
+            return
+        try:
+            await self._redis.setex(f"{SEARCH_RESULT_KEY_PREFIX}:{key}", self._ttl, payload)
+        except Exception as e:
+            logger.debug("Search cache write error: %s", e)
+
+
+class TieredSearchResultCache(SearchResultCache):
+    """In-process LRU in front of an optional shared tier.
+
+    Reads check memory first and only ask the shared tier on a miss;
+    shared-tier hits are copied into memory. Writes go to both tiers.
+    Data versions come from ``versions`` (normally Redis, so bumps made by
+    sync workers reach every API pod even without a shared result tier),
+    falling back to the shared tier and then to memory.
+    """
+
+    def __init__(
+        self,
+        memory: InMemorySearchResultCache,
+        shared: Optional[SearchResultCache] = None,
+        versions: Optional[SearchResultCache] = None,
+    ) -> None:
+        """Initialize TieredSearchResultCache."""
+        self._memory = memory
+        self._shared = shared
+        self._versions = versions or shared or memory
+
+    async def get_data_version(self, collection_readable_id: str) -> Optional[int]:
+        """Return the data version from the version tier."""
+        return await self._versions.get_data_version(collection_readable_id)
+
+    async def bump_data_version(self, collection_readable_id: str) -> None:
+        """Advance the data version in the version tier."""
+        await self._versions.bump_data_version(collection_readable_id)
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached payload from memory, then the shared tier."""
+        payload = await self._memory.get(key)
+        if payload is not None or self._shared is None:
+            return payload
+        payload = await self._shared.get(key)
+        if payload is not None:
+            await self._memory.set(key, payload)
+        return payload
+
+    async def set(self, key: str, payload: str) -> None:
+        """Store the payload in every tier."""
+        await self._memory.set(key, payload)
+        if self._shared is not None:
+            await self._shared.set(key, payload)
@@ -0,0 +1,142 @@
+"""Tests for the Redis access principal cache adapter."""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from airweave.adapters.cache.access_principal import (
+    LUA_SET_IF_GENERATION,
+    RedisAccessPrincipalCache,
+)
+
+
+class _FakePipeline:
+    def __init__(self, hashes: dict, counters: dict, ttls: dict):
+        self._hashes = hashes
+        self._counters = counters
+        self._ttls = ttls
+        self._ops: list = []
+
+    def incr(self, key):
+        self._ops.append(("incr", key))
+
+    def expire(self, key, ttl):
+        self._ops.append(("expire", key, ttl))
+
+    def delete(self, key):
+        self._ops.append(("delete", key))
+
+    async def execute(self):
+        for op in self._ops:
+            if op[0] == "incr":
+                self._counters[op[1]] = self._counters.get(op[1], 0) + 1
+            elif op[0] == "expire":
+                self._ttls[op[1]] = op[2]
+            else:
+                self._hashes.pop(op[1], None)
+
+
+def _fake_redis() -> MagicMock:
+    """In-memory Redis running the generation-checked write script's logic."""
+    hashes: dict = {}
+    counters: dict = {}
+    ttls: dict = {}
+
+    async def _eval(script, numkeys, key, generation_key, field, payload, ttl, generation):
+        assert script == LUA_SET_IF_GENERATION and numkeys == 2
+        if counters.get(generation_key, 0) != generation:
+            return 0
+        hashes.setdefault(key, {})[field] = payload
+        ttls[key] = ttl
+        return 1
+
+    redis = MagicMock()
+    redis.hashes = hashes
+    redis.ttls = ttls
+    redis.hget = AsyncMock(side_effect=lambda key, field: hashes.get(key, {}).get(field))
+    redis.get = AsyncMock(side_effect=lambda key: counters.get(key))
+    redis.eval = AsyncMock(side_effect=_eval)
+    redis.pipeline = MagicMock(
+        side_effect=lambda transaction=True: _FakePipeline(hashes, counters, ttls)
+    )
+    return redis
+
+
+async def _set(cache, org, principal, scope, group_ids):
+    await cache.set_groups(org, principal, scope, group_ids, await cache.generation(org))
+
+
+class TestRedisAccessPrincipalCache:
+    @pytest.mark.asyncio
+    async def test_roundtrip_per_scope(self):
+        redis = _fake_redis()
+        cache = RedisAccessPrincipalCache(redis, ttl_seconds=60)
+        org = uuid4()
+
+        await _set(cache, org, "john@acme.com", "org", ["eng", "all-staff"])
+
+        assert await cache.get_groups(org, "john@acme.com", "org") == ["eng", "all-staff"]
+        assert await cache.get_groups(org, "john@acme.com", "collection:docs") is None
+        assert redis.ttls[f"acl:principals:{org}"] == 60
+
+    @pytest.mark.asyncio
+    async def test_empty_group_list_is_a_hit(self):
+        cache = RedisAccessPrincipalCache(_fake_redis())
+        org = uuid4()
+
+        await _set(cache, org, "nobody@acme.com", "org", [])
+
+        assert await cache.get_groups(org, "nobody@acme.com", "org") == []
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_only_that_organization(self):
+        cache = RedisAccessPrincipalCache(_fake_redis())
+        org_a, org_b = uuid4(), uuid4()
+        await _set(cache, org_a, "john@acme.com", "org", ["eng"])
+        await _set(cache, org_b, "john@acme.com", "org", ["ops"])
+
+        await cache.invalidate_organization(org_a)
+
+        assert await cache.get_groups(org_a, "john@acme.com", "org") is None
+        assert await cache.get_groups(org_b, "john@acme.com", "org") == ["ops"]
+
+    @pytest.mark.asyncio
+    async def test_entries_older_than_ttl_are_misses(self):
+        cache = RedisAccessPrincipalCache(_fake_redis(), ttl_seconds=60)
+        org = uuid4()
+        await _set(cache, org, "john@acme.com", "org", ["eng"])
+
+        with patch(
+            "airweave.adapters.cache.access_principal.time.time", return_value=time.time() + 61
+        ):
+            assert await cache.get_groups(org, "john@acme.com", "org") is None
+
+    @pytest.mark.asyncio
+    async def test_write_resolved_before_invalidation_is_dropped(self):
+        cache = RedisAccessPrincipalCache(_fake_redis())
+        org = uuid4()
+        generation = await cache.generation(org)  # read before resolving
+
+        await cache.invalidate_organization(org)  # membership sync finishes
+        await cache.set_groups(org, "john@acme.com", "org", ["stale"], generation)
+
+        assert await cache.get_groups(org, "john@acme.com", "org") is None
+        await _set(cache, org, "john@acme.com", "org", ["fresh"])
+        assert await cache.get_groups(org, "john@acme.com", "org") == ["fresh"]
+
+    @pytest.mark.asyncio
+    async def test_errors_are_swallowed(self):
+        redis = MagicMock()
+        redis.hget = AsyncMock(side_effect=ConnectionError("down"))
+        redis.get = AsyncMock(side_effect=ConnectionError("down"))
+        redis.eval = AsyncMock(side_effect=ConnectionError("down"))
+        redis.pipeline = MagicMock(side_effect=ConnectionError("down"))
+        cache = RedisAccessPrincipalCache(redis)
+        org = uuid4()
+
+        assert await cache.generation(org) is None
+        await cache.set_groups(org, "john@acme.com", "org", ["eng"], 0)
+        await cache.invalidate_organization(org)
+        assert await cache.get_groups(org, "john@acme.com", "org") is None
@@ -0,0 +1,134 @@
+"""Tests for the embedding cache adapters — LRU, Redis, and tiered."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from airweave.adapters.cache.embedding import (
+    InMemoryEmbeddingCache,
+    RedisEmbeddingCache,
+    TieredEmbeddingCache,
+)
+
+
+def _vec(val: float, dims: int = 4) -> list[float]:
+    return [val] * dims
+
+
+# ---------------------------------------------------------------------------
+# InMemoryEmbeddingCache
+# ---------------------------------------------------------------------------
+
+
+class TestInMemoryEmbeddingCache:
+    @pytest.mark.asyncio
+    async def test_roundtrip_and_miss(self):
+        cache = InMemoryEmbeddingCache(max_entries=10)
+        await cache.set_many({"a": _vec(0.5)})
+
+        assert await cache.get_many(["a", "b"]) == [_vec(0.5), None]
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        cache = InMemoryEmbeddingCache(max_entries=2)
+        await cache.set_many({"a": _vec(1.0), "b": _vec(2.0)})
+        await cache.get_many(["a"])  # touch a → b becomes LRU
+        await cache.set_many({"c": _vec(3.0)})
+
+        assert len(cache) == 2
+        assert await cache.get_many(["a", "b", "c"]) == [_vec(1.0), None, _vec(3.0)]
+
+    @pytest.mark.asyncio
+    async def test_zero_capacity_stores_nothing(self):
+        cache = InMemoryEmbeddingCache(max_entries=0)
+        await cache.set_many({"a": _vec(1.0)})
+
+        assert await cache.get_many(["a"]) == [None]
+
+
+# ---------------------------------------------------------------------------
+# RedisEmbeddingCache
+# ---------------------------------------------------------------------------
+
+
+class _FakePipeline:
+    def __init__(self, store: dict):
+        self._store = store
+        self._ops: list[tuple[str, int, str]] = []
+
+    def setex(self, key, ttl, value):
+        self._ops.append((key, ttl, value))
+
+    async def execute(self):
+        for key, _ttl, value in self._ops:
+            self._store[key] = value
+
+
+def _fake_redis() -> MagicMock:
+    store: dict[str, str] = {}
+    redis = MagicMock()
+    redis.store = store
+    redis.mget = AsyncMock(side_effect=lambda keys: [store.get(k) for k in keys])
+    redis.pipeline = MagicMock(side_effect=lambda transaction=False: _FakePipeline(store))
+    return redis
+
+
+class TestRedisEmbeddingCache:
+    @pytest.mark.asyncio
+    async def test_roundtrip_uses_prefixed_keys(self):
+        redis = _fake_redis()
+        cache = RedisEmbeddingCache(redis, ttl_seconds=60)
+        await cache.set_many({"k": _vec(0.25)})
+
+        assert list(redis.store) == ["embedding:k"]
+        assert await cache.get_many(["k", "missing"]) == [_vec(0.25), None]
+
+    @pytest.mark.asyncio
+    async def test_read_error_is_a_miss(self):
+        redis = MagicMock()
+        redis.mget = AsyncMock(side_effect=ConnectionError("down"))
+        cache = RedisEmbeddingCache(redis)
+
+        assert await cache.get_many(["a", "b"]) == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_write_error_is_swallowed(self):
+        redis = MagicMock()
+        redis.pipeline = MagicMock(side_effect=ConnectionError("down"))
+        cache = RedisEmbeddingCache(redis)
+
+        await cache.set_many({"a": _vec(1.0)})
+
+
+# ---------------------------------------------------------------------------
+# TieredEmbeddingCache
+# ---------------------------------------------------------------------------
+
+
+class TestTieredEmbeddingCache:
+    @pytest.mark.asyncio
+    async def test_shared_hit_backfills_memory(self):
+        memory = InMemoryEmbeddingCache(max_entries=10)
+        shared = InMemoryEmbeddingCache(max_entries=10)
+        await shared.set_many({"a": _vec(1.0)})
+        cache = TieredEmbeddingCache(memory=memory, shared=shared)
+
+        assert await cache.get_many(["a", "b"]) == [_vec(1.0), None]
+        assert await memory.get_many(["a"]) == [_vec(1.0)]
+
+    @pytest.mark.asyncio
+    async def test_set_writes_every_tier(self):
+        memory = InMemoryEmbeddingCache(max_entries=10)
+        shared = InMemoryEmbeddingCache(max_entries=10)
+        cache = TieredEmbeddingCache(memory=memory, shared=shared)
+        await cache.set_many({"a": _vec(1.0)})
+
+        assert await memory.get_many(["a"]) == [_vec(1.0)]
+        assert await shared.get_many(["a"]) == [_vec(1.0)]
+
+    @pytest.mark.asyncio
+    async def test_memory_only(self):
+        cache = TieredEmbeddingCache(memory=InMemoryEmbeddingCache(max_entries=10))
+        await cache.set_many({"a": _vec(1.0)})
+
+        assert await cache.get_many(["a"]) == [_vec(1.0)]
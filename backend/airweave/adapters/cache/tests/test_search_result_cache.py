@@ -0,0 +1,186 @@
+"""Tests for the search result cache adapters — LRU, Redis, and tiered."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from airweave.adapters.cache import search_result as search_result_module
+from airweave.adapters.cache.search_result import (
+    InMemorySearchResultCache,
+    RedisSearchResultCache,
+    TieredSearchResultCache,
+)
+
+# ---------------------------------------------------------------------------
+# InMemorySearchResultCache
+# ---------------------------------------------------------------------------
+
+
+class TestInMemorySearchResultCache:
+    @pytest.mark.asyncio
+    async def test_roundtrip_and_miss(self):
+        cache = InMemorySearchResultCache(max_entries=10)
+        await cache.set("a", "payload-a")
+
+        assert await cache.get("a") == "payload-a"
+        assert await cache.get("b") is None
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        cache = InMemorySearchResultCache(max_entries=2)
+        await cache.set("a", "1")
+        await cache.set("b", "2")
+        await cache.get("a")  # touch a → b becomes LRU
+        await cache.set("c", "3")
+
+        assert len(cache) == 2
+        assert [await cache.get(k) for k in ("a", "b", "c")] == ["1", None, "3"]
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_misses(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(search_result_module.time, "monotonic", lambda: now[0])
+        cache = InMemorySearchResultCache(max_entries=10, ttl_seconds=5)
+        await cache.set("a", "1")
+
+        now[0] = 105.0
+
+        assert await cache.get("a") is None
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_oversized_payloads_are_not_stored(self):
+        cache = InMemorySearchResultCache(max_entries=10, max_entry_bytes=4)
+        await cache.set("a", "12345")
+
+        assert await cache.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_data_versions_start_at_zero_and_bump(self):
+        cache = InMemorySearchResultCache(max_entries=10)
+        assert await cache.get_data_version("col") == 0
+
+        await cache.bump_data_version("col")
+
+        assert await cache.get_data_version("col") == 1
+        assert await cache.get_data_version("other") == 0
+
+
+# ---------------------------------------------------------------------------
+# RedisSearchResultCache
+# ---------------------------------------------------------------------------
+
+
+def _fake_redis(store: dict) -> MagicMock:
+    redis = MagicMock()
+
+    async def _get(key):
+        return store.get(key)
+
+    async def _setex(key, ttl, value):
+        store[key] = value
+
+    async def _incr(key):
+        store[key] = str(int(store.get(key, 0)) + 1)
+
+    redis.get = AsyncMock(side_effect=_get)
+    redis.setex = AsyncMock(side_effect=_setex)
+    redis.incr = AsyncMock(side_effect=_incr)
+    return redis
+
+
+class TestRedisSearchResultCache:
+    @pytest.mark.asyncio
+    async def test_roundtrip_uses_prefixed_keys_and_ttl(self):
+        store: dict = {}
+        redis = _fake_redis(store)
+        cache = RedisSearchResultCache(redis, ttl_seconds=60)
+
+        await cache.set("k", "payload")
+
+        redis.setex.assert_awaited_once_with("search:result:k", 60, "payload")
+        assert await cache.get("k") == "payload"
+
+    @pytest.mark.asyncio
+    async def test_data_version_counts_bumps(self):
+        store: dict = {}
+        cache = RedisSearchResultCache(_fake_redis(store))
+        assert await cache.get_data_version("col") == 0
+
+        await cache.bump_data_version("col")
+        await cache.bump_data_version("col")
+
+        assert store["search:version:col"] == "2"
+        assert await cache.get_data_version("col") == 2
+
+    @pytest.mark.asyncio
+    async def test_oversized_payloads_are_not_written(self):
+        redis = _fake_redis({})
+        cache = RedisSearchResultCache(redis, max_entry_bytes=4)
+
+        await cache.set("k", "12345")
+
+        redis.setex.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_errors_are_misses_and_unknown_versions(self):
+        redis = MagicMock()
+        redis.get = AsyncMock(side_effect=ConnectionError("down"))
+        redis.setex = AsyncMock(side_effect=ConnectionError("down"))
+        redis.incr = AsyncMock(side_effect=ConnectionError("down"))
+        cache = RedisSearchResultCache(redis)
+
+        assert await cache.get("k") is None
+        assert await cache.get_data_version("col") is None
+        await cache.set("k", "payload")
+        await cache.bump_data_version("col")
+
+
+# ---------------------------------------------------------------------------
+# TieredSearchResultCache
+# ---------------------------------------------------------------------------
+
+
+class TestTieredSearchResultCache:
+    @pytest.mark.asyncio
+    async def test_shared_hit_backfills_memory(self):
+        memory = InMemorySearchResultCache(max_entries=10)
+        store: dict = {}
+        redis = _fake_redis(store)
+        shared = RedisSearchResultCache(redis)
+        cache = TieredSearchResultCache(memory=memory, shared=shared)
+        await shared.set("k", "payload")
+
+        assert await cache.get("k") == "payload"
+        assert await memory.get("k") == "payload"
+
+        redis.get.reset_mock()
+        assert await cache.get("k") == "payload"
+        redis.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_set_writes_both_tiers(self):
+        memory = InMemorySearchResultCache(max_entries=10)
+        store: dict = {}
+        cache = TieredSearchResultCache(
+            memory=memory, shared=RedisSearchResultCache(_fake_redis(store))
+        )
+
+        await cache.set("k", "payload")
+
+        assert await memory.get("k") == "payload"
+        assert store["search:result:k"] == "payload"
+
+    @pytest.mark.asyncio
+    async def test_versions_come_from_version_tier_without_shared_results(self):
+        memory = InMemorySearchResultCache(max_entries=10)
+        store: dict = {}
+        versions = RedisSearchResultCache(_fake_redis(store))
+        cache = TieredSearchResultCache(memory=memory, versions=versions)
+
+        await cache.bump_data_version("col")
+        await cache.set("k", "payload")
+
+        assert await cache.get_data_version("col") == 1
+        assert await memory.get_data_version("col") == 0
+        assert "search:result:k" not in store
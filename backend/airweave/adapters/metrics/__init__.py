@@ -10,25 +10,52 @@ from airweave.adapters.metrics.agentic_search import (
     StepDurationRecord,
 )
 from airweave.adapters.metrics.db_pool import FakeDbPoolMetrics, PrometheusDbPoolMetrics
+from airweave.adapters.metrics.embedding_cache import (
+    FakeEmbeddingCacheMetrics,
+    PrometheusEmbeddingCacheMetrics,
+)
 from airweave.adapters.metrics.http import (
     FakeHttpMetrics,
     PrometheusHttpMetrics,
     RequestRecord,
     ResponseSizeRecord,
 )
+from airweave.adapters.metrics.http_client_pool import (
+    FakeHttpClientPoolMetrics,
+    PrometheusHttpClientPoolMetrics,
+)
 from airweave.adapters.metrics.renderer import FakeMetricsRenderer, PrometheusMetricsRenderer
+from airweave.adapters.metrics.search_query_writer import (
+    FakeSearchQueryWriterMetrics,
+    PrometheusSearchQueryWriterMetrics,
+)
+from airweave.adapters.metrics.vespa_feed import FakeVespaFeedMetrics, PrometheusVespaFeedMetrics
+from airweave.adapters.metrics.vespa_query import (
+    FakeVespaQueryMetrics,
+    PrometheusVespaQueryMetrics,
+)
 from airweave.adapters.metrics.worker import FakeWorkerMetrics, PrometheusWorkerMetrics
 
 __all__ = [
     "FakeAgenticSearchMetrics",
     "FakeDbPoolMetrics",
+    "FakeEmbeddingCacheMetrics",
+    "FakeHttpClientPoolMetrics",
     "FakeHttpMetrics",
     "FakeMetricsRenderer",
+    "FakeSearchQueryWriterMetrics",
+    "FakeVespaFeedMetrics",
+    "FakeVespaQueryMetrics",
     "FakeWorkerMetrics",
     "PrometheusAgenticSearchMetrics",
     "PrometheusDbPoolMetrics",
+    "PrometheusEmbeddingCacheMetrics",
+    "PrometheusHttpClientPoolMetrics",
     "PrometheusHttpMetrics",
     "PrometheusMetricsRenderer",
+    "PrometheusSearchQueryWriterMetrics",
+    "PrometheusVespaFeedMetrics",
+    "PrometheusVespaQueryMetrics",
     "PrometheusWorkerMetrics",
     "RequestRecord",
     "ResponseSizeRecord",
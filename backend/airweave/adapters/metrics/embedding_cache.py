@@ -0,0 +1,66 @@
+"""Embedding cache metrics adapters (Prometheus + Fake).
+
+Prometheus implementation exposes hit/miss counters for the dense
+embedding cache on the worker's CollectorRegistry.
+"""
+
+from prometheus_client import CollectorRegistry, Counter
+
+from airweave.core.protocols.metrics import EmbeddingCacheMetrics
+
+
+class PrometheusEmbeddingCacheMetrics(EmbeddingCacheMetrics):
+    """Prometheus-backed embedding cache metrics."""
+
+    def __init__(self, registry: CollectorRegistry | None = None) -> None:
+        self._registry = registry or CollectorRegistry()
+
+        self._hits_total = Counter(
+            "airweave_embedding_cache_hits_total",
+            "Texts whose dense embedding was served from the cache",
+            ["model"],
+            registry=self._registry,
+        )
+
+        self._misses_total = Counter(
+            "airweave_embedding_cache_misses_total",
+            "Texts whose dense embedding had to be computed by the embedder",
+            ["model"],
+            registry=self._registry,
+        )
+
+    # -- EmbeddingCacheMetrics protocol methods --
+
+    def inc_hits(self, model: str, count: int) -> None:
+        if count:
+            self._hits_total.labels(model=model).inc(count)
+
+    def inc_misses(self, model: str, count: int) -> None:
+        if count:
+            self._misses_total.labels(model=model).inc(count)
+
+
+# ---------------------------------------------------------------------------
+# Fake
+# ---------------------------------------------------------------------------
+
+
+class FakeEmbeddingCacheMetrics(EmbeddingCacheMetrics):
+    """In-memory spy implementing the EmbeddingCacheMetrics protocol."""
+
+    def __init__(self) -> None:
+        self.hits: dict[str, int] = {}
+        self.misses: dict[str, int] = {}
+
+    def inc_hits(self, model: str, count: int) -> None:
+        self.hits[model] = self.hits.get(model, 0) + count
+
+    def inc_misses(self, model: str, count: int) -> None:
+        self.misses[model] = self.misses.get(model, 0) + count
+
+    # -- test helpers --
+
+    def clear(self) -> None:
+        """Reset all recorded state."""
+        self.hits.clear()
+        self.misses.clear()
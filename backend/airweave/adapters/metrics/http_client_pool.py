@@ -0,0 +1,67 @@
+"""Source HTTP client pool metrics adapters (Prometheus + Fake).
+
+Prometheus implementation exposes how many source API requests reused a
+pooled connection and how many TCP/TLS handshakes syncs performed, on the
+worker's CollectorRegistry.
+"""
+
+from prometheus_client import CollectorRegistry, Counter
+
+from airweave.core.protocols.metrics import HttpClientPoolMetrics
+
+
+class PrometheusHttpClientPoolMetrics(HttpClientPoolMetrics):
+    """Prometheus-backed source HTTP client pool metrics."""
+
+    def __init__(self, registry: CollectorRegistry | None = None) -> None:
+        self._registry = registry or CollectorRegistry()
+
+        self._requests_total = Counter(
+            "airweave_source_http_requests_total",
+            "Source HTTP requests by protocol and whether the connection was reused",
+            ["source", "protocol", "connection"],
+            registry=self._registry,
+        )
+
+        self._handshakes_total = Counter(
+            "airweave_source_http_handshakes_total",
+            "TCP and TLS handshakes performed by source HTTP clients",
+            ["source", "kind"],
+            registry=self._registry,
+        )
+
+    # -- HttpClientPoolMetrics protocol methods --
+
+    def inc_requests(self, source: str, protocol: str, connection: str) -> None:
+        self._requests_total.labels(source=source, protocol=protocol, connection=connection).inc()
+
+    def inc_handshakes(self, source: str, kind: str) -> None:
+        self._handshakes_total.labels(source=source, kind=kind).inc()
+
+
+# ---------------------------------------------------------------------------
+# Fake
+# ---------------------------------------------------------------------------
+
+
+class FakeHttpClientPoolMetrics(HttpClientPoolMetrics):
+    """In-memory spy implementing the HttpClientPoolMetrics protocol."""
+
+    def __init__(self) -> None:
+        self.requests: dict[tuple[str, str, str], int] = {}
+        self.handshakes: dict[tuple[str, str], int] = {}
+
+    def inc_requests(self, source: str, protocol: str, connection: str) -> None:
+        key = (source, protocol, connection)
+        self.requests[key] = self.requests.get(key, 0) + 1
+
+    def inc_handshakes(self, source: str, kind: str) -> None:
+        key = (source, kind)
+        self.handshakes[key] = self.handshakes.get(key, 0) + 1
+
+    # -- test helpers --
+
+    def clear(self) -> None:
+        """Reset all recorded state."""
+        self.requests.clear()
+        self.handshakes.clear()
@@ -0,0 +1,91 @@
+"""Search query writer metrics adapters (Prometheus + Fake).
+
+Prometheus implementation exposes batch insert latency and size, records
+dropped before reaching the database and the depth of the in-process queue
+of the background search analytics writer.
+"""
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+
+from airweave.core.protocols.metrics import SearchQueryWriterMetrics
+
+_FLUSH_DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class PrometheusSearchQueryWriterMetrics(SearchQueryWriterMetrics):
+    """Prometheus-backed search query writer metrics."""
+
+    def __init__(self, registry: CollectorRegistry | None = None) -> None:
+        self._registry = registry or CollectorRegistry()
+
+        self._flush_duration = Histogram(
+            "airweave_search_query_writer_flush_duration_seconds",
+            "Latency of search analytics batch inserts in seconds",
+            ["status"],
+            buckets=_FLUSH_DURATION_BUCKETS,
+            registry=self._registry,
+        )
+
+        self._rows_total = Counter(
+            "airweave_search_query_writer_rows_total",
+            "Search analytics rows handed to batch inserts",
+            ["status"],
+            registry=self._registry,
+        )
+
+        self._dropped_total = Counter(
+            "airweave_search_query_writer_dropped_total",
+            "Search analytics records that were not persisted",
+            ["reason"],
+            registry=self._registry,
+        )
+
+        self._queue_depth = Gauge(
+            "airweave_search_query_writer_queue_depth",
+            "Search analytics records waiting to be written",
+            registry=self._registry,
+        )
+
+    # -- SearchQueryWriterMetrics protocol methods --
+
+    def observe_flush(self, status: str, rows: int, duration: float) -> None:
+        self._flush_duration.labels(status=status).observe(duration)
+        self._rows_total.labels(status=status).inc(rows)
+
+    def inc_dropped(self, reason: str, count: int) -> None:
+        if count:
+            self._dropped_total.labels(reason=reason).inc(count)
+
+    def set_queue_depth(self, depth: int) -> None:
+        self._queue_depth.set(depth)
+
+
+# ---------------------------------------------------------------------------
+# Fake
+# ---------------------------------------------------------------------------
+
+
+class FakeSearchQueryWriterMetrics(SearchQueryWriterMetrics):
+    """In-memory spy implementing the SearchQueryWriterMetrics protocol."""
+
+    def __init__(self) -> None:
+        self.flushes: list[tuple[str, int, float]] = []
+        self.dropped: dict[str, int] = {}
+        self.queue_depth: int = 0
+
+    def observe_flush(self, status: str, rows: int, duration: float) -> None:
+        self.flushes.append((status, rows, duration))
+
+    def inc_dropped(self, reason: str, count: int) -> None:
+        self.dropped[reason] = self.dropped.get(reason, 0) + count
+
+    def set_queue_depth(self, depth: int) -> None:
+        self.queue_depth = depth
+
+    # -- test helpers --
+
+    def clear(self) -> None:
+        """Reset all recorded state."""
+        self.flushes.clear()
+        self.dropped.clear()
+        self.queue_depth = 0
@@ -0,0 +1,53 @@
+"""Unit tests for embedding cache metrics adapters."""
+
+from airweave.adapters.metrics import (
+    FakeEmbeddingCacheMetrics,
+    PrometheusEmbeddingCacheMetrics,
+)
+
+
+class TestFakeEmbeddingCacheMetrics:
+    """Tests for the FakeEmbeddingCacheMetrics test helper."""
+
+    def test_accumulates_per_model(self):
+        fake = FakeEmbeddingCacheMetrics()
+        fake.inc_hits("m", 3)
+        fake.inc_hits("m", 2)
+        fake.inc_misses("m", 1)
+
+        assert fake.hits == {"m": 5}
+        assert fake.misses == {"m": 1}
+
+    def test_clear_resets_all_state(self):
+        fake = FakeEmbeddingCacheMetrics()
+        fake.inc_hits("m", 1)
+        fake.inc_misses("m", 1)
+        fake.clear()
+
+        assert fake.hits == {}
+        assert fake.misses == {}
+
+
+class TestPrometheusEmbeddingCacheMetrics:
+    """Tests for the Prometheus adapter."""
+
+    def test_counters_exposed(self):
+        from prometheus_client import CollectorRegistry, generate_latest
+
+        registry = CollectorRegistry()
+        adapter = PrometheusEmbeddingCacheMetrics(registry=registry)
+        adapter.inc_hits("text-embedding-3-large", 7)
+        adapter.inc_misses("text-embedding-3-large", 2)
+        output = generate_latest(registry).decode()
+
+        assert 'airweave_embedding_cache_hits_total{model="text-embedding-3-large"} 7.0' in output
+        assert 'airweave_embedding_cache_misses_total{model="text-embedding-3-large"} 2.0' in output
+
+    def test_zero_count_does_not_create_series(self):
+        from prometheus_client import CollectorRegistry, generate_latest
+
+        registry = CollectorRegistry()
+        adapter = PrometheusEmbeddingCacheMetrics(registry=registry)
+        adapter.inc_hits("m", 0)
+
+        assert 'model="m"' not in generate_latest(registry).decode()
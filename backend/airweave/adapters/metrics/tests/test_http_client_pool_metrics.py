@@ -0,0 +1,51 @@
+"""Unit tests for source HTTP client pool metrics adapters."""
+
+from airweave.adapters.metrics import (
+    FakeHttpClientPoolMetrics,
+    PrometheusHttpClientPoolMetrics,
+)
+
+
+class TestFakeHttpClientPoolMetrics:
+    """Tests for the FakeHttpClientPoolMetrics test helper."""
+
+    def test_records_all_signals(self):
+        fake = FakeHttpClientPoolMetrics()
+        fake.inc_requests("notion", "http2", "new")
+        fake.inc_requests("notion", "http2", "reused")
+        fake.inc_requests("notion", "http2", "reused")
+        fake.inc_handshakes("notion", "tls")
+
+        assert fake.requests == {
+            ("notion", "http2", "new"): 1,
+            ("notion", "http2", "reused"): 2,
+        }
+        assert fake.handshakes == {("notion", "tls"): 1}
+
+    def test_clear_resets_all_state(self):
+        fake = FakeHttpClientPoolMetrics()
+        fake.inc_requests("s", "http11", "new")
+        fake.inc_handshakes("s", "tcp")
+        fake.clear()
+
+        assert fake.requests == {}
+        assert fake.handshakes == {}
+
+
+class TestPrometheusHttpClientPoolMetrics:
+    """Tests for the Prometheus adapter."""
+
+    def test_series_exposed(self):
+        from prometheus_client import CollectorRegistry, generate_latest
+
+        registry = CollectorRegistry()
+        adapter = PrometheusHttpClientPoolMetrics(registry=registry)
+        adapter.inc_requests("github", "http11", "reused")
+        adapter.inc_handshakes("github", "tcp")
+        output = generate_latest(registry).decode()
+
+        assert (
+            "airweave_source_http_requests_total"
+            '{connection="reused",protocol="http11",source="github"} 1.0' in output
+        )
+        assert 'airweave_source_http_handshakes_total{kind="tcp",source="github"} 1.0' in output
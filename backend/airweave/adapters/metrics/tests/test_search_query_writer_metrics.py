@@ -0,0 +1,54 @@
+"""Unit tests for search query writer metrics adapters."""
+
+from airweave.adapters.metrics import (
+    FakeSearchQueryWriterMetrics,
+    PrometheusSearchQueryWriterMetrics,
+)
+
+
+class TestFakeSearchQueryWriterMetrics:
+    """Tests for the FakeSearchQueryWriterMetrics test helper."""
+
+    def test_records_all_signals(self):
+        fake = FakeSearchQueryWriterMetrics()
+        fake.observe_flush("success", 25, 0.01)
+        fake.inc_dropped("queue_full", 2)
+        fake.inc_dropped("queue_full", 1)
+        fake.set_queue_depth(7)
+
+        assert fake.flushes == [("success", 25, 0.01)]
+        assert fake.dropped == {"queue_full": 3}
+        assert fake.queue_depth == 7
+
+    def test_clear_resets_all_state(self):
+        fake = FakeSearchQueryWriterMetrics()
+        fake.observe_flush("error", 3, 0.5)
+        fake.inc_dropped("write_failed", 3)
+        fake.set_queue_depth(1)
+        fake.clear()
+
+        assert fake.flushes == []
+        assert fake.dropped == {}
+        assert fake.queue_depth == 0
+
+
+class TestPrometheusSearchQueryWriterMetrics:
+    """Tests for the Prometheus adapter."""
+
+    def test_series_exposed(self):
+        from prometheus_client import CollectorRegistry, generate_latest
+
+        registry = CollectorRegistry()
+        adapter = PrometheusSearchQueryWriterMetrics(registry=registry)
+        adapter.observe_flush("success", 40, 0.02)
+        adapter.inc_dropped("queue_full", 4)
+        adapter.set_queue_depth(12)
+        output = generate_latest(registry).decode()
+
+        assert (
+            'airweave_search_query_writer_flush_duration_seconds_count{status="success"} 1.0'
+            in output
+        )
+        assert 'airweave_search_query_writer_rows_total{status="success"} 40.0' in output
+        assert 'airweave_search_query_writer_dropped_total{reason="queue_full"} 4.0' in output
+        assert "airweave_search_query_writer_queue_depth 12.0" in output
@@ -0,0 +1,58 @@
+"""Unit tests for Vespa feed metrics adapters."""
+
+from airweave.adapters.metrics import FakeVespaFeedMetrics, PrometheusVespaFeedMetrics
+
+
+class TestFakeVespaFeedMetrics:
+    """Tests for the FakeVespaFeedMetrics test helper."""
+
+    def test_records_all_signals(self):
+        fake = FakeVespaFeedMetrics()
+        fake.inc_documents("base_entity", "success", 3)
+        fake.inc_documents("base_entity", "success", 2)
+        fake.observe_request("base_entity", "200", 0.01)
+        fake.inc_retries("base_entity", "throttled")
+        fake.set_in_flight_limit(32)
+
+        assert fake.documents == {("base_entity", "success"): 5}
+        assert fake.requests == [("base_entity", "200", 0.01)]
+        assert fake.retries == [("base_entity", "throttled")]
+        assert fake.in_flight_limits == [32]
+
+    def test_clear_resets_all_state(self):
+        fake = FakeVespaFeedMetrics()
+        fake.inc_documents("s", "failure", 1)
+        fake.inc_retries("s", "transport")
+        fake.clear()
+
+        assert fake.documents == {}
+        assert fake.retries == []
+
+
+class TestPrometheusVespaFeedMetrics:
+    """Tests for the Prometheus adapter."""
+
+    def test_series_exposed(self):
+        from prometheus_client import CollectorRegistry, generate_latest
+
+        registry = CollectorRegistry()
+        adapter = PrometheusVespaFeedMetrics(registry=registry)
+        adapter.inc_documents("base_entity", "success", 7)
+        adapter.observe_request("base_entity", "429", 0.02)
+        adapter.inc_retries("base_entity", "throttled")
+        adapter.set_in_flight_limit(48)
+        output = generate_latest(registry).decode()
+
+        assert (
+            'airweave_vespa_feed_documents_total{outcome="success",schema="base_entity"} 7.0'
+            in output
+        )
+        assert (
+            "airweave_vespa_feed_request_duration_seconds_count"
+            '{schema="base_entity",status="429"} 1.0' in output
+        )
+        assert (
+            'airweave_vespa_feed_retries_total{reason="throttled",schema="base_entity"} 1.0'
+            in output
+        )
+        assert "airweave_vespa_feed_in_flight_limit 48.0" in output
@@ -0,0 +1,47 @@
+"""Unit tests for Vespa query metrics adapters."""
+
+from airweave.adapters.metrics import FakeVespaQueryMetrics, PrometheusVespaQueryMetrics
+
+
+class TestFakeVespaQueryMetrics:
+    """Tests for the FakeVespaQueryMetrics test helper."""
+
+    def test_records_all_signals(self):
+        fake = FakeVespaQueryMetrics()
+        fake.observe_query("search", "200", 0.05)
+        fake.observe_slot_wait("agentic_search", 0.001)
+        fake.set_in_flight(3)
+
+        assert fake.queries == [("search", "200", 0.05)]
+        assert fake.slot_waits == [("agentic_search", 0.001)]
+        assert fake.in_flight == [3]
+
+    def test_clear_resets_all_state(self):
+        fake = FakeVespaQueryMetrics()
+        fake.observe_query("search", "error", 1.0)
+        fake.set_in_flight(1)
+        fake.clear()
+
+        assert fake.queries == []
+        assert fake.in_flight == []
+
+
+class TestPrometheusVespaQueryMetrics:
+    """Tests for the Prometheus adapter."""
+
+    def test_series_exposed(self):
+        from prometheus_client import CollectorRegistry, generate_latest
+
+        registry = CollectorRegistry()
+        adapter = PrometheusVespaQueryMetrics(registry=registry)
+        adapter.observe_query("search", "200", 0.04)
+        adapter.observe_slot_wait("search", 0.002)
+        adapter.set_in_flight(5)
+        output = generate_latest(registry).decode()
+
+        assert (
+            'airweave_vespa_query_duration_seconds_count{caller="search",status="200"} 1.0'
+            in output
+        )
+        assert 'airweave_vespa_query_slot_wait_seconds_count{caller="search"} 1.0' in output
+        assert "airweave_vespa_query_in_flight 5.0" in output
@@ -0,0 +1,99 @@
+"""Vespa feed metrics adapters (Prometheus + Fake).
+
+Prometheus implementation exposes document throughput, per-request
+latency, retries and the adaptive in-flight limit of the async Vespa
+feeder on the worker's CollectorRegistry.
+"""
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+
+from airweave.core.protocols.metrics import VespaFeedMetrics
+
+_REQUEST_DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class PrometheusVespaFeedMetrics(VespaFeedMetrics):
+    """Prometheus-backed Vespa feed metrics."""
+
+    def __init__(self, registry: CollectorRegistry | None = None) -> None:
+        self._registry = registry or CollectorRegistry()
+
+        self._documents_total = Counter(
+            "airweave_vespa_feed_documents_total",
+            "Documents fed to Vespa",
+            ["schema", "outcome"],
+            registry=self._registry,
+        )
+
+        self._request_duration = Histogram(
+            "airweave_vespa_feed_request_duration_seconds",
+            "Latency of individual Vespa document PUTs in seconds",
+            ["schema", "status"],
+            buckets=_REQUEST_DURATION_BUCKETS,
+            registry=self._registry,
+        )
+
+        self._retries_total = Counter(
+            "airweave_vespa_feed_retries_total",
+            "Vespa document PUTs that were retried",
+            ["schema", "reason"],
+            registry=self._registry,
+        )
+
+        self._in_flight_limit = Gauge(
+            "airweave_vespa_feed_in_flight_limit",
+            "Current adaptive limit on concurrent Vespa document PUTs",
+            registry=self._registry,
+        )
+
+    # -- VespaFeedMetrics protocol methods --
+
+    def inc_documents(self, schema: str, outcome: str, count: int) -> None:
+        if count:
+            self._documents_total.labels(schema=schema, outcome=outcome).inc(count)
+
+    def observe_request(self, schema: str, status: str, duration: float) -> None:
+        self._request_duration.labels(schema=schema, status=status).observe(duration)
+
+    def inc_retries(self, schema: str, reason: str) -> None:
+        self._retries_total.labels(schema=schema, reason=reason).inc()
+
+    def set_in_flight_limit(self, limit: int) -> None:
+        self._in_flight_limit.set(limit)
+
+
+# ---------------------------------------------------------------------------
+# Fake
+# ---------------------------------------------------------------------------
+
+
+class FakeVespaFeedMetrics(VespaFeedMetrics):
+    """In-memory spy implementing the VespaFeedMetrics protocol."""
+
+    def __init__(self) -> None:
+        self.documents: dict[tuple[str, str], int] = {}
+        self.requests: list[tuple[str, str, float]] = []
+        self.retries: list[tuple[str, str]] = []
+        self.in_flight_limits: list[int] = []
+
+    def inc_documents(self, schema: str, outcome: str, count: int) -> None:
+        key = (schema, outcome)
+        self.documents[key] = self.documents.get(key, 0) + count
+
+    def observe_request(self, schema: str, status: str, duration: float) -> None:
+        self.requests.append((schema, status, duration))
+
+    def inc_retries(self, schema: str, reason: str) -> None:
+        self.retries.append((schema, reason))
+
+    def set_in_flight_limit(self, limit: int) -> None:
+        self.in_flight_limits.append(limit)
+
+    # -- test helpers --
+
+    def clear(self) -> None:
+        """Reset all recorded state."""
+        self.documents.clear()
+        self.requests.clear()
+        self.retries.clear()
+        self.in_flight_limits.clear()
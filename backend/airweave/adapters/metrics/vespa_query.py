@@ -0,0 +1,84 @@
+"""Vespa query metrics adapters (Prometheus + Fake).
+
+Prometheus implementation exposes per-caller query latency, time spent
+waiting for an in-flight slot and the number of in-flight queries of the
+shared async Vespa query client.
+"""
+
+from prometheus_client import CollectorRegistry, Gauge, Histogram
+
+from airweave.core.protocols.metrics import VespaQueryMetrics
+
+_QUERY_DURATION_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_SLOT_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+class PrometheusVespaQueryMetrics(VespaQueryMetrics):
+    """Prometheus-backed Vespa query metrics."""
+
+    def __init__(self, registry: CollectorRegistry | None = None) -> None:
+        self._registry = registry or CollectorRegistry()
+
+        self._query_duration = Histogram(
+            "airweave_vespa_query_duration_seconds",
+            "Latency of Vespa queries in seconds",
+            ["caller", "status"],
+            buckets=_QUERY_DURATION_BUCKETS,
+            registry=self._registry,
+        )
+
+        self._slot_wait = Histogram(
+            "airweave_vespa_query_slot_wait_seconds",
+            "Time Vespa queries waited for an in-flight slot in seconds",
+            ["caller"],
+            buckets=_SLOT_WAIT_BUCKETS,
+            registry=self._registry,
+        )
+
+        self._in_flight = Gauge(
+            "airweave_vespa_query_in_flight",
+            "Vespa queries currently in flight on the shared query client",
+            registry=self._registry,
+        )
+
+    # -- VespaQueryMetrics protocol methods --
+
+    def observe_query(self, caller: str, status: str, duration: float) -> None:
+        self._query_duration.labels(caller=caller, status=status).observe(duration)
+
+    def observe_slot_wait(self, caller: str, duration: float) -> None:
+        self._slot_wait.labels(caller=caller).observe(duration)
+
+    def set_in_flight(self, count: int) -> None:
+        self._in_flight.set(count)
+
+
+# ---------------------------------------------------------------------------
+# Fake
+# ---------------------------------------------------------------------------
+
+
+class FakeVespaQueryMetrics(VespaQueryMetrics):
+    """In-memory spy implementing the VespaQueryMetrics protocol."""
+
+    def __init__(self) -> None:
+        self.queries: list[tuple[str, str, float]] = []
+        self.slot_waits: list[tuple[str, float]] = []
+        self.in_flight: list[int] = []
+
+    def observe_query(self, caller: str, status: str, duration: float) -> None:
+        self.queries.append((caller, status, duration))
+
+    def observe_slot_wait(self, caller: str, duration: float) -> None:
+        self.slot_waits.append((caller, duration))
+
+    def set_in_flight(self, count: int) -> None:
+        self.in_flight.append(count)
+
+    # -- test helpers --
+
+    def clear(self) -> None:
+        """Reset all recorded state."""
+        self.queries.clear()
+        self.slot_waits.clear()
+        self.in_flight.clear()
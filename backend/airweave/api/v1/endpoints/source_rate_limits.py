@@ -148,6 +148,10 @@ async def delete_source_rate_limit(
     if existing:
         await crud.source_rate_limit.remove(db, id=existing.id, ctx=ctx)
         await db.commit()
+
+        from airweave.core.source_rate_limiter_service import SourceRateLimiter
+
+        await SourceRateLimiter.invalidate_config(ctx.organization.id, source_short_name)
         ctx.logger.info(f"Removed rate limit for {source_short_name}")
     else:
         ctx.logger.debug(f"No rate limit configured for {source_short_name}, nothing to delete")
@@ -55,6 +55,39 @@ class Settings(BaseSettings):
         WEB_FETCHER_MAX_CONCURRENT (int): Max concurrent web scraping requests
         OPENAI_MAX_CONCURRENT (int): Max concurrent OpenAI API requests
         CTTI_MAX_CONCURRENT (int): Max concurrent CTTI (ClinicalTrials.gov) requests
+        ENTITY_HASH_ALGORITHM (str): Digest for entity change detection ("sha256" or "blake2b").
+        ENTITY_HASH_LEGACY_FALLBACK (bool): Match legacy SHA-256 hashes after switching digest.
+        ENTITY_TRACKER_SPILL_THRESHOLD (int): Encountered IDs per type before mmap spill (0 = off).
+        SOURCE_RATE_LIMIT_LEASE_SIZE (int): Max source rate-limit permits leased per round trip.
+        SOURCE_HTTP_POOL_HTTP2 (bool): Offer HTTP/2 on pooled source HTTP connections.
+        SOURCE_HTTP_POOL_MAX_CONNECTIONS (int): Max open connections per sync source.
+        SOURCE_HTTP_POOL_MAX_KEEPALIVE (int): Max idle keep-alive connections per sync source.
+        SOURCE_HTTP_POOL_KEEPALIVE_EXPIRY (float): Seconds an idle source connection stays open.
+        CONVERTER_PROCESS_POOL_ENABLED (bool): Run document parsing in a process pool.
+        CONVERTER_PROCESS_POOL_WORKERS (int): Extraction worker processes (0 = CPU count).
+        CONVERTER_TASK_TIMEOUT_SECONDS (float): Per-file extraction time limit in the pool.
+        CONVERTER_TASK_MEMORY_LIMIT_MB (int): Address-space cap per extraction worker.
+        EMBEDDING_CACHE_ENABLED (bool): Whether sync workers cache dense chunk embeddings.
+        EMBEDDING_CACHE_MAX_ENTRIES (int): Max vectors kept in the in-process LRU tier.
+        EMBEDDING_CACHE_REDIS_ENABLED (bool): Whether to add the shared Redis tier.
+        EMBEDDING_CACHE_TTL_SECONDS (int): TTL for vectors in the Redis tier.
+        QUERY_EMBEDDING_CACHE_ENABLED (bool): Whether search reuses embeddings of seen queries.
+        QUERY_EMBEDDING_CACHE_MAX_ENTRIES (int): Max query embeddings kept in process.
+        QUERY_EMBEDDING_CACHE_REDIS_ENABLED (bool): Whether API pods share dense query vectors.
+        QUERY_EMBEDDING_CACHE_TTL_SECONDS (int): TTL for query vectors in the Redis tier.
+        ACCESS_PRINCIPAL_CACHE_ENABLED (bool): Whether resolved ACL group closures are cached.
+        ACCESS_PRINCIPAL_CACHE_TTL_SECONDS (int): Max age of a cached group closure.
+        SEARCH_RESULT_CACHE_ENABLED (bool): Whether identical searches are answered from cache.
+        SEARCH_RESULT_CACHE_MAX_ENTRIES (int): Max responses kept in the in-process LRU tier.
+        SEARCH_RESULT_CACHE_MAX_ENTRY_BYTES (int): Serialized responses above this are not cached.
+        SEARCH_RESULT_CACHE_REDIS_ENABLED (bool): Whether to add the shared Redis result tier.
+        SEARCH_RESULT_CACHE_TTL_SECONDS (int): Max age of a cached response in every tier.
+        SEARCH_PLAN_CACHE_ENABLED (bool): Whether search reuses resolved sources and destination.
+        SEARCH_PLAN_CACHE_MAX_ENTRIES (int): Max collection search plans kept in process.
+        SEARCH_PLAN_CACHE_TTL_SECONDS (int): Max age of a plan (bounds staleness across pods).
+        SEARCH_QUERY_WRITER_MAX_QUEUE_SIZE (int): Search analytics records buffered before drops.
+        SEARCH_QUERY_WRITER_BATCH_SIZE (int): Search analytics rows per multi-row insert.
+        SEARCH_QUERY_WRITER_FLUSH_INTERVAL_SECONDS (float): Max wait before queued rows are written.
         STRIPE_DEVELOPER_MONTHLY: str = ""
         STRIPE_PRO_MONTHLY: str = ""
         STRIPE_TEAM_MONTHLY: str = ""
@@ -224,6 +257,61 @@ class Settings(BaseSettings):
     OPENAI_MAX_CONCURRENT: int = 20  # Max concurrent OpenAI API requests
     CTTI_MAX_CONCURRENT: int = 3  # Max concurrent CTTI (ClinicalTrials.gov) requests
 
+    # Entity change-detection hashing ("sha256" keeps the legacy unprefixed format)
+    ENTITY_HASH_ALGORITHM: str = "sha256"  # "sha256" or "blake2b"
+    ENTITY_HASH_LEGACY_FALLBACK: bool = True  # Match legacy SHA-256 rows after switching
+
+    # Encountered-ID digests per entity type before the tracker spills to mmap files
+    ENTITY_TRACKER_SPILL_THRESHOLD: int = 1_000_000
+
+    # Source rate limits: permits leased per Redis round trip (capped at 10% of the limit)
+    SOURCE_RATE_LIMIT_LEASE_SIZE: int = 10
+
+    # Pooled source HTTP connections (one pool per source per sync)
+    SOURCE_HTTP_POOL_HTTP2: bool = True
+    SOURCE_HTTP_POOL_MAX_CONNECTIONS: int = 100
+    SOURCE_HTTP_POOL_MAX_KEEPALIVE: int = 20
+    SOURCE_HTTP_POOL_KEEPALIVE_EXPIRY: float = 30.0
+
+    # Document extraction process pool (opt-in; workers only)
+    CONVERTER_PROCESS_POOL_ENABLED: bool = False
+    CONVERTER_PROCESS_POOL_WORKERS: int = 0  # 0 = os.cpu_count()
+    CONVERTER_TASK_TIMEOUT_SECONDS: float = 120.0
+    CONVERTER_TASK_MEMORY_LIMIT_MB: int = 2048
+
+    # Dense embedding cache (content-addressed, consulted before the embedder)
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 10_000  # ~12KB each at 3072 dims (float32)
+    EMBEDDING_CACHE_REDIS_ENABLED: bool = False
+    EMBEDDING_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+
+    # Search query embeddings (shared by classic and agentic search)
+    QUERY_EMBEDDING_CACHE_ENABLED: bool = True
+    QUERY_EMBEDDING_CACHE_MAX_ENTRIES: int = 5_000
+    QUERY_EMBEDDING_CACHE_REDIS_ENABLED: bool = False
+    QUERY_EMBEDDING_CACHE_TTL_SECONDS: int = 24 * 3600
+
+    # Resolved ACL principals (invalidated per org by ACL membership syncs)
+    ACCESS_PRINCIPAL_CACHE_ENABLED: bool = True
+    ACCESS_PRINCIPAL_CACHE_TTL_SECONDS: int = 300
+
+    # Search results (opt-in; keyed on per-collection data versions bumped by syncs)
+    SEARCH_RESULT_CACHE_ENABLED: bool = False
+    SEARCH_RESULT_CACHE_MAX_ENTRIES: int = 1000
+    SEARCH_RESULT_CACHE_MAX_ENTRY_BYTES: int = 512 * 1024
+    SEARCH_RESULT_CACHE_REDIS_ENABLED: bool = False
+    SEARCH_RESULT_CACHE_TTL_SECONDS: int = 300
+
+    # Search plans (per-collection sources/destination; dropped by collection events)
+    SEARCH_PLAN_CACHE_ENABLED: bool = True
+    SEARCH_PLAN_CACHE_MAX_ENTRIES: int = 1000
+    SEARCH_PLAN_CACHE_TTL_SECONDS: int = 300
+
+    # Search analytics persistence (batched by a background writer, off the request path)
+    SEARCH_QUERY_WRITER_MAX_QUEUE_SIZE: int = 10_000
+    SEARCH_QUERY_WRITER_BATCH_SIZE: int = 200
+    SEARCH_QUERY_WRITER_FLUSH_INTERVAL_SECONDS: float = 1.0
+
     # SSRF protection
     SSRF_ALLOW_PRIVATE_NETWORKS: bool = False
 
@@ -14,9 +14,11 @@ from dataclasses import dataclass, replace
 from typing import Any, Optional
 
 from airweave.core.protocols import (
+    AccessPrincipalCache,
     CircuitBreaker,
     ContextCache,
     EmailService,
+    EmbeddingCache,
     EndpointVerifier,
     EventBus,
     HealthServiceProtocol,
@@ -24,6 +26,8 @@ from airweave.core.protocols import (
     OcrProvider,
     PubSub,
     RateLimiter,
+    SearchResultCache,
+    VespaQueryClientProtocol,
     WebhookAdmin,
     WebhookPublisher,
     WebhookServiceProtocol,
@@ -50,6 +54,7 @@ from airweave.domains.credentials.protocols import IntegrationCredentialReposito
 from airweave.domains.embedders.protocols import (
     DenseEmbedderProtocol,
     DenseEmbedderRegistryProtocol,
+    QueryEmbeddingCacheProtocol,
     SparseEmbedderProtocol,
     SparseEmbedderRegistryProtocol,
 )
@@ -92,6 +97,7 @@ from airweave.domains.temporal.protocols import (
 )
 from airweave.domains.usage.protocols import UsageLedgerProtocol, UsageLimitCheckerProtocol
 from airweave.domains.users.protocols import UserServiceProtocol
+from airweave.search.protocols import SearchPlanCacheProtocol, SearchQueryWriterProtocol
 
 
 @dataclass(frozen=True)
@@ -239,6 +245,34 @@ class Container:
     # Optional: None when no OCR backend (Mistral/Docling) is configured
     ocr_provider: Optional[OcrProvider] = None
 
+    # Dense embedding cache consulted by sync workers before the embedder
+    # Optional: None when EMBEDDING_CACHE_ENABLED is off
+    embedding_cache: Optional[EmbeddingCache] = None
+
+    # Query embeddings reused by EmbedQuery and agentic search
+    # Optional: None when QUERY_EMBEDDING_CACHE_ENABLED is off
+    query_embedding_cache: Optional[QueryEmbeddingCacheProtocol] = None
+
+    # Resolved ACL group closures consulted by AccessBroker on search
+    # Optional: None when ACCESS_PRINCIPAL_CACHE_ENABLED is off
+    access_principal_cache: Optional[AccessPrincipalCache] = None
+
+    # Versioned search responses consulted by SearchService.search
+    # Optional: None when SEARCH_RESULT_CACHE_ENABLED is off
+    search_result_cache: Optional[SearchResultCache] = None
+
+    # Batched search analytics writer fed by SearchService (flushed on shutdown)
+    # Optional: None in containers built without a database (tests)
+    search_query_writer: Optional[SearchQueryWriterProtocol] = None
+
+    # Resolved per-collection search setup (sources, destination) reused by SearchFactory
+    # Optional: None when SEARCH_PLAN_CACHE_ENABLED is off
+    search_plan_cache: Optional[SearchPlanCacheProtocol] = None
+
+    # Pooled Vespa query connections shared by all searches (closed on shutdown)
+    # Optional: None in containers built without Vespa (tests)
+    vespa_query_client: Optional[VespaQueryClientProtocol] = None
+
     # -----------------------------------------------------------------
     # Convenience methods
     # -----------------------------------------------------------------
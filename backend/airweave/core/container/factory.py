@@ -16,6 +16,17 @@ from prometheus_client import CollectorRegistry
 
 from airweave.adapters.analytics.posthog import PostHogTracker
 from airweave.adapters.analytics.subscriber import AnalyticsEventSubscriber
+from airweave.adapters.cache.access_principal import RedisAccessPrincipalCache
+from airweave.adapters.cache.embedding import (
+    InMemoryEmbeddingCache,
+    RedisEmbeddingCache,
+    TieredEmbeddingCache,
+)
+from airweave.adapters.cache.search_result import (
+    InMemorySearchResultCache,
+    RedisSearchResultCache,
+    TieredSearchResultCache,
+)
 from airweave.adapters.circuit_breaker import InMemoryCircuitBreaker
 from airweave.adapters.encryption.fernet import FernetCredentialEncryptor
 from airweave.adapters.event_bus.in_memory import InMemoryEventBus
@@ -25,6 +36,8 @@ from airweave.adapters.metrics import (
     PrometheusDbPoolMetrics,
     PrometheusHttpMetrics,
     PrometheusMetricsRenderer,
+    PrometheusSearchQueryWriterMetrics,
+    PrometheusVespaQueryMetrics,
 )
 from airweave.adapters.ocr.docling import DoclingOcrAdapter
 from airweave.adapters.ocr.fallback import FallbackOcrProvider
@@ -37,7 +50,14 @@ from airweave.core.container.container import Container
 from airweave.core.health.service import HealthService
 from airweave.core.logging import logger
 from airweave.core.metrics_service import PrometheusMetricsService
-from airweave.core.protocols import CircuitBreaker, OcrProvider, PubSub
+from airweave.core.protocols import (
+    AccessPrincipalCache,
+    CircuitBreaker,
+    EmbeddingCache,
+    OcrProvider,
+    PubSub,
+    SearchResultCache,
+)
 from airweave.core.protocols.event_bus import EventBus
 from airweave.core.protocols.identity import IdentityProvider
 from airweave.core.protocols.payment import PaymentGatewayProtocol
@@ -63,6 +83,7 @@ from airweave.domains.embedders.config import (
     validate_embedding_config_sync,
 )
 from airweave.domains.embedders.protocols import DenseEmbedderProtocol, SparseEmbedderProtocol
+from airweave.domains.embedders.query_cache import QueryEmbeddingCache
 from airweave.domains.embedders.registry import DenseEmbedderRegistry, SparseEmbedderRegistry
 from airweave.domains.embedders.sparse.fastembed import (
     FastEmbedSparseEmbedder as DomainFastEmbedSparseEmbedder,
@@ -107,8 +128,12 @@ from airweave.domains.usage.subscribers.billing_listener import UsageBillingList
 from airweave.domains.webhooks.service import WebhookServiceImpl
 from airweave.domains.webhooks.subscribers import WebhookEventSubscriber
 from airweave.platform.auth.settings import integration_settings
+from airweave.platform.destinations.vespa.query_client import VespaQueryClient
 from airweave.platform.sync.subscribers.progress_relay import SyncProgressRelay
 from airweave.platform.temporal.client import TemporalClient
+from airweave.search.plan_cache import SearchPlanCache
+from airweave.search.query_writer import SearchQueryWriter
+from airweave.search.subscribers import SearchPlanCacheInvalidator, SearchResultCacheInvalidator
 
 
 def create_container(settings: Settings) -> Container:
@@ -141,6 +166,9 @@ def create_container(settings: Settings) -> Container:
     from airweave.adapters.cache.redis import RedisContextCache
 
     context_cache = RedisContextCache(redis_client=redis_client.client)
+    access_principal_cache = _create_access_principal_cache(settings)
+    search_result_cache = _create_search_result_cache(settings)
+    search_plan_cache = _create_search_plan_cache(settings)
 
     # -----------------------------------------------------------------
     # Rate limiter (Redis-backed or Null for local dev / disabled)
@@ -214,6 +242,8 @@ def create_container(settings: Settings) -> Container:
     # Metrics (Prometheus adapters, shared registry, wrapped in service)
     # -----------------------------------------------------------------
     metrics = _create_metrics_service(settings)
+    search_query_writer = _create_search_query_writer(settings, metrics)
+    vespa_query_client = VespaQueryClient.from_settings(metrics=metrics.vespa_query)
 
     event_bus = _create_event_bus(
         webhook_publisher=svix_adapter,
@@ -221,6 +251,8 @@ def create_container(settings: Settings) -> Container:
         pubsub=pubsub,
         usage_ledger=usage_ledger,
         context_cache=context_cache,
+        search_result_cache=search_result_cache,
+        search_plan_cache=search_plan_cache,
     )
 
     # -----------------------------------------------------------------
@@ -362,6 +394,8 @@ def create_container(settings: Settings) -> Container:
 
     dense_embedder = _create_dense_embedder(settings, dense_embedder_registry)
     sparse_embedder = _create_sparse_embedder(sparse_embedder_registry)
+    embedding_cache = _create_embedding_cache(settings)
+    query_embedding_cache = _create_query_embedding_cache(settings)
 
     # -----------------------------------------------------------------
     # Collection service (needs collection_repo, sc_repo, sync_lifecycle, dense_registry)
@@ -463,6 +497,13 @@ def create_container(settings: Settings) -> Container:
         sparse_embedder_registry=sparse_embedder_registry,
         dense_embedder=dense_embedder,
         sparse_embedder=sparse_embedder,
+        embedding_cache=embedding_cache,
+        query_embedding_cache=query_embedding_cache,
+        access_principal_cache=access_principal_cache,
+        search_result_cache=search_result_cache,
+        search_query_writer=search_query_writer,
+        search_plan_cache=search_plan_cache,
+        vespa_query_client=vespa_query_client,
         ocr_provider=ocr_provider,
         metrics=metrics,
         source_service=source_deps["source_service"],
@@ -553,6 +594,8 @@ def _create_metrics_service(settings: Settings) -> PrometheusMetricsService:
             registry=registry,
             max_overflow=settings.db_pool_max_overflow,
         ),
+        vespa_query=PrometheusVespaQueryMetrics(registry=registry),
+        search_query_writer=PrometheusSearchQueryWriterMetrics(registry=registry),
         renderer=PrometheusMetricsRenderer(registry=registry),
         host=settings.METRICS_HOST,
         port=settings.METRICS_PORT,
@@ -565,6 +608,8 @@ def _create_event_bus(
     pubsub: PubSub,
     usage_ledger: UsageLedgerProtocol,
     context_cache=None,
+    search_result_cache: Optional[SearchResultCache] = None,
+    search_plan_cache: Optional[SearchPlanCache] = None,
 ) -> EventBus:
     """Create event bus with subscribers wired up.
 
@@ -574,6 +619,8 @@ def _create_event_bus(
     - SyncProgressRelay: Relays entity batch events to Redis PubSub (entity.*)
     - UsageBillingListener: Accumulates usage from entity/query/sync/
       source_connection events
+    - SearchResultCacheInvalidator: Bumps collection data versions when
+      syncs write (only when the search result cache is enabled)
 
     Returns:
         EventBus
@@ -612,6 +659,18 @@ def _create_event_bus(
     for pattern in donke_subscriber.EVENT_PATTERNS:
         bus.subscribe(pattern, donke_subscriber.handle)
 
+    # SearchResultCacheInvalidator — data version bumps on sync writes/deletes
+    if search_result_cache is not None:
+        invalidator = SearchResultCacheInvalidator(cache=search_result_cache)
+        for pattern in invalidator.EVENT_PATTERNS:
+            bus.subscribe(pattern, invalidator.handle)
+
+    # SearchPlanCacheInvalidator — drop cached search setup on collection/source changes
+    if search_plan_cache is not None:
+        plan_invalidator = SearchPlanCacheInvalidator(cache=search_plan_cache)
+        for pattern in plan_invalidator.EVENT_PATTERNS:
+            bus.subscribe(pattern, plan_invalidator.handle)
+
     return bus
 
 
@@ -712,6 +771,116 @@ def _create_sparse_embedder(registry: SparseEmbedderRegistry) -> SparseEmbedderP
     return DomainFastEmbedSparseEmbedder(model=spec.api_model_name)
 
 
+def _create_embedding_cache(settings: Settings) -> Optional[EmbeddingCache]:
+    """Create the dense embedding cache used by sync workers.
+
+    Always has a bounded in-process LRU tier; the shared Redis tier is
+    added when EMBEDDING_CACHE_REDIS_ENABLED is set. Returns None when
+    caching is disabled.
+    """
+    if not settings.EMBEDDING_CACHE_ENABLED:
+        return None
+
+    shared = None
+    if settings.EMBEDDING_CACHE_REDIS_ENABLED:
+        shared = RedisEmbeddingCache(
+            redis_client=redis_client.client,
+            ttl_seconds=settings.EMBEDDING_CACHE_TTL_SECONDS,
+        )
+
+    return TieredEmbeddingCache(
+        memory=InMemoryEmbeddingCache(max_entries=settings.EMBEDDING_CACHE_MAX_ENTRIES),
+        shared=shared,
+    )
+
+
+def _create_query_embedding_cache(settings: Settings) -> Optional[QueryEmbeddingCache]:
+    """Create the search query embedding cache shared by both search stacks.
+
+    Dense vectors go to an in-process LRU, tiered with Redis when
+    QUERY_EMBEDDING_CACHE_REDIS_ENABLED is set; sparse vectors stay in
+    process. Returns None when disabled.
+    """
+    if not settings.QUERY_EMBEDDING_CACHE_ENABLED:
+        return None
+
+    shared = None
+    if settings.QUERY_EMBEDDING_CACHE_REDIS_ENABLED:
+        shared = RedisEmbeddingCache(
+            redis_client=redis_client.client,
+            ttl_seconds=settings.QUERY_EMBEDDING_CACHE_TTL_SECONDS,
+        )
+    return QueryEmbeddingCache(
+        dense_cache=TieredEmbeddingCache(
+            memory=InMemoryEmbeddingCache(max_entries=settings.QUERY_EMBEDDING_CACHE_MAX_ENTRIES),
+            shared=shared,
+        ),
+        sparse_max_entries=settings.QUERY_EMBEDDING_CACHE_MAX_ENTRIES,
+    )
+
+
+def _create_access_principal_cache(settings: Settings) -> Optional[AccessPrincipalCache]:
+    """Create the Redis cache of resolved ACL group closures.
+
+    Shared across API pods and invalidated per organization by the
+    AccessControlPipeline on worker pods. Returns None when disabled.
+    """
+    if not settings.ACCESS_PRINCIPAL_CACHE_ENABLED:
+        return None
+
+    return RedisAccessPrincipalCache(
+        redis_client=redis_client.client,
+        ttl_seconds=settings.ACCESS_PRINCIPAL_CACHE_TTL_SECONDS,
+    )
+
+
+def _create_search_result_cache(settings: Settings) -> Optional[SearchResultCache]:
+    """Create the search result cache (in-process LRU, optional Redis tier).
+
+    Data versions always live in Redis so version bumps made by sync
+    workers reach every API pod. Returns None when disabled.
+    """
+    if not settings.SEARCH_RESULT_CACHE_ENABLED:
+        return None
+
+    redis_tier = RedisSearchResultCache(
+        redis_client=redis_client.client,
+        ttl_seconds=settings.SEARCH_RESULT_CACHE_TTL_SECONDS,
+        max_entry_bytes=settings.SEARCH_RESULT_CACHE_MAX_ENTRY_BYTES,
+    )
+    return TieredSearchResultCache(
+        memory=InMemorySearchResultCache(
+            max_entries=settings.SEARCH_RESULT_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.SEARCH_RESULT_CACHE_TTL_SECONDS,
+            max_entry_bytes=settings.SEARCH_RESULT_CACHE_MAX_ENTRY_BYTES,
+        ),
+        shared=redis_tier if settings.SEARCH_RESULT_CACHE_REDIS_ENABLED else None,
+        versions=redis_tier,
+    )
+
+
+def _create_search_plan_cache(settings: Settings) -> Optional[SearchPlanCache]:
+    """Create the in-process search plan cache, or None when disabled."""
+    if not settings.SEARCH_PLAN_CACHE_ENABLED:
+        return None
+    return SearchPlanCache(
+        max_entries=settings.SEARCH_PLAN_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.SEARCH_PLAN_CACHE_TTL_SECONDS,
+    )
+
+
+def _create_search_query_writer(
+    settings: Settings, metrics: PrometheusMetricsService
+) -> SearchQueryWriter:
+    """Create the background writer that batches search analytics inserts."""
+    return SearchQueryWriter(
+        max_queue_size=settings.SEARCH_QUERY_WRITER_MAX_QUEUE_SIZE,
+        batch_size=settings.SEARCH_QUERY_WRITER_BATCH_SIZE,
+        flush_interval_seconds=settings.SEARCH_QUERY_WRITER_FLUSH_INTERVAL_SECONDS,
+        metrics=metrics.search_query_writer,
+    )
+
+
 def _create_source_services(settings: Settings) -> dict:
     """Create source services, registries, repository adapters, and lifecycle service.
 
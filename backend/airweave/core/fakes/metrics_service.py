@@ -6,6 +6,8 @@ from airweave.core.protocols.metrics import (
     DbPoolMetrics,
     HttpMetrics,
     MetricsService,
+    SearchQueryWriterMetrics,
+    VespaQueryMetrics,
 )
 
 
@@ -21,10 +23,14 @@ class FakeMetricsService(MetricsService):
         http: HttpMetrics,
         agentic_search: AgenticSearchMetrics,
         db_pool: DbPoolMetrics,
+        vespa_query: VespaQueryMetrics,
+        search_query_writer: SearchQueryWriterMetrics,
     ) -> None:
         self.http = http
         self.agentic_search = agentic_search
         self.db_pool = db_pool
+        self.vespa_query = vespa_query
+        self.search_query_writer = search_query_writer
 
     async def start(self, *, pool: DbPool) -> None:
         pass
@@ -19,6 +19,8 @@ from airweave.core.protocols.metrics import (
     HttpMetrics,
     MetricsRenderer,
     MetricsService,
+    SearchQueryWriterMetrics,
+    VespaQueryMetrics,
 )
 
 
@@ -27,9 +29,9 @@ class PrometheusMetricsService(MetricsService):
 
     Satisfies the ``MetricsService`` protocol structurally.
 
-    Public attributes (``http``, ``agentic_search``, ``db_pool``) are
-    typed with their respective protocols so ``Inject()`` in deps.py can
-    resolve them via nested attribute lookup.
+    Public attributes (``http``, ``agentic_search``, ``db_pool``,
+    ``vespa_query``, ``search_query_writer``) are typed with their respective protocols so
+    ``Inject()`` in deps.py can resolve them via nested attribute lookup.
 
     ``_renderer`` is private to prevent accidental injection — it is an
     implementation detail of the sidecar server.
@@ -38,12 +40,16 @@ class PrometheusMetricsService(MetricsService):
     http: HttpMetrics
     agentic_search: AgenticSearchMetrics
     db_pool: DbPoolMetrics
+    vespa_query: VespaQueryMetrics
+    search_query_writer: SearchQueryWriterMetrics
 
     def __init__(
         self,
         http: HttpMetrics,
         agentic_search: AgenticSearchMetrics,
         db_pool: DbPoolMetrics,
+        vespa_query: VespaQueryMetrics,
+        search_query_writer: SearchQueryWriterMetrics,
         renderer: MetricsRenderer,
         host: str,
         port: int,
@@ -51,6 +57,8 @@ class PrometheusMetricsService(MetricsService):
         self.http = http
         self.agentic_search = agentic_search
         self.db_pool = db_pool
+        self.vespa_query = vespa_query
+        self.search_query_writer = search_query_writer
         self._renderer = renderer
         self._host = host
         self._port = port
@@ -6,7 +6,12 @@ infrastructure protocols only.
 """
 
 from airweave.core.health.protocols import HealthProbe, HealthServiceProtocol
-from airweave.core.protocols.cache import ContextCache
+from airweave.core.protocols.cache import (
+    AccessPrincipalCache,
+    ContextCache,
+    EmbeddingCache,
+    SearchResultCache,
+)
 from airweave.core.protocols.circuit_breaker import CircuitBreaker
 from airweave.core.protocols.email import EmailService
 from airweave.core.protocols.encryption import CredentialEncryptor
@@ -16,15 +21,21 @@ from airweave.core.protocols.metrics import (
     AgenticSearchMetrics,
     DbPool,
     DbPoolMetrics,
+    EmbeddingCacheMetrics,
+    HttpClientPoolMetrics,
     HttpMetrics,
     MetricsRenderer,
     MetricsService,
+    SearchQueryWriterMetrics,
+    VespaFeedMetrics,
+    VespaQueryMetrics,
     WorkerMetrics,
 )
 from airweave.core.protocols.ocr import OcrProvider
 from airweave.core.protocols.payment import PaymentGatewayProtocol
 from airweave.core.protocols.pubsub import PubSub, PubSubSubscription
 from airweave.core.protocols.rate_limiter import RateLimiter
+from airweave.core.protocols.vespa import VespaFeederProtocol, VespaQueryClientProtocol
 from airweave.core.protocols.webhooks import (
     EndpointVerifier,
     WebhookAdmin,
@@ -34,6 +45,7 @@ from airweave.core.protocols.webhooks import (
 from airweave.core.protocols.worker_metrics_registry import WorkerMetricsRegistryProtocol
 
 __all__ = [
+    "AccessPrincipalCache",
     "AgenticSearchMetrics",
     "ContextCache",
     "CircuitBreaker",
@@ -42,12 +54,15 @@ __all__ = [
     "DbPoolMetrics",
     "DomainEvent",
     "EmailService",
+    "EmbeddingCache",
+    "EmbeddingCacheMetrics",
     "EndpointVerifier",
     "EventBus",
     "EventHandler",
     "EventSubscriber",
     "HealthProbe",
     "HealthServiceProtocol",
+    "HttpClientPoolMetrics",
     "HttpMetrics",
     "IdentityProvider",
     "MetricsRenderer",
@@ -57,6 +72,12 @@ __all__ = [
     "PubSub",
     "PubSubSubscription",
     "RateLimiter",
+    "SearchQueryWriterMetrics",
+    "SearchResultCache",
+    "VespaFeedMetrics",
+    "VespaFeederProtocol",
+    "VespaQueryClientProtocol",
+    "VespaQueryMetrics",
     "WebhookAdmin",
     "WebhookPublisher",
     "WebhookServiceProtocol",
@@ -9,8 +9,16 @@ Invalidation strategy:
   on critical mutation paths (org create/delete, membership changes)
 - Feature flags, billing plan changes, etc. rely on TTL — 30s max staleness
   is acceptable for admin operations
+
+Also hosts the ``EmbeddingCache`` protocol used by the sync pipeline to
+skip re-embedding chunks whose text has not changed, and the
+``AccessPrincipalCache`` protocol used by ``AccessBroker`` to skip group
+expansion on access-controlled searches, and the ``SearchResultCache``
+protocol used by ``SearchService`` to answer repeated searches between
+syncs.
 """
 
+from collections.abc import Mapping, Sequence
 from typing import Optional, Protocol, runtime_checkable
 from uuid import UUID
 
@@ -62,3 +70,100 @@ class ContextCache(Protocol):
     async def invalidate_api_key(self, api_key: str) -> None:
         """Remove cached API key entry."""
         ...
+
+
+@runtime_checkable
+class EmbeddingCache(Protocol):
+    """Content-addressed cache for dense embedding vectors.
+
+    Keys are opaque strings built by the caller (see
+    ``CachedDenseEmbedder``) so the cache never needs to know about
+    models, dimensions, or text. Adapters: bounded in-process LRU,
+    Redis (shared across pods), and a tiered combination of both.
+
+    All methods are fail-safe — a broken tier behaves like a miss.
+    """
+
+    async def get_many(self, keys: Sequence[str]) -> list[Optional[list[float]]]:
+        """Return cached vectors aligned with ``keys`` (None on miss)."""
+        ...
+
+    async def set_many(self, items: Mapping[str, list[float]]) -> None:
+        """Store vectors under their keys."""
+        ...
+
+
+@runtime_checkable
+class AccessPrincipalCache(Protocol):
+    """Cache of resolved group closures per (organization, principal, scope).
+
+    ``scope`` distinguishes organization-wide resolution from resolution
+    scoped to one collection. Entries are invalidated per organization
+    whenever an ACL membership sync changes memberships, because a change
+    to one nested group can affect every principal in the organization.
+
+    Each invalidation bumps the organization's generation. Callers read the
+    generation before resolving and pass it to ``set_groups``, which drops
+    the write if an invalidation happened in between, so a closure computed
+    from memberships mid-sync cannot outlive the sync's invalidation.
+
+    All methods are fail-safe — errors behave like a miss.
+    """
+
+    async def get_groups(
+        self, organization_id: UUID, principal: str, scope: str
+    ) -> Optional[list[str]]:
+        """Return the cached group IDs or None on miss."""
+        ...
+
+    async def generation(self, organization_id: UUID) -> Optional[int]:
+        """Return how often the organization has been invalidated, or None if unknown."""
+        ...
+
+    async def set_groups(
+        self,
+        organization_id: UUID,
+        principal: str,
+        scope: str,
+        group_ids: Sequence[str],
+        generation: int,
+    ) -> None:
+        """Cache the resolved group IDs unless the generation has moved on."""
+        ...
+
+    async def invalidate_organization(self, organization_id: UUID) -> None:
+        """Drop every cached entry for an organization and bump its generation."""
+        ...
+
+
+@runtime_checkable
+class SearchResultCache(Protocol):
+    """Cache of serialized search results plus per-collection data versions.
+
+    Callers embed the collection's current data version in every key, so
+    bumping the version (whenever a sync writes to the collection) orphans
+    all earlier entries without enumerating them; they age out by TTL.
+    Adapters: bounded in-process LRU, Redis (shared across pods), and a
+    tiered combination of both.
+
+    All methods are fail-safe — errors behave like a miss.
+    """
+
+    async def get_data_version(self, collection_readable_id: str) -> Optional[int]:
+        """Return the collection's data version, or None if it cannot be read.
+
+        Callers must bypass the cache on None rather than assume a version.
+        """
+        ...
+
+    async def bump_data_version(self, collection_readable_id: str) -> None:
+        """Advance the collection's data version, invalidating its entries."""
+        ...
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached payload or None on miss or expiry."""
+        ...
+
+    async def set(self, key: str, payload: str) -> None:
+        """Store a payload (adapters may drop payloads over their size limit)."""
+        ...
@@ -5,6 +5,10 @@ Consolidates all metrics-related protocols into a single module:
 - AgenticSearchMetrics: agentic search pipeline instrumentation
 - DbPoolMetrics: database connection pool gauges
 - WorkerMetrics: Temporal worker gauge instrumentation
+- EmbeddingCacheMetrics: dense embedding cache hit/miss counters
+- VespaFeedMetrics: Vespa document feed throughput, latency and throttling
+- VespaQueryMetrics: pooled Vespa query latency and in-flight saturation
+- HttpClientPoolMetrics: source HTTP connection reuse and handshakes
 - MetricsRenderer: metrics serialization for scraping
 - MetricsService: facade that owns all metrics adapters
 """
@@ -157,6 +161,112 @@ class WorkerMetrics(Protocol):
         ...
 
 
+# ---------------------------------------------------------------------------
+# EmbeddingCacheMetrics
+# ---------------------------------------------------------------------------
+
+
+@runtime_checkable
+class EmbeddingCacheMetrics(Protocol):
+    """Protocol for dense embedding cache hit/miss counters."""
+
+    def inc_hits(self, model: str, count: int) -> None:
+        """Add ``count`` texts served from the cache for ``model``."""
+        ...
+
+    def inc_misses(self, model: str, count: int) -> None:
+        """Add ``count`` texts that had to be sent to the embedder for ``model``."""
+        ...
+
+
+# ---------------------------------------------------------------------------
+# VespaFeedMetrics
+# ---------------------------------------------------------------------------
+
+
+@runtime_checkable
+class VespaFeedMetrics(Protocol):
+    """Protocol for Vespa document feed instrumentation."""
+
+    def inc_documents(self, schema: str, outcome: str, count: int) -> None:
+        """Add ``count`` fed documents for ``schema`` (outcome: success/failure)."""
+        ...
+
+    def observe_request(self, schema: str, status: str, duration: float) -> None:
+        """Record one document PUT's latency in seconds and its status."""
+        ...
+
+    def inc_retries(self, schema: str, reason: str) -> None:
+        """Count a retried document PUT (reason: throttled/server_error/transport)."""
+        ...
+
+    def set_in_flight_limit(self, limit: int) -> None:
+        """Publish the current adaptive in-flight request limit."""
+        ...
+
+
+# ---------------------------------------------------------------------------
+# VespaQueryMetrics
+# ---------------------------------------------------------------------------
+
+
+@runtime_checkable
+class VespaQueryMetrics(Protocol):
+    """Protocol for shared Vespa query client instrumentation."""
+
+    def observe_query(self, caller: str, status: str, duration: float) -> None:
+        """Record one query's latency in seconds and its HTTP status (or ``error``)."""
+        ...
+
+    def observe_slot_wait(self, caller: str, duration: float) -> None:
+        """Record how long a query waited for an in-flight slot, in seconds."""
+        ...
+
+    def set_in_flight(self, count: int) -> None:
+        """Publish the number of queries currently holding a slot."""
+        ...
+
+
+# ---------------------------------------------------------------------------
+# SearchQueryWriterMetrics
+# ---------------------------------------------------------------------------
+
+
+@runtime_checkable
+class SearchQueryWriterMetrics(Protocol):
+    """Protocol for the background search analytics writer."""
+
+    def observe_flush(self, status: str, rows: int, duration: float) -> None:
+        """Record one batch insert of ``rows`` rows (status: success/error) in seconds."""
+        ...
+
+    def inc_dropped(self, reason: str, count: int) -> None:
+        """Count records that were not persisted (reason: queue_full/write_failed)."""
+        ...
+
+    def set_queue_depth(self, depth: int) -> None:
+        """Publish the number of records waiting to be written."""
+        ...
+
+
+# ---------------------------------------------------------------------------
+# HttpClientPoolMetrics
+# ---------------------------------------------------------------------------
+
+
+@runtime_checkable
+class HttpClientPoolMetrics(Protocol):
+    """Protocol for pooled source HTTP client instrumentation."""
+
+    def inc_requests(self, source: str, protocol: str, connection: str) -> None:
+        """Count a request sent over a ``new`` or ``reused`` connection (http11/http2)."""
+        ...
+
+    def inc_handshakes(self, source: str, kind: str) -> None:
+        """Count a completed connection handshake (kind: tcp/tls)."""
+        ...
+
+
 # ---------------------------------------------------------------------------
 # MetricsRenderer
 # ---------------------------------------------------------------------------
@@ -190,14 +300,16 @@ class MetricsRenderer(Protocol):
 class MetricsService(Protocol):
     """Protocol for the metrics facade.
 
-    Public attributes (``http``, ``agentic_search``, ``db_pool``) are typed
-    with their respective protocols so ``Inject()`` in deps.py can resolve
-    them via nested attribute lookup.
+    Public attributes (``http``, ``agentic_search``, ``db_pool``,
+    ``vespa_query``, ``search_query_writer``) are typed with their respective protocols so
+    ``Inject()`` in deps.py can resolve them via nested attribute lookup.
     """
 
     http: HttpMetrics
     agentic_search: AgenticSearchMetrics
     db_pool: DbPoolMetrics
+    vespa_query: VespaQueryMetrics
+    search_query_writer: SearchQueryWriterMetrics
 
     async def start(self, *, pool: DbPool) -> None:
         """Start the metrics sidecar server and background samplers."""
@@ -0,0 +1,44 @@
+"""Vespa query client and document feeder protocols.
+
+One pooled query client per process is built by the container factory and
+shared by every classic and agentic search. The Temporal worker builds its
+own query client and one feeder on the worker metrics registry and passes
+them to the destinations of its syncs, so every sync reuses the same
+connection pools.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    from airweave.platform.destinations.vespa.query_client import VespaQueryResult
+    from airweave.platform.destinations.vespa.types import FeedResult, VespaDocument
+
+
+@runtime_checkable
+class VespaQueryClientProtocol(Protocol):
+    """Pooled client for Vespa's ``/search/`` endpoint with bounded concurrency."""
+
+    async def query(self, body: Dict[str, Any], *, caller: str = "search") -> "VespaQueryResult":
+        """Run one query; non-200 answers are returned, not raised."""
+        ...
+
+    async def close(self) -> None:
+        """Close pooled connections (called on process shutdown)."""
+        ...
+
+
+@runtime_checkable
+class VespaFeederProtocol(Protocol):
+    """Pooled feeder for Vespa's ``/document/v1`` API with adaptive concurrency."""
+
+    async def feed(
+        self,
+        docs_by_schema: Dict[str, List["VespaDocument"]],
+        timeout: Optional[float] = None,
+    ) -> "FeedResult":
+        """Feed all schemas concurrently; per-document failures are returned, not raised."""
+        ...
+
+    async def close(self) -> None:
+        """Close pooled connections (called on process shutdown)."""
+        ...
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave import crud, schemas
 from airweave.core.context import BaseContext
+from airweave.core.source_rate_limiter_service import SourceRateLimiter
 
 
 async def set_source_rate_limit(
@@ -67,6 +68,7 @@ async def set_source_rate_limit(
             ctx=ctx,
         )
         await db.commit()
+        await SourceRateLimiter.invalidate_config(org_id, source_short_name)
         # Refresh to avoid MissingGreenlet errors when serializing
         await db.refresh(updated)
         ctx.logger.info(
@@ -86,6 +88,7 @@ async def set_source_rate_limit(
             ctx=ctx,
         )
         await db.commit()
+        await SourceRateLimiter.invalidate_config(org_id, source_short_name)
         # Refresh to avoid MissingGreenlet errors when serializing
         await db.refresh(created)
         ctx.logger.info(
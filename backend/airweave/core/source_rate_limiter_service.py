@@ -3,53 +3,55 @@
 Prevents Airweave from exhausting customer API quotas by enforcing adjusted
 rate limits on external source API calls. Supports both org-level (e.g., Google Drive)
 and connection-level (e.g., Notion per-user) rate limiting.
+
+Counting stays global in Redis sliding windows, but each process leases a
+small block of permits per window in one round trip and spends them locally
+(:class:`PermitPool`). Limit configs and source levels are cached in process;
+config changes are broadcast over Redis pub/sub so every pod drops its copy.
 """
 
+import asyncio
+import json
 import time
-from typing import Optional
-from uuid import UUID
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
 
+from airweave.core.config import settings
 from airweave.core.exceptions import SourceRateLimitExceededException
 from airweave.core.logging import logger
+from airweave.core.protocols.pubsub import PubSub, PubSubSubscription
 from airweave.core.redis_client import redis_client
 from airweave.core.shared_models import RateLimitLevel
 
-
-class SourceRateLimiter:
-    """Distributed source rate limiter using Redis sliding window algorithm.
-
-    Enforces rate limits on external source API calls across horizontally scaled instances.
-    Counts stored in Redis sorted sets, configurations cached from database.
-
-    Uses Lua scripts for atomic check-and-increment operations to prevent race conditions
-    when concurrent requests check limits simultaneously.
-    """
-
-    # Redis key prefixes
-    KEY_PREFIX = "source_rate_limit"
-    CONFIG_CACHE_PREFIX = "source_rate_limit_config"
-    CONFIG_CACHE_TTL = 300  # 5 minutes
-
-    # Lua script for atomic check-and-increment
-    # Returns: current_count if allowed, -1 if over limit
-    # If over limit, also returns retry_after as second return value
-    LUA_CHECK_AND_INCREMENT = """
+# Lua script for atomically returning unused permits and leasing new ones.
+# Leased permits are scored at the END of the lease, so a permit spent at any
+# moment of its lease is still inside every window that contains that moment.
+# Returns: {granted, retry_after}; granted == 0 means the window is full.
+LUA_LEASE_PERMITS = """
 local key = KEYS[1]
 local limit = tonumber(ARGV[1])
 local window_start = tonumber(ARGV[2])
 local current_time = tonumber(ARGV[3])
 local window_seconds = tonumber(ARGV[4])
 local expire_seconds = tonumber(ARGV[5])
-local unique_id = ARGV[6]  -- UUID to make each entry unique
+local lease_id = ARGV[6]
+local requested = tonumber(ARGV[7])
+local lease_end = tonumber(ARGV[8])
+local returned = tonumber(ARGV[9])  -- ARGV[10..] are unused permits to give back
+
+for i = 1, returned do
+    redis.call('ZREM', key, ARGV[9 + i])
+end
 
 -- Remove old entries outside sliding window
 redis.call('ZREMRANGEBYSCORE', key, 0, window_start)
 
--- Count current requests in window
-local current_count = redis.call('ZCOUNT', key, window_start, current_time)
+-- Count requests in window, including permits leased but not yet spent
+local current_count = redis.call('ZCOUNT', key, window_start, '+inf')
+local available = limit - current_count
 
--- Check if over limit
-if current_count >= limit then
+if available <= 0 then
     -- Get oldest entry to calculate retry_after
     local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
     local retry_after = window_seconds  -- Default
@@ -59,23 +61,209 @@ if current_count >= limit then
         retry_after = math.max(0.1, (oldest_timestamp + window_seconds) - current_time)
     end
 
-    return {-1, retry_after}  -- Over limit, return retry_after
+    return {0, tostring(retry_after)}
 end
 
--- Add current request to sliding window with unique member
--- Score = current_time (for range queries)
--- Member = unique_id (ensures uniqueness for concurrent requests at same time)
-redis.call('ZADD', key, current_time, unique_id)
+local granted = math.min(requested, available)
+for i = 1, granted do
+    redis.call('ZADD', key, lease_end, lease_id .. ':' .. i)
+end
 
 -- Set expiration for auto-cleanup
 redis.call('EXPIRE', key, expire_seconds)
 
-return {current_count + 1, 0}  -- Success, return new count
+return {granted, '0'}
 """
 
+
+_NEEDS_LEASE = object()
+
+
+@dataclass
+class _Lease:
+    """Permits leased for one sliding-window key."""
+
+    lease_id: str = ""
+    granted: int = 0
+    used: int = 0
+    expires_at: float = 0.0
+    denied_until: float = 0.0
+    # Once passed, the permits have left every window and any refusal has lapsed
+    retain_until: float = 0.0
+
+    def unused_members(self) -> List[str]:
+        """ZSET members of the permits that were never spent."""
+        return [f"{self.lease_id}:{i}" for i in range(self.used + 1, self.granted + 1)]
+
+
+class PermitPool:
+    """Per-process pool of permits leased from Redis sliding windows.
+
+    Each key gets a lease of up to ``lease_size`` permits (at most a tenth of
+    its limit), valid for a tenth of the window and at most
+    ``MAX_LEASE_SECONDS``. Permits are spent locally until the lease runs out
+    or expires; the next lease returns the unused ones in the same round trip.
+    A refused lease is remembered until its retry_after, so a saturated window
+    is not hammered with round trips.
+
+    Permits of a lease that is never renewed (the key goes idle, or the
+    process stops) are not given back: they stay scored at the lease's end
+    and count against the limit for one more window. Once that window has
+    passed, the idle key's lease and lock are pruned (checked at most every
+    ``PRUNE_INTERVAL_SECONDS``), so per-connection keys do not pile up.
+    """
+
+    MAX_LEASE_SECONDS = 1.0
+    PRUNE_INTERVAL_SECONDS = 60.0
+
+    def __init__(
+        self,
+        redis_getter: Optional[Callable[[], Any]] = None,
+        lease_size: Optional[int] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the pool.
+
+        Args:
+            redis_getter: Returns the Redis client (defaults to the shared client)
+            lease_size: Max permits per lease (defaults to SOURCE_RATE_LIMIT_LEASE_SIZE)
+            clock: Wall-clock source shared with the Redis scores
+        """
+        self._redis_getter = redis_getter or (lambda: redis_client.client)
+        self._lease_size = lease_size or settings.SOURCE_RATE_LIMIT_LEASE_SIZE
+        self._clock = clock
+        self._leases: Dict[str, _Lease] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._next_prune = 0.0
+
+    async def acquire(self, key: str, limit: int, window_seconds: float) -> Optional[float]:
+        """Take one permit for ``key``.
+
+        Returns:
+            None if a permit was taken, otherwise the seconds to wait (retry_after)
+        """
+        outcome = self._take_local(key)
+        if outcome is not _NEEDS_LEASE:
+            return outcome
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another request may have renewed the lease while we waited
+            outcome = self._take_local(key)
+            if outcome is not _NEEDS_LEASE:
+                return outcome
+
+            lease = await self._renew(key, limit, window_seconds)
+            if lease.granted == 0:
+                return max(0.1, lease.denied_until - self._clock())
+            lease.used = 1
+            return None
+
+    def _take_local(self, key: str) -> Any:
+        """Spend a locally leased permit.
+
+        Returns:
+            None if a permit was taken, retry_after while a refusal stands,
+            or ``_NEEDS_LEASE`` if the lease is missing, used up or expired
+        """
+        lease = self._leases.get(key)
+        if lease is None:
+            return _NEEDS_LEASE
+        now = self._clock()
+        if now < lease.denied_until:
+            return lease.denied_until - now
+        if lease.used < lease.granted and now < lease.expires_at:
+            lease.used += 1
+            return None
+        return _NEEDS_LEASE
+
+    async def _renew(self, key: str, limit: int, window_seconds: float) -> _Lease:
+        """Return the unused permits of the current lease and lease a new block."""
+        old = self._leases.get(key)
+        returned = old.unused_members() if old is not None else []
+
+        now = self._clock()
+        lease_seconds = min(self.MAX_LEASE_SECONDS, window_seconds / 10)
+        requested = max(1, min(self._lease_size, limit // 10))
+        lease = _Lease(lease_id=str(uuid4()), expires_at=now + lease_seconds)
+
+        result = await self._redis_getter().eval(
+            LUA_LEASE_PERMITS,
+            1,  # Number of keys
+            key,  # KEYS[1]
+            limit,  # ARGV[1]
+            now - window_seconds,  # ARGV[2]
+            now,  # ARGV[3]
+            window_seconds,  # ARGV[4]
+            int(window_seconds * 2 + lease_seconds) + 1,  # ARGV[5]
+            lease.lease_id,  # ARGV[6]
+            requested,  # ARGV[7]
+            lease.expires_at,  # ARGV[8]
+            len(returned),  # ARGV[9]
+            *returned,  # ARGV[10..]
+        )
+
+        lease.granted = int(result[0])
+        if lease.granted == 0:
+            lease.denied_until = now + float(result[1])
+        lease.retain_until = max(lease.expires_at + window_seconds, lease.denied_until)
+        self._leases[key] = lease
+        self._prune(now)
+        return lease
+
+    def _prune(self, now: float) -> None:
+        """Drop leases and locks of keys idle past their retention.
+
+        Keys whose lock is held are kept, so a renewal in progress never
+        races a second renewal on a fresh lock.
+        """
+        if now < self._next_prune:
+            return
+        self._next_prune = now + self.PRUNE_INTERVAL_SECONDS
+
+        for key, lease in list(self._leases.items()):
+            lock = self._locks.get(key)
+            if now >= lease.retain_until and not (lock and lock.locked()):
+                del self._leases[key]
+                self._locks.pop(key, None)
+        # Locks left behind by a renewal that failed before storing a lease
+        for key, lock in list(self._locks.items()):
+            if key not in self._leases and not lock.locked():
+                del self._locks[key]
+
+
+class SourceRateLimiter:
+    """Distributed source rate limiter using Redis sliding window algorithm.
+
+    Enforces rate limits on external source API calls across horizontally scaled instances.
+    Counts stored in Redis sorted sets and spent through per-process permit
+    leases; configurations cached in process and invalidated over pub/sub.
+
+    Uses Lua scripts for atomic lease operations to prevent race conditions
+    when concurrent requests check limits simultaneously.
+    """
+
+    # Redis key prefixes
+    KEY_PREFIX = "source_rate_limit"
+    CONFIG_CACHE_PREFIX = "source_rate_limit_config"
+    CONFIG_CACHE_TTL = 300  # 5 minutes
+
+    # Pub/sub channel carrying "{org_id}:{source_short_name}" of changed configs
+    CONFIG_INVALIDATION_NAMESPACE = "source_rate_limit"
+    CONFIG_INVALIDATION_ID = "config_invalidation"
+    # Bounds staleness if an invalidation is missed (e.g. listener reconnecting)
+    LOCAL_CONFIG_TTL = 60
+    LISTENER_RETRY_SECONDS = 30
+
+    _permits = PermitPool()
+    _local_configs: Dict[Tuple[UUID, str], Tuple[float, Optional[dict]]] = {}
+    _local_levels: Dict[str, Optional[str]] = {}
+    _invalidation_listener: Optional[asyncio.Task] = None
+    _listener_retry_at = 0.0
+
     @staticmethod
     async def _get_source_rate_limit_level(source_short_name: str) -> Optional[str]:
-        """Get rate_limit_level from Source table (cached).
+        """Get rate_limit_level from the source registry (cached in process).
 
         Args:
             source_short_name: Source identifier
@@ -83,39 +271,33 @@ return {current_count + 1, 0}  -- Success, return new count
         Returns:
             "org", "connection", or None if source doesn't use rate limiting
         """
-        cache_key = f"source_metadata:{source_short_name}:rate_limit_level"
+        if source_short_name in SourceRateLimiter._local_levels:
+            return SourceRateLimiter._local_levels[source_short_name]
 
-        # Try cache first
-        try:
-            cached = await redis_client.client.get(cache_key)
-            if cached:
-                return cached if cached != "None" else None
-        except Exception:
-            pass
-
-        # Cache miss - fetch from source registry
         try:
             # [code blue] todo: inject source_registry via Inject() instead of container access
             from airweave.core import container as container_mod
 
             source_registry = container_mod.container.source_registry
-            entry = source_registry.get(source_short_name)
-            rate_limit_level = entry.rate_limit_level
-
-            # Cache for 10 minutes (source metadata rarely changes)
-            try:
-                await redis_client.client.setex(cache_key, 600, rate_limit_level or "None")
-            except Exception:
-                pass
-
-            return rate_limit_level
-
+            rate_limit_level = source_registry.get(source_short_name).rate_limit_level
         except KeyError:
-            return None
+            rate_limit_level = None
         except Exception as e:
             logger.error(f"Failed to fetch source metadata for {source_short_name}: {e}")
             return None
 
+        # The registry is built once per process, so the level never changes
+        SourceRateLimiter._local_levels[source_short_name] = rate_limit_level
+        return rate_limit_level
+
+    @staticmethod
+    def _get_pubsub() -> Optional[PubSub]:
+        """Return the container's PubSub adapter, or None before the container is built."""
+        from airweave.core import container as container_mod
+
+        container = container_mod.container
+        return container.pubsub if container else None
+
     @staticmethod
     def _get_redis_key(
         org_id: UUID,
@@ -167,7 +349,7 @@ return {current_count + 1, 0}  -- Success, return new count
         org_id: UUID,
         source_short_name: str,
     ) -> Optional[dict]:
-        """Get rate limit configuration from cache or database.
+        """Get rate limit configuration from the process cache, Redis or database.
 
         Gets ONE limit that applies to all users/connections of this source
         in the organization.
@@ -179,15 +361,30 @@ return {current_count + 1, 0}  -- Success, return new count
         Returns:
             Dict with 'limit' and 'window_seconds' if configured, None otherwise
         """
+        SourceRateLimiter._ensure_invalidation_listener()
+
+        local_key = (org_id, source_short_name)
+        cached = SourceRateLimiter._local_configs.get(local_key)
+        if cached is not None and time.monotonic() - cached[0] < SourceRateLimiter.LOCAL_CONFIG_TTL:
+            return cached[1]
+
+        config = await SourceRateLimiter._fetch_limit_config(org_id, source_short_name)
+        SourceRateLimiter._local_configs[local_key] = (time.monotonic(), config)
+        return config
+
+    @staticmethod
+    async def _fetch_limit_config(
+        org_id: UUID,
+        source_short_name: str,
+    ) -> Optional[dict]:
+        """Get rate limit configuration from the Redis cache or database."""
         cache_key = SourceRateLimiter._get_config_cache_key(org_id, source_short_name)
 
         # Try cache first
         try:
             cached = await redis_client.client.get(cache_key)
             if cached:
-                import json
-
-                return json.loads(cached)
+                return json.loads(cached) or None
         except Exception as e:
             logger.warning(f"Failed to get rate limit config from cache: {e}")
 
@@ -223,8 +420,6 @@ return {current_count + 1, 0}  -- Success, return new count
 
                 # Cache for next time
                 try:
-                    import json
-
                     await redis_client.client.setex(
                         cache_key,
                         SourceRateLimiter.CONFIG_CACHE_TTL,
@@ -239,6 +434,84 @@ return {current_count + 1, 0}  -- Success, return new count
             logger.error(f"Failed to fetch rate limit config from database: {e}")
             return None
 
+    @staticmethod
+    async def invalidate_config(org_id: UUID, source_short_name: str) -> None:
+        """Drop a changed limit config from every cache, on every pod.
+
+        Call after creating, updating or deleting a source rate limit.
+
+        Args:
+            org_id: Organization ID
+            source_short_name: Source identifier
+        """
+        SourceRateLimiter._local_configs.pop((org_id, source_short_name), None)
+        try:
+            await redis_client.client.delete(
+                SourceRateLimiter._get_config_cache_key(org_id, source_short_name)
+            )
+            pubsub = SourceRateLimiter._get_pubsub()
+            if pubsub is not None:
+                await pubsub.publish(
+                    SourceRateLimiter.CONFIG_INVALIDATION_NAMESPACE,
+                    SourceRateLimiter.CONFIG_INVALIDATION_ID,
+                    f"{org_id}:{source_short_name}",
+                )
+        except Exception as e:
+            logger.warning(f"Failed to invalidate rate limit config for {source_short_name}: {e}")
+
+    @staticmethod
+    def _ensure_invalidation_listener() -> None:
+        """Start this process's invalidation listener if it is not running."""
+        task = SourceRateLimiter._invalidation_listener
+        if task is not None and not task.done():
+            return
+        now = time.monotonic()
+        if now >= SourceRateLimiter._listener_retry_at:
+            SourceRateLimiter._listener_retry_at = now + SourceRateLimiter.LISTENER_RETRY_SECONDS
+            SourceRateLimiter._invalidation_listener = asyncio.create_task(
+                SourceRateLimiter._listen_for_invalidations()
+            )
+
+    @staticmethod
+    async def _listen_for_invalidations() -> None:
+        """Drop locally cached configs named on the invalidation channel.
+
+        Subscribes through the container's PubSub adapter. If the subscription
+        fails, the task ends and a later lookup restarts it (at most every
+        LISTENER_RETRY_SECONDS); LOCAL_CONFIG_TTL bounds staleness in the
+        meantime. The subscription's connection is released every time.
+        """
+        pubsub = SourceRateLimiter._get_pubsub()
+        if pubsub is None:
+            return
+
+        subscription: Optional[PubSubSubscription] = None
+        try:
+            subscription = await pubsub.subscribe(
+                SourceRateLimiter.CONFIG_INVALIDATION_NAMESPACE,
+                SourceRateLimiter.CONFIG_INVALIDATION_ID,
+            )
+            async for message in subscription.listen():
+                if message.get("type") != "message":
+                    continue
+                org_id, _, source_short_name = str(message["data"]).partition(":")
+                try:
+                    SourceRateLimiter._local_configs.pop((UUID(org_id), source_short_name), None)
+                except ValueError:
+                    continue
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"[SourceRateLimit] Config invalidation listener stopped: {e}")
+        finally:
+            if subscription is not None:
+                try:
+                    await subscription.close()
+                except Exception as e:
+                    logger.warning(
+                        f"[SourceRateLimit] Failed to close config invalidation subscription: {e}"
+                    )
+
     @staticmethod
     async def check_and_increment(
         org_id: UUID,
@@ -301,36 +574,10 @@ return {current_count + 1, 0}  -- Success, return new count
             org_id, source_short_name, rate_limit_level, source_connection_id
         )
 
-        current_time = time.time()
-        window_start = current_time - window_seconds
-        expire_seconds = window_seconds * 2
-
-        # Generate unique ID for this request (prevents ZADD collision at same timestamp)
-        from uuid import uuid4
-
-        unique_id = str(uuid4())
-
-        # Execute atomic Lua script for check-and-increment
-        # This prevents race conditions when concurrent requests check simultaneously
-        result = await redis_client.client.eval(
-            SourceRateLimiter.LUA_CHECK_AND_INCREMENT,
-            1,  # Number of keys
-            redis_key,  # KEYS[1]
-            limit,  # ARGV[1]
-            window_start,  # ARGV[2]
-            current_time,  # ARGV[3]
-            window_seconds,  # ARGV[4]
-            expire_seconds,  # ARGV[5]
-            unique_id,  # ARGV[6]
-        )
-
-        # result = [count, retry_after]
-        # If count == -1, we're over the limit
-        count_or_error = int(result[0])
-        retry_after = float(result[1])
+        # Step 4: Spend a locally leased permit (leases a new block when needed)
+        retry_after = await SourceRateLimiter._permits.acquire(redis_key, limit, window_seconds)
 
-        if count_or_error == -1:
-            # Over limit - Lua script calculated retry_after for us
+        if retry_after is not None:
             logger.warning(
                 f"Source rate limit exceeded for {source_short_name}. "
                 f"{limit}/{limit} requests in {window_seconds}s window, "
@@ -342,10 +589,8 @@ return {current_count + 1, 0}  -- Success, return new count
                 source_short_name=source_short_name,
             )
 
-        # Under limit - request was atomically incremented
-        new_count = count_or_error
         logger.debug(
-            f"[SourceRateLimit] ✅ Request allowed - {new_count}/{limit} "
+            f"[SourceRateLimit] ✅ Request allowed - limit {limit} "
             f"requests in window. org={org_id}, source={source_short_name}, "
             f"connection={source_connection_id}, rate_limit_level={rate_limit_level}, "
             f"window={window_seconds}s"
@@ -394,33 +639,9 @@ return {current_count + 1, 0}  -- Success, return new count
 
         redis_key = f"pipedream_proxy_rate_limit:{org_id}"
 
-        current_time = time.time()
-        window_start = current_time - window_seconds
-        expire_seconds = window_seconds * 2
-
-        # Generate unique ID for this request
-        from uuid import uuid4
-
-        unique_id = str(uuid4())
-
-        # Execute atomic Lua script for check-and-increment
-        result = await redis_client.client.eval(
-            SourceRateLimiter.LUA_CHECK_AND_INCREMENT,
-            1,  # Number of keys
-            redis_key,  # KEYS[1]
-            limit,  # ARGV[1]
-            window_start,  # ARGV[2]
-            current_time,  # ARGV[3]
-            window_seconds,  # ARGV[4]
-            expire_seconds,  # ARGV[5]
-            unique_id,  # ARGV[6]
-        )
-
-        # result = [count, retry_after]
-        count_or_error = int(result[0])
-        retry_after = float(result[1])
+        retry_after = await SourceRateLimiter._permits.acquire(redis_key, limit, window_seconds)
 
-        if count_or_error == -1:
+        if retry_after is not None:
             # Over limit
             logger.warning(
                 f"Pipedream proxy rate limit exceeded for org {org_id}. "
@@ -432,10 +653,8 @@ return {current_count + 1, 0}  -- Success, return new count
                 retry_after=retry_after, source_short_name="pipedream_proxy"
             )
 
-        # Under limit - request was atomically incremented
-        new_count = count_or_error
         logger.debug(
-            f"[PipedreamProxy] ✅ Request allowed - {new_count}/{limit} "
+            f"[PipedreamProxy] ✅ Request allowed - limit {limit} "
             f"requests in window. org={org_id}, window={window_seconds}s"
         )
 
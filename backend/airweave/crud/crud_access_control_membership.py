@@ -1,10 +1,11 @@
 """CRUD operations for access control memberships."""
 
-from typing import List
+from typing import List, Optional, Set
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from airweave.crud._base_organization import CRUDBaseOrganization
 from airweave.models.access_control_membership import AccessControlMembership
@@ -82,6 +83,68 @@ class CRUDAccessControlMembership(
         result = await db.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_group_closure(
+        self,
+        db: AsyncSession,
+        member_id: str,
+        member_type: str,
+        organization_id: UUID,
+        readable_collection_id: Optional[str] = None,
+        max_depth: int = 10,
+    ) -> Set[str]:
+        """Get every group a member belongs to, directly or through nested groups.
+
+        Resolves the transitive closure in a single recursive CTE instead of
+        one query per group. The first hop (the member's direct groups) is
+        optionally scoped to a collection's source connections; group-to-group
+        hops are organization-wide.
+
+        ``max_depth`` bounds nesting *levels* (direct groups are level 1).
+        Rows are deduplicated per (group, level), so cycles terminate and the
+        working set stays bounded by ``groups * max_depth``.
+
+        Args:
+            db: Database session
+            member_id: Member identifier (email for users, ID for groups)
+            member_type: "user" or "group"
+            organization_id: Organization ID for multi-tenant isolation
+            readable_collection_id: Optional collection readable_id to scope direct memberships
+            max_depth: Maximum number of nesting levels to follow
+
+        Returns:
+            Set of group IDs (direct + transitive)
+        """
+        from airweave.models.source_connection import SourceConnection
+
+        direct = select(
+            AccessControlMembership.group_id.label("group_id"),
+            literal(1).label("depth"),
+        ).where(
+            AccessControlMembership.organization_id == organization_id,
+            AccessControlMembership.member_id == member_id,
+            AccessControlMembership.member_type == member_type,
+        )
+        if readable_collection_id is not None:
+            direct = direct.join(
+                SourceConnection,
+                AccessControlMembership.source_connection_id == SourceConnection.id,
+            ).where(SourceConnection.readable_collection_id == readable_collection_id)
+
+        closure = direct.cte("group_closure", recursive=True)
+        parent = aliased(AccessControlMembership)
+        closure = closure.union(
+            select(parent.group_id, closure.c.depth + 1)
+            .join(closure, parent.member_id == closure.c.group_id)
+            .where(
+                parent.organization_id == organization_id,
+                parent.member_type == "group",
+                closure.c.depth < max_depth,
+            )
+        )
+
+        result = await db.execute(select(closure.c.group_id).distinct())
+        return set(result.scalars().all())
+
     async def bulk_create(
         self,
         db: AsyncSession,
@@ -1,11 +1,12 @@
 """CRUD operations for entities."""
 
 from datetime import datetime, timezone
-from typing import Optional
+from typing import NamedTuple, Optional
 from uuid import UUID
 
-from sqlalchemy import func, select, update
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import String, and_, column, func, literal, select, tuple_, update, values
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave.core.context import BaseContext
@@ -16,9 +17,23 @@ from airweave.models.entity import Entity
 from airweave.schemas.entity import EntityCreate, EntityUpdate
 
 
+class EntityIdHash(NamedTuple):
+    """Lightweight (id, hash) projection of an entity row."""
+
+    id: UUID
+    hash: str
+
+
 class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
     """CRUD operations for entities."""
 
+    # Rows per UPDATE ... FROM (VALUES ...) statement; 2 bind params per row
+    # keeps each statement well under the asyncpg 32767-parameter limit.
+    BULK_UPDATE_CHUNK_SIZE = 5_000
+
+    # Keys per unnest() lookup statement.
+    LOOKUP_CHUNK_SIZE = 5_000
+
     def __init__(self):
         """Initialize the CRUD object.
 
@@ -147,10 +162,8 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
         """Get many entities by (entity_id, sync_id, entity_definition_short_name).
 
         Handles multi-type entities correctly by including entity_definition_short_name
-        in the lookup.
-
-        For large datasets (>1000 entities), chunks requests to avoid
-        database timeouts from massive OR conditions.
+        in the lookup. Requests are joined against unnested key arrays, chunked at
+        ``LOOKUP_CHUNK_SIZE`` keys per statement.
 
         Args:
             db: Database session
@@ -160,35 +173,113 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
         Returns:
             Dict mapping (entity_id, entity_definition_short_name) -> Entity
         """
-        if not entity_requests:
-            return {}
+        result_map: dict[tuple[str, str], Entity] = {}
 
-        from sqlalchemy import and_, or_
+        for chunk in self._chunk_requests(entity_requests):
+            requested = self._requested_keys(chunk)
+            stmt = select(Entity).join(requested, self._matches_requested(requested))
+            result = await db.execute(stmt.where(Entity.sync_id == sync_id))
+            for row in result.unique().scalars().all():
+                result_map[(row.entity_id, row.entity_definition_short_name)] = row
 
-        CHUNK_SIZE = 1000
-        result_map: dict[tuple[str, str], Entity] = {}
+        return result_map
+
+    async def bulk_get_id_hash_by_entity_sync_and_definition(
+        self,
+        db: AsyncSession,
+        *,
+        sync_id: UUID,
+        entity_requests: list[tuple[str, str]],
+    ) -> dict[tuple[str, str], EntityIdHash]:
+        """Get (id, hash) for many entities by (entity_id, entity_definition_short_name).
 
-        for i in range(0, len(entity_requests), CHUNK_SIZE):
-            chunk = entity_requests[i : i + CHUNK_SIZE]
+        Same lookup as bulk_get_by_entity_sync_and_definition() but selects only
+        the columns action resolution needs instead of full ORM rows.
 
-            conditions = [
-                and_(
-                    Entity.entity_id == eid,
-                    Entity.entity_definition_short_name == short_name,
-                )
-                for eid, short_name in chunk
-            ]
+        Args:
+            db: Database session
+            sync_id: The sync ID to filter by
+            entity_requests: List of (entity_id, entity_definition_short_name) tuples
 
-            stmt = select(Entity).where(Entity.sync_id == sync_id, or_(*conditions))
+        Returns:
+            Dict mapping (entity_id, entity_definition_short_name) -> EntityIdHash
+        """
+        result_map: dict[tuple[str, str], EntityIdHash] = {}
 
+        for chunk in self._chunk_requests(entity_requests):
+            requested = self._requested_keys(chunk)
+            stmt = (
+                select(
+                    Entity.entity_id,
+                    Entity.entity_definition_short_name,
+                    Entity.id,
+                    Entity.hash,
+                )
+                .join(requested, self._matches_requested(requested))
+                .where(Entity.sync_id == sync_id)
+            )
             result = await db.execute(stmt)
-            rows = list(result.unique().scalars().all())
-
-            for row in rows:
-                result_map[(row.entity_id, row.entity_definition_short_name)] = row
+            for entity_id, short_name, db_id, entity_hash in result.all():
+                result_map[(entity_id, short_name)] = EntityIdHash(db_id, entity_hash)
 
         return result_map
 
+    async def get_id_hash_map_by_sync_id(
+        self,
+        db: AsyncSession,
+        sync_id: UUID,
+    ) -> dict[tuple[str, str], EntityIdHash]:
+        """Load the compact (entity_id, short_name) -> (id, hash) map for a whole sync.
+
+        Args:
+            db: Database session
+            sync_id: The sync ID to load
+
+        Returns:
+            Dict mapping (entity_id, entity_definition_short_name) -> EntityIdHash
+        """
+        stmt = select(
+            Entity.entity_id,
+            Entity.entity_definition_short_name,
+            Entity.id,
+            Entity.hash,
+        ).where(Entity.sync_id == sync_id)
+        result = await db.execute(stmt)
+        return {
+            (entity_id, short_name): EntityIdHash(db_id, entity_hash)
+            for entity_id, short_name, db_id, entity_hash in result.all()
+        }
+
+    def _chunk_requests(
+        self, entity_requests: list[tuple[str, str]]
+    ) -> list[list[tuple[str, str]]]:
+        """Split lookup keys into LOOKUP_CHUNK_SIZE chunks."""
+        size = self.LOOKUP_CHUNK_SIZE
+        return [entity_requests[i : i + size] for i in range(0, len(entity_requests), size)]
+
+    @staticmethod
+    def _requested_keys(chunk: list[tuple[str, str]]):
+        """Build ``unnest(:entity_ids, :short_names) AS requested(...)`` for a chunk.
+
+        Two array parameters replace the per-key OR chain, so the planner can
+        hash-join the keys against the (sync_id, entity_id, short_name) index.
+        """
+        return (
+            func.unnest(
+                literal([entity_id for entity_id, _ in chunk], ARRAY(String)),
+                literal([short_name for _, short_name in chunk], ARRAY(String)),
+            )
+            .table_valued(column("entity_id", String), column("short_name", String))
+            .render_derived(name="requested")
+        )
+
+    @staticmethod
+    def _matches_requested(requested):
+        return and_(
+            Entity.entity_id == requested.c.entity_id,
+            Entity.entity_definition_short_name == requested.c.short_name,
+        )
+
     def _get_org_id_from_context(self, ctx: BaseContext) -> UUID | None:
         """Attempt to extract organization ID from the API context."""
         # 1) Direct attributes
@@ -274,20 +365,38 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
         db: AsyncSession,
         *,
         rows: list[tuple[UUID, str]],
+        sync_job_id: Optional[UUID] = None,
     ) -> None:
         """Bulk update the 'hash' field for many entities.
 
+        Issues one ``UPDATE entity ... FROM (VALUES ...)`` statement per
+        ``BULK_UPDATE_CHUNK_SIZE`` rows instead of one statement per row, so an
+        update-heavy batch costs a single round trip.
+
         Args:
             db: The async database session.
             rows: list of tuples (entity_db_id, new_hash)
+            sync_job_id: If given, stamped on every updated row in the same pass.
         """
         if not rows:
             return
-        for entity_db_id, new_hash in rows:
+
+        set_values = {"modified_at": datetime.now(timezone.utc).replace(tzinfo=None)}
+        if sync_job_id is not None:
+            set_values["sync_job_id"] = sync_job_id
+
+        for start in range(0, len(rows), self.BULK_UPDATE_CHUNK_SIZE):
+            chunk = rows[start : start + self.BULK_UPDATE_CHUNK_SIZE]
+            new_hashes = values(
+                column("id", PG_UUID(as_uuid=True)),
+                column("hash", String),
+                name="new_hashes",
+            ).data(chunk)
             stmt = (
                 update(Entity)
-                .where(Entity.id == entity_db_id)
-                .values(hash=new_hash, modified_at=datetime.now(timezone.utc).replace(tzinfo=None))
+                .where(Entity.id == new_hashes.c.id)
+                .values(hash=new_hashes.c.hash, **set_values)
+                .execution_options(synchronize_session=False)
             )
             await db.execute(stmt)
 
@@ -359,6 +468,39 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
         result = await db.execute(stmt)
         return list(result.unique().scalars().all())
 
+    async def get_keys_page_by_sync_id(
+        self,
+        db: AsyncSession,
+        sync_id: UUID,
+        after: Optional[tuple[str, str]] = None,
+        limit: int = 10_000,
+    ) -> list[tuple[str, str]]:
+        """Get one keyset page of (entity_id, entity_definition_short_name) for a sync.
+
+        Only the two key columns are selected (no ORM rows), ordered to match the
+        (sync_id, entity_id, entity_definition_short_name) unique index so each page
+        is an index range scan. Pass the last key of the previous page as ``after``.
+
+        Args:
+            db: The database session
+            sync_id: The sync ID
+            after: Last (entity_id, entity_definition_short_name) already read, or None
+            limit: Maximum number of keys to return
+
+        Returns:
+            Up to ``limit`` keys; fewer means the scan is complete
+        """
+        stmt = select(Entity.entity_id, Entity.entity_definition_short_name).where(
+            Entity.sync_id == sync_id
+        )
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(Entity.entity_id, Entity.entity_definition_short_name) > tuple_(*after)
+            )
+        stmt = stmt.order_by(Entity.entity_id, Entity.entity_definition_short_name).limit(limit)
+        result = await db.execute(stmt)
+        return [(row[0], row[1]) for row in result.all()]
+
     async def get_latest_entity_time_for_job(
         self,
         db: AsyncSession,
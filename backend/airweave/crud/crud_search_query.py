@@ -1,9 +1,9 @@
 """CRUD operations for search query models."""
 
-from typing import List
+from typing import Any, Dict, List
 from uuid import UUID
 
-from sqlalchemy import and_, desc, select
+from sqlalchemy import and_, desc, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave.core.context import BaseContext
@@ -55,6 +55,26 @@ class CRUDSearchQuery(CRUDBaseOrganization[SearchQuery, SearchQueryCreate, Searc
         result = await db.execute(query)
         return list(result.unique().scalars().all())
 
+    async def create_many(self, db: AsyncSession, *, rows: List[Dict[str, Any]]) -> int:
+        """Insert search query records with a single multi-row INSERT and commit.
+
+        Unlike ``create``, rows are not bound to one auth context: each row must
+        carry its own ``organization_id`` and audit fields. Used by the
+        background search query writer, which batches records across requests.
+
+        Args:
+            db: Database session
+            rows: Column values of the search queries to insert
+
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+        await db.execute(insert(SearchQuery).values(rows))
+        await db.commit()
+        return len(rows)
+
 
 # Create singleton instance
 search_query = CRUDSearchQuery(SearchQuery)
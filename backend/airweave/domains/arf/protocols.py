@@ -64,7 +64,7 @@ class ArfReaderProtocol(Protocol):
         ...
 
     async def get_entity_count(self) -> int:
-        """Count entity files."""
+        """Count stored entities."""
         ...
 
     async def iter_entities(self) -> AsyncGenerator[BaseEntity, None]:
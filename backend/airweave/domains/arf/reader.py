@@ -6,8 +6,13 @@ for automatic replay when execution_config.behavior.replay_from_arf=True.
 Storage layout:
     raw/{sync_id}/
     ├── manifest.json
-    ├── entities/{entity_id}.json
+    ├── segments/{seq}-{token}.seg, .idx.json   (v2)
+    ├── entities/{entity_id}.json               (v1, until migrated)
     └── files/{entity_id}_{name}.{ext}
+
+v2 segments are streamed one object read per segment. v1 entity files that
+a sync has not migrated yet are read afterwards, skipping ids the segments
+already hold (an interrupted migration leaves both).
 """
 
 import asyncio
@@ -22,6 +27,7 @@ import aiofiles
 from airweave.core.logging import ContextualLogger
 from airweave.core.logging import logger as default_logger
 from airweave.domains.arf.protocols import ArfReaderProtocol
+from airweave.domains.arf.segments import SegmentStore
 from airweave.domains.storage.exceptions import StorageNotFoundError
 from airweave.domains.storage.paths import StoragePaths
 from airweave.domains.storage.protocols import StorageBackend
@@ -47,6 +53,7 @@ class ArfReader(ArfReaderProtocol):
         self.logger = logger or default_logger
         self.restore_files = restore_files
         self._temp_dir: Optional[Path] = None
+        self._segments: Optional[SegmentStore] = None
 
     # =========================================================================
     # Path helpers
@@ -61,6 +68,18 @@ class ArfReader(ArfReaderProtocol):
     def _entities_dir(self) -> str:
         return StoragePaths.arf_entities_dir(self.sync_id)
 
+    async def _get_segments(self) -> SegmentStore:
+        """Load the v2 segment index once (empty if unreadable)."""
+        if self._segments is None:
+            store = SegmentStore(self._storage, self.sync_id)
+            try:
+                await store.load()
+            except Exception as e:
+                self.logger.warning(f"Failed to load ARF segments for sync {self.sync_id}: {e}")
+                store = SegmentStore(self._storage, self.sync_id)
+            self._segments = store
+        return self._segments
+
     # =========================================================================
     # Reading operations
     # =========================================================================
@@ -85,7 +104,7 @@ class ArfReader(ArfReaderProtocol):
             return False
 
     async def list_entity_files(self) -> List[str]:
-        """List all entity JSON file paths."""
+        """List all v1 entity JSON file paths."""
         entities_dir = self._entities_dir()
         try:
             files = await self._storage.list_files(entities_dir)
@@ -94,19 +113,35 @@ class ArfReader(ArfReaderProtocol):
             return []
 
     async def get_entity_count(self) -> int:
-        """Count entities in ARF storage."""
+        """Count entities in ARF storage (segment records plus v1 files)."""
+        segments = await self._get_segments()
         entities_dir = self._entities_dir()
         try:
-            return await self._storage.count_files(entities_dir, pattern="*.json")
+            legacy = await self._storage.count_files(entities_dir, pattern="*.json")
         except Exception:
-            return 0
+            legacy = 0
+        return len(segments) + legacy
 
     async def iter_entity_dicts(self, batch_size: int = 50) -> AsyncGenerator[Dict[str, Any], None]:
-        """Iterate over raw entity dicts with batched concurrent reads."""
+        """Iterate over raw entity dicts.
+
+        Segments are streamed first; v1 files are then read in concurrent
+        batches of ``batch_size``.
+        """
         if batch_size <= 0:
             raise ValueError(f"batch_size must be positive, got {batch_size}")
 
+        segments = await self._get_segments()
+        if len(segments):
+            self.logger.info(
+                f"Streaming {len(segments)} entities from {segments.segment_count} ARF segments"
+            )
+            async for _, entity_dict in segments.iter_records():
+                yield entity_dict
+
         entity_files = await self.list_entity_files()
+        if not entity_files:
+            return
         total_batches = (len(entity_files) + batch_size - 1) // batch_size
         self.logger.info(
             f"Reading {len(entity_files)} entity files in {total_batches} concurrent batches "
@@ -122,7 +157,7 @@ class ArfReader(ArfReaderProtocol):
             for idx, result in enumerate(results):
                 if isinstance(result, Exception):
                     self.logger.warning(f"Failed to read entity from {batch[idx]}: {result}")
-                else:
+                elif str(result.get("entity_id")) not in segments:
                     yield result
 
     # =========================================================================
@@ -199,7 +234,7 @@ class ArfReader(ArfReaderProtocol):
             self.logger.warning(f"Could not read manifest: {e}")
 
         entity_count = await self.get_entity_count()
-        self.logger.info(f"Found {entity_count} entity files to replay")
+        self.logger.info(f"Found {entity_count} entities to replay")
 
         async for entity_dict in self.iter_entity_dicts():
             try:
@@ -79,7 +79,7 @@ class ArfReplaySource(BaseSource):
         )
 
     async def generate_entities(self) -> AsyncGenerator[BaseEntity, None]:
-        """Generate entities from ARF storage."""
+        """Generate entities from ARF storage, streamed segment by segment."""
         self.logger.info(f"ARF Replay: Reading entities from sync {self.sync_id}")
         async for entity in self.reader.iter_entities():
             yield entity
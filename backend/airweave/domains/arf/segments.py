@@ -0,0 +1,461 @@
+"""ARF v2 segment store.
+
+ARF v1 stored every raw entity as its own ``entities/{entity_id}.json``
+object, so capture cost several object operations per entity and replay
+listed and read millions of small objects. v2 packs entities into
+immutable, append-only segments:
+
+    raw/{sync_id}/segments/
+    ├── {seq}-{token}.seg        records: MAGIC, then (>I length, zlib(JSON))*
+    └── {seq}-{token}.idx.json   sidecar: entity_id -> [offset, length, stored_file]
+                                 plus ids deleted by this write (tombstones)
+
+Each write appends one segment and its sidecar; a sidecar is written after
+its segment, so a segment without a sidecar (interrupted write) is ignored.
+Sidecars are applied in sequence order to build the live index, later
+records and tombstones overriding earlier ones.
+
+Superseded records are reclaimed by compaction: small segments are merged
+once enough of them pile up, and everything is rewritten once dead records
+outnumber live ones. New segments are written before old ones are deleted,
+so an interrupted compaction only leaves duplicates that the index
+resolves.
+
+Other processes may write to the same sync (a later sync job on another
+pod), so a cached index goes stale. :meth:`SegmentStore.refresh` re-lists
+the sidecars and applies the ones it has not seen, and every mutation
+refreshes first. The next sequence number therefore always comes from the
+storage listing rather than from memory. The random token in each name
+keeps two truly concurrent writers from overwriting each other's files.
+
+Record payloads are the same dicts v1 stored, so reconstruction is shared
+by both formats. v1 entity files are imported on the first write to a sync
+(:meth:`SegmentStore.migrate_legacy`); readers serve them until then.
+"""
+
+import asyncio
+import json
+import struct
+import uuid
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from airweave.core.logging import logger
+from airweave.domains.storage.paths import StoragePaths
+from airweave.domains.storage.protocols import StorageBackend
+
+FORMAT_VERSION = 2
+
+_MAGIC = b"ARF2"
+_LENGTH = struct.Struct(">I")
+_COMPRESSION_LEVEL = 6
+_INDEX_SUFFIX = ".idx.json"
+
+
+class SegmentLocation(NamedTuple):
+    """Where the live record of an entity is stored."""
+
+    segment: str
+    offset: int
+    length: int
+    stored_file: Optional[str]
+
+
+@dataclass
+class _SegmentInfo:
+    """Sidecar summary kept in memory for compaction decisions."""
+
+    has_records: bool
+    record_count: int
+    deleted: List[str] = field(default_factory=list)
+
+
+def encode_segment(records: List[Tuple[str, Dict[str, Any]]]) -> Tuple[bytes, Dict[str, list]]:
+    """Encode records into segment bytes and their sidecar entries.
+
+    Args:
+        records: ``(entity_id, entity_dict)`` pairs with unique ids.
+
+    Returns:
+        Segment bytes and ``entity_id -> [offset, length, stored_file]``.
+    """
+    parts = [_MAGIC]
+    entries: Dict[str, list] = {}
+    offset = len(_MAGIC)
+    for entity_id, entity_dict in records:
+        payload = zlib.compress(
+            json.dumps(entity_dict, separators=(",", ":")).encode("utf-8"), _COMPRESSION_LEVEL
+        )
+        parts.append(_LENGTH.pack(len(payload)))
+        parts.append(payload)
+        entries[entity_id] = [offset, len(payload), entity_dict.get("__stored_file__")]
+        offset += _LENGTH.size + len(payload)
+    return b"".join(parts), entries
+
+
+def decode_record(data: bytes, offset: int, length: int) -> Dict[str, Any]:
+    """Decode the record at ``offset`` of a segment.
+
+    Raises:
+        ValueError: If the segment or record is malformed.
+    """
+    if data[: len(_MAGIC)] != _MAGIC:
+        raise ValueError("Not an ARF v2 segment")
+    (stored_length,) = _LENGTH.unpack_from(data, offset)
+    if stored_length != length:
+        raise ValueError(f"Record length mismatch at offset {offset}")
+    start = offset + _LENGTH.size
+    return json.loads(zlib.decompress(data[start : start + length]))
+
+
+class SegmentStore:
+    """Index and segment I/O for one sync's ARF v2 data.
+
+    Mutations (and :meth:`refresh`) must hold :attr:`lock`; reads work on a
+    snapshot of the index.
+    """
+
+    # Records per segment written by compaction and migration
+    SEGMENT_MAX_RECORDS = 5000
+    # Segments below this many records count as small
+    SMALL_SEGMENT_RECORDS = SEGMENT_MAX_RECORDS // 4
+    # Small segments merged together once this many exist
+    MERGE_FANIN = 32
+    # Full rewrite once dead records outnumber live ones (and at least this many)
+    COMPACT_MIN_DEAD = 1000
+    # Concurrent object reads when loading sidecars or legacy files
+    READ_CONCURRENCY = 32
+
+    def __init__(self, storage: StorageBackend, sync_id: Any) -> None:
+        """Initialize an unloaded store (call :meth:`load` before use)."""
+        self.sync_id = str(sync_id)
+        self.lock = asyncio.Lock()
+        self._storage = storage
+        self._index: Dict[str, SegmentLocation] = {}
+        self._segments: Dict[str, _SegmentInfo] = {}
+        # Sidecar names already applied (or skipped as unreadable)
+        self._seen: set[str] = set()
+        self._next_seq = 0
+        self.legacy_migrated = False
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """Number of live entities."""
+        return len(self._index)
+
+    def __contains__(self, entity_id: object) -> bool:
+        """Whether ``entity_id`` has a live record."""
+        return entity_id in self._index
+
+    def get(self, entity_id: str) -> Optional[SegmentLocation]:
+        """Location of the live record of ``entity_id``, if any."""
+        return self._index.get(entity_id)
+
+    def entity_ids(self) -> List[str]:
+        """Ids of all live entities."""
+        return list(self._index)
+
+    @property
+    def segment_count(self) -> int:
+        """Number of sidecars (segments plus tombstone-only writes)."""
+        return len(self._segments)
+
+    @property
+    def dead_records(self) -> int:
+        """Stored records that are superseded or deleted."""
+        return sum(info.record_count for info in self._segments.values()) - len(self._index)
+
+    async def load(self) -> None:
+        """Build the live index from the sidecars in storage."""
+        names = await self._list_sidecars()
+        self._index.clear()
+        self._segments.clear()
+        self._seen.clear()
+        await self._apply_sidecars(names)
+        self._next_seq = max((_sequence_of(name) for name in names), default=-1) + 1
+
+    async def refresh(self) -> None:
+        """Catch up with sidecars written by other processes since the last load.
+
+        New sidecars that sort after everything applied so far are applied
+        incrementally. If a known sidecar disappeared (compacted elsewhere) or
+        a new one sorts before an applied one, the index is rebuilt instead.
+        """
+        names = await self._list_sidecars()
+        listed = set(names)
+        new = [name for name in names if name not in self._seen]
+        if (self._seen - listed) or (new and self._seen and new[0] < max(self._seen)):
+            await self.load()
+            return
+        await self._apply_sidecars(new)
+        listed_next = max((_sequence_of(name) for name in names), default=-1) + 1
+        self._next_seq = max(self._next_seq, listed_next)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    async def append(
+        self,
+        records: List[Tuple[str, Dict[str, Any]]],
+        deleted: Iterable[str] = (),
+    ) -> Dict[str, SegmentLocation]:
+        """Append records and tombstones as one segment write.
+
+        Args:
+            records: ``(entity_id, entity_dict)`` pairs; the last of duplicate ids wins.
+            deleted: Entity ids to delete.
+
+        Returns:
+            Previous locations of the written or deleted ids that were live.
+        """
+        await self.refresh()
+        unique = list(dict(records).items())
+        tombstones = [eid for eid in dict.fromkeys(deleted) if eid in self._index]
+        previous = {
+            eid: self._index[eid]
+            for eid in [eid for eid, _ in unique] + tombstones
+            if eid in self._index
+        }
+        if not unique and not tombstones:
+            return previous
+
+        await self._write(unique, tombstones)
+        await self._maybe_compact()
+        return previous
+
+    async def migrate_legacy(self) -> int:
+        """Import v1 entity files into segments, then delete them.
+
+        Ids that already have a v2 record keep it. Safe to re-run after an
+        interruption.
+
+        Returns:
+            Number of v1 entities imported.
+        """
+        await self.refresh()
+        entities_dir = StoragePaths.arf_entities_dir(self.sync_id)
+        paths = sorted(
+            p for p in await self._storage.list_files(entities_dir) if p.endswith(".json")
+        )
+        imported = 0
+        pending: List[Tuple[str, Dict[str, Any]]] = []
+        for start in range(0, len(paths), self.READ_CONCURRENCY):
+            batch = paths[start : start + self.READ_CONCURRENCY]
+            results = await asyncio.gather(
+                *(self._storage.read_json(path) for path in batch), return_exceptions=True
+            )
+            for path, result in zip(batch, results, strict=True):
+                if not isinstance(result, dict) or "entity_id" not in result:
+                    logger.warning(f"[ARF] Skipping unreadable v1 entity {path}: {result}")
+                    continue
+                entity_id = str(result["entity_id"])
+                if entity_id not in self._index:
+                    pending.append((entity_id, result))
+            if len(pending) >= self.SEGMENT_MAX_RECORDS:
+                await self._write(pending, [])
+                imported += len(pending)
+                pending = []
+        if pending:
+            await self._write(pending, [])
+            imported += len(pending)
+
+        if paths:
+            await self._storage.delete(entities_dir)
+            logger.info(f"[ARF] Migrated {imported} v1 entities of sync {self.sync_id} to v2")
+        self.legacy_migrated = True
+        return imported
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    async def read(self, entity_id: str) -> Optional[Dict[str, Any]]:
+        """Read the live record of ``entity_id`` (one segment read)."""
+        location = self._index.get(entity_id)
+        if location is None:
+            return None
+        data = await self._storage.read_file(
+            StoragePaths.arf_segment_path(self.sync_id, location.segment)
+        )
+        return decode_record(data, location.offset, location.length)
+
+    async def iter_records(self) -> AsyncGenerator[Tuple[str, Dict[str, Any]], None]:
+        """Stream live ``(entity_id, entity_dict)`` pairs, one segment read at a time.
+
+        The next segment is fetched while the current one is decoded.
+        Unreadable segments are logged and skipped.
+        """
+        by_segment: Dict[str, List[Tuple[int, int, str]]] = {}
+        for entity_id, location in self._index.items():
+            by_segment.setdefault(location.segment, []).append(
+                (location.offset, location.length, entity_id)
+            )
+        names = sorted(by_segment)
+        if not names:
+            return
+
+        fetch = asyncio.ensure_future(self._read_segment(names[0]))
+        try:
+            for position, name in enumerate(names):
+                data = await fetch
+                if position + 1 < len(names):
+                    fetch = asyncio.ensure_future(self._read_segment(names[position + 1]))
+                if data is None:
+                    continue
+                for offset, length, entity_id in sorted(by_segment[name]):
+                    try:
+                        yield entity_id, decode_record(data, offset, length)
+                    except Exception as e:
+                        logger.warning(f"[ARF] Corrupt record {entity_id} in {name}: {e}")
+        finally:
+            if not fetch.done():
+                fetch.cancel()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    async def _list_sidecars(self) -> List[str]:
+        """Sorted names (without suffix) of the sidecars in storage."""
+        files = await self._storage.list_files(StoragePaths.arf_segments_dir(self.sync_id))
+        return sorted(
+            path.rsplit("/", 1)[-1][: -len(_INDEX_SUFFIX)]
+            for path in files
+            if path.endswith(_INDEX_SUFFIX)
+        )
+
+    async def _apply_sidecars(self, names: List[str]) -> None:
+        """Read and apply sidecars in the given (storage) order."""
+        sidecars: List[Any] = []
+        for start in range(0, len(names), self.READ_CONCURRENCY):
+            batch = names[start : start + self.READ_CONCURRENCY]
+            sidecars.extend(
+                await asyncio.gather(
+                    *(
+                        self._storage.read_json(
+                            StoragePaths.arf_segment_index_path(self.sync_id, name)
+                        )
+                        for name in batch
+                    ),
+                    return_exceptions=True,
+                )
+            )
+        for name, sidecar in zip(names, sidecars, strict=True):
+            self._seen.add(name)
+            if not isinstance(sidecar, dict):
+                logger.warning(f"[ARF] Skipping unreadable sidecar {name}: {sidecar}")
+                continue
+            self._apply(name, sidecar)
+
+    def _apply(self, name: str, sidecar: Dict[str, Any]) -> None:
+        records = sidecar.get("records") or {}
+        deleted = list(sidecar.get("deleted") or [])
+        for entity_id in deleted:
+            self._index.pop(entity_id, None)
+        for entity_id, (offset, length, stored_file) in records.items():
+            self._index[entity_id] = SegmentLocation(name, offset, length, stored_file)
+        self._segments[name] = _SegmentInfo(
+            has_records=bool(sidecar.get("segment")),
+            record_count=len(records),
+            deleted=deleted,
+        )
+
+    async def _write(self, records: List[Tuple[str, Dict[str, Any]]], deleted: List[str]) -> str:
+        name = f"{self._next_seq:010d}-{uuid.uuid4().hex[:8]}"
+        self._next_seq += 1
+        entries: Dict[str, list] = {}
+        if records:
+            data, entries = encode_segment(records)
+            await self._storage.write_file(StoragePaths.arf_segment_path(self.sync_id, name), data)
+        sidecar = {
+            "version": FORMAT_VERSION,
+            "segment": f"{name}.seg" if records else None,
+            "records": entries,
+            "deleted": deleted,
+        }
+        await self._storage.write_json(
+            StoragePaths.arf_segment_index_path(self.sync_id, name), sidecar
+        )
+        self._seen.add(name)
+        self._apply(name, sidecar)
+        return name
+
+    async def _read_segment(self, name: str) -> Optional[bytes]:
+        try:
+            return await self._storage.read_file(StoragePaths.arf_segment_path(self.sync_id, name))
+        except Exception as e:
+            logger.warning(f"[ARF] Failed to read segment {name} of sync {self.sync_id}: {e}")
+            return None
+
+    async def _maybe_compact(self) -> None:
+        dead = self.dead_records
+        if dead >= self.COMPACT_MIN_DEAD and dead > len(self._index):
+            await self._rewrite(list(self._segments), full=True)
+            return
+        small = [
+            name
+            for name, info in self._segments.items()
+            if info.record_count < self.SMALL_SEGMENT_RECORDS
+        ]
+        if len(small) >= self.MERGE_FANIN:
+            await self._rewrite(small, full=False)
+
+    async def _rewrite(self, names: List[str], full: bool) -> None:
+        """Rewrite the live records of ``names`` into new segments, then drop them.
+
+        A partial rewrite carries the tombstones of the dropped sidecars
+        forward, since older kept segments may still hold those records.
+        """
+        dropped = set(names)
+        tombstones: List[str] = []
+        if not full:
+            tombstones = list(
+                dict.fromkeys(
+                    eid
+                    for name in names
+                    for eid in self._segments[name].deleted
+                    if eid not in self._index
+                )
+            )
+
+        live: Dict[str, List[Tuple[int, int, str]]] = {}
+        for entity_id, location in self._index.items():
+            if location.segment in dropped:
+                live.setdefault(location.segment, []).append(
+                    (location.offset, location.length, entity_id)
+                )
+
+        pending: List[Tuple[str, Dict[str, Any]]] = []
+        for name in sorted(live):
+            data = await self._storage.read_file(StoragePaths.arf_segment_path(self.sync_id, name))
+            for offset, length, entity_id in sorted(live[name]):
+                pending.append((entity_id, decode_record(data, offset, length)))
+            while len(pending) >= self.SEGMENT_MAX_RECORDS:
+                chunk = pending[: self.SEGMENT_MAX_RECORDS]
+                pending = pending[self.SEGMENT_MAX_RECORDS :]
+                await self._write(chunk, [])
+        if pending or tombstones:
+            await self._write(pending, tombstones)
+
+        for name in names:
+            info = self._segments.pop(name)
+            self._seen.discard(name)
+            if info.has_records:
+                await self._storage.delete(StoragePaths.arf_segment_path(self.sync_id, name))
+            await self._storage.delete(StoragePaths.arf_segment_index_path(self.sync_id, name))
+        logger.debug(
+            f"[ARF] Compacted {len(names)} segments of sync {self.sync_id} "
+            f"({'full' if full else 'merge'}, {len(self._index)} live records)"
+        )
+
+
+def _sequence_of(name: str) -> int:
+    try:
+        return int(name.split("-", 1)[0])
+    except ValueError:
+        return -1
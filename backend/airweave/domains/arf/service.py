@@ -1,23 +1,29 @@
 """ARF service for entity capture and retrieval.
 
-Stores raw entities during sync with entity-level granularity.
+Stores raw entities during sync in append-only segments (ARF v2, see
+``segments.py``): each batch is one segment write plus its sidecar index,
+instead of several object operations per entity.
 Supports full syncs, incremental syncs, manifest management, and replay stats.
 
 Storage layout:
     raw/{sync_id}/
     ├── manifest.json
-    ├── entities/{entity_id}.json
+    ├── segments/{seq}-{token}.seg, .idx.json
+    ├── entities/{entity_id}.json     (v1, migrated on first write)
     └── files/{entity_id}_{name}.{ext}
 """
 
 import asyncio
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, Iterable, List, Optional, Tuple
 
 import aiofiles
 
 from airweave.domains.arf.protocols import ArfServiceProtocol
+from airweave.domains.arf.reader import ArfReader
+from airweave.domains.arf.segments import SegmentStore
 from airweave.domains.arf.types import SyncManifest
 from airweave.domains.storage.exceptions import StorageNotFoundError
 from airweave.domains.storage.paths import StoragePaths
@@ -34,9 +40,14 @@ class ArfService(ArfServiceProtocol):
     All storage I/O is delegated to the injected StorageBackend.
     """
 
+    # Segment indexes kept in memory (least recently used dropped; reloaded on demand)
+    MAX_OPEN_STORES = 32
+
     def __init__(self, storage: StorageBackend) -> None:
         """Initialize with injected storage backend."""
         self._storage = storage
+        self._stores: "OrderedDict[str, SegmentStore]" = OrderedDict()
+        self._open_lock = asyncio.Lock()
 
     # =========================================================================
     # Path helpers (delegated to StoragePaths)
@@ -85,26 +96,11 @@ class ArfService(ArfServiceProtocol):
         entity_dict["__captured_at__"] = datetime.now(timezone.utc).isoformat()
         return entity_dict
 
-    # =========================================================================
-    # Core operations
-    # =========================================================================
-
-    async def upsert_entity(self, entity: BaseEntity, sync_context: SyncContext) -> None:
-        """Store or update a single entity."""
-        sync_id = str(sync_context.sync.id)
+    async def _build_record(
+        self, entity: BaseEntity, sync_id: str, sync_context: SyncContext
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Serialize an entity, copying its file attachment to storage if present."""
         entity_id = str(entity.entity_id)
-        entity_path = self._entity_path(sync_id, entity_id)
-
-        is_update = await self._storage.exists(entity_path)
-        if is_update:
-            try:
-                old_entity = await self._storage.read_json(entity_path)
-                old_file = old_entity.get("__stored_file__")
-                if old_file:
-                    await self._storage.delete(old_file)
-            except Exception:
-                pass
-
         entity_dict = self._serialize_entity(entity)
 
         if self._is_file_entity(entity) and hasattr(entity, "local_path"):
@@ -120,76 +116,133 @@ class ArfService(ArfServiceProtocol):
                 except Exception as e:
                     sync_context.logger.warning(f"Could not store file for {entity_id}: {e}")
 
-        await self._storage.write_json(entity_path, entity_dict)
+        return entity_id, entity_dict
+
+    async def _delete_stored_files(self, paths: Iterable[str]) -> None:
+        for path in paths:
+            try:
+                await self._storage.delete(path)
+            except Exception:
+                pass
+
+    # =========================================================================
+    # Segment stores
+    # =========================================================================
+
+    async def _get_store(self, sync_id: str, for_write: bool = False) -> SegmentStore:
+        """Return the loaded segment store of a sync (cached per process).
+
+        Other processes write to the same syncs, so a cached index is
+        refreshed from the sidecar listing before it serves reads. Writers
+        skip that here because ``SegmentStore.append`` refreshes under the
+        store lock anyway; they import any v1 entity files first, so the
+        write path only ever deals with segments.
+        """
+        async with self._open_lock:
+            store = self._stores.get(sync_id)
+            if store is None:
+                store = SegmentStore(self._storage, sync_id)
+                await store.load()
+                self._stores[sync_id] = store
+                if len(self._stores) > self.MAX_OPEN_STORES:
+                    self._stores.popitem(last=False)
+                refresh = False
+            else:
+                self._stores.move_to_end(sync_id)
+                refresh = not for_write
+
+        if refresh:
+            async with store.lock:
+                await store.refresh()
+
+        if for_write and not store.legacy_migrated:
+            async with store.lock:
+                if not store.legacy_migrated:
+                    await store.migrate_legacy()
+        return store
+
+    # =========================================================================
+    # Core operations
+    # =========================================================================
+
+    async def upsert_entity(self, entity: BaseEntity, sync_context: SyncContext) -> None:
+        """Store or update a single entity."""
+        await self.upsert_entities([entity], sync_context)
 
     _UPSERT_BATCH_SIZE: int = 50
 
     async def upsert_entities(self, entities: List[BaseEntity], sync_context: SyncContext) -> int:
-        """Store or update multiple entities, batched with asyncio.gather."""
-        total = len(entities)
-        for start in range(0, total, self._UPSERT_BATCH_SIZE):
-            batch = entities[start : start + self._UPSERT_BATCH_SIZE]
-            await asyncio.gather(*(self.upsert_entity(e, sync_context) for e in batch))
-        return total
+        """Store or update multiple entities as one appended segment.
 
-    async def delete_entity(self, entity_id: str, sync_context: SyncContext) -> bool:
-        """Delete an entity and its associated files."""
+        File attachments are copied with bounded concurrency first; stored
+        files that an update no longer references are deleted afterwards.
+        """
+        if not entities:
+            return 0
         sync_id = str(sync_context.sync.id)
-        entity_path = self._entity_path(sync_id, entity_id)
+        store = await self._get_store(sync_id, for_write=True)
 
-        if not await self._storage.exists(entity_path):
-            return False
+        records = []
+        for start in range(0, len(entities), self._UPSERT_BATCH_SIZE):
+            batch = entities[start : start + self._UPSERT_BATCH_SIZE]
+            records.extend(
+                await asyncio.gather(*(self._build_record(e, sync_id, sync_context) for e in batch))
+            )
 
-        try:
-            entity_dict = await self._storage.read_json(entity_path)
-            stored_file = entity_dict.get("__stored_file__")
-            if stored_file:
-                await self._storage.delete(stored_file)
-        except Exception:
-            pass
+        async with store.lock:
+            previous = await store.append(records)
 
-        deleted = await self._storage.delete(entity_path)
-        if deleted:
-            sync_context.logger.debug(f"Deleted ARF entity: {entity_id}")
-        return deleted
+        new_files = {entity_id: record.get("__stored_file__") for entity_id, record in records}
+        await self._delete_stored_files(
+            location.stored_file
+            for entity_id, location in previous.items()
+            if location.stored_file and location.stored_file != new_files.get(entity_id)
+        )
+        return len(entities)
+
+    async def delete_entity(self, entity_id: str, sync_context: SyncContext) -> bool:
+        """Delete an entity and its associated files."""
+        return await self.delete_entities([entity_id], sync_context) > 0
 
     async def delete_entities(self, entity_ids: List[str], sync_context: SyncContext) -> int:
-        """Delete multiple entities."""
-        deleted_count = 0
-        for entity_id in entity_ids:
-            if await self.delete_entity(entity_id, sync_context):
-                deleted_count += 1
-        return deleted_count
+        """Delete multiple entities with one tombstone write."""
+        if not entity_ids:
+            return 0
+        store = await self._get_store(str(sync_context.sync.id), for_write=True)
+        async with store.lock:
+            previous = await store.append([], deleted=entity_ids)
+
+        await self._delete_stored_files(
+            location.stored_file for location in previous.values() if location.stored_file
+        )
+        if previous:
+            sync_context.logger.debug(f"Deleted {len(previous)} ARF entities")
+        return len(previous)
 
     async def get_entity(self, sync_id: str, entity_id: str) -> Optional[Dict[str, Any]]:
         """Get a single entity by ID."""
-        entity_path = self._entity_path(sync_id, entity_id)
+        store = await self._get_store(sync_id)
+        if entity_id in store:
+            try:
+                return await store.read(entity_id)
+            except StorageNotFoundError:
+                # Segment compacted by another process since the refresh
+                async with store.lock:
+                    await store.load()
+                return await store.read(entity_id)
+        # Not yet migrated v1 store
         try:
-            return await self._storage.read_json(entity_path)
+            return await self._storage.read_json(self._entity_path(sync_id, entity_id))
         except StorageNotFoundError:
             return None
 
     async def iter_entities(
         self, sync_id: str, batch_size: int = 50
     ) -> AsyncGenerator[Dict[str, Any], None]:
-        """Iterate over all entity dicts with batched concurrent reads."""
-        entities_dir = f"{self._sync_path(sync_id)}/entities"
-        try:
-            files = await self._storage.list_files(entities_dir)
-        except Exception:
-            return
-
-        json_files = [f for f in files if f.endswith(".json")]
-
-        for i in range(0, len(json_files), batch_size):
-            batch = json_files[i : i + batch_size]
-            results = await asyncio.gather(
-                *[self._storage.read_json(file_path) for file_path in batch],
-                return_exceptions=True,
-            )
-            for result in results:
-                if not isinstance(result, Exception):
-                    yield result
+        """Iterate over all entity dicts (segment by segment, then any v1 files)."""
+        reader = ArfReader(sync_id=sync_id, storage=self._storage, restore_files=False)
+        async for entity_dict in reader.iter_entity_dicts(batch_size=batch_size):
+            yield entity_dict
 
     # =========================================================================
     # Full sync support
@@ -198,38 +251,23 @@ class ArfService(ArfServiceProtocol):
     async def cleanup_stale_entities(self, sync_context: SyncContext, runtime: SyncRuntime) -> int:
         """Delete entities not seen during the current sync.
 
-        Uses filename comparison (single list_files call) instead of
-        reading every entity JSON to extract entity_id.
+        Staleness is decided from the in-memory segment index; no entity
+        records are read.
         """
         sync_id = str(sync_context.sync.id)
-        seen_ids = runtime.entity_tracker.get_all_encountered_ids_flat()
-
-        entities_dir = StoragePaths.arf_entities_dir(sync_id)
         try:
-            stored_files = await self._storage.list_files(entities_dir)
+            store = await self._get_store(sync_id, for_write=True)
+            async with store.lock:
+                await store.refresh()
         except Exception:
             return 0
 
-        stored_json = {f for f in stored_files if f.endswith(".json")}
-        seen_paths = {self._entity_path(sync_id, eid) for eid in seen_ids}
-        stale_paths = stored_json - seen_paths
-
-        if not stale_paths:
+        stale_ids = list(runtime.entity_tracker.filter_unencountered(store.entity_ids()))
+        if not stale_ids:
             return 0
 
-        sync_context.logger.info(f"Cleaning up {len(stale_paths)} stale entities from ARF store")
-        deleted = 0
-        for path in stale_paths:
-            try:
-                entity_dict = await self._storage.read_json(path)
-                stored_file = entity_dict.get("__stored_file__")
-                if stored_file:
-                    await self._storage.delete(stored_file)
-            except Exception:
-                pass
-            if await self._storage.delete(path):
-                deleted += 1
-        return deleted
+        sync_context.logger.info(f"Cleaning up {len(stale_ids)} stale entities from ARF store")
+        return await self.delete_entities(stale_ids, sync_context)
 
     # =========================================================================
     # Manifest management
@@ -291,13 +329,20 @@ class ArfService(ArfServiceProtocol):
 
     async def delete_sync(self, sync_id: str) -> bool:
         """Delete entire ARF store for a sync."""
+        async with self._open_lock:
+            self._stores.pop(sync_id, None)
         return await self._storage.delete(self._sync_path(sync_id))
 
     async def get_entity_count(self, sync_id: str) -> int:
-        """Count entities in store."""
-        entities_dir = f"{self._sync_path(sync_id)}/entities"
+        """Count entities in store (live segment records plus unmigrated v1 files)."""
         try:
-            return await self._storage.count_files(entities_dir, pattern="*.json")
+            store = await self._get_store(sync_id)
+            legacy = 0
+            if not store.legacy_migrated:
+                legacy = await self._storage.count_files(
+                    StoragePaths.arf_entities_dir(sync_id), pattern="*.json"
+                )
+            return len(store) + legacy
         except Exception:
             return 0
 
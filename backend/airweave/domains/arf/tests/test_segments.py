@@ -0,0 +1,201 @@
+"""Unit tests for the ARF v2 segment store.
+
+Covers:
+- record encoding round trip
+- index rebuild from sidecars (later writes and tombstones win)
+- interrupted writes (segment without sidecar) are ignored
+- merging small segments, carrying tombstones forward
+- full compaction once dead records outnumber live ones
+- streaming iteration with unreadable segments skipped
+- refreshing from writes and compactions of another store instance
+
+Uses a FakeStorageBackend for all I/O.
+"""
+
+from typing import Any, Dict, List, Tuple
+from uuid import uuid4
+
+import pytest
+
+from airweave.domains.arf.segments import SegmentStore, decode_record, encode_segment
+from airweave.domains.storage.fakes import FakeStorageBackend
+
+SYNC_ID = str(uuid4())
+
+
+def _records(ids: List[str], version: str = "v1") -> List[Tuple[str, Dict[str, Any]]]:
+    return [(eid, {"entity_id": eid, "version": version}) for eid in ids]
+
+
+async def _loaded(storage: FakeStorageBackend) -> SegmentStore:
+    store = SegmentStore(storage, SYNC_ID)
+    await store.load()
+    return store
+
+
+async def _collect(store: SegmentStore) -> Dict[str, Dict[str, Any]]:
+    return {eid: record async for eid, record in store.iter_records()}
+
+
+def _small_store_limits(monkeypatch, fanin: int = 3, small: int = 3, min_dead: int = 10**9):
+    monkeypatch.setattr(SegmentStore, "MERGE_FANIN", fanin)
+    monkeypatch.setattr(SegmentStore, "SMALL_SEGMENT_RECORDS", small)
+    monkeypatch.setattr(SegmentStore, "COMPACT_MIN_DEAD", min_dead)
+
+
+def test_encode_decode_round_trip():
+    records = [("a", {"entity_id": "a", "text": "x" * 500}), ("b", {"entity_id": "b"})]
+    data, entries = encode_segment(records)
+
+    for entity_id, record in records:
+        offset, length, stored_file = entries[entity_id]
+        assert decode_record(data, offset, length) == record
+        assert stored_file is None
+
+
+def test_decode_rejects_foreign_data():
+    with pytest.raises(ValueError):
+        decode_record(b"{not a segment}", 4, 1)
+
+
+@pytest.mark.asyncio
+async def test_reload_applies_writes_in_order():
+    storage = FakeStorageBackend()
+    store = await _loaded(storage)
+    await store.append(_records(["a", "b", "c"]))
+    await store.append(_records(["a"], version="v2"))
+    await store.append([], deleted=["b"])
+
+    reloaded = await _loaded(storage)
+    assert sorted(reloaded.entity_ids()) == ["a", "c"]
+    assert (await reloaded.read("a"))["version"] == "v2"
+    assert await reloaded.read("b") is None
+
+
+@pytest.mark.asyncio
+async def test_append_returns_previous_locations():
+    storage = FakeStorageBackend()
+    store = await _loaded(storage)
+    await store.append([("a", {"entity_id": "a", "__stored_file__": "files/a.txt"})])
+
+    previous = await store.append(_records(["a", "new"]))
+
+    assert list(previous) == ["a"]
+    assert previous["a"].stored_file == "files/a.txt"
+
+
+@pytest.mark.asyncio
+async def test_segment_without_sidecar_is_ignored():
+    storage = FakeStorageBackend()
+    store = await _loaded(storage)
+    await store.append(_records(["a"]))
+    data, _ = encode_segment(_records(["ghost"]))
+    storage.seed_file(f"raw/{SYNC_ID}/segments/9999999999-deadbeef.seg", data)
+
+    reloaded = await _loaded(storage)
+    assert reloaded.entity_ids() == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_small_segments_are_merged(monkeypatch):
+    _small_store_limits(monkeypatch)
+    storage = FakeStorageBackend()
+    store = await _loaded(storage)
+
+    for i in range(3):
+        await store.append(_records([f"e-{i}"]))
+
+    assert store.segment_count == 1
+    assert len(await storage.list_files(f"raw/{SYNC_ID}/segments")) == 2
+    assert sorted(await _collect(store)) == ["e-0", "e-1", "e-2"]
+
+
+@pytest.mark.asyncio
+async def test_merge_keeps_deletes_of_records_in_kept_segments(monkeypatch):
+    _small_store_limits(monkeypatch)
+    storage = FakeStorageBackend()
+    store = await _loaded(storage)
+
+    await store.append(_records(["a", "b", "c", "d"]))  # large: kept by merges
+    await store.append([], deleted=["a"])
+    await store.append(_records(["x"]))
+    await store.append(_records(["y"]))  # third small sidecar triggers the merge
+
+    assert store.segment_count == 2
+    reloaded = await _loaded(storage)
+    assert sorted(reloaded.entity_ids()) == ["b", "c", "d", "x", "y"]
+    assert sorted(await _collect(reloaded)) == ["b", "c", "d", "x", "y"]
+
+
+@pytest.mark.asyncio
+async def test_full_compaction_drops_dead_records(monkeypatch):
+    _small_store_limits(monkeypatch, fanin=1000, min_dead=4)
+    storage = FakeStorageBackend()
+    store = await _loaded(storage)
+
+    await store.append(_records(["a", "b", "c"]))
+    await store.append(_records(["a", "b", "c"], version="v2"))
+    await store.append(_records(["a", "b"], version="v3"))
+
+    assert store.dead_records == 0
+    reloaded = await _loaded(storage)
+    records = await _collect(reloaded)
+    assert {eid: r["version"] for eid, r in records.items()} == {
+        "a": "v3",
+        "b": "v3",
+        "c": "v2",
+    }
+
+
+@pytest.mark.asyncio
+async def test_iteration_skips_unreadable_segment():
+    storage = FakeStorageBackend()
+    store = await _loaded(storage)
+    await store.append(_records(["a"]))
+    await store.append(_records(["b"]))
+    first = sorted(p for p in await storage.list_files(f"raw/{SYNC_ID}") if p.endswith(".seg"))[0]
+    await storage.delete(first)
+
+    assert sorted(await _collect(store)) == ["b"]
+
+
+async def _sequences(storage: FakeStorageBackend) -> List[int]:
+    return sorted(
+        int(path.rsplit("/", 1)[-1].split("-", 1)[0])
+        for path in await storage.list_files(f"raw/{SYNC_ID}")
+        if path.endswith(".idx.json")
+    )
+
+
+@pytest.mark.asyncio
+async def test_append_takes_sequence_from_storage_listing():
+    storage = FakeStorageBackend()
+    first = await _loaded(storage)
+    second = await _loaded(storage)
+
+    await first.append(_records(["a"]))
+    await second.append(_records(["a"], version="v2"))
+    await first.append(_records(["b"]))
+
+    assert await _sequences(storage) == [0, 1, 2]
+    assert (await first.read("a"))["version"] == "v2"
+    assert sorted(second.entity_ids()) == ["a"]
+    await second.refresh()
+    assert sorted(second.entity_ids()) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_refresh_reloads_after_compaction_elsewhere(monkeypatch):
+    storage = FakeStorageBackend()
+    reader = await _loaded(storage)
+    writer = await _loaded(storage)
+    await writer.append(_records(["a", "b"]))
+    await reader.refresh()
+
+    _small_store_limits(monkeypatch, fanin=1000, min_dead=2)
+    await writer.append(_records(["a", "b"], version="v2"))
+    await writer.append([], deleted=["b"])
+    await reader.refresh()
+
+    assert reader.entity_ids() == writer.entity_ids() == ["a"]
+    assert (await reader.read("a"))["version"] == "v2"
@@ -8,6 +8,7 @@ Covers:
 - get_entity_count, sync_exists, delete_sync
 - get_manifest, upsert_manifest (create and update)
 - cleanup_stale_entities
+- two service instances (pods) sharing one storage backend
 - get_replay_stats
 
 Uses a FakeStorageBackend to avoid any real I/O.
@@ -92,10 +93,16 @@ def _make_sync_context(sync_id: str = SYNC_ID) -> Any:
     return SimpleNamespace(sync=sync, sync_job=sync_job, collection=collection, logger=logger)
 
 
+def _tracker(seen: set) -> Any:
+    return SimpleNamespace(
+        filter_unencountered=lambda ids, key=None: (i for i in ids if i not in seen)
+    )
+
+
 def _make_runtime(source_short_name: str = "github") -> Any:
     source = SimpleNamespace(short_name=source_short_name)
     dense_embedder = SimpleNamespace(dimensions=768, model_name="test-embed")
-    entity_tracker = SimpleNamespace(get_all_encountered_ids_flat=lambda: set())
+    entity_tracker = _tracker(set())
     return SimpleNamespace(
         source=source, dense_embedder=dense_embedder, entity_tracker=entity_tracker
     )
@@ -107,6 +114,21 @@ def _build_service() -> tuple:
     return svc, storage
 
 
+def _seed_v1_entity(
+    storage: FakeStorageBackend, entity_id: str, stored_file: Optional[str] = None
+) -> None:
+    data = {
+        "entity_id": entity_id,
+        "name": f"Legacy {entity_id}",
+        "__entity_class__": "SimpleNamespace",
+        "__entity_module__": "types",
+        "__captured_at__": "2025-01-01T00:00:00Z",
+    }
+    if stored_file:
+        data["__stored_file__"] = stored_file
+    storage.seed_json(ArfService._entity_path(SYNC_ID, entity_id), data)
+
+
 # ---------------------------------------------------------------------------
 # Tests: _safe_filename
 # ---------------------------------------------------------------------------
@@ -168,9 +190,9 @@ async def test_upsert_entity_overwrites():
     e2 = _make_entity("ent-1", name="v2")
     await svc.upsert_entity(e2, ctx)
 
-    entity_path = svc._entity_path(SYNC_ID, "ent-1")
-    stored = await storage.read_json(entity_path)
+    stored = await svc.get_entity(SYNC_ID, "ent-1")
     assert stored["name"] == "v2"
+    assert await svc.get_entity_count(SYNC_ID) == 1
 
 
 # ---------------------------------------------------------------------------
@@ -361,8 +383,7 @@ async def test_upsert_file_entity_stores_file(tmp_path):
     entity = _make_file_entity("file-1", "Report", local_path=str(test_file))
     await svc.upsert_entity(entity, ctx)
 
-    entity_path = svc._entity_path(SYNC_ID, "file-1")
-    stored = await storage.read_json(entity_path)
+    stored = await svc.get_entity(SYNC_ID, "file-1")
     assert "__stored_file__" in stored
 
     file_content = await storage.read_file(stored["__stored_file__"])
@@ -378,8 +399,7 @@ async def test_upsert_file_entity_without_local_path():
     entity = _make_file_entity("file-2", "No File")
     await svc.upsert_entity(entity, ctx)
 
-    entity_path = svc._entity_path(SYNC_ID, "file-2")
-    stored = await storage.read_json(entity_path)
+    stored = await svc.get_entity(SYNC_ID, "file-2")
     assert "__stored_file__" not in stored
 
 
@@ -393,8 +413,7 @@ async def test_upsert_file_entity_update_cleans_old_file(tmp_path):
     entity = _make_file_entity("file-1", "V1", local_path=str(old_file))
     await svc.upsert_entity(entity, ctx)
 
-    entity_path = svc._entity_path(SYNC_ID, "file-1")
-    old_stored = await storage.read_json(entity_path)
+    old_stored = await svc.get_entity(SYNC_ID, "file-1")
     old_file_path = old_stored["__stored_file__"]
 
     new_file = tmp_path / "new.pdf"
@@ -404,7 +423,7 @@ async def test_upsert_file_entity_update_cleans_old_file(tmp_path):
 
     assert not await storage.exists(old_file_path)
 
-    new_stored = await storage.read_json(entity_path)
+    new_stored = await svc.get_entity(SYNC_ID, "file-1")
     new_content = await storage.read_file(new_stored["__stored_file__"])
     assert new_content == b"new content"
 
@@ -419,8 +438,7 @@ async def test_delete_entity_with_stored_file(tmp_path):
     entity = _make_file_entity("file-1", "Doc", local_path=str(test_file))
     await svc.upsert_entity(entity, ctx)
 
-    entity_path = svc._entity_path(SYNC_ID, "file-1")
-    stored = await storage.read_json(entity_path)
+    stored = await svc.get_entity(SYNC_ID, "file-1")
     file_path = stored["__stored_file__"]
 
     deleted = await svc.delete_entity("file-1", ctx)
@@ -489,7 +507,7 @@ async def test_cleanup_stale_entities_removes_unseen():
 
     seen = {"e-0", "e-2"}
     runtime = _make_runtime()
-    runtime.entity_tracker = SimpleNamespace(get_all_encountered_ids_flat=lambda: seen)
+    runtime.entity_tracker = _tracker(seen)
 
     removed = await svc.cleanup_stale_entities(ctx, runtime)
     assert removed == 2
@@ -503,7 +521,7 @@ async def test_cleanup_stale_entities_nothing_stale():
 
     seen = {"e-0", "e-1"}
     runtime = _make_runtime()
-    runtime.entity_tracker = SimpleNamespace(get_all_encountered_ids_flat=lambda: seen)
+    runtime.entity_tracker = _tracker(seen)
 
     removed = await svc.cleanup_stale_entities(ctx, runtime)
     assert removed == 0
@@ -518,7 +536,7 @@ async def test_cleanup_stale_entities_uses_filename_comparison_not_json_reads():
 
     seen = {"e-0", "e-1", "e-2"}
     runtime = _make_runtime()
-    runtime.entity_tracker = SimpleNamespace(get_all_encountered_ids_flat=lambda: seen)
+    runtime.entity_tracker = _tracker(seen)
 
     read_json_calls = []
     original_read_json = storage.read_json
@@ -568,32 +586,29 @@ async def test_list_syncs_empty():
 
 
 @pytest.mark.asyncio
-async def test_upsert_update_tolerates_corrupt_old_entity(tmp_path):
-    """When reading the old entity during update fails, upsert still succeeds."""
+async def test_upsert_update_tolerates_old_file_cleanup_failure(tmp_path):
+    """When deleting the replaced file fails, upsert still succeeds."""
     svc, storage = _build_service()
     ctx = _make_sync_context()
 
-    test_file = tmp_path / "a.txt"
-    test_file.write_bytes(b"data")
-    entity = _make_file_entity("f-1", "V1", local_path=str(test_file))
-    await svc.upsert_entity(entity, ctx)
+    old_file = tmp_path / "a.txt"
+    old_file.write_bytes(b"data")
+    await svc.upsert_entity(_make_file_entity("f-1", "V1", local_path=str(old_file)), ctx)
 
-    original_read_json = storage.read_json
+    original_delete = storage.delete
 
-    async def _fail_once(path):
-        if "f-1" in path and not getattr(_fail_once, "called", False):
-            _fail_once.called = True
+    async def _fail_files(path):
+        if "/files/" in path:
             raise RuntimeError("disk error")
-        return await original_read_json(path)
+        return await original_delete(path)
 
-    storage.read_json = _fail_once
+    storage.delete = _fail_files
 
-    entity2 = _make_file_entity("f-1", "V2", local_path=str(test_file))
-    await svc.upsert_entity(entity2, ctx)
+    new_file = tmp_path / "b.txt"
+    new_file.write_bytes(b"data")
+    await svc.upsert_entity(_make_file_entity("f-1", "V2", local_path=str(new_file)), ctx)
 
-    entity_path = svc._entity_path(SYNC_ID, "f-1")
-    storage.read_json = original_read_json
-    stored = await storage.read_json(entity_path)
+    stored = await svc.get_entity(SYNC_ID, "f-1")
     assert stored["name"] == "V2"
 
 
@@ -606,36 +621,34 @@ async def test_upsert_file_entity_tolerates_write_failure(tmp_path):
     test_file = tmp_path / "doc.pdf"
     test_file.write_bytes(b"content")
 
-    storage.write_file = AsyncMock(side_effect=RuntimeError("write failed"))
+    original_write_file = storage.write_file
+
+    async def _fail_files(path, content):
+        if "/files/" in path:
+            raise RuntimeError("write failed")
+        await original_write_file(path, content)
+
+    storage.write_file = _fail_files
 
     entity = _make_file_entity("f-1", "Doc", local_path=str(test_file))
     await svc.upsert_entity(entity, ctx)
 
-    entity_path = svc._entity_path(SYNC_ID, "f-1")
-    stored = await storage.read_json(entity_path)
+    stored = await svc.get_entity(SYNC_ID, "f-1")
     assert "__stored_file__" not in stored
 
 
 @pytest.mark.asyncio
-async def test_delete_entity_tolerates_corrupt_entity_data():
-    """Delete still removes entity JSON even if reading it for file cleanup fails."""
+async def test_migration_skips_corrupt_v1_entity():
+    """An unreadable v1 file is skipped; the rest of the store migrates."""
     svc, storage = _build_service()
     ctx = _make_sync_context()
-    await svc.upsert_entity(_make_entity("e-1"), ctx)
-
-    entity_path = svc._entity_path(SYNC_ID, "e-1")
-    storage._json_store[entity_path] = "not-a-dict"
+    _seed_v1_entity(storage, "e-1")
+    storage._json_store[svc._entity_path(SYNC_ID, "e-2")] = "not-a-dict"
 
-    original_read = storage.read_json
+    await svc.upsert_entity(_make_entity("e-3"), ctx)
 
-    async def _fail_read(path):
-        if path == entity_path:
-            raise RuntimeError("corrupt")
-        return await original_read(path)
-
-    storage.read_json = _fail_read
-    deleted = await svc.delete_entity("e-1", ctx)
-    assert deleted is True
+    assert await svc.get_entity_count(SYNC_ID) == 2
+    assert await svc.delete_entity("e-1", ctx) is True
 
 
 @pytest.mark.asyncio
@@ -674,7 +687,132 @@ async def test_cleanup_stale_tolerates_list_files_failure():
 
     ctx = _make_sync_context()
     runtime = _make_runtime()
-    runtime.entity_tracker = SimpleNamespace(get_all_encountered_ids_flat=lambda: set())
+    runtime.entity_tracker = _tracker(set())
 
     removed = await svc.cleanup_stale_entities(ctx, runtime)
     assert removed == 0
+
+
+# ---------------------------------------------------------------------------
+# Tests: v2 segment layout and v1 migration
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_batch_upsert_is_one_segment_write():
+    """A batch costs one segment and one sidecar, not objects per entity."""
+    svc, storage = _build_service()
+    ctx = _make_sync_context()
+    await svc.upsert_entities([_make_entity(f"e-{i}") for i in range(200)], ctx)
+
+    stored = await storage.list_files(f"raw/{SYNC_ID}")
+    assert len(stored) == 2
+    assert all("/segments/" in path for path in stored)
+
+
+@pytest.mark.asyncio
+async def test_store_survives_reload():
+    """A fresh service on the same storage sees upserts and deletes."""
+    svc, storage = _build_service()
+    ctx = _make_sync_context()
+    await svc.upsert_entities([_make_entity(f"e-{i}") for i in range(3)], ctx)
+    await svc.upsert_entity(_make_entity("e-0", name="updated"), ctx)
+    await svc.delete_entities(["e-1"], ctx)
+
+    reloaded = ArfService(storage=storage)
+    assert await reloaded.get_entity_count(SYNC_ID) == 2
+    assert (await reloaded.get_entity(SYNC_ID, "e-0"))["name"] == "updated"
+    assert await reloaded.get_entity(SYNC_ID, "e-1") is None
+
+
+@pytest.mark.asyncio
+async def test_v1_store_is_readable_before_migration():
+    svc, storage = _build_service()
+    _seed_v1_entity(storage, "old-1")
+    _seed_v1_entity(storage, "old-2")
+
+    assert await svc.get_entity_count(SYNC_ID) == 2
+    assert (await svc.get_entity(SYNC_ID, "old-1"))["name"] == "Legacy old-1"
+    collected = [d async for d in svc.iter_entities(SYNC_ID)]
+    assert {d["entity_id"] for d in collected} == {"old-1", "old-2"}
+
+
+@pytest.mark.asyncio
+async def test_v1_store_migrates_on_first_write():
+    svc, storage = _build_service()
+    ctx = _make_sync_context()
+    file_path = f"raw/{SYNC_ID}/files/old-1_doc.txt"
+    storage.seed_file(file_path, b"legacy content")
+    _seed_v1_entity(storage, "old-1", stored_file=file_path)
+    _seed_v1_entity(storage, "old-2")
+
+    await svc.upsert_entity(_make_entity("new-1"), ctx)
+
+    assert await storage.list_files(f"raw/{SYNC_ID}/entities") == []
+    assert await svc.get_entity_count(SYNC_ID) == 3
+    collected = [d async for d in svc.iter_entities(SYNC_ID)]
+    assert sorted(d["entity_id"] for d in collected) == ["new-1", "old-1", "old-2"]
+
+    # Stored files of migrated entities are still cleaned up on delete
+    assert await svc.delete_entity("old-1", ctx) is True
+    assert not await storage.exists(file_path)
+
+
+@pytest.mark.asyncio
+async def test_iter_skips_v1_copies_of_migrated_entities():
+    """An interrupted migration leaves v1 files behind; they are not replayed twice."""
+    svc, storage = _build_service()
+    ctx = _make_sync_context()
+    await svc.upsert_entity(_make_entity("e-1", name="v2"), ctx)
+    _seed_v1_entity(storage, "e-1")
+    _seed_v1_entity(storage, "e-2")
+
+    reloaded = ArfService(storage=storage)
+    collected = [d async for d in reloaded.iter_entities(SYNC_ID)]
+    assert sorted((d["entity_id"], d["name"]) for d in collected) == [
+        ("e-1", "v2"),
+        ("e-2", "Legacy e-2"),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Tests: several processes sharing storage
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_service_instances_see_each_others_writes():
+    storage = FakeStorageBackend()
+    first, second = ArfService(storage=storage), ArfService(storage=storage)
+    ctx = _make_sync_context()
+
+    await first.upsert_entities([_make_entity("ent-1", "v1")], ctx)
+    assert (await second.get_entity(SYNC_ID, "ent-1"))["name"] == "v1"
+
+    await second.upsert_entities([_make_entity("ent-1", "v2")], ctx)
+    assert (await first.get_entity(SYNC_ID, "ent-1"))["name"] == "v2"
+    assert await first.get_entity_count(SYNC_ID) == 1
+
+    await first.upsert_entities([_make_entity("ent-1", "v3")], ctx)
+    await second.delete_entities(["ent-2"], ctx)
+
+    fresh = ArfService(storage=storage)
+    for svc in (first, second, fresh):
+        assert (await svc.get_entity(SYNC_ID, "ent-1"))["name"] == "v3"
+        assert await svc.get_entity_count(SYNC_ID) == 1
+
+
+@pytest.mark.asyncio
+async def test_cleanup_uses_entities_written_by_another_instance():
+    storage = FakeStorageBackend()
+    first, second = ArfService(storage=storage), ArfService(storage=storage)
+    ctx = _make_sync_context()
+    await first.upsert_entities([_make_entity("ent-1")], ctx)
+    await second.upsert_entities([_make_entity("ent-2")], ctx)
+
+    runtime = _make_runtime()
+    runtime.entity_tracker = _tracker({"ent-1"})
+    deleted = await first.cleanup_stale_entities(ctx, runtime)
+
+    assert deleted == 1
+    assert await second.get_entity(SYNC_ID, "ent-2") is None
@@ -0,0 +1,107 @@
+"""Caching decorator for dense embedders.
+
+Wraps any DenseEmbedderProtocol implementation and consults an
+EmbeddingCache before calling the provider. Entries are keyed by
+(model_name, dimensions, SHA-256 of the text), so a lightly edited
+document only pays for the chunks whose text actually changed.
+"""
+
+import hashlib
+from typing import Optional
+
+from airweave.core.protocols.cache import EmbeddingCache
+from airweave.core.protocols.metrics import EmbeddingCacheMetrics
+from airweave.domains.embedders.protocols import DenseEmbedderProtocol
+from airweave.domains.embedders.types import DenseEmbedding
+
+
+class CachedDenseEmbedder(DenseEmbedderProtocol):
+    """Dense embedder that only sends cache misses to the wrapped embedder.
+
+    Identical texts within one batch are embedded once. Only vectors that
+    come back from the wrapped embedder with the expected dimensionality
+    are written to the cache, so a misbehaving provider can't poison it.
+    """
+
+    def __init__(
+        self,
+        *,
+        embedder: DenseEmbedderProtocol,
+        cache: EmbeddingCache,
+        metrics: Optional[EmbeddingCacheMetrics] = None,
+    ) -> None:
+        """Initialize the caching decorator.
+
+        Args:
+            embedder: The provider embedder to delegate misses to.
+            cache: Cache consulted before every provider call.
+            metrics: Optional hit/miss counters.
+        """
+        self._embedder = embedder
+        self._cache = cache
+        self._metrics = metrics
+
+    # ------------------------------------------------------------------
+    # Public interface
+    # ------------------------------------------------------------------
+
+    @property
+    def model_name(self) -> str:
+        """The model identifier of the wrapped embedder."""
+        return self._embedder.model_name
+
+    @property
+    def dimensions(self) -> int:
+        """The output vector dimensionality of the wrapped embedder."""
+        return self._embedder.dimensions
+
+    async def embed(self, text: str) -> DenseEmbedding:
+        """Embed a single text, serving it from the cache when possible."""
+        results = await self.embed_many([text])
+        return results[0]
+
+    async def embed_many(self, texts: list[str]) -> list[DenseEmbedding]:
+        """Embed a batch of texts, sending only cache misses to the provider."""
+        if not texts:
+            return []
+
+        keys = [self._cache_key(text) for text in texts]
+        cached = await self._cache.get_many(keys)
+
+        # Deduplicate misses so repeated texts in one batch are embedded once.
+        miss_texts: dict[str, str] = {}
+        for key, text, vector in zip(keys, texts, cached, strict=True):
+            if vector is None and key not in miss_texts:
+                miss_texts[key] = text
+
+        hits = len(texts) - sum(1 for vector in cached if vector is None)
+        if self._metrics is not None:
+            self._metrics.inc_hits(self.model_name, hits)
+            self._metrics.inc_misses(self.model_name, len(miss_texts))
+
+        computed: dict[str, list[float]] = {}
+        if miss_texts:
+            results = await self._embedder.embed_many(list(miss_texts.values()))
+            computed = {
+                key: result.vector for key, result in zip(miss_texts.keys(), results, strict=True)
+            }
+            await self._cache.set_many(
+                {k: v for k, v in computed.items() if len(v) == self.dimensions}
+            )
+
+        return [
+            DenseEmbedding(vector=vector if vector is not None else computed[key])
+            for key, vector in zip(keys, cached, strict=True)
+        ]
+
+    async def close(self) -> None:
+        """Close the wrapped embedder."""
+        await self._embedder.close()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _cache_key(self, text: str) -> str:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self.model_name}:{self.dimensions}:{digest}"
@@ -0,0 +1,117 @@
+"""Unit tests for CachedDenseEmbedder."""
+
+import pytest
+
+from airweave.adapters.cache.embedding import InMemoryEmbeddingCache
+from airweave.adapters.metrics import FakeEmbeddingCacheMetrics
+from airweave.domains.embedders.dense.cached import CachedDenseEmbedder
+from airweave.domains.embedders.types import DenseEmbedding
+
+_DIMS = 4
+
+
+class _CountingEmbedder:
+    """Dense embedder that encodes text length and records every call."""
+
+    def __init__(self, dimensions: int = _DIMS) -> None:
+        self._dimensions = dimensions
+        self.calls: list[list[str]] = []
+        self.closed = False
+
+    @property
+    def model_name(self) -> str:
+        return "counting"
+
+    @property
+    def dimensions(self) -> int:
+        return self._dimensions
+
+    async def embed(self, text: str) -> DenseEmbedding:
+        return (await self.embed_many([text]))[0]
+
+    async def embed_many(self, texts: list[str]) -> list[DenseEmbedding]:
+        self.calls.append(list(texts))
+        return [DenseEmbedding(vector=[float(len(t))] * self._dimensions) for t in texts]
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _build(inner=None, max_entries: int = 100):
+    inner = inner or _CountingEmbedder()
+    metrics = FakeEmbeddingCacheMetrics()
+    embedder = CachedDenseEmbedder(
+        embedder=inner, cache=InMemoryEmbeddingCache(max_entries=max_entries), metrics=metrics
+    )
+    return embedder, inner, metrics
+
+
+@pytest.mark.asyncio
+async def test_second_call_served_from_cache():
+    embedder, inner, metrics = _build()
+
+    first = await embedder.embed_many(["a", "bb"])
+    second = await embedder.embed_many(["a", "bb"])
+
+    assert inner.calls == [["a", "bb"]]
+    assert [r.vector for r in first] == [r.vector for r in second]
+    assert metrics.hits == {"counting": 2}
+    assert metrics.misses == {"counting": 2}
+
+
+@pytest.mark.asyncio
+async def test_only_misses_sent_and_order_preserved():
+    embedder, inner, _ = _build()
+    await embedder.embed_many(["a"])
+
+    results = await embedder.embed_many(["ccc", "a", "bb"])
+
+    assert inner.calls[-1] == ["ccc", "bb"]
+    assert [r.vector[0] for r in results] == [3.0, 1.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_texts_in_batch_embedded_once():
+    embedder, inner, _ = _build()
+
+    results = await embedder.embed_many(["same", "same", "other"])
+
+    assert inner.calls == [["same", "other"]]
+    assert len(results) == 3
+
+
+@pytest.mark.asyncio
+async def test_key_includes_model_and_dimensions():
+    cache = InMemoryEmbeddingCache(max_entries=100)
+    small = CachedDenseEmbedder(embedder=_CountingEmbedder(dimensions=4), cache=cache)
+    large = CachedDenseEmbedder(embedder=_CountingEmbedder(dimensions=8), cache=cache)
+
+    await small.embed_many(["a"])
+    result = await large.embed("a")
+
+    assert len(result.vector) == 8
+
+
+@pytest.mark.asyncio
+async def test_wrong_dimension_vectors_not_cached():
+    class _Broken(_CountingEmbedder):
+        async def embed_many(self, texts):
+            self.calls.append(list(texts))
+            return [DenseEmbedding(vector=[0.0]) for _ in texts]
+
+    embedder, inner, _ = _build(inner=_Broken())
+    await embedder.embed_many(["a"])
+    await embedder.embed_many(["a"])
+
+    assert len(inner.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_delegates_properties_and_close():
+    embedder, inner, _ = _build()
+
+    assert embedder.model_name == "counting"
+    assert embedder.dimensions == _DIMS
+    assert await embedder.embed_many([]) == []
+    await embedder.close()
+    assert inner.closed
@@ -6,6 +6,7 @@ from airweave.core.protocols.registry import RegistryProtocol
 from airweave.domains.embedders.types import (
     DenseEmbedderEntry,
     DenseEmbedding,
+    QueryEmbeddingStats,
     SparseEmbedderEntry,
     SparseEmbedding,
 )
@@ -62,6 +63,26 @@ class SparseEmbedderProtocol(Protocol):
         ...
 
 
+class QueryEmbeddingCacheProtocol(Protocol):
+    """Cache of search query embeddings shared by classic and agentic search.
+
+    Entries are keyed by (model, dimensions, whitespace-normalized text).
+    Each call embeds only the misses of its batch and reports the outcome.
+    """
+
+    async def embed_dense(
+        self, embedder: DenseEmbedderProtocol, texts: list[str]
+    ) -> tuple[list[DenseEmbedding], QueryEmbeddingStats]:
+        """Dense-embed queries, sending only cache misses to ``embedder``."""
+        ...
+
+    async def embed_sparse(
+        self, embedder: SparseEmbedderProtocol, texts: list[str]
+    ) -> tuple[list[SparseEmbedding], QueryEmbeddingStats]:
+        """Sparse-embed queries, sending only cache misses to ``embedder``."""
+        ...
+
+
 # ---------------------------------------------------------------------------
 # Registry protocols
 # ---------------------------------------------------------------------------
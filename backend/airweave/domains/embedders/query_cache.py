@@ -0,0 +1,176 @@
+"""Query embedding cache shared by classic and agentic search.
+
+Search embeds the user query (and every expanded variant or agentic
+variation) on each request, which for dense models is a remote API round
+trip. Popular and repeated queries are embedded once and then served from:
+
+- an EmbeddingCache for dense vectors (in-process LRU, optionally tiered
+  with Redis so API pods share entries), and
+- a bounded in-process LRU for sparse vectors, whose model runs locally.
+
+Keys are (model, dimensions, whitespace-normalized text); the normalized
+text is also what the embedder sees on a miss, so a cached vector is
+exactly what a fresh call would have returned.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Awaitable, TypeVar
+
+from airweave.core.protocols.cache import EmbeddingCache
+from airweave.domains.embedders.protocols import (
+    DenseEmbedderProtocol,
+    QueryEmbeddingCacheProtocol,
+    SparseEmbedderProtocol,
+)
+from airweave.domains.embedders.types import DenseEmbedding, QueryEmbeddingStats, SparseEmbedding
+
+T = TypeVar("T")
+
+# Weight of the newest observation in the per-model latency average.
+_LATENCY_SMOOTHING = 0.2
+
+
+class QueryEmbeddingCache(QueryEmbeddingCacheProtocol):
+    """Caches query embeddings and reports per-batch hit statistics.
+
+    Saved latency is estimated from a running average of the embedder's
+    per-query latency on misses, so it reads 0 until a model has been
+    called at least once in this process.
+    """
+
+    def __init__(self, dense_cache: EmbeddingCache, sparse_max_entries: int) -> None:
+        """Initialize the query embedding cache.
+
+        Args:
+            dense_cache: Cache for dense vectors (keys are namespaced by this class).
+            sparse_max_entries: Maximum sparse embeddings kept in process.
+        """
+        self._dense_cache = dense_cache
+        self._sparse_max_entries = sparse_max_entries
+        self._sparse: OrderedDict[str, SparseEmbedding] = OrderedDict()
+        self._ms_per_query: dict[str, float] = {}
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Collapse whitespace so trivially different queries share an entry."""
+        return " ".join(text.split())
+
+    async def embed_dense(
+        self, embedder: DenseEmbedderProtocol, texts: list[str]
+    ) -> tuple[list[DenseEmbedding], QueryEmbeddingStats]:
+        """Dense-embed queries, sending only cache misses to ``embedder``."""
+        if not texts:
+            return [], QueryEmbeddingStats()
+
+        model = f"dense:{embedder.model_name}:{embedder.dimensions}"
+        normalized = [self.normalize(text) for text in texts]
+        keys = [self._key(model, text) for text in normalized]
+        cached = await self._dense_cache.get_many(keys)
+
+        misses = self._unique_misses(keys, normalized, cached)
+        computed: dict[str, list[float]] = {}
+        if misses:
+            results = await self._timed(
+                model, len(misses), embedder.embed_many(list(misses.values()))
+            )
+            computed = {key: r.vector for key, r in zip(misses.keys(), results, strict=True)}
+            await self._dense_cache.set_many(
+                {k: v for k, v in computed.items() if len(v) == embedder.dimensions}
+            )
+
+        embeddings = [
+            DenseEmbedding(vector=vector if vector is not None else computed[key])
+            for key, vector in zip(keys, cached, strict=True)
+        ]
+        return embeddings, self._stats(model, len(texts), len(misses))
+
+    async def embed_sparse(
+        self, embedder: SparseEmbedderProtocol, texts: list[str]
+    ) -> tuple[list[SparseEmbedding], QueryEmbeddingStats]:
+        """Sparse-embed queries, sending only cache misses to ``embedder``."""
+        if not texts:
+            return [], QueryEmbeddingStats()
+
+        model = f"sparse:{embedder.model_name}"
+        normalized = [self.normalize(text) for text in texts]
+        keys = [self._key(model, text) for text in normalized]
+        cached = [self._sparse_get(key) for key in keys]
+
+        misses = self._unique_misses(keys, normalized, cached)
+        computed: dict[str, SparseEmbedding] = {}
+        if misses:
+            miss_texts = list(misses.values())
+            if len(miss_texts) == 1:
+                call = self._single(embedder.embed(miss_texts[0]))
+            else:
+                call = embedder.embed_many(miss_texts)
+            results = await self._timed(model, len(miss_texts), call)
+            computed = dict(zip(misses.keys(), results, strict=True))
+            for key, embedding in computed.items():
+                self._sparse_set(key, embedding)
+
+        embeddings = [
+            embedding if embedding is not None else computed[key]
+            for key, embedding in zip(keys, cached, strict=True)
+        ]
+        return embeddings, self._stats(model, len(texts), len(misses))
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _key(model: str, text: str) -> str:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"query:{model}:{digest}"
+
+    @staticmethod
+    def _unique_misses(keys: list[str], texts: list[str], cached: list) -> dict[str, str]:
+        """Map each missing key to its text, embedding repeated texts once."""
+        misses: dict[str, str] = {}
+        for key, text, value in zip(keys, texts, cached, strict=True):
+            if value is None and key not in misses:
+                misses[key] = text
+        return misses
+
+    @staticmethod
+    async def _single(call: Awaitable[SparseEmbedding]) -> list[SparseEmbedding]:
+        return [await call]
+
+    async def _timed(self, model: str, count: int, call: Awaitable[T]) -> T:
+        """Await an embedder call and fold its per-query latency into the average."""
+        start = time.perf_counter()
+        result = await call
+        per_query = (time.perf_counter() - start) * 1000 / count
+        previous = self._ms_per_query.get(model)
+        self._ms_per_query[model] = (
+            per_query
+            if previous is None
+            else previous + _LATENCY_SMOOTHING * (per_query - previous)
+        )
+        return result
+
+    def _stats(self, model: str, total: int, misses: int) -> QueryEmbeddingStats:
+        # Duplicate texts within a batch count as hits: they skip the embedder too.
+        hits = total - misses
+        return QueryEmbeddingStats(
+            hits=hits,
+            misses=misses,
+            saved_ms=hits * self._ms_per_query.get(model, 0.0),
+        )
+
+    def _sparse_get(self, key: str) -> SparseEmbedding | None:
+        embedding = self._sparse.get(key)
+        if embedding is not None:
+            self._sparse.move_to_end(key)
+        return embedding
+
+    def _sparse_set(self, key: str, embedding: SparseEmbedding) -> None:
+        if self._sparse_max_entries <= 0:
+            return
+        self._sparse[key] = embedding
+        self._sparse.move_to_end(key)
+        while len(self._sparse) > self._sparse_max_entries:
+            self._sparse.popitem(last=False)
@@ -0,0 +1,159 @@
+"""Unit tests for QueryEmbeddingCache."""
+
+import pytest
+
+from airweave.adapters.cache.embedding import InMemoryEmbeddingCache
+from airweave.domains.embedders import query_cache as query_cache_module
+from airweave.domains.embedders.query_cache import QueryEmbeddingCache
+from airweave.domains.embedders.types import DenseEmbedding, SparseEmbedding
+
+_DIMS = 4
+
+
+class _CountingDenseEmbedder:
+    """Dense embedder that encodes text length and records every call."""
+
+    def __init__(self, model: str = "counting", dimensions: int = _DIMS) -> None:
+        self._model = model
+        self._dimensions = dimensions
+        self.calls: list[list[str]] = []
+
+    @property
+    def model_name(self) -> str:
+        return self._model
+
+    @property
+    def dimensions(self) -> int:
+        return self._dimensions
+
+    async def embed(self, text: str) -> DenseEmbedding:
+        return (await self.embed_many([text]))[0]
+
+    async def embed_many(self, texts: list[str]) -> list[DenseEmbedding]:
+        self.calls.append(list(texts))
+        return [DenseEmbedding(vector=[float(len(t))] * self._dimensions) for t in texts]
+
+    async def close(self) -> None:
+        pass
+
+
+class _CountingSparseEmbedder:
+    """Sparse embedder that records single and batch calls separately."""
+
+    def __init__(self) -> None:
+        self.single_calls: list[str] = []
+        self.batch_calls: list[list[str]] = []
+
+    @property
+    def model_name(self) -> str:
+        return "bm25"
+
+    async def embed(self, text: str) -> SparseEmbedding:
+        self.single_calls.append(text)
+        return SparseEmbedding(indices=[len(text)], values=[1.0])
+
+    async def embed_many(self, texts: list[str]) -> list[SparseEmbedding]:
+        self.batch_calls.append(list(texts))
+        return [SparseEmbedding(indices=[len(t)], values=[1.0]) for t in texts]
+
+    async def close(self) -> None:
+        pass
+
+
+def _cache(max_entries: int = 100) -> QueryEmbeddingCache:
+    return QueryEmbeddingCache(
+        dense_cache=InMemoryEmbeddingCache(max_entries=max_entries),
+        sparse_max_entries=max_entries,
+    )
+
+
+class TestDense:
+    @pytest.mark.asyncio
+    async def test_only_misses_reach_the_embedder(self):
+        cache, embedder = _cache(), _CountingDenseEmbedder()
+
+        _, first = await cache.embed_dense(embedder, ["reset password"])
+        results, second = await cache.embed_dense(embedder, ["reset password", "sso setup"])
+
+        assert embedder.calls == [["reset password"], ["sso setup"]]
+        assert [r.vector[0] for r in results] == [14.0, 9.0]
+        assert (first.hits, first.misses) == (0, 1)
+        assert (second.hits, second.misses) == (1, 1)
+        assert second.hit_rate == 0.5
+
+    @pytest.mark.asyncio
+    async def test_whitespace_variants_share_an_entry(self):
+        cache, embedder = _cache(), _CountingDenseEmbedder()
+
+        await cache.embed_dense(embedder, ["  reset   password\n"])
+        _, stats = await cache.embed_dense(embedder, ["reset password"])
+
+        assert embedder.calls == [["reset password"]]
+        assert stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_entries_are_scoped_by_model(self):
+        cache = _cache()
+        small, large = _CountingDenseEmbedder("small"), _CountingDenseEmbedder("large")
+
+        await cache.embed_dense(small, ["q"])
+        _, stats = await cache.embed_dense(large, ["q"])
+
+        assert stats.misses == 1
+        assert large.calls == [["q"]]
+
+    @pytest.mark.asyncio
+    async def test_duplicates_in_one_batch_are_embedded_once(self):
+        cache, embedder = _cache(), _CountingDenseEmbedder()
+
+        results, stats = await cache.embed_dense(embedder, ["q", "q"])
+
+        assert embedder.calls == [["q"]]
+        assert len(results) == 2
+        assert (stats.hits, stats.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_saved_latency_is_estimated_from_misses(self, monkeypatch):
+        clock = iter([1.0, 1.2])  # one miss batch of two queries taking 200 ms
+        monkeypatch.setattr(query_cache_module.time, "perf_counter", lambda: next(clock))
+        cache, embedder = _cache(), _CountingDenseEmbedder()
+
+        _, cold = await cache.embed_dense(embedder, ["a", "b"])
+        _, warm = await cache.embed_dense(embedder, ["a", "b", "a"])
+
+        assert cold.saved_ms == 0.0
+        assert warm.saved_ms == pytest.approx(300.0)
+
+
+class TestSparse:
+    @pytest.mark.asyncio
+    async def test_single_miss_uses_embed_and_is_cached(self):
+        cache, embedder = _cache(), _CountingSparseEmbedder()
+
+        await cache.embed_sparse(embedder, ["q"])
+        results, stats = await cache.embed_sparse(embedder, ["q"])
+
+        assert embedder.single_calls == ["q"]
+        assert results[0].indices == [1]
+        assert stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_sends_only_misses(self):
+        cache, embedder = _cache(), _CountingSparseEmbedder()
+        await cache.embed_sparse(embedder, ["a"])
+
+        results, stats = await cache.embed_sparse(embedder, ["a", "bb", "ccc"])
+
+        assert embedder.batch_calls == [["bb", "ccc"]]
+        assert [r.indices for r in results] == [[1], [2], [3]]
+        assert (stats.hits, stats.misses) == (1, 2)
+
+    @pytest.mark.asyncio
+    async def test_lru_bound(self):
+        cache, embedder = _cache(max_entries=1), _CountingSparseEmbedder()
+
+        await cache.embed_sparse(embedder, ["a"])
+        await cache.embed_sparse(embedder, ["b"])
+        await cache.embed_sparse(embedder, ["a"])
+
+        assert embedder.single_calls == ["a", "b", "a"]
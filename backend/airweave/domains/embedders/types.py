@@ -1,6 +1,9 @@
 """Types for the embedders domain."""
 
-from pydantic import BaseModel, Field
+from typing import Annotated, Any
+
+import numpy as np
+from pydantic import BaseModel, Field, PlainSerializer, PlainValidator, WithJsonSchema
 
 from airweave.core.protocols.registry import BaseRegistryEntry
 
@@ -9,6 +12,28 @@ from airweave.core.protocols.registry import BaseRegistryEntry
 # ---------------------------------------------------------------------------
 
 
+def as_dense_array(vector: Any) -> np.ndarray:
+    """Return ``vector`` as a contiguous 1-D float32 array.
+
+    Arrays that are already contiguous float32 are returned as-is (no copy);
+    lists and other dtypes are converted once.
+    """
+    array = np.ascontiguousarray(vector, dtype=np.float32)
+    if array.ndim != 1:
+        raise ValueError(f"Dense vector must be 1-D, got shape {array.shape}")
+    return array
+
+
+# Compact dense vector carried on entities through the sync pipeline:
+# 4 bytes per dimension instead of a list of boxed Python floats.
+DenseVector = Annotated[
+    np.ndarray,
+    PlainValidator(as_dense_array),
+    PlainSerializer(lambda array: array.tolist(), when_used="json"),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}}),
+]
+
+
 class DenseEmbedding(BaseModel):
     """A dense embedding vector."""
 
@@ -22,6 +47,20 @@ class SparseEmbedding(BaseModel):
     values: list[float] = Field(..., description="Weights for each token index.")
 
 
+class QueryEmbeddingStats(BaseModel):
+    """Cache outcome of embedding one batch of search queries."""
+
+    hits: int = Field(0, description="Queries served from the cache.")
+    misses: int = Field(0, description="Queries sent to the embedder.")
+    saved_ms: float = Field(0.0, description="Estimated embedder latency avoided by hits.")
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of queries served from the cache (0.0 for an empty batch)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
 # ---------------------------------------------------------------------------
 # Registry entry types
 # ---------------------------------------------------------------------------
@@ -732,7 +732,7 @@ class SourceLifecycleService(SourceLifecycleServiceProtocol):
             if original_factory:
                 base_client = original_factory(**kwargs)
             else:
-                base_client = httpx.AsyncClient(**kwargs)
+                base_client = source.create_base_http_client(**kwargs)
 
             return AirweaveHttpClient(
                 wrapped_client=base_client,
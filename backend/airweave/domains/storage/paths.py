@@ -71,6 +71,21 @@ class StoragePaths:
         """Files directory: raw/{sync_id}/files/."""
         return f"{cls.arf_sync_path(sync_id)}/files"
 
+    @classmethod
+    def arf_segments_dir(cls, sync_id: Union[str, UUID]) -> str:
+        """Segments directory (ARF v2): raw/{sync_id}/segments/."""
+        return f"{cls.arf_sync_path(sync_id)}/segments"
+
+    @classmethod
+    def arf_segment_path(cls, sync_id: Union[str, UUID], segment: str) -> str:
+        """Segment records path: raw/{sync_id}/segments/{segment}.seg."""
+        return f"{cls.arf_segments_dir(sync_id)}/{segment}.seg"
+
+    @classmethod
+    def arf_segment_index_path(cls, sync_id: Union[str, UUID], segment: str) -> str:
+        """Segment sidecar index path: raw/{sync_id}/segments/{segment}.idx.json."""
+        return f"{cls.arf_segments_dir(sync_id)}/{segment}.idx.json"
+
     # =========================================================================
     # Temp path builders
     # =========================================================================
@@ -4,6 +4,8 @@ from typing import Optional
 
 from airweave import schemas
 from airweave.api.context import ApiContext
+from airweave.core.protocols.metrics import HttpClientPoolMetrics
+from airweave.core.protocols.vespa import VespaFeederProtocol, VespaQueryClientProtocol
 from airweave.domains.embedders.protocols import DenseEmbedderProtocol, SparseEmbedderProtocol
 from airweave.platform.sync.config import SyncConfig
 
@@ -27,6 +29,9 @@ class FakeSyncService:
         access_token: Optional[str] = None,
         force_full_sync: bool = False,
         execution_config: Optional[SyncConfig] = None,
+        vespa_feeder: Optional[VespaFeederProtocol] = None,
+        http_client_pool_metrics: Optional[HttpClientPoolMetrics] = None,
+        vespa_query_client: Optional[VespaQueryClientProtocol] = None,
     ) -> schemas.Sync:
         """Record call and return the sync as-is."""
         self._calls.append(("run", sync, sync_job))
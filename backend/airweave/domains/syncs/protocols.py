@@ -8,6 +8,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave import schemas
 from airweave.api.context import ApiContext
+from airweave.core.protocols.metrics import HttpClientPoolMetrics
+from airweave.core.protocols.vespa import VespaFeederProtocol, VespaQueryClientProtocol
 from airweave.core.shared_models import SyncJobStatus
 from airweave.db.unit_of_work import UnitOfWork
 from airweave.domains.embedders.protocols import DenseEmbedderProtocol, SparseEmbedderProtocol
@@ -184,6 +186,9 @@ class SyncServiceProtocol(Protocol):
         access_token: Optional[str] = None,
         force_full_sync: bool = False,
         execution_config: Optional[SyncConfig] = None,
+        vespa_feeder: Optional[VespaFeederProtocol] = None,
+        http_client_pool_metrics: Optional[HttpClientPoolMetrics] = None,
+        vespa_query_client: Optional[VespaQueryClientProtocol] = None,
     ) -> schemas.Sync:
         """Run a sync via SyncFactory + SyncOrchestrator."""
         ...
@@ -8,6 +8,8 @@ from typing import Optional
 from airweave import schemas
 from airweave.api.context import ApiContext
 from airweave.core.datetime_utils import utc_now_naive
+from airweave.core.protocols.metrics import HttpClientPoolMetrics
+from airweave.core.protocols.vespa import VespaFeederProtocol, VespaQueryClientProtocol
 from airweave.core.shared_models import SyncJobStatus
 from airweave.db.session import get_db_context
 from airweave.domains.embedders.protocols import DenseEmbedderProtocol, SparseEmbedderProtocol
@@ -38,6 +40,9 @@ class SyncService(SyncServiceProtocol):
         access_token: Optional[str] = None,
         force_full_sync: bool = False,
         execution_config: Optional[SyncConfig] = None,
+        vespa_feeder: Optional[VespaFeederProtocol] = None,
+        http_client_pool_metrics: Optional[HttpClientPoolMetrics] = None,
+        vespa_query_client: Optional[VespaQueryClientProtocol] = None,
     ) -> schemas.Sync:
         """Run a sync.
 
@@ -52,6 +57,10 @@ class SyncService(SyncServiceProtocol):
             access_token: Optional access token instead of stored credentials.
             force_full_sync: If True, forces a full sync with orphaned entity deletion.
             execution_config: Optional execution config for sync behavior.
+            vespa_feeder: Optional pooled Vespa document feeder (worker registry).
+            http_client_pool_metrics: Optional source HTTP pool instrumentation
+                (worker registry).
+            vespa_query_client: Optional pooled Vespa query client (worker registry).
 
         Returns:
             The sync.
@@ -70,6 +79,9 @@ class SyncService(SyncServiceProtocol):
                     execution_config=execution_config,
                     dense_embedder=dense_embedder,
                     sparse_embedder=sparse_embedder,
+                    vespa_feeder=vespa_feeder,
+                    http_client_pool_metrics=http_client_pool_metrics,
+                    vespa_query_client=vespa_query_client,
                 )
         except Exception as e:
             ctx.logger.error(f"Error during sync orchestrator creation: {e}")
@@ -157,7 +157,7 @@ async def test_run(case: RunCase):
 
 @pytest.mark.asyncio
 async def test_run_forwards_optional_kwargs():
-    """access_token, force_full_sync, execution_config reach the factory."""
+    """access_token, force_full_sync, execution_config and metrics reach the factory."""
     fake_job_svc = FakeSyncJobService()
     svc = SyncService(sync_job_service=fake_job_svc)
 
@@ -180,6 +180,9 @@ async def test_run_forwards_optional_kwargs():
         )
 
         exec_config = MagicMock()
+        feeder = MagicMock()
+        pool_metrics = MagicMock()
+        query_client = MagicMock()
 
         await svc.run(
             sync=_mock_sync(),
@@ -192,12 +195,18 @@ async def test_run_forwards_optional_kwargs():
             access_token="tok-123",
             force_full_sync=True,
             execution_config=exec_config,
+            vespa_feeder=feeder,
+            http_client_pool_metrics=pool_metrics,
+            vespa_query_client=query_client,
         )
 
         _, kwargs = mock_factory_cls.create_orchestrator.call_args
         assert kwargs["access_token"] == "tok-123"
         assert kwargs["force_full_sync"] is True
         assert kwargs["execution_config"] is exec_config
+        assert kwargs["vespa_feeder"] is feeder
+        assert kwargs["http_client_pool_metrics"] is pool_metrics
+        assert kwargs["vespa_query_client"] is query_client
 
 
 # ---------------------------------------------------------------------------
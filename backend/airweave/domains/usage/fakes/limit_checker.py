@@ -9,6 +9,7 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from airweave.domains.usage.exceptions import UsageLimitExceededError
 from airweave.domains.usage.protocols import UsageLimitCheckerProtocol
 from airweave.domains.usage.types import ActionType
 
@@ -31,6 +32,13 @@ class FakeUsageLimitChecker(UsageLimitCheckerProtocol):
         """Initialize with empty deny set and call log."""
         self._denied: set[tuple[UUID, ActionType]] = set()
         self.calls: list[tuple[UUID, ActionType, int]] = []
+        self.reserve_calls: list[tuple[UUID, ActionType, int]] = []
+        self.released: dict[tuple[UUID, ActionType], int] = {}
+        self._grant_limits: dict[tuple[UUID, ActionType], int] = {}
+
+    def limit_grants(self, organization_id: UUID, action_type: ActionType, total: int) -> None:
+        """Cap the total units ``reserve()`` will ever grant for the pair."""
+        self._grant_limits[(organization_id, action_type)] = total
 
     def deny(self, organization_id: UUID, action_type: ActionType) -> None:
         """Configure a specific (org, action) pair to be denied."""
@@ -50,3 +58,26 @@ class FakeUsageLimitChecker(UsageLimitCheckerProtocol):
         """Return True unless the (org, action) pair was explicitly denied."""
         self.calls.append((organization_id, action_type, amount))
         return (organization_id, action_type) not in self._denied
+
+    async def reserve(
+        self,
+        db: AsyncSession,
+        organization_id: UUID,
+        action_type: ActionType,
+        amount: int,
+    ) -> int:
+        """Grant *amount* units until denied or the configured grant cap runs out."""
+        self.reserve_calls.append((organization_id, action_type, amount))
+        key = (organization_id, action_type)
+        remaining = self._grant_limits.get(key)
+        if key in self._denied or remaining == 0:
+            raise UsageLimitExceededError(action_type=action_type.value, limit=0, current_usage=0)
+        granted = amount if remaining is None else min(amount, remaining)
+        if remaining is not None:
+            self._grant_limits[key] = remaining - granted
+        return granted
+
+    def release(self, organization_id: UUID, action_type: ActionType, amount: int) -> None:
+        """Record released units."""
+        key = (organization_id, action_type)
+        self.released[key] = self.released.get(key, 0) + amount
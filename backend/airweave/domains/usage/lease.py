@@ -0,0 +1,144 @@
+"""Usage budget lease — block-wise usage allowances for hot loops.
+
+Checking the limit per unit costs a DB session checkout per call. A lease
+reserves a block of allowances from the limit checker, hands them out
+locally, and reserves the next block in the background once the current
+one runs low. When the checker refuses a block, units already granted
+are still handed out, then the refusal is raised — so the caller stops
+at the limit, not a block after it.
+
+Consumed units are billed through the UsageLedger as usual. The lease
+returns them to the checker (together with any unused units) at each
+renewal and on ``close()``, which callers should do after flushing the
+ledger so the usage table already contains them.
+"""
+
+import asyncio
+from typing import Optional
+from uuid import UUID
+
+from airweave.domains.usage.protocols import UsageLimitCheckerProtocol
+from airweave.domains.usage.types import ActionType
+
+DEFAULT_LEASE_BLOCK_SIZE = 1000
+
+# Start reserving the next block when this fraction of the current one is left.
+_RENEW_FRACTION = 0.25
+
+
+class UsageBudgetLease:
+    """Locally consumed block of pre-checked usage allowances.
+
+    Usage::
+
+        lease = UsageBudgetLease(checker, org_id, ActionType.ENTITIES)
+        for item in items:
+            await lease.consume()  # raises UsageLimitExceededError at the limit
+        ...
+        await ledger.flush(org_id)
+        await lease.close()
+    """
+
+    def __init__(
+        self,
+        checker: UsageLimitCheckerProtocol,
+        organization_id: UUID,
+        action_type: ActionType,
+        block_size: int = DEFAULT_LEASE_BLOCK_SIZE,
+    ) -> None:
+        """Initialize the lease (nothing is reserved until the first consume).
+
+        Args:
+            checker: Limit checker that grants and takes back blocks.
+            organization_id: Organization whose limit is consumed.
+            action_type: Action type being consumed.
+            block_size: Units requested per reservation.
+        """
+        self._checker = checker
+        self._organization_id = organization_id
+        self._action_type = action_type
+        self._block_size = block_size
+        self._renew_threshold = int(block_size * _RENEW_FRACTION)
+
+        self._remaining = 0
+        self._consumed = 0  # consumed since the last release to the checker
+        self._renewal: Optional[asyncio.Task[int]] = None
+
+    @property
+    def remaining(self) -> int:
+        """Units available locally without another reservation."""
+        return self._remaining
+
+    async def consume(self, amount: int = 1) -> None:
+        """Take *amount* units, reserving another block first if needed.
+
+        Raises:
+            UsageLimitExceededError: If the limit is reached.
+            PaymentRequiredError: If the billing status blocks the action.
+        """
+        self._collect_renewal()
+        while self._remaining < amount:
+            await self._await_renewal()
+
+        self._remaining -= amount
+        self._consumed += amount
+
+        if self._remaining <= self._renew_threshold and self._renewal is None:
+            self._start_renewal()
+
+    async def close(self) -> None:
+        """Stop any pending renewal and return all held units to the checker."""
+        task, self._renewal = self._renewal, None
+        if task is not None:
+            if not task.done():
+                task.cancel()
+            try:
+                self._remaining += await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._release(self._consumed + self._remaining)
+        self._consumed = 0
+        self._remaining = 0
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _start_renewal(self) -> None:
+        # Hand consumed units back first: from here on the ledger accounts for them.
+        self._release(self._consumed)
+        self._consumed = 0
+        self._renewal = asyncio.create_task(self._reserve())
+
+    async def _await_renewal(self) -> None:
+        """Wait for the in-flight reservation (starting one if needed).
+
+        A refused reservation stays stored, so every later call re-raises it
+        instead of asking the checker again.
+        """
+        if self._renewal is None:
+            self._start_renewal()
+        task = self._renewal
+        granted = await task
+        self._renewal = None
+        self._remaining += granted
+
+    def _collect_renewal(self) -> None:
+        """Fold a successfully finished background reservation into the balance."""
+        task = self._renewal
+        if task is None or not task.done() or task.cancelled() or task.exception() is not None:
+            return
+        self._renewal = None
+        self._remaining += task.result()
+
+    async def _reserve(self) -> int:
+        from airweave.db.session import get_db_context
+
+        async with get_db_context() as db:
+            return await self._checker.reserve(
+                db, self._organization_id, self._action_type, self._block_size
+            )
+
+    def _release(self, amount: int) -> None:
+        if amount > 0:
+            self._checker.release(self._organization_id, self._action_type, amount)
@@ -6,6 +6,11 @@ cached per-org with a short TTL.
 
 SOURCE_CONNECTIONS and TEAM_MEMBERS always query live counts.
 ENTITIES and QUERIES accept cached usage data (30s TTL).
+
+Hot loops (the sync entity stream) take allowances in blocks via
+``reserve()`` / ``release()`` instead of calling ``is_allowed()`` per unit;
+see :class:`~airweave.domains.usage.lease.UsageBudgetLease`. Units reserved
+but not yet released count against the limit for every caller.
 """
 
 import asyncio
@@ -71,13 +76,15 @@ def _parse_plan(raw: Union[str, BillingPlan]) -> Optional[BillingPlan]:
 class _OrgCache:
     """Short-lived per-org cache entry."""
 
-    __slots__ = ("has_billing", "usage", "usage_limit", "fetched_at")
+    __slots__ = ("has_billing", "usage", "usage_limit", "fetched_at", "reserved")
 
     def __init__(self) -> None:
         self.has_billing: Optional[bool] = None
         self.usage: Optional[Usage] = None
         self.usage_limit: Optional[UsageLimit] = None
         self.fetched_at: Optional[datetime] = None
+        # Units handed out by reserve() and not yet released, per action type
+        self.reserved: dict[ActionType, int] = {}
 
     @property
     def is_stale(self) -> bool:
@@ -125,28 +132,14 @@ class UsageLimitChecker(UsageLimitCheckerProtocol):
             if not has_billing:
                 return True
 
-            billing_status = await self._get_billing_status(db, organization_id)
-            restricted = BILLING_STATUS_RESTRICTIONS.get(billing_status, set())
-            if action_type in restricted:
-                raise PaymentRequiredError(
-                    action_type=action_type.value,
-                    payment_status=billing_status.value,
-                )
+            await self._check_billing_status(db, organization_id, action_type)
 
             if action_type in _FRESH_ACTION_TYPES:
                 return await self._check_dynamic(db, organization_id, action_type, amount, cache)
 
-            if cache.is_stale:
-                cache.usage = await self._get_usage(db, organization_id)
-                cache.fetched_at = datetime.now(UTC)
-
-            if cache.usage_limit is None:
-                cache.usage_limit = await self._infer_limit(db, organization_id)
-
-            current = getattr(cache.usage, action_type.value, 0) if cache.usage else 0
-            limit_field = f"max_{action_type.value}"
-            limit = getattr(cache.usage_limit, limit_field, None) if cache.usage_limit else None
-
+            current, limit = await self._get_cached_usage_and_limit(
+                db, organization_id, action_type, cache
+            )
             if limit is None:
                 return True
 
@@ -158,10 +151,102 @@ class UsageLimitChecker(UsageLimitCheckerProtocol):
                 )
             return True
 
+    async def reserve(
+        self,
+        db: AsyncSession,
+        organization_id: UUID,
+        action_type: ActionType,
+        amount: int,
+    ) -> int:
+        """Reserve up to *amount* units of *action_type*.
+
+        Grants ``min(amount, remaining allowance)`` and holds those units
+        against the limit until they are released.
+
+        Returns:
+            The number of units granted (at least 1).
+
+        Raises:
+            UsageLimitExceededError: If no allowance is left.
+            PaymentRequiredError: If the billing status blocks the action.
+        """
+        async with self._lock:
+            cache = self._get_cache(organization_id)
+
+            has_billing = await self._check_has_billing(db, organization_id, cache)
+            if not has_billing:
+                return amount
+
+            await self._check_billing_status(db, organization_id, action_type)
+
+            if action_type in _FRESH_ACTION_TYPES:
+                await self._check_dynamic(db, organization_id, action_type, amount, cache)
+                return amount
+
+            current, limit = await self._get_cached_usage_and_limit(
+                db, organization_id, action_type, cache
+            )
+            if limit is None:
+                return amount
+
+            granted = min(amount, limit - current)
+            if granted <= 0:
+                raise UsageLimitExceededError(
+                    action_type=action_type.value,
+                    limit=limit,
+                    current_usage=current,
+                )
+            cache.reserved[action_type] = cache.reserved.get(action_type, 0) + granted
+            return granted
+
+    def release(self, organization_id: UUID, action_type: ActionType, amount: int) -> None:
+        """Return *amount* reserved units (used or not).
+
+        Used units reach the usage table through the ledger, so the cached
+        usage is marked stale and re-read on the next check.
+        """
+        cache = self._cache.get(organization_id)
+        if cache is None or amount <= 0:
+            return
+        cache.reserved[action_type] = max(0, cache.reserved.get(action_type, 0) - amount)
+        cache.fetched_at = None
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    async def _check_billing_status(
+        self, db: AsyncSession, org_id: UUID, action_type: ActionType
+    ) -> None:
+        billing_status = await self._get_billing_status(db, org_id)
+        restricted = BILLING_STATUS_RESTRICTIONS.get(billing_status, set())
+        if action_type in restricted:
+            raise PaymentRequiredError(
+                action_type=action_type.value,
+                payment_status=billing_status.value,
+            )
+
+    async def _get_cached_usage_and_limit(
+        self,
+        db: AsyncSession,
+        org_id: UUID,
+        action_type: ActionType,
+        cache: _OrgCache,
+    ) -> tuple[int, Optional[int]]:
+        """Return (current usage incl. outstanding reservations, limit or None)."""
+        if cache.is_stale:
+            cache.usage = await self._get_usage(db, org_id)
+            cache.fetched_at = datetime.now(UTC)
+
+        if cache.usage_limit is None:
+            cache.usage_limit = await self._infer_limit(db, org_id)
+
+        current = getattr(cache.usage, action_type.value, 0) if cache.usage else 0
+        current += cache.reserved.get(action_type, 0)
+        limit_field = f"max_{action_type.value}"
+        limit = getattr(cache.usage_limit, limit_field, None) if cache.usage_limit else None
+        return current, limit
+
     async def _check_has_billing(self, db: AsyncSession, org_id: UUID, cache: _OrgCache) -> bool:
         if cache.has_billing is not None:
             return cache.has_billing
@@ -251,3 +336,16 @@ class AlwaysAllowLimitChecker(UsageLimitCheckerProtocol):
     ) -> bool:
         """Always allow; no enforcement."""
         return True
+
+    async def reserve(
+        self,
+        db: AsyncSession,
+        organization_id: UUID,
+        action_type: ActionType,
+        amount: int,
+    ) -> int:
+        """Grant the full amount; no enforcement."""
+        return amount
+
+    def release(self, organization_id: UUID, action_type: ActionType, amount: int) -> None:
+        """Nothing is held, so nothing to release."""
@@ -34,6 +34,25 @@ class UsageLimitCheckerProtocol(Protocol):
         """
         ...
 
+    async def reserve(
+        self,
+        db: AsyncSession,
+        organization_id: UUID,
+        action_type: ActionType,
+        amount: int,
+    ) -> int:
+        """Reserve up to *amount* units of *action_type* for local consumption.
+
+        Returns the number of units granted (at least 1). Granted units
+        count against the limit until released. Raises
+        UsageLimitExceededError or PaymentRequiredError if none are allowed.
+        """
+        ...
+
+    def release(self, organization_id: UUID, action_type: ActionType, amount: int) -> None:
+        """Return *amount* previously reserved units, consumed or not."""
+        ...
+
 
 @runtime_checkable
 class UsageLedgerProtocol(Protocol):
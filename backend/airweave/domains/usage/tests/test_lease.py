@@ -0,0 +1,124 @@
+"""Unit tests for UsageBudgetLease."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from airweave.domains.usage.exceptions import UsageLimitExceededError
+from airweave.domains.usage.fakes.limit_checker import FakeUsageLimitChecker
+from airweave.domains.usage.lease import UsageBudgetLease
+from airweave.domains.usage.tests.conftest import DEFAULT_ORG_ID, _make_checker
+from airweave.domains.usage.tests.test_service import _seeded_checker
+from airweave.domains.usage.types import ActionType
+from airweave.schemas.organization_billing import BillingPlan
+
+KEY = (DEFAULT_ORG_ID, ActionType.ENTITIES)
+
+
+@asynccontextmanager
+async def _fake_db_context():
+    yield AsyncMock()
+
+
+@pytest.fixture(autouse=True)
+def _patch_db_context():
+    with patch("airweave.db.session.get_db_context", new=_fake_db_context):
+        yield
+
+
+def _lease(checker, block_size=100):
+    return UsageBudgetLease(checker, DEFAULT_ORG_ID, ActionType.ENTITIES, block_size=block_size)
+
+
+class TestConsume:
+    @pytest.mark.asyncio
+    async def test_reserves_once_per_block(self):
+        checker = FakeUsageLimitChecker()
+        lease = _lease(checker)
+
+        for _ in range(70):
+            await lease.consume()
+
+        assert checker.reserve_calls == [(DEFAULT_ORG_ID, ActionType.ENTITIES, 100)]
+        assert checker.calls == []
+        assert lease.remaining == 30
+
+    @pytest.mark.asyncio
+    async def test_renews_in_background_before_running_out(self):
+        checker = FakeUsageLimitChecker()
+        lease = _lease(checker)
+
+        for _ in range(75):
+            await lease.consume()
+        await asyncio.sleep(0)
+        assert len(checker.reserve_calls) == 2  # next block requested at 25 left
+
+        for _ in range(25):
+            await lease.consume()
+        assert lease.remaining == 100
+
+    @pytest.mark.asyncio
+    async def test_stops_exactly_at_limit(self):
+        checker = FakeUsageLimitChecker()
+        checker.limit_grants(DEFAULT_ORG_ID, ActionType.ENTITIES, 130)
+        lease = _lease(checker)
+
+        consumed = 0
+        with pytest.raises(UsageLimitExceededError):
+            for _ in range(1000):
+                await lease.consume()
+                consumed += 1
+
+        assert consumed == 130
+
+    @pytest.mark.asyncio
+    async def test_refusal_is_not_retried(self):
+        checker = FakeUsageLimitChecker()
+        checker.deny(DEFAULT_ORG_ID, ActionType.ENTITIES)
+        lease = _lease(checker)
+
+        for _ in range(3):
+            with pytest.raises(UsageLimitExceededError):
+                await lease.consume()
+
+        assert len(checker.reserve_calls) == 1
+
+
+class TestReconciliation:
+    @pytest.mark.asyncio
+    async def test_close_releases_everything_granted(self):
+        checker = FakeUsageLimitChecker()
+        lease = _lease(checker)
+
+        for _ in range(180):
+            await lease.consume()
+        await lease.close()
+
+        granted = sum(amount for *_, amount in checker.reserve_calls)
+        assert checker.released[KEY] == granted
+        assert lease.remaining == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_leases_share_the_limit(self):
+        checker, *_ = _seeded_checker(plan=BillingPlan.PRO, entities=99850)
+        first, second = _lease(checker), _lease(checker)
+
+        await first.consume()
+        await second.consume()
+
+        # 150 units of headroom: the first lease holds 100, the second gets the rest
+        assert first.remaining == 99
+        assert second.remaining == 49
+        await first.close()
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_unbilled_org_is_never_limited(self):
+        checker, *_ = _make_checker()
+        lease = _lease(checker, block_size=10)
+
+        for _ in range(50):
+            await lease.consume()
+        await lease.close()
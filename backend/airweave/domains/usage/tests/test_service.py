@@ -373,3 +373,63 @@ class TestBillingRecordFallback:
         """No billing record at all should still fall back to developer limits."""
         checker, *_ = _make_checker()
         assert await checker.is_allowed(db, DEFAULT_ORG_ID, ActionType.ENTITIES) is True
+
+
+# ---------------------------------------------------------------------------
+# reserve / release — block allowances
+# ---------------------------------------------------------------------------
+
+
+class TestReserve:
+    @pytest.mark.asyncio
+    async def test_grants_full_block_under_limit(self, db):
+        checker, *_ = _seeded_checker(plan=BillingPlan.PRO, entities=50000)
+        assert await checker.reserve(db, DEFAULT_ORG_ID, ActionType.ENTITIES, 1000) == 1000
+
+    @pytest.mark.asyncio
+    async def test_grants_partial_block_near_limit(self, db):
+        checker, *_ = _seeded_checker(plan=BillingPlan.PRO, entities=99990)
+        assert await checker.reserve(db, DEFAULT_ORG_ID, ActionType.ENTITIES, 1000) == 10
+
+    @pytest.mark.asyncio
+    async def test_reserved_units_count_against_limit(self, db):
+        checker, *_ = _seeded_checker(plan=BillingPlan.PRO, entities=99000)
+        await checker.reserve(db, DEFAULT_ORG_ID, ActionType.ENTITIES, 1000)
+
+        with pytest.raises(UsageLimitExceededError) as exc_info:
+            await checker.reserve(db, DEFAULT_ORG_ID, ActionType.ENTITIES, 1000)
+        assert exc_info.value.current_usage == 100000
+        with pytest.raises(UsageLimitExceededError):
+            await checker.is_allowed(db, DEFAULT_ORG_ID, ActionType.ENTITIES)
+
+    @pytest.mark.asyncio
+    async def test_release_frees_units_and_rereads_usage(self, db):
+        checker, usage_repo, *_ = _seeded_checker(plan=BillingPlan.PRO, entities=99000)
+        await checker.reserve(db, DEFAULT_ORG_ID, ActionType.ENTITIES, 1000)
+        # 400 of the reserved units were used and flushed by the ledger
+        usage_repo.seed_current(
+            DEFAULT_ORG_ID, _make_usage_model(org_id=DEFAULT_ORG_ID, entities=99400)
+        )
+
+        checker.release(DEFAULT_ORG_ID, ActionType.ENTITIES, 1000)
+
+        assert await checker.reserve(db, DEFAULT_ORG_ID, ActionType.ENTITIES, 1000) == 600
+
+    @pytest.mark.asyncio
+    async def test_payment_status_blocks_reserve(self, db):
+        checker, *_ = _seeded_checker(period_status=BillingPeriodStatus.ENDED_UNPAID)
+        with pytest.raises(PaymentRequiredError):
+            await checker.reserve(db, DEFAULT_ORG_ID, ActionType.ENTITIES, 1000)
+
+    @pytest.mark.asyncio
+    async def test_unlimited_and_unbilled_grant_full_block(self, db):
+        enterprise, *_ = _seeded_checker(plan=BillingPlan.ENTERPRISE, entities=999999999)
+        unbilled, *_ = _make_checker()
+        assert await enterprise.reserve(db, DEFAULT_ORG_ID, ActionType.ENTITIES, 500) == 500
+        assert await unbilled.reserve(db, DEFAULT_ORG_ID, ActionType.ENTITIES, 500) == 500
+
+    @pytest.mark.asyncio
+    async def test_always_allow_checker_grants_full_block(self, db):
+        checker = AlwaysAllowLimitChecker()
+        assert await checker.reserve(db, DEFAULT_ORG_ID, ActionType.ENTITIES, 500) == 500
+        checker.release(DEFAULT_ORG_ID, ActionType.ENTITIES, 500)
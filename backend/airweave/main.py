@@ -104,6 +104,14 @@ async def lifespan(app: FastAPI):
 
     container_mod.container.health.shutting_down = True
 
+    # Write search analytics still queued by the background writer
+    if container_mod.container.search_query_writer is not None:
+        await container_mod.container.search_query_writer.close()
+
+    # Close the pooled Vespa query connections shared by all searches
+    if container_mod.container.vespa_query_client is not None:
+        await container_mod.container.vespa_query_client.close()
+
     # Clean up health check engine connections
     from airweave.db.session import health_check_engine
 
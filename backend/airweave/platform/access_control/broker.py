@@ -1,11 +1,13 @@
 """Access broker for resolving user access context."""
 
-from typing import List, Optional, Set
+from typing import Optional, Set
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import airweave.core.container as _container_module  # TODO(code-blue): inject via constructor
 from airweave import crud
+from airweave.core.protocols.cache import AccessPrincipalCache
 from airweave.platform.access_control.schemas import AccessContext
 from airweave.platform.entities._base import AccessControl
 
@@ -19,17 +21,37 @@ class AccessBroker:
     Access control is only applied when at least one source in the collection
     has supports_access_control=True. For collections with only non-AC sources,
     no filtering is applied (all entities visible to everyone).
+
+    Group expansion is a single recursive query over membership tuples.
+    Resolved groups are cached per (organization, principal, scope) in the
+    container's AccessPrincipalCache; AccessControlPipeline invalidates an
+    organization's entries at the end of every membership sync. Resolutions
+    that started before an invalidation are not stored after it.
     """
 
+    # Maximum nesting levels followed when expanding group-to-group memberships
+    MAX_GROUP_NESTING_DEPTH = 10
+
+    # Cache scope for organization-wide (not collection-scoped) resolution
+    _ORGANIZATION_SCOPE = "org"
+
+    def __init__(self, principal_cache: Optional[AccessPrincipalCache] = None) -> None:
+        """Initialize the broker.
+
+        Args:
+            principal_cache: Cache of resolved groups. Defaults to the
+                container's ``access_principal_cache`` (if any).
+        """
+        self._principal_cache = principal_cache
+
     async def resolve_access_context(
         self, db: AsyncSession, user_principal: str, organization_id: UUID
     ) -> AccessContext:
         """Resolve user's access context by expanding group memberships.
 
         Steps:
-        1. Query database for user's direct group memberships
-        2. Recursively expand group-to-group relationships (if any)
-        3. Build AccessContext with user + all expanded group principals
+        1. Resolve user's direct + nested group memberships (one recursive query)
+        2. Build AccessContext with user + all expanded group principals
 
         Note: SharePoint uses /transitivemembers so group expansion happens
         server-side. Other sources may store group-group tuples that need
@@ -43,25 +65,15 @@ class AccessBroker:
         Returns:
             AccessContext with fully expanded principals
         """
-        # Query direct user-group memberships (member_type="user")
-        memberships = await crud.access_control_membership.get_by_member(
-            db=db, member_id=user_principal, member_type="user", organization_id=organization_id
-        )
-
-        # Build principals
-        user_principals = [f"user:{user_principal}"]
-
-        # Recursively expand group-to-group relationships (if any exist)
-        # For SharePoint: no group-group tuples exist (uses /transitivemembers)
-        # For other sources: this handles nested group expansion
-        all_groups = await self._expand_group_memberships(
-            db=db, group_ids=[m.group_id for m in memberships], organization_id=organization_id
+        # Direct + nested group memberships in one query (or from cache)
+        all_groups = await self._resolve_groups(
+            db=db, user_principal=user_principal, organization_id=organization_id
         )
 
         return AccessContext(
             user_principal=user_principal,
-            user_principals=user_principals,
-            group_principals=[f"group:{g}" for g in all_groups],
+            user_principals=[f"user:{user_principal}"],
+            group_principals=[f"group:{g}" for g in sorted(all_groups)],
         )
 
     async def resolve_access_context_for_collection(
@@ -83,9 +95,9 @@ class AccessBroker:
         Steps:
         1. Check if collection has any sources with access control
         2. If no AC sources, return None (no filtering needed)
-        3. Query database for user's group memberships within the collection
-        4. Recursively expand group-to-group relationships (if any)
-        5. Build AccessContext with user + all expanded group principals
+        3. Resolve user's group memberships within the collection, plus nested
+           groups (one recursive query)
+        4. Build AccessContext with user + all expanded group principals
 
         Args:
             db: Database session
@@ -108,30 +120,27 @@ class AccessBroker:
             # No access control sources in collection → skip filtering
             return None
 
-        # Query user-group memberships scoped to collection (member_type="user")
-        memberships = await crud.access_control_membership.get_by_member_and_collection(
+        # Direct memberships scoped to collection, then nested groups organization-wide,
+        # in one query (or from cache)
+        all_groups = await self._resolve_groups(
             db=db,
-            member_id=user_principal,
-            member_type="user",
-            readable_collection_id=readable_collection_id,
+            user_principal=user_principal,
             organization_id=organization_id,
-        )
-
-        # Build principals
-        user_principals = [f"user:{user_principal}"]
-
-        # Recursively expand group-to-group relationships (if any exist)
-        # Note: Group expansion is still organization-wide, not collection-scoped
-        all_groups = await self._expand_group_memberships(
-            db=db, group_ids=[m.group_id for m in memberships], organization_id=organization_id
+            readable_collection_id=readable_collection_id,
         )
 
         return AccessContext(
             user_principal=user_principal,
-            user_principals=user_principals,
-            group_principals=[f"group:{g}" for g in all_groups],
+            user_principals=[f"user:{user_principal}"],
+            group_principals=[f"group:{g}" for g in sorted(all_groups)],
         )
 
+    async def invalidate_organization(self, organization_id: UUID) -> None:
+        """Drop cached group resolutions for an organization after memberships change."""
+        cache = self._get_principal_cache()
+        if cache is not None:
+            await cache.invalidate_organization(organization_id)
+
     async def _collection_has_ac_sources(
         self,
         db: AsyncSession,
@@ -175,52 +184,66 @@ class AccessBroker:
         result = await db.execute(stmt)
         return result.scalar() or False
 
-    async def _expand_group_memberships(
-        self, db: AsyncSession, group_ids: List[str], organization_id: UUID
+    async def _resolve_groups(
+        self,
+        db: AsyncSession,
+        user_principal: str,
+        organization_id: UUID,
+        readable_collection_id: Optional[str] = None,
     ) -> Set[str]:
-        """Recursively expand group memberships to handle nested groups.
+        """Resolve a user's direct and transitive groups, consulting the cache first.
 
         For sources that store group-to-group relationships (e.g., Google Drive),
-        this recursively expands nested groups via CRUD layer. For SharePoint,
-        /transitivemembers handles this server-side, so no group-group tuples exist.
+        nested groups are expanded up to ``MAX_GROUP_NESTING_DEPTH`` levels. For
+        SharePoint, /transitivemembers handles this server-side, so no group-group
+        tuples exist and the recursion stops after the direct memberships.
 
         Args:
             db: Database session
-            group_ids: List of initial group IDs
+            user_principal: User principal (username or identifier)
             organization_id: Organization ID
+            readable_collection_id: Optional collection readable_id scoping direct memberships
 
         Returns:
             Set of all group IDs (direct + transitive)
         """
-        all_groups = set(group_ids)
-        to_process = set(group_ids)
-        visited = set()
-
-        # Recursively expand (max depth: 10 to prevent infinite loops)
-        max_depth = 10
-        depth = 0
-
-        while to_process and depth < max_depth:
-            current_group = to_process.pop()
-            if current_group in visited:
-                continue
-            visited.add(current_group)
-
-            # Query for group-to-group memberships via CRUD layer (member_type="group")
-            nested_memberships = await crud.access_control_membership.get_by_member(
-                db=db, member_id=current_group, member_type="group", organization_id=organization_id
-            )
+        cache = self._get_principal_cache()
+        scope = (
+            f"collection:{readable_collection_id}"
+            if readable_collection_id is not None
+            else self._ORGANIZATION_SCOPE
+        )
 
-            # Add parent groups and queue for processing
-            for m in nested_memberships:
-                if m.group_id not in all_groups:
-                    all_groups.add(m.group_id)
-                    to_process.add(m.group_id)
+        generation = None
+        if cache is not None:
+            cached = await cache.get_groups(organization_id, user_principal, scope)
+            if cached is not None:
+                return set(cached)
+            # Read before the query so a concurrent invalidation rejects our write
+            generation = await cache.generation(organization_id)
 
-            depth += 1
+        all_groups = await crud.access_control_membership.get_group_closure(
+            db=db,
+            member_id=user_principal,
+            member_type="user",
+            organization_id=organization_id,
+            readable_collection_id=readable_collection_id,
+            max_depth=self.MAX_GROUP_NESTING_DEPTH,
+        )
+
+        if cache is not None and generation is not None:
+            await cache.set_groups(
+                organization_id, user_principal, scope, sorted(all_groups), generation
+            )
 
         return all_groups
 
+    def _get_principal_cache(self) -> Optional[AccessPrincipalCache]:
+        if self._principal_cache is not None:
+            return self._principal_cache
+        container = _container_module.container
+        return container.access_principal_cache if container is not None else None
+
     def check_entity_access(
         self, entity_access: Optional[AccessControl], access_context: Optional[AccessContext]
     ) -> bool:
@@ -13,6 +13,7 @@ from airweave import schemas
 from airweave.core.constants.reserved_ids import NATIVE_VESPA_UUID
 from airweave.core.context import BaseContext
 from airweave.core.logging import ContextualLogger
+from airweave.core.protocols.vespa import VespaFeederProtocol, VespaQueryClientProtocol
 from airweave.platform.destinations._base import BaseDestination
 from airweave.platform.destinations.vespa import VespaDestination
 from airweave.platform.entities._base import BaseEntity
@@ -31,6 +32,8 @@ class DestinationsContextBuilder:
         ctx: BaseContext,
         logger: ContextualLogger,
         execution_config: Optional[SyncConfig] = None,
+        feeder: Optional[VespaFeederProtocol] = None,
+        query_client: Optional[VespaQueryClientProtocol] = None,
     ) -> tuple:
         """Build destinations and entity map.
 
@@ -41,6 +44,8 @@ class DestinationsContextBuilder:
             ctx: Base context (provides org identity for CRUD)
             logger: Contextual logger
             execution_config: Optional execution config for filtering
+            feeder: Optional pooled Vespa document feeder
+            query_client: Optional pooled Vespa query client
 
         Returns:
             Tuple of (destinations, entity_map).
@@ -52,6 +57,8 @@ class DestinationsContextBuilder:
             ctx=ctx,
             logger=logger,
             execution_config=execution_config,
+            feeder=feeder,
+            query_client=query_client,
         )
         entity_map = cls._get_entity_definition_map()
 
@@ -129,6 +136,8 @@ class DestinationsContextBuilder:
         ctx,
         logger: ContextualLogger,
         execution_config: Optional[SyncConfig] = None,
+        feeder: Optional[VespaFeederProtocol] = None,
+        query_client: Optional[VespaQueryClientProtocol] = None,
     ) -> List[BaseDestination]:
         """Create destination instances."""
         destinations = []
@@ -147,6 +156,8 @@ class DestinationsContextBuilder:
                     collection=collection,
                     ctx=ctx,
                     logger=logger,
+                    feeder=feeder,
+                    query_client=query_client,
                 )
                 if destination:
                     destinations.append(destination)
@@ -178,18 +189,22 @@ class DestinationsContextBuilder:
         collection: schemas.CollectionRecord,
         ctx,
         logger: ContextualLogger,
+        feeder: Optional[VespaFeederProtocol] = None,
+        query_client: Optional[VespaQueryClientProtocol] = None,
     ) -> Optional[BaseDestination]:
         """Create a single destination instance."""
         if destination_connection_id != NATIVE_VESPA_UUID:
             logger.warning(f"Unknown destination connection {destination_connection_id}, skipping")
             return None
-        return await cls._create_vespa(collection, logger)
+        return await cls._create_vespa(collection, logger, feeder=feeder, query_client=query_client)
 
     @classmethod
     async def _create_vespa(
         cls,
         collection: schemas.CollectionRecord,
         logger: ContextualLogger,
+        feeder: Optional[VespaFeederProtocol] = None,
+        query_client: Optional[VespaQueryClientProtocol] = None,
     ) -> BaseDestination:
         """Create native Vespa destination directly."""
         logger.info("Using native Vespa destination (settings-based)")
@@ -200,6 +215,8 @@ class DestinationsContextBuilder:
             organization_id=collection.organization_id,
             vector_size=None,
             logger=logger,
+            feeder=feeder,
+            query_client=query_client,
         )
         logger.info("Created native Vespa destination")
         return destination
@@ -1,6 +1,7 @@
 """Code chunker using AST-based parsing with TokenChunker safety net."""
 
-from typing import Any, Dict, List, Optional
+import threading
+from typing import Any, Dict, List, Optional, Sequence
 
 from airweave.core.logging import logger
 from airweave.platform.chunkers._base import BaseChunker
@@ -18,7 +19,9 @@ class CodeChunker(BaseChunker):
     2. TokenChunker fallback: Force-splits any oversized chunks at token boundaries
 
     The chunker is shared across all syncs in the pod to avoid reloading
-    the Magika language detection model for every sync job.
+    the Magika language detection model for every sync job. When callers
+    already know each text's language (see CodeLanguageDetector), texts are
+    chunked by cached per-language chunkers and skip auto-detection.
 
     Note: Even with AST-based splitting, single large AST nodes (massive functions
     without children) can exceed chunk_size, so we use TokenChunker as safety net.
@@ -47,6 +50,9 @@ class CodeChunker(BaseChunker):
         self._code_chunker = None  # Lazy init
         self._token_chunker = None  # Lazy init (emergency fallback)
         self._tiktoken_tokenizer = None  # Lazy init
+        self._safe_encoding = None  # Lazy init
+        self._language_chunkers: Dict[str, Any] = {}  # language -> Chonkie chunker (or None)
+        self._language_lock = threading.Lock()
         self._initialized = True
 
         logger.debug(
@@ -82,6 +88,7 @@ class CodeChunker(BaseChunker):
             # that may appear in code comments/strings. Without this wrapper,
             # Chonkie calls encode() directly without allowed_special='all'.
             safe_encoding = SafeEncoding(tokenizer.encoding)
+            self._safe_encoding = safe_encoding
 
             # Initialize Chonkie's CodeChunker with auto language detection
             self._code_chunker = ChonkieCodeChunker(
@@ -106,7 +113,9 @@ class CodeChunker(BaseChunker):
         except Exception as e:
             raise SyncFailureError(f"Failed to initialize CodeChunker: {e}")
 
-    async def chunk_batch(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+    async def chunk_batch(
+        self, texts: List[str], languages: Optional[Sequence[Optional[str]]] = None
+    ) -> List[List[Dict[str, Any]]]:
         """Chunk a batch of code texts with two-stage approach.
 
         Stage 1: CodeChunker chunks at AST boundaries (functions, classes)
@@ -117,6 +126,8 @@ class CodeChunker(BaseChunker):
 
         Args:
             texts: List of code textual representations to chunk
+            languages: Optional tree-sitter language per text (None entries are
+                auto-detected)
 
         Returns:
             List of chunk lists (one per input text), where each chunk is a dict
@@ -128,7 +139,10 @@ class CodeChunker(BaseChunker):
 
         # Stage 1: AST-based code chunking
         try:
-            code_results = await run_in_thread_pool(self._code_chunker.chunk_batch, texts)
+            if languages is None:
+                code_results = await run_in_thread_pool(self._code_chunker.chunk_batch, texts)
+            else:
+                code_results = await run_in_thread_pool(self._chunk_by_language, texts, languages)
         except Exception as e:
             # CodeChunker failure = sync failure (not entity-level)
             raise SyncFailureError(f"CodeChunker batch processing failed: {e}")
@@ -170,6 +184,45 @@ class CodeChunker(BaseChunker):
 
         return filtered_results
 
+    def _chunk_by_language(
+        self, texts: List[str], languages: Sequence[Optional[str]]
+    ) -> List[List[Any]]:
+        """Chunk texts grouped by known language, keeping input order."""
+        groups: Dict[Optional[str], List[int]] = {}
+        for idx, language in enumerate(languages):
+            groups.setdefault(language, []).append(idx)
+
+        results: List[List[Any]] = [[] for _ in texts]
+        for language, indices in groups.items():
+            chunker = self._get_language_chunker(language) if language else None
+            chunker = chunker or self._code_chunker
+            group_results = chunker.chunk_batch([texts[i] for i in indices])
+            for idx, chunks in zip(indices, group_results, strict=True):
+                results[idx] = chunks
+        return results
+
+    def _get_language_chunker(self, language: str) -> Any:
+        """Return the cached Chonkie chunker for a language (None if unsupported)."""
+        if language in self._language_chunkers:
+            return self._language_chunkers[language]
+
+        with self._language_lock:
+            if language not in self._language_chunkers:
+                from chonkie import CodeChunker as ChonkieCodeChunker
+
+                try:
+                    chunker = ChonkieCodeChunker(
+                        language=language,
+                        tokenizer=self._safe_encoding,
+                        chunk_size=self.CHUNK_SIZE,
+                        include_nodes=False,
+                    )
+                except Exception as e:
+                    logger.debug(f"[CodeChunker] No chunker for language '{language}': {e}")
+                    chunker = None
+                self._language_chunkers[language] = chunker
+        return self._language_chunkers[language]
+
     def _apply_safety_net_batched(
         self, code_results: List[List[Any]]
     ) -> List[List[Dict[str, Any]]]:
@@ -0,0 +1,158 @@
+"""Pod-level code language detection for the code chunking path.
+
+Code batches used to build a fresh ``Magika()`` (loading its ONNX model),
+encode every file in full to identify it, and look up a tree-sitter
+parser per entity. :class:`CodeLanguageDetector` is a singleton that:
+
+- loads the Magika model lazily, once per pod;
+- identifies files from a bounded prefix (Magika itself only reads the
+  first and last few KB of its input, so files shorter than the prefix
+  get exactly the same answer);
+- caches results per (file extension, prefix digest), so vendored
+  copies, generated files and re-syncs of unchanged files skip inference;
+- keeps a registry of tree-sitter parsers per language, including
+  negative results, shared with :class:`~airweave.platform.chunkers.code.CodeChunker`
+  through the detected language names.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from airweave.core.logging import logger
+
+
+class CodeLanguageDetector:
+    """Singleton Magika + tree-sitter language detector (one per pod).
+
+    Thread-safe: batches are detected in the shared thread pool.
+    """
+
+    # Bytes of each file fed to Magika
+    PREFIX_BYTES = 16 * 1024
+
+    MAX_CACHE_ENTRIES = 50_000
+
+    _instance: Optional["CodeLanguageDetector"] = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        """Singleton pattern - one instance per pod."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """Initialize once per pod (the model loads lazily on first detection)."""
+        if self._initialized:
+            return
+
+        self._magika: Any = None
+        self._available: Optional[bool] = None
+        self._load_lock = threading.Lock()
+
+        self._parsers: Dict[str, Any] = {}  # language -> parser, or None if unsupported
+        self._results: "OrderedDict[Tuple[str, bytes], Optional[str]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._initialized = True
+
+    @property
+    def available(self) -> bool:
+        """Whether Magika and tree-sitter are installed."""
+        if self._available is None:
+            try:
+                import magika  # noqa: F401
+                import tree_sitter_language_pack  # noqa: F401
+
+                self._available = True
+            except ImportError:
+                self._available = False
+        return self._available
+
+    def detect(self, text: str, extension: str = "") -> Optional[str]:
+        """Return the tree-sitter language of ``text``, or None if unsupported.
+
+        Args:
+            text: File content.
+            extension: Lower-case file extension including the dot, if known.
+        """
+        try:
+            # Every char is at least one byte, so this prefix covers PREFIX_BYTES
+            prefix = text[: self.PREFIX_BYTES].encode("utf-8")[: self.PREFIX_BYTES]
+        except UnicodeEncodeError:
+            return None
+        key = (extension, hashlib.blake2b(prefix, digest_size=16).digest())
+
+        with self._cache_lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+
+        try:
+            language = self._identify(prefix)
+        except Exception as e:
+            logger.debug(f"[CodeLanguageDetector] Identification failed: {e}")
+            language = None
+        if language is not None and self.get_parser(language) is None:
+            language = None
+
+        with self._cache_lock:
+            self._results[key] = language
+            if len(self._results) > self.MAX_CACHE_ENTRIES:
+                self._results.popitem(last=False)
+        return language
+
+    def detect_batch(
+        self, texts: Sequence[str], extensions: Optional[Sequence[str]] = None
+    ) -> List[Optional[str]]:
+        """Detect languages for a batch (see :meth:`detect`)."""
+        if extensions is None:
+            extensions = [""] * len(texts)
+        return [self.detect(text, ext) for text, ext in zip(texts, extensions, strict=True)]
+
+    def get_parser(self, language: str) -> Any:
+        """Return the cached tree-sitter parser for ``language``, or None if unsupported."""
+        if language in self._parsers:
+            return self._parsers[language]
+        try:
+            parser = self._load_parser(language)
+        except Exception:
+            parser = None
+        self._parsers[language] = parser
+        return parser
+
+    @staticmethod
+    def extension_of(file_name: Optional[str]) -> str:
+        """Lower-case extension (with dot) used as part of the cache key."""
+        return os.path.splitext(file_name or "")[1].lower()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _identify(self, data: bytes) -> Optional[str]:
+        result = self._get_magika().identify_bytes(data)
+        label = result.output.label
+        return label.lower() if label else None
+
+    def _get_magika(self) -> Any:
+        if self._magika is None:
+            with self._load_lock:
+                if self._magika is None:
+                    self._magika = self._load_magika()
+                    logger.info("Loaded Magika language detection model")
+        return self._magika
+
+    def _load_magika(self) -> Any:
+        from magika import Magika
+
+        return Magika()
+
+    def _load_parser(self, language: str) -> Any:
+        from tree_sitter_language_pack import get_parser
+
+        return get_parser(language)
@@ -13,6 +13,7 @@ if TYPE_CHECKING:
     from airweave.core.protocols.event_bus import EventBus
     from airweave.domains.embedders.protocols import DenseEmbedderProtocol, SparseEmbedderProtocol
     from airweave.platform.destinations._base import BaseDestination
+    from airweave.platform.http_client.pool import SourceHttpClientPool
     from airweave.platform.sources._base import BaseSource
     from airweave.platform.sync.cursor import SyncCursor
     from airweave.platform.sync.pipeline.entity_tracker import EntityTracker
@@ -37,3 +38,4 @@ class SyncRuntime:
     dense_embedder: Optional["DenseEmbedderProtocol"] = None
     sparse_embedder: Optional["SparseEmbedderProtocol"] = None
     destinations: List["BaseDestination"] = field(default_factory=list)
+    http_client_pool: Optional["SourceHttpClientPool"] = None
@@ -19,6 +19,7 @@ from .xlsx_converter import XlsxConverter
 
 if TYPE_CHECKING:
     from airweave.core.protocols import OcrProvider
+    from airweave.platform.converters.process_pool import ExtractionProcessPool
 
 # ---------------------------------------------------------------------------
 # Singleton management
@@ -61,7 +62,10 @@ del _mod
 _singletons: dict | None = None
 
 
-def initialize_converters(ocr_provider: "OcrProvider | None" = None) -> None:
+def initialize_converters(
+    ocr_provider: "OcrProvider | None" = None,
+    extraction_pool: "ExtractionProcessPool | None" = None,
+) -> None:
     """Initialize converter singletons with the given OCR provider.
 
     Called once at startup from ``main.py`` lifespan and ``worker main()``.
@@ -75,6 +79,8 @@ def initialize_converters(ocr_provider: "OcrProvider | None" = None) -> None:
         ocr_provider: The OCR provider (e.g., FallbackOcrProvider with
             circuit breaking) to inject into document converters, or
             ``None`` if OCR is unavailable.
+        extraction_pool: Optional process pool that PDF/DOCX/PPTX/XLSX
+            parsing is routed through, or ``None`` to parse in threads.
     """
     global _singletons
     if _singletons is not None:
@@ -82,13 +88,13 @@ def initialize_converters(ocr_provider: "OcrProvider | None" = None) -> None:
 
     _singletons = {
         "mistral_converter": ocr_provider,
-        "pdf_converter": PdfConverter(ocr_provider=ocr_provider),
-        "docx_converter": DocxConverter(ocr_provider=ocr_provider),
-        "pptx_converter": PptxConverter(ocr_provider=ocr_provider),
+        "pdf_converter": PdfConverter(ocr_provider=ocr_provider, extraction_pool=extraction_pool),
+        "docx_converter": DocxConverter(ocr_provider=ocr_provider, extraction_pool=extraction_pool),
+        "pptx_converter": PptxConverter(ocr_provider=ocr_provider, extraction_pool=extraction_pool),
         "img_converter": ocr_provider,  # Images go directly to OCR
         "html_converter": HtmlConverter(),
         "txt_converter": TxtConverter(),
-        "xlsx_converter": XlsxConverter(),
+        "xlsx_converter": XlsxConverter(extraction_pool=extraction_pool),
         "code_converter": CodeConverter(),
         "web_converter": WebConverter(),
     }
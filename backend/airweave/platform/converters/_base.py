@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from typing import Callable, ClassVar, Dict, List, Optional
 
-from airweave.core.logging import logger
+from airweave.core.logging import ContextualLogger, logger
 from airweave.core.protocols.ocr import OcrProvider
+from airweave.platform.converters.process_pool import ExtractionProcessPool
 
 
 class BaseTextConverter(ABC):
@@ -26,6 +30,67 @@ class BaseTextConverter(ABC):
         pass
 
 
+@dataclass
+class _BatchStats:
+    """Per-stage counters and wall-clock timings for one ``convert_batch`` call."""
+
+    files: int = 0
+    text_layer: int = 0
+    text_fallback: int = 0
+    ocr: int = 0
+    extract_seconds: float = 0.0
+    ocr_seconds: float = 0.0
+    total_seconds: float = 0.0
+
+
+class _OcrPipeline:
+    """Submits files to an OCR provider in fixed-size groups as they arrive.
+
+    A group is sent as soon as it fills up, so OCR runs while the rest of
+    the batch is still being extracted. :meth:`finish` sends the remainder
+    and merges every group's results.
+    """
+
+    def __init__(self, provider: Optional[OcrProvider], group_size: int) -> None:
+        self._provider = provider
+        self._group_size = max(1, group_size)
+        self._pending: List[str] = []
+        self._tasks: List[asyncio.Task[Dict[str, Optional[str]]]] = []
+        self._started: Optional[float] = None
+        self.elapsed_seconds = 0.0
+
+    def add(self, path: str) -> None:
+        """Queue a file, submitting a group once it is full."""
+        if self._provider is None:
+            return
+        self._pending.append(path)
+        if len(self._pending) >= self._group_size:
+            self._submit()
+
+    async def finish(self) -> Dict[str, Optional[str]]:
+        """Submit any partial group and wait for all OCR results."""
+        if self._pending:
+            self._submit()
+        results: Dict[str, Optional[str]] = {}
+        for group_results in await asyncio.gather(*self._tasks):
+            results.update(group_results)
+        if self._started is not None:
+            self.elapsed_seconds = time.monotonic() - self._started
+        return results
+
+    def cancel(self) -> None:
+        """Cancel groups still in flight (e.g. after another group failed)."""
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
+
+    def _submit(self) -> None:
+        group, self._pending = self._pending, []
+        if self._started is None:
+            self._started = time.monotonic()
+        self._tasks.append(asyncio.create_task(self._provider.convert_batch(group)))
+
+
 class HybridDocumentConverter(BaseTextConverter):
     """Converter that tries cheap local text extraction before falling back to OCR.
 
@@ -33,6 +98,10 @@ class HybridDocumentConverter(BaseTextConverter):
     The shared :meth:`convert_batch` handles the extract-first / OCR-fallback
     orchestration so each format only needs to provide the extraction logic.
 
+    Subclasses may also set ``_process_extractor`` to a module-level, blocking
+    extractor. When an :class:`ExtractionProcessPool` is injected, extraction
+    runs through it instead of :meth:`_try_extract`, using every core.
+
     Usage::
 
         class DocxConverter(HybridDocumentConverter):
@@ -41,16 +110,37 @@ class HybridDocumentConverter(BaseTextConverter):
 
 
         converter = DocxConverter(ocr_provider=MistralOCR())
+
+    Within a batch, files are extracted concurrently (bounded by
+    ``EXTRACTION_CONCURRENCY``, or the pool size when a pool is injected).
+    Files that need OCR are submitted to the provider in groups of
+    ``OCR_SUBMIT_SIZE`` as soon as a group fills up, so OCR of the first
+    scanned files overlaps with extraction of the rest.
     """
 
-    def __init__(self, ocr_provider: Optional[OcrProvider] = None) -> None:
+    # Max files extracted at once within one batch when no pool is injected.
+    EXTRACTION_CONCURRENCY: ClassVar[int] = 4
+    # Files per OCR provider call; a full group is submitted immediately.
+    OCR_SUBMIT_SIZE: ClassVar[int] = 5
+
+    # Picklable extractor used with an extraction pool (``None`` = thread path only).
+    _process_extractor: ClassVar[Optional[Callable[[str], Optional[str]]]] = None
+
+    def __init__(
+        self,
+        ocr_provider: Optional[OcrProvider] = None,
+        extraction_pool: Optional[ExtractionProcessPool] = None,
+    ) -> None:
         """Initialize the converter.
 
         Args:
             ocr_provider: OCR provider for fallback. If ``None``, files that
                           cannot be text-extracted will return ``None``.
+            extraction_pool: Optional process pool for text extraction. If
+                          ``None``, :meth:`_try_extract` runs in-process.
         """
         self._ocr_provider = ocr_provider
+        self._extraction_pool = extraction_pool
 
     @abstractmethod
     async def _try_extract(self, path: str) -> Optional[str]:
@@ -60,6 +150,12 @@ class HybridDocumentConverter(BaseTextConverter):
             Extracted markdown if successful, or ``None`` if OCR is needed.
         """
 
+    async def _extract(self, path: str) -> Optional[str]:
+        """Route extraction through the process pool when one is configured."""
+        if self._extraction_pool is not None and self._process_extractor is not None:
+            return await self._extraction_pool.run(self._process_extractor, path)
+        return await self._try_extract(path)
+
     @staticmethod
     def _try_read_as_text(path: str, max_probe_bytes: int = 8192) -> Optional[str]:
         """Check if a file is actually plain text despite its extension.
@@ -108,61 +204,114 @@ class HybridDocumentConverter(BaseTextConverter):
         except Exception:
             return None
 
-    async def convert_batch(self, file_paths: List[str]) -> Dict[str, Optional[str]]:
+    async def convert_batch(
+        self,
+        file_paths: List[str],
+        sync_logger: Optional[ContextualLogger] = None,
+    ) -> Dict[str, Optional[str]]:
         """Convert files to markdown, trying extraction first.
 
         For each file, calls :meth:`_try_extract`. If that returns content,
-        uses it directly (0 API calls). Otherwise, batches the file for OCR.
+        uses it directly (0 API calls). Otherwise, queues the file for OCR.
+        Extraction runs concurrently and OCR groups are submitted while the
+        remaining files are still being extracted.
 
         Args:
             file_paths: Local file paths to convert.
+            sync_logger: Optional sync-scoped logger that receives per-file
+                messages and the per-stage timing summary.
 
         Returns:
             Mapping of ``file_path -> markdown`` (``None`` on failure).
         """
+        log = sync_logger or logger
+        started = time.monotonic()
+        stats = _BatchStats(files=len(file_paths))
         results: Dict[str, Optional[str]] = {}
         needs_ocr: List[str] = []
+        ocr = _OcrPipeline(self._ocr_provider, self.OCR_SUBMIT_SIZE)
+        semaphore = asyncio.Semaphore(self._extraction_concurrency())
+
+        async def convert_one(path: str) -> None:
+            async with semaphore:
+                markdown = await self._extract_with_fallback(path, stats, log)
+            if markdown:
+                results[path] = markdown
+            else:
+                needs_ocr.append(path)
+                ocr.add(path)
 
-        for path in file_paths:
-            name = os.path.basename(path)
-            try:
-                markdown = await self._try_extract(path)
-                if markdown:
-                    results[path] = markdown
-                    logger.debug(f"{name}: extracted via text layer")
-                else:
-                    # Before falling back to OCR, check if the file is actually
-                    # plain text with a misleading extension (e.g. .docx containing text)
-                    text_content = self._try_read_as_text(path)
-                    if text_content:
-                        results[path] = text_content
-                        logger.info(
-                            f"{name}: extension suggests binary but content is plain text, "
-                            "using text fallback instead of OCR"
-                        )
-                    else:
-                        logger.debug(f"{name}: text extraction insufficient, needs OCR")
-                        needs_ocr.append(path)
-            except Exception as exc:
-                logger.warning(f"{name}: extraction error ({exc}), needs OCR")
-                # Same fallback check on extraction errors
-                text_content = self._try_read_as_text(path)
-                if text_content:
-                    results[path] = text_content
-                    logger.info(
-                        f"{name}: extraction failed but content is plain text, "
-                        "using text fallback instead of OCR"
-                    )
-                else:
-                    needs_ocr.append(path)
-
-        if needs_ocr:
-            if self._ocr_provider is None:
-                logger.warning(f"No OCR converter configured, {len(needs_ocr)} files will fail")
+        try:
+            await asyncio.gather(*(convert_one(path) for path in file_paths))
+            stats.extract_seconds = time.monotonic() - started
+            stats.ocr = len(needs_ocr)
+
+            if needs_ocr and self._ocr_provider is None:
+                log.warning(f"No OCR converter configured, {len(needs_ocr)} files will fail")
                 for path in needs_ocr:
                     results[path] = None
-            else:
-                ocr_results = await self._ocr_provider.convert_batch(needs_ocr)
-                results.update(ocr_results)
 
+            results.update(await ocr.finish())
+            stats.ocr_seconds = ocr.elapsed_seconds
+        finally:
+            ocr.cancel()
+
+        stats.total_seconds = time.monotonic() - started
+        if file_paths:
+            self._log_stats(stats, log)
         return results
+
+    def _extraction_concurrency(self) -> int:
+        """Files extracted at once: the pool size if a pool is injected."""
+        if self._extraction_pool is not None and self._process_extractor is not None:
+            return max(1, self._extraction_pool.max_workers)
+        return max(1, self.EXTRACTION_CONCURRENCY)
+
+    async def _extract_with_fallback(
+        self, path: str, stats: _BatchStats, log: ContextualLogger
+    ) -> Optional[str]:
+        """Extract one file, probing for plain text before giving up to OCR.
+
+        Returns:
+            Markdown or text content, or ``None`` if the file needs OCR.
+        """
+        name = os.path.basename(path)
+        try:
+            markdown = await self._extract(path)
+            if markdown:
+                stats.text_layer += 1
+                log.debug(f"{name}: extracted via text layer")
+                return markdown
+            # Before falling back to OCR, check if the file is actually
+            # plain text with a misleading extension (e.g. .docx containing text)
+            text_content = await asyncio.to_thread(self._try_read_as_text, path)
+            if text_content:
+                stats.text_fallback += 1
+                log.info(
+                    f"{name}: extension suggests binary but content is plain text, "
+                    "using text fallback instead of OCR"
+                )
+                return text_content
+            log.debug(f"{name}: text extraction insufficient, needs OCR")
+            return None
+        except Exception as exc:
+            log.warning(f"{name}: extraction error ({exc}), needs OCR")
+            # Same fallback check on extraction errors
+            text_content = await asyncio.to_thread(self._try_read_as_text, path)
+            if text_content:
+                stats.text_fallback += 1
+                log.info(
+                    f"{name}: extraction failed but content is plain text, "
+                    "using text fallback instead of OCR"
+                )
+                return text_content
+            return None
+
+    def _log_stats(self, stats: _BatchStats, log: ContextualLogger) -> None:
+        """Report per-stage timings for a finished batch."""
+        log.info(
+            f"{self.__class__.__name__}: converted {stats.files} files in "
+            f"{stats.total_seconds:.2f}s (text layer {stats.text_layer}, "
+            f"text fallback {stats.text_fallback}, OCR {stats.ocr}; "
+            f"extract {stats.extract_seconds:.2f}s, OCR {stats.ocr_seconds:.2f}s)"
+        )
@@ -9,7 +9,10 @@ from __future__ import annotations
 from typing import Optional
 
 from airweave.platform.converters._base import HybridDocumentConverter
-from airweave.platform.converters.text_extractors.docx import extract_docx_text
+from airweave.platform.converters.text_extractors.docx import (
+    extract_docx_markdown_sync,
+    extract_docx_text,
+)
 
 
 class DocxConverter(HybridDocumentConverter):
@@ -25,6 +28,8 @@ class DocxConverter(HybridDocumentConverter):
         results = await converter.convert_batch(["/tmp/doc.docx"])
     """
 
+    _process_extractor = staticmethod(extract_docx_markdown_sync)
+
     async def _try_extract(self, path: str) -> Optional[str]:
         """Extract text from a DOCX using python-docx.
 
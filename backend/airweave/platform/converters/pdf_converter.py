@@ -10,6 +10,7 @@ from typing import Optional
 
 from airweave.platform.converters._base import HybridDocumentConverter
 from airweave.platform.converters.text_extractors.pdf import (
+    extract_pdf_markdown_sync,
     extract_pdf_text,
     text_to_markdown,
 )
@@ -28,6 +29,8 @@ class PdfConverter(HybridDocumentConverter):
         results = await converter.convert_batch(["/tmp/doc.pdf"])
     """
 
+    _process_extractor = staticmethod(extract_pdf_markdown_sync)
+
     async def _try_extract(self, path: str) -> Optional[str]:
         """Extract text from a PDF using PyMuPDF.
 
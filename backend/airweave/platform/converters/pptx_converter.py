@@ -9,7 +9,10 @@ from __future__ import annotations
 from typing import Optional
 
 from airweave.platform.converters._base import HybridDocumentConverter
-from airweave.platform.converters.text_extractors.pptx import extract_pptx_text
+from airweave.platform.converters.text_extractors.pptx import (
+    extract_pptx_markdown_sync,
+    extract_pptx_text,
+)
 
 
 class PptxConverter(HybridDocumentConverter):
@@ -25,6 +28,8 @@ class PptxConverter(HybridDocumentConverter):
         results = await converter.convert_batch(["/tmp/slides.pptx"])
     """
 
+    _process_extractor = staticmethod(extract_pptx_markdown_sync)
+
     async def _try_extract(self, path: str) -> Optional[str]:
         """Extract text from a PPTX using python-pptx.
 
@@ -0,0 +1,190 @@
+"""Process-pool execution engine for CPU-heavy document extraction.
+
+PyMuPDF, python-docx, python-pptx and openpyxl parsing is pure-Python /
+GIL-holding work, so running it through ``run_in_thread_pool`` pins a
+worker pod to a single core. :class:`ExtractionProcessPool` runs the
+module-level ``extract_*_markdown_sync`` functions in separate processes:
+
+- Warm-up: every worker imports the parser libraries once at spawn time.
+- Limits: a per-worker address-space cap (``RLIMIT_AS``) and a per-task
+  CPU-time cap (``RLIMIT_CPU``), plus a wall-clock timeout in the caller.
+- Crash isolation: a worker that segfaults or is killed only breaks the
+  executor, which is rebuilt. Tasks caught in the crash are retried once;
+  a task that crashes again raises :class:`ExtractionProcessError` so the
+  converter falls back to its plain-text probe / OCR path.
+- Results cross the process boundary as plain strings.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional, TypeVar
+
+from airweave.core.logging import logger
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    resource = None  # type: ignore[assignment]
+
+T = TypeVar("T")
+
+# Parser libraries imported by each worker at spawn time.
+_WARM_UP_MODULES = ("fitz", "docx", "pptx", "openpyxl")
+
+# How many times a task caught in a worker crash is resubmitted.
+_CRASH_RETRIES = 1
+
+
+class ExtractionProcessError(Exception):
+    """Raised when an extraction task crashes its worker or exceeds its limits."""
+
+
+def _init_worker(memory_limit_bytes: int) -> None:
+    """Apply the memory cap and pre-import parser libraries in a new worker."""
+    if resource is not None and memory_limit_bytes > 0:
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, memory_limit_bytes))
+        except (ValueError, OSError):
+            pass
+
+    for module in _WARM_UP_MODULES:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            pass
+
+
+def _run_task(func: Callable[[str], T], path: str, cpu_seconds: int) -> T:
+    """Run one extraction inside a worker with a CPU-time budget.
+
+    The soft ``RLIMIT_CPU`` is set relative to the CPU time the worker has
+    already used, so a runaway parse is killed by ``SIGXCPU`` instead of
+    occupying the worker forever.
+    """
+    if resource is not None and cpu_seconds > 0:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        soft = int(usage.ru_utime + usage.ru_stime) + cpu_seconds
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        try:
+            resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+        except (ValueError, OSError):
+            pass
+    return func(path)
+
+
+def _ping() -> int:
+    """No-op task used to force worker spawn during warm-up."""
+    return os.getpid()
+
+
+class ExtractionProcessPool:
+    """Opt-in process pool for document text extraction.
+
+    Usage::
+
+        pool = ExtractionProcessPool(max_workers=8)
+        await pool.start()
+        markdown = await pool.run(extract_pdf_markdown_sync, "/tmp/doc.pdf")
+        pool.shutdown()
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        task_timeout_seconds: float = 120.0,
+        memory_limit_mb: int = 2048,
+        max_tasks_per_child: int = 200,
+    ) -> None:
+        """Initialize the pool (workers are spawned lazily or by :meth:`start`).
+
+        Args:
+            max_workers: Worker process count. Defaults to ``os.cpu_count()``.
+            task_timeout_seconds: Wall-clock and CPU-time limit per task.
+            memory_limit_mb: Address-space cap per worker process (0 = none).
+            max_tasks_per_child: Recycle a worker after this many tasks to
+                bound memory held by parser libraries.
+        """
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._task_timeout = task_timeout_seconds
+        self._memory_limit_bytes = max(0, memory_limit_mb) * 1024 * 1024
+        self._max_tasks_per_child = max_tasks_per_child
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def max_workers(self) -> int:
+        """Number of worker processes."""
+        return self._max_workers
+
+    async def start(self) -> None:
+        """Spawn and warm up all workers before the first real task."""
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *[loop.run_in_executor(executor, _ping) for _ in range(self._max_workers)]
+        )
+        logger.info(f"Extraction process pool warmed up with {self._max_workers} workers")
+
+    async def run(self, func: Callable[[str], T], path: str) -> T:
+        """Run a module-level extractor on ``path`` in a worker process.
+
+        Exceptions raised by ``func`` propagate unchanged. Crashes, memory
+        exhaustion and timeouts raise :class:`ExtractionProcessError`.
+        """
+        name = os.path.basename(path)
+        loop = asyncio.get_running_loop()
+        cpu_seconds = int(self._task_timeout)
+
+        for attempt in range(_CRASH_RETRIES + 1):
+            executor = self._get_executor()
+            try:
+                future = loop.run_in_executor(executor, _run_task, func, path, cpu_seconds)
+                return await asyncio.wait_for(future, timeout=self._task_timeout)
+            except BrokenProcessPool:
+                self._replace_executor(executor)
+                if attempt < _CRASH_RETRIES:
+                    logger.warning(f"{name}: extraction worker crashed, retrying on fresh pool")
+                    continue
+                raise ExtractionProcessError(f"{name}: extraction worker crashed")
+            except asyncio.TimeoutError:
+                raise ExtractionProcessError(
+                    f"{name}: extraction exceeded {self._task_timeout:.0f}s"
+                )
+            except MemoryError:
+                raise ExtractionProcessError(f"{name}: extraction exceeded memory limit")
+
+        raise ExtractionProcessError(f"{name}: extraction failed")  # pragma: no cover
+
+    def shutdown(self) -> None:
+        """Stop all workers without waiting for in-flight tasks."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._memory_limit_bytes,),
+                max_tasks_per_child=self._max_tasks_per_child,
+            )
+        return self._executor
+
+    def _replace_executor(self, broken: ProcessPoolExecutor) -> None:
+        """Drop a broken executor unless another task already replaced it."""
+        if self._executor is broken:
+            broken.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -7,14 +7,22 @@ Re-exports all extractor functions and result types for convenience::
     from airweave.platform.converters.text_extractors import extract_pptx_text
 """
 
-from .docx import extract_docx_text
-from .pdf import PdfExtractionResult, extract_pdf_text, text_to_markdown
-from .pptx import extract_pptx_text
+from .docx import extract_docx_markdown_sync, extract_docx_text
+from .pdf import (
+    PdfExtractionResult,
+    extract_pdf_markdown_sync,
+    extract_pdf_text,
+    text_to_markdown,
+)
+from .pptx import extract_pptx_markdown_sync, extract_pptx_text
 
 __all__ = [
     "PdfExtractionResult",
     "extract_pdf_text",
+    "extract_pdf_markdown_sync",
     "text_to_markdown",
     "extract_docx_text",
+    "extract_docx_markdown_sync",
     "extract_pptx_text",
+    "extract_pptx_markdown_sync",
 ]
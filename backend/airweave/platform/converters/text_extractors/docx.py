@@ -85,40 +85,47 @@ async def extract_docx_text(path: str) -> Optional[str]:
     Raises:
         SyncFailureError: If python-docx is not installed.
     """
+    return await asyncio.to_thread(extract_docx_markdown_sync, path)
+
+
+def extract_docx_markdown_sync(path: str) -> Optional[str]:
+    """Blocking variant of :func:`extract_docx_text`.
+
+    Module-level so it can run inside an
+    :class:`~airweave.platform.converters.process_pool.ExtractionProcessPool`
+    worker process.
+    """
     try:
         from docx import Document
     except ImportError:
         raise SyncFailureError("python-docx required for DOCX text extraction but not installed")
 
-    def _extract() -> Optional[str]:
-        name = os.path.basename(path)
+    name = os.path.basename(path)
 
-        try:
-            doc = Document(path)
-        except Exception as exc:
-            logger.warning(f"Failed to open DOCX {name}: {exc}")
-            return None
-
-        parts: list[str] = []
+    try:
+        doc = Document(path)
+    except Exception as exc:
+        logger.warning(f"Failed to open DOCX {name}: {exc}")
+        return None
 
-        for para in doc.paragraphs:
-            line = _format_paragraph(para)
-            if line:
-                parts.append(line)
+    parts: list[str] = []
 
-        for table in doc.tables:
-            md_table = _format_table(table)
-            if md_table:
-                parts.append(md_table)
+    for para in doc.paragraphs:
+        line = _format_paragraph(para)
+        if line:
+            parts.append(line)
 
-        markdown = "\n\n".join(parts)
+    for table in doc.tables:
+        md_table = _format_table(table)
+        if md_table:
+            parts.append(md_table)
 
-        total_chars = len(markdown.strip())
-        if total_chars < MIN_TOTAL_CHARS:
-            logger.debug(f"DOCX {name}: only {total_chars} chars extracted, insufficient")
-            return None
+    markdown = "\n\n".join(parts)
 
-        logger.debug(f"DOCX {name}: extracted {total_chars} chars")
-        return markdown
+    total_chars = len(markdown.strip())
+    if total_chars < MIN_TOTAL_CHARS:
+        logger.debug(f"DOCX {name}: only {total_chars} chars extracted, insufficient")
+        return None
 
-    return await asyncio.to_thread(_extract)
+    logger.debug(f"DOCX {name}: extracted {total_chars} chars")
+    return markdown
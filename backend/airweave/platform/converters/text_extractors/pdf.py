@@ -14,6 +14,7 @@ from __future__ import annotations
 import asyncio
 import os
 from dataclasses import dataclass, field
+from typing import Optional
 
 from airweave.core.logging import logger
 from airweave.platform.sync.exceptions import SyncFailureError
@@ -87,46 +88,67 @@ async def extract_pdf_text(path: str) -> PdfExtractionResult:
     Raises:
         SyncFailureError: If PyMuPDF is not installed.
     """
+    return await asyncio.to_thread(_extract_pdf_sync, path)
+
+
+def extract_pdf_markdown_sync(path: str) -> Optional[str]:
+    """Synchronously extract markdown from a PDF with a text layer on every page.
+
+    Module-level and returns a plain string so it can run inside an
+    :class:`~airweave.platform.converters.process_pool.ExtractionProcessPool`
+    worker process.
+
+    Args:
+        path: Path to the PDF file.
+
+    Returns:
+        Markdown if all pages have a text layer, ``None`` if OCR is needed.
+    """
+    extraction = _extract_pdf_sync(path)
+    if extraction.fully_extracted and extraction.full_text:
+        return text_to_markdown(extraction.full_text)
+    return None
+
+
+def _extract_pdf_sync(path: str) -> PdfExtractionResult:
+    """Blocking PyMuPDF extraction shared by the async and process-pool paths."""
     try:
         import fitz  # PyMuPDF
     except ImportError:
         raise SyncFailureError("PyMuPDF (fitz) required for PDF text extraction but not installed")
 
-    def _extract() -> PdfExtractionResult:
-        result = PdfExtractionResult(path=path)
-
-        try:
-            doc = fitz.open(path)
-        except Exception as exc:
-            logger.warning(f"Failed to open PDF {os.path.basename(path)}: {exc}")
-            return result
-
-        try:
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                page_result = _extract_page(page, page_num)
-                result.pages.append(page_result)
-        finally:
-            doc.close()
-
-        # Log summary
-        name = os.path.basename(path)
-        total = len(result.pages)
-        extracted = total - len(result.pages_needing_ocr)
-        ocr_needed = len(result.pages_needing_ocr)
-
-        if ocr_needed == 0:
-            logger.debug(f"PDF {name}: all {total} pages have text layer")
-        elif extracted == 0:
-            logger.debug(f"PDF {name}: all {total} pages are image-only (scanned)")
-        else:
-            logger.debug(
-                f"PDF {name}: {extracted}/{total} pages have text, {ocr_needed} are image-only"
-            )
+    result = PdfExtractionResult(path=path)
 
+    try:
+        doc = fitz.open(path)
+    except Exception as exc:
+        logger.warning(f"Failed to open PDF {os.path.basename(path)}: {exc}")
         return result
 
-    return await asyncio.to_thread(_extract)
+    try:
+        for page_num in range(len(doc)):
+            page = doc[page_num]
+            page_result = _extract_page(page, page_num)
+            result.pages.append(page_result)
+    finally:
+        doc.close()
+
+    # Log summary
+    name = os.path.basename(path)
+    total = len(result.pages)
+    extracted = total - len(result.pages_needing_ocr)
+    ocr_needed = len(result.pages_needing_ocr)
+
+    if ocr_needed == 0:
+        logger.debug(f"PDF {name}: all {total} pages have text layer")
+    elif extracted == 0:
+        logger.debug(f"PDF {name}: all {total} pages are image-only (scanned)")
+    else:
+        logger.debug(
+            f"PDF {name}: {extracted}/{total} pages have text, {ocr_needed} are image-only"
+        )
+
+    return result
 
 
 def _extract_page(page, page_num: int) -> PageExtractionResult:
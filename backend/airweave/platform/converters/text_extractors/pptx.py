@@ -82,31 +82,36 @@ async def extract_pptx_text(path: str) -> Optional[str]:
     Raises:
         SyncFailureError: If python-pptx is not installed.
     """
+    return await asyncio.to_thread(extract_pptx_markdown_sync, path)
+
+
+def extract_pptx_markdown_sync(path: str) -> Optional[str]:
+    """Blocking variant of :func:`extract_pptx_text`.
+
+    Module-level so it can run inside an
+    :class:`~airweave.platform.converters.process_pool.ExtractionProcessPool`
+    worker process.
+    """
     try:
         from pptx import Presentation
     except ImportError:
         raise SyncFailureError("python-pptx required for PPTX text extraction but not installed")
 
-    def _extract() -> Optional[str]:
-        name = os.path.basename(path)
-
-        try:
-            prs = Presentation(path)
-        except Exception as exc:
-            logger.warning(f"Failed to open PPTX {name}: {exc}")
-            return None
+    name = os.path.basename(path)
 
-        slide_markdowns = [
-            _extract_slide(slide, idx) for idx, slide in enumerate(prs.slides, start=1)
-        ]
-        markdown = "\n\n---\n\n".join(slide_markdowns)
+    try:
+        prs = Presentation(path)
+    except Exception as exc:
+        logger.warning(f"Failed to open PPTX {name}: {exc}")
+        return None
 
-        total_chars = len(markdown.strip())
-        if total_chars < MIN_TOTAL_CHARS:
-            logger.debug(f"PPTX {name}: only {total_chars} chars extracted, insufficient")
-            return None
+    slide_markdowns = [_extract_slide(slide, idx) for idx, slide in enumerate(prs.slides, start=1)]
+    markdown = "\n\n---\n\n".join(slide_markdowns)
 
-        logger.debug(f"PPTX {name}: extracted {total_chars} chars")
-        return markdown
+    total_chars = len(markdown.strip())
+    if total_chars < MIN_TOTAL_CHARS:
+        logger.debug(f"PPTX {name}: only {total_chars} chars extracted, insufficient")
+        return None
 
-    return await asyncio.to_thread(_extract)
+    logger.debug(f"PPTX {name}: extracted {total_chars} chars")
+    return markdown
@@ -1,10 +1,11 @@
 """XLSX to markdown converter using openpyxl."""
 
 import asyncio
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from airweave.core.logging import logger
 from airweave.platform.converters._base import BaseTextConverter
+from airweave.platform.converters.process_pool import ExtractionProcessPool
 from airweave.platform.sync.async_helpers import run_in_thread_pool
 from airweave.platform.sync.exceptions import EntityProcessingError, SyncFailureError
 
@@ -16,6 +17,15 @@ class XlsxConverter(BaseTextConverter):
     Extracts all sheets as markdown tables with formulas and cell values.
     """
 
+    def __init__(self, extraction_pool: Optional[ExtractionProcessPool] = None) -> None:
+        """Initialize the converter.
+
+        Args:
+            extraction_pool: Optional process pool for openpyxl parsing. If
+                ``None``, parsing runs in the shared thread pool.
+        """
+        self._extraction_pool = extraction_pool
+
     async def convert_batch(self, file_paths: List[str]) -> Dict[str, str]:
         """Convert XLSX files to markdown text using openpyxl.
 
@@ -67,9 +77,12 @@ class XlsxConverter(BaseTextConverter):
 
         return results
 
-    async def _extract_xlsx_to_markdown(self, xlsx_path: str) -> str:  # noqa: C901
+    async def _extract_xlsx_to_markdown(self, xlsx_path: str) -> str:
         """Extract XLSX content to markdown format.
 
+        Runs in the extraction process pool when one is configured, otherwise
+        in the shared thread pool.
+
         Args:
             xlsx_path: Path to XLSX file
 
@@ -79,90 +92,107 @@ class XlsxConverter(BaseTextConverter):
         Raises:
             EntityProcessingError: If file cannot be opened or has no sheets
         """
-
-        def _extract() -> str:  # noqa: C901
-            from openpyxl import load_workbook
-
-            try:
-                # Load workbook with formula evaluation
-                wb = load_workbook(xlsx_path, data_only=False)
-            except Exception as e:
-                raise EntityProcessingError(f"Failed to open XLSX file {xlsx_path}: {e}")
-
-            sheet_names = wb.sheetnames
-
-            if not sheet_names:
-                raise EntityProcessingError(f"XLSX file {xlsx_path} has no sheets")
-
-            markdown_parts = []
-
-            # Process each sheet
-            for sheet_name in sheet_names:
-                sheet = wb[sheet_name]
-
-                # Get max row and column
-                max_row = sheet.max_row
-                max_col = sheet.max_column
-
-                if max_row == 0 or max_col == 0:
-                    # Empty sheet - skip
-                    logger.debug(f"Sheet '{sheet_name}' is empty, skipping")
-                    continue
-
-                # Add sheet header
-                markdown_parts.append(f"## Sheet: {sheet_name}\n")
-
-                # Extract all rows
-                rows_data = []
-                for row in sheet.iter_rows(min_row=1, max_row=max_row, max_col=max_col):
-                    row_values = []
-                    for cell in row:
-                        # Get cell value (formulas will be evaluated if data_only=True)
-                        value = cell.value
-                        if value is None:
-                            row_values.append("")
-                        else:
-                            row_values.append(str(value))
-                    rows_data.append(row_values)
-
-                if not rows_data:
-                    markdown_parts.append("*Empty sheet*\n")
-                    continue
-
-                # Convert to markdown table
-                # Use first row as header
-                if len(rows_data) > 1:
-                    header = rows_data[0]
-                    data_rows = rows_data[1:]
-
-                    # Create markdown table
-                    # Header row
-                    markdown_parts.append("| " + " | ".join(header) + " |")
-                    # Separator row
-                    markdown_parts.append("| " + " | ".join(["---"] * len(header)) + " |")
-
-                    # Data rows
-                    for row in data_rows:
-                        # Pad row if shorter than header
-                        padded_row = row + [""] * (len(header) - len(row))
-                        markdown_parts.append("| " + " | ".join(padded_row[: len(header)]) + " |")
-                else:
-                    # Single row - just show as list
-                    for value in rows_data[0]:
-                        if value:
-                            markdown_parts.append(f"- {value}")
-
-                markdown_parts.append("")  # Blank line between sheets
-
-            # Combine all sheets
-            if not markdown_parts:
-                raise EntityProcessingError(f"XLSX file {xlsx_path} has no extractable content")
-
-            return "\n".join(markdown_parts)
-
         try:
-            return await run_in_thread_pool(_extract)
+            if self._extraction_pool is not None:
+                return await self._extraction_pool.run(extract_xlsx_markdown_sync, xlsx_path)
+            return await run_in_thread_pool(extract_xlsx_markdown_sync, xlsx_path)
         except EntityProcessingError:
             raise
         except Exception as e:
             raise EntityProcessingError(f"XLSX extraction failed for {xlsx_path}: {e}")
+
+
+def extract_xlsx_markdown_sync(xlsx_path: str) -> str:  # noqa: C901
+    """Blocking openpyxl extraction of every sheet as a markdown table.
+
+    Module-level so it can run inside an
+    :class:`~airweave.platform.converters.process_pool.ExtractionProcessPool`
+    worker process.
+
+    Args:
+        xlsx_path: Path to XLSX file
+
+    Returns:
+        Markdown formatted string with all sheets
+
+    Raises:
+        EntityProcessingError: If file cannot be opened or has no sheets
+    """
+    from openpyxl import load_workbook
+
+    try:
+        # Load workbook with formula evaluation
+        wb = load_workbook(xlsx_path, data_only=False)
+    except Exception as e:
+        raise EntityProcessingError(f"Failed to open XLSX file {xlsx_path}: {e}")
+
+    sheet_names = wb.sheetnames
+
+    if not sheet_names:
+        raise EntityProcessingError(f"XLSX file {xlsx_path} has no sheets")
+
+    markdown_parts = []
+
+    # Process each sheet
+    for sheet_name in sheet_names:
+        sheet = wb[sheet_name]
+
+        # Get max row and column
+        max_row = sheet.max_row
+        max_col = sheet.max_column
+
+        if max_row == 0 or max_col == 0:
+            # Empty sheet - skip
+            logger.debug(f"Sheet '{sheet_name}' is empty, skipping")
+            continue
+
+        # Add sheet header
+        markdown_parts.append(f"## Sheet: {sheet_name}\n")
+
+        # Extract all rows
+        rows_data = []
+        for row in sheet.iter_rows(min_row=1, max_row=max_row, max_col=max_col):
+            row_values = []
+            for cell in row:
+                # Get cell value (formulas will be evaluated if data_only=True)
+                value = cell.value
+                if value is None:
+                    row_values.append("")
+                else:
+                    row_values.append(str(value))
+            rows_data.append(row_values)
+
+        if not rows_data:
+            markdown_parts.append("*Empty sheet*\n")
+            continue
+
+        # Convert to markdown table
+        # Use first row as header
+        if len(rows_data) > 1:
+            header = rows_data[0]
+            data_rows = rows_data[1:]
+
+            # Create markdown table
+            # Header row
+            markdown_parts.append("| " + " | ".join(header) + " |")
+            # Separator row
+            markdown_parts.append("| " + " | ".join(["---"] * len(header)) + " |")
+
+            # Data rows
+            for row in data_rows:
+                # Pad row if shorter than header
+                padded_row = row + [""] * (len(header) - len(row))
+                markdown_parts.append("| " + " | ".join(padded_row[: len(header)]) + " |")
+        else:
+            # Single row - just show as list
+            for value in rows_data[0]:
+                if value:
+                    markdown_parts.append(f"- {value}")
+
+        markdown_parts.append("")  # Blank line between sheets
+
+    # Combine all sheets
+    if not markdown_parts:
+        raise EntityProcessingError(f"XLSX file {xlsx_path} has no extractable content")
+
+    return "\n".join(markdown_parts)
@@ -13,7 +13,7 @@ import asyncio
 import json
 import time
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import quote
 from uuid import UUID
 
@@ -22,15 +22,15 @@ import httpx
 from airweave.core.config import settings
 from airweave.core.logging import ContextualLogger
 from airweave.core.logging import logger as default_logger
+from airweave.core.protocols.vespa import VespaFeederProtocol, VespaQueryClientProtocol
 from airweave.platform.destinations.vespa.config import (
     ALL_VESPA_SCHEMAS,
     DELETE_BATCH_SIZE,
     DELETE_CONCURRENCY,
     DELETE_QUERY_HITS_LIMIT,
-    FEED_MAX_CONNECTIONS,
-    FEED_MAX_QUEUE_SIZE,
-    FEED_MAX_WORKERS,
 )
+from airweave.platform.destinations.vespa.feeder import VespaFeeder
+from airweave.platform.destinations.vespa.query_client import VespaQueryClient
 from airweave.platform.destinations.vespa.types import (
     DeleteResult,
     FeedResult,
@@ -44,8 +44,13 @@ from airweave.schemas.search_result import (
     SystemMetadataResult,
 )
 
-if TYPE_CHECKING:
-    from vespa.application import Vespa
+
+def _container_query_client() -> Optional[VespaQueryClientProtocol]:
+    """Return the container's pooled query client, if the container is initialized."""
+    from airweave.core import container as container_mod
+
+    container = container_mod.container
+    return container.vespa_query_client if container is not None else None
 
 
 class VespaClient:
@@ -53,24 +58,31 @@ class VespaClient:
 
     Handles all I/O operations with Vespa, including:
     - Connection management
-    - Document feeding via feed_iterable
+    - Document feeding via the shared pooled VespaFeeder
     - Document deletion via selection-based API
-    - Query execution
+    - Query execution via the shared pooled VespaQueryClient
     """
 
     def __init__(
         self,
-        app: "Vespa",
+        query_client: Optional[VespaQueryClientProtocol] = None,
         logger: Optional[ContextualLogger] = None,
+        feeder: Optional[VespaFeederProtocol] = None,
     ):
         """Initialize the Vespa client.
 
         Args:
-            app: Connected pyvespa Vespa application instance
+            query_client: Pooled query client to use; without one a dedicated
+                client is created and closed with this instance
             logger: Optional logger for debug/warning messages
+            feeder: Pooled document feeder to use; without one a dedicated
+                feeder is created on first feed and closed with this instance
         """
-        self.app = app
+        self._owns_query_client = query_client is None
+        self._query_client = query_client or VespaQueryClient.from_settings(logger=logger)
         self._logger = logger or default_logger
+        self._owns_feeder = feeder is None
+        self._feeder = feeder
 
     @classmethod
     async def connect(
@@ -78,33 +90,59 @@ class VespaClient:
         url: Optional[str] = None,
         port: Optional[int] = None,
         logger: Optional[ContextualLogger] = None,
+        feeder: Optional[VespaFeederProtocol] = None,
+        query_client: Optional[VespaQueryClientProtocol] = None,
     ) -> "VespaClient":
-        """Create and connect a Vespa client.
+        """Create a Vespa client.
+
+        Queries go through a pooled query client that outlives this instance
+        (the given one, else the container's), so this is cheap; only a
+        non-default ``url``/``port`` gets a dedicated pool. Feeds likewise go
+        through the given pooled feeder when there is one.
 
         Args:
             url: Vespa URL (defaults to settings.VESPA_URL)
             port: Vespa port (defaults to settings.VESPA_PORT)
             logger: Optional logger
+            feeder: Pooled document feeder for the configured Vespa
+            query_client: Pooled query client for the configured Vespa
 
         Returns:
             Connected VespaClient instance
         """
-        from vespa.application import Vespa
-
         vespa_url = url or settings.VESPA_URL
         vespa_port = port or settings.VESPA_PORT
 
-        app = Vespa(url=vespa_url, port=vespa_port)
+        if (vespa_url, vespa_port) != (settings.VESPA_URL, settings.VESPA_PORT):
+            query_client = VespaQueryClient(
+                base_url=f"{vespa_url}:{vespa_port}",
+                request_timeout=settings.VESPA_TIMEOUT,
+                logger=logger,
+            )
+            owns_query_client = True
+        else:
+            query_client = query_client or _container_query_client()
+            owns_query_client = query_client is None
 
         log = logger or default_logger
-        log.info(f"Connected to Vespa at {vespa_url}:{vespa_port}")
+        log.debug(f"Connected to Vespa at {vespa_url}:{vespa_port}")
 
-        return cls(app=app, logger=logger)
+        client = cls(query_client=query_client, logger=logger, feeder=feeder)
+        client._owns_query_client = owns_query_client
+        return client
 
     async def close(self) -> None:
-        """Close the Vespa connection."""
+        """Close the Vespa connection.
+
+        A pooled query client or feeder passed in outlives this instance and
+        is closed on process shutdown; dedicated ones are closed here.
+        """
         self._logger.debug("Closing Vespa connection")
-        self.app = None
+        if self._owns_feeder and self._feeder is not None:
+            await self._feeder.close()
+            self._feeder = None
+        if self._owns_query_client:
+            await self._query_client.close()
 
     # -------------------------------------------------------------------------
     # Feed Operations
@@ -113,72 +151,28 @@ class VespaClient:
     async def feed_documents(
         self,
         docs_by_schema: Dict[str, List[VespaDocument]],
-        callback: Optional[Callable] = None,
     ) -> FeedResult:
-        """Feed documents to Vespa using feed_iterable.
-
-        Uses pyvespa's feed_iterable for efficient concurrent feeding via HTTP/2
-        multiplexing. Documents are grouped by schema and fed separately.
+        """Feed documents to Vespa through the async feeder.
 
-        IMPORTANT: feed_iterable is synchronous, so we run it in a thread pool.
+        All schemas are fed concurrently over the feeder's pooled keep-alive
+        connections; each schema stream is bounded by VESPA_TIMEOUT.
 
         Args:
             docs_by_schema: Dict mapping schema name to list of VespaDocuments
-            callback: Optional callback for tracking progress
 
         Returns:
             FeedResult with success count and failed documents
-        """
-        result = FeedResult()
-
-        def track_callback(response, doc_id: str):
-            if response.is_successful():
-                result.success_count += 1
-            else:
-                result.failed_docs.append((doc_id, response.status_code, response.json))
-
-        actual_callback = callback or track_callback
 
-        # Feed each schema's documents
-        for schema, docs in docs_by_schema.items():
-            if not docs:
-                continue
-
-            # Convert VespaDocument to dict format expected by feed_iterable
-            doc_dicts = [{"id": doc.id, "fields": doc.fields} for doc in docs]
-
-            def _feed_sync(docs_iter=doc_dicts, schema_name=schema):
-                self.app.feed_iterable(
-                    iter=docs_iter,
-                    schema=schema_name,
-                    namespace="airweave",
-                    callback=actual_callback,
-                    max_queue_size=FEED_MAX_QUEUE_SIZE,
-                    max_workers=FEED_MAX_WORKERS,
-                    max_connections=FEED_MAX_CONNECTIONS,
-                )
-
-            schema_start = time.perf_counter()
-            try:
-                await asyncio.wait_for(
-                    asyncio.to_thread(_feed_sync),
-                    timeout=settings.VESPA_TIMEOUT,
-                )
-            except asyncio.TimeoutError:
-                schema_ms = (time.perf_counter() - schema_start) * 1000
-                self._logger.error(
-                    f"[VespaClient] Feed to schema '{schema}' TIMED OUT after "
-                    f"{schema_ms:.0f}ms ({len(docs)} docs)"
-                )
-                raise
-            schema_ms = (time.perf_counter() - schema_start) * 1000
-
-            self._logger.info(
-                f"[VespaClient] Fed schema '{schema}': {len(docs)} docs in {schema_ms:.1f}ms "
-                f"({schema_ms / len(docs):.1f}ms/doc)"
-            )
+        Raises:
+            asyncio.TimeoutError: If a schema stream exceeds VESPA_TIMEOUT
+        """
+        return await self._get_feeder().feed(docs_by_schema, timeout=settings.VESPA_TIMEOUT)
 
-        return result
+    def _get_feeder(self) -> VespaFeederProtocol:
+        """Return the pooled feeder, creating a dedicated one on first use."""
+        if self._feeder is None:
+            self._feeder = VespaFeeder.from_settings(logger=self._logger)
+        return self._feeder
 
     # -------------------------------------------------------------------------
     # Delete Operations
@@ -339,16 +333,16 @@ class VespaClient:
         }
 
         start = time.perf_counter()
-        response: Any = await asyncio.to_thread(self.app.query, body=query_params)
+        response = await self._query_client.query(query_params, caller="delete")
         elapsed_ms = (time.perf_counter() - start) * 1000
 
         if not response.is_successful():
-            raw = response.json if hasattr(response, "json") else {}
+            raw = response.json
             error_msg = raw.get("root", {}).get("errors", str(raw))
             raise RuntimeError(f"Doc ID query failed: {error_msg}")
 
-        hits: List[Dict[str, Any]] = response.hits or []
-        raw_json = response.json if hasattr(response, "json") else {}
+        hits: List[Dict[str, Any]] = response.hits
+        raw_json = response.json
         total_count = raw_json.get("root", {}).get("fields", {}).get("totalCount", len(hits))
         if total_count > len(hits):
             raise RuntimeError(
@@ -511,9 +505,7 @@ class VespaClient:
     # -------------------------------------------------------------------------
 
     async def execute_query(self, query_params: Dict[str, Any]) -> VespaQueryResponse:
-        """Execute a query against Vespa.
-
-        Runs the query in a thread pool since pyvespa is synchronous.
+        """Execute a query against Vespa over the shared connection pool.
 
         Args:
             query_params: Complete Vespa query parameters including YQL
@@ -523,7 +515,7 @@ class VespaClient:
         """
         start_time = time.monotonic()
         try:
-            response = await asyncio.to_thread(self.app.query, body=query_params)
+            response = await self._query_client.query(query_params, caller="search")
         except Exception as e:
             self._logger.error(f"[VespaClient] Vespa query failed: {e}")
             raise RuntimeError(f"Vespa search failed: {e}") from e
@@ -531,23 +523,22 @@ class VespaClient:
 
         # Check for errors
         if not response.is_successful():
-            error_msg = getattr(response, "json", {}).get("error", str(response))
+            error_msg = response.json.get("error", str(response))
             self._logger.error(f"[VespaClient] Vespa returned error: {error_msg}")
             raise RuntimeError(f"Vespa search error: {error_msg}")
 
         # Extract metrics
-        raw_json = response.json if hasattr(response, "json") else {}
-        root = raw_json.get("root", {})
+        root = response.json.get("root", {})
         coverage = root.get("coverage", {})
         total_count = root.get("fields", {}).get("totalCount", 0)
 
         self._logger.info(
             f"[VespaClient] Query completed in {query_time_ms:.1f}ms, "
-            f"total={total_count}, hits={len(response.hits or [])}"
+            f"total={total_count}, hits={len(response.hits)}"
         )
 
         return VespaQueryResponse(
-            hits=response.hits or [],
+            hits=response.hits,
             total_count=total_count,
             coverage_percent=coverage.get("coverage", 100.0),
             query_time_ms=query_time_ms,
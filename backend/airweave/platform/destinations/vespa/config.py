@@ -27,10 +27,36 @@ VESPA_EMBEDDING_DIM = 3072
 # Feed Settings (bulk_insert)
 # =============================================================================
 
-FEED_MAX_QUEUE_SIZE = 500
-FEED_MAX_WORKERS = 16
+# Keep-alive connections in the feeder's pool; in-flight PUTs beyond this wait
+# for a free connection (Vespa is reached over plain HTTP, so this is HTTP/1.1)
 FEED_MAX_CONNECTIONS = 16
 
+# Adaptive in-flight document PUTs: start, floor and ceiling. The limit grows
+# additively on success and halves when Vespa answers 429/503.
+FEED_INITIAL_IN_FLIGHT = 64
+FEED_MIN_IN_FLIGHT = 4
+FEED_MAX_IN_FLIGHT = 256
+
+# Per-document retries for throttled (429/503), 5xx and transport failures
+FEED_MAX_RETRIES = 5
+FEED_RETRY_BASE_DELAY = 0.25
+FEED_RETRY_MAX_DELAY = 5.0
+
+# =============================================================================
+# Query Settings (shared search client)
+# =============================================================================
+
+# Max concurrent /search/ requests per process; further queries wait for a slot
+QUERY_MAX_IN_FLIGHT = 64
+
+# Keep-alive connections kept open to the Vespa query endpoint per process.
+# Plain http:// is HTTP/1.1 (one request per connection at a time), so the
+# pool matches the in-flight bound instead of waiting inside httpx.
+QUERY_MAX_CONNECTIONS = QUERY_MAX_IN_FLIGHT
+
+# Seconds an idle pooled connection is kept alive before being closed
+QUERY_KEEPALIVE_EXPIRY = 60.0
+
 # =============================================================================
 # Delete Settings
 # =============================================================================
@@ -21,6 +21,7 @@ from uuid import UUID
 from airweave.core.config import settings
 from airweave.core.logging import ContextualLogger
 from airweave.core.logging import logger as default_logger
+from airweave.core.protocols.vespa import VespaFeederProtocol, VespaQueryClientProtocol
 from airweave.platform.decorators import destination
 from airweave.platform.destinations._base import VectorDBDestination
 from airweave.platform.destinations.vespa.client import VespaClient
@@ -79,6 +80,8 @@ class VespaDestination(VectorDBDestination):
         vector_size: Optional[int] = None,
         logger: Optional[ContextualLogger] = None,
         soft_fail: bool = False,
+        feeder: Optional[VespaFeederProtocol] = None,
+        query_client: Optional[VespaQueryClientProtocol] = None,
         **kwargs,
     ) -> "VespaDestination":
         """Create and return a connected Vespa destination.
@@ -91,6 +94,8 @@ class VespaDestination(VectorDBDestination):
             vector_size: Vector dimensions (unused - Vespa handles embeddings)
             logger: Logger instance
             soft_fail: If True, errors won't fail the sync (default False - Vespa is primary)
+            feeder: Pooled document feeder (defaults to a dedicated one)
+            query_client: Pooled query client (defaults to the container's)
             **kwargs: Additional keyword arguments (unused)
 
         Returns:
@@ -102,7 +107,9 @@ class VespaDestination(VectorDBDestination):
         instance.organization_id = organization_id
 
         # Initialize components
-        instance._client = await VespaClient.connect(logger=instance.logger)
+        instance._client = await VespaClient.connect(
+            logger=instance.logger, feeder=feeder, query_client=query_client
+        )
         instance._transformer = EntityTransformer(
             collection_id=collection_id,
             logger=instance.logger,
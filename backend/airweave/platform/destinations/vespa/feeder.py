@@ -0,0 +1,366 @@
+"""Asyncio-native Vespa document feeder.
+
+Replaces pyvespa's thread-based ``feed_iterable`` with direct
+``/document/v1`` PUTs over one long-lived keep-alive connection pool:
+
+- All schemas of a batch are fed concurrently.
+- An AIMD limiter bounds in-flight requests: it grows by roughly one
+  request per round trip on success and halves when Vespa answers 429/503.
+- Each document is retried on its own (throttling, 5xx, transport errors)
+  with exponential backoff; permanent failures are reported per document.
+- Throughput, latency, retries and the current limit are reported through
+  :class:`~airweave.core.protocols.metrics.VespaFeedMetrics`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import quote
+
+import httpx
+
+from airweave.core.config import settings
+from airweave.core.logging import ContextualLogger
+from airweave.core.logging import logger as default_logger
+from airweave.core.protocols.metrics import VespaFeedMetrics
+from airweave.core.protocols.vespa import VespaFeederProtocol
+from airweave.platform.destinations.vespa.config import (
+    FEED_INITIAL_IN_FLIGHT,
+    FEED_MAX_CONNECTIONS,
+    FEED_MAX_IN_FLIGHT,
+    FEED_MAX_RETRIES,
+    FEED_MIN_IN_FLIGHT,
+    FEED_RETRY_BASE_DELAY,
+    FEED_RETRY_MAX_DELAY,
+)
+from airweave.platform.destinations.vespa.types import FeedResult, VespaDocument
+
+_THROTTLE_STATUSES = frozenset({429, 503})
+
+
+class AdaptiveLimiter:
+    """Additive-increase / multiplicative-decrease bound on in-flight requests."""
+
+    # Minimum seconds between two decreases, so one burst of 429s from
+    # requests that were already in flight only halves the limit once.
+    DECREASE_COOLDOWN_SECONDS = 0.5
+
+    def __init__(self, initial: int, minimum: int, maximum: int) -> None:
+        """Initialize the limiter.
+
+        Args:
+            initial: Starting limit.
+            minimum: Floor the limit never drops below.
+            maximum: Ceiling the limit never grows above.
+        """
+        self._minimum = minimum
+        self._maximum = maximum
+        self._limit = float(max(minimum, min(initial, maximum)))
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current whole-request limit."""
+        return int(self._limit)
+
+    @property
+    def maximum(self) -> int:
+        """Ceiling for the limit."""
+        return self._maximum
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently holding a slot."""
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        """Wait for a free slot under the current limit."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self._limit))
+            self._in_flight += 1
+
+    async def release(self, throttled: bool) -> None:
+        """Return a slot and adapt the limit to the request outcome."""
+        async with self._condition:
+            self._in_flight -= 1
+            if throttled:
+                now = time.monotonic()
+                if now - self._last_decrease >= self.DECREASE_COOLDOWN_SECONDS:
+                    self._limit = max(float(self._minimum), self._limit / 2)
+                    self._last_decrease = now
+            else:
+                self._limit = min(float(self._maximum), self._limit + 1 / self._limit)
+            self._condition.notify_all()
+
+
+class VespaFeeder(VespaFeederProtocol):
+    """Feeds VespaDocuments through a pooled HTTP client with adaptive concurrency.
+
+    The Temporal worker builds one feeder per process and shares it across
+    its syncs, so connections and the adaptive limit carry over between
+    batches and syncs; it is closed on worker shutdown.
+
+    Usage::
+
+        feeder = VespaFeeder(base_url="http://vespa:8081")
+        result = await feeder.feed(docs_by_schema, timeout=60)
+        await feeder.close()
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        namespace: str = "airweave",
+        http_client: Optional[httpx.AsyncClient] = None,
+        request_timeout: float = 60.0,
+        initial_in_flight: int = FEED_INITIAL_IN_FLIGHT,
+        min_in_flight: int = FEED_MIN_IN_FLIGHT,
+        max_in_flight: int = FEED_MAX_IN_FLIGHT,
+        max_retries: int = FEED_MAX_RETRIES,
+        retry_base_delay: float = FEED_RETRY_BASE_DELAY,
+        retry_max_delay: float = FEED_RETRY_MAX_DELAY,
+        metrics: Optional[VespaFeedMetrics] = None,
+        logger: Optional[ContextualLogger] = None,
+    ) -> None:
+        """Initialize the feeder (the HTTP client is created on first feed).
+
+        Args:
+            base_url: Vespa container URL including port.
+            namespace: Document namespace.
+            http_client: Optional pre-built client (the feeder will not close it).
+            request_timeout: Per-request timeout in seconds.
+            initial_in_flight: Starting in-flight request limit.
+            min_in_flight: Floor for the adaptive limit.
+            max_in_flight: Ceiling for the adaptive limit.
+            max_retries: Retries per document before it is reported as failed.
+            retry_base_delay: First backoff delay in seconds (doubles per retry).
+            retry_max_delay: Backoff cap in seconds.
+            metrics: Optional metrics sink.
+            logger: Optional logger.
+        """
+        self._base_url = base_url.rstrip("/")
+        self._namespace = namespace
+        self._client = http_client
+        self._owns_client = http_client is None
+        self._request_timeout = request_timeout
+        self._limiter = AdaptiveLimiter(initial_in_flight, min_in_flight, max_in_flight)
+        self._max_retries = max_retries
+        self._retry_base_delay = retry_base_delay
+        self._retry_max_delay = retry_max_delay
+        self._metrics = metrics
+        self._logger = logger or default_logger
+
+    @classmethod
+    def from_settings(
+        cls,
+        *,
+        metrics: Optional[VespaFeedMetrics] = None,
+        logger: Optional[ContextualLogger] = None,
+    ) -> VespaFeeder:
+        """Build a feeder for the Vespa instance configured in settings."""
+        return cls(
+            base_url=f"{settings.VESPA_URL}:{settings.VESPA_PORT}",
+            request_timeout=settings.VESPA_TIMEOUT,
+            metrics=metrics,
+            logger=logger,
+        )
+
+    @property
+    def limiter(self) -> AdaptiveLimiter:
+        """The adaptive in-flight limiter (exposed for diagnostics)."""
+        return self._limiter
+
+    async def feed(
+        self,
+        docs_by_schema: Dict[str, List[VespaDocument]],
+        timeout: Optional[float] = None,
+    ) -> FeedResult:
+        """Feed all schemas concurrently.
+
+        Args:
+            docs_by_schema: Documents grouped by schema.
+            timeout: Wall-clock limit per schema stream in seconds.
+
+        Returns:
+            FeedResult with the success count and (doc_id, status, body) failures.
+
+        Raises:
+            asyncio.TimeoutError: If a schema stream exceeds ``timeout``. The
+                other streams are cancelled.
+        """
+        result = FeedResult()
+        streams = [
+            asyncio.create_task(self._feed_schema_with_timeout(schema, docs, result, timeout))
+            for schema, docs in docs_by_schema.items()
+            if docs
+        ]
+        if not streams:
+            return result
+
+        try:
+            await asyncio.gather(*streams)
+        except BaseException:
+            for task in streams:
+                task.cancel()
+            await asyncio.gather(*streams, return_exceptions=True)
+            raise
+        return result
+
+    async def close(self) -> None:
+        """Close the HTTP client if this feeder created it."""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+        self._client = None
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self._request_timeout,
+                limits=httpx.Limits(
+                    max_connections=FEED_MAX_CONNECTIONS,
+                    max_keepalive_connections=FEED_MAX_CONNECTIONS,
+                ),
+            )
+            self._owns_client = True
+        return self._client
+
+    async def _feed_schema_with_timeout(
+        self,
+        schema: str,
+        docs: List[VespaDocument],
+        result: FeedResult,
+        timeout: Optional[float],
+    ) -> None:
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._feed_schema(schema, docs, result), timeout=timeout)
+        except asyncio.TimeoutError:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._logger.error(
+                f"[VespaFeeder] Feed to schema '{schema}' TIMED OUT after "
+                f"{elapsed_ms:.0f}ms ({len(docs)} docs)"
+            )
+            raise
+
+        elapsed = time.perf_counter() - start
+        self._logger.info(
+            f"[VespaFeeder] Fed schema '{schema}': {len(docs)} docs in {elapsed * 1000:.1f}ms "
+            f"({len(docs) / elapsed if elapsed > 0 else 0:.0f} docs/s, "
+            f"in-flight limit {self._limiter.limit})"
+        )
+
+    async def _feed_schema(
+        self,
+        schema: str,
+        docs: List[VespaDocument],
+        result: FeedResult,
+    ) -> None:
+        """Stream one schema's documents, keeping at most max_in_flight tasks alive."""
+        client = self._get_client()
+        pending: Set[asyncio.Task] = set()
+        try:
+            for doc in docs:
+                if len(pending) >= self._limiter.maximum:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        task.result()
+                pending.add(asyncio.create_task(self._feed_document(client, schema, doc, result)))
+            if pending:
+                await asyncio.gather(*pending)
+        except BaseException:
+            for task in pending:
+                task.cancel()
+            raise
+
+    async def _feed_document(
+        self,
+        client: httpx.AsyncClient,
+        schema: str,
+        doc: VespaDocument,
+        result: FeedResult,
+    ) -> None:
+        """PUT one document, retrying transient failures with backoff."""
+        url = (
+            f"{self._base_url}/document/v1/{self._namespace}/{schema}/docid/"
+            f"{quote(doc.id, safe='')}"
+        )
+        payload = {"fields": doc.fields}
+
+        for attempt in range(self._max_retries + 1):
+            status, body, retry_reason = await self._put_once(client, schema, url, payload)
+            if status == 200:
+                result.success_count += 1
+                self._record_documents(schema, "success")
+                return
+            if retry_reason is None or attempt == self._max_retries:
+                result.failed_docs.append((doc.id, status, body))
+                self._record_documents(schema, "failure")
+                return
+            if self._metrics is not None:
+                self._metrics.inc_retries(schema, retry_reason)
+            await asyncio.sleep(self._backoff(attempt))
+
+    async def _put_once(
+        self,
+        client: httpx.AsyncClient,
+        schema: str,
+        url: str,
+        payload: Dict[str, Any],
+    ) -> tuple[Optional[int], Any, Optional[str]]:
+        """Issue one request under the limiter.
+
+        Returns:
+            (status, body, retry_reason); retry_reason is None for outcomes
+            that must not be retried (success or a non-transient error).
+        """
+        await self._limiter.acquire()
+        throttled = False
+        start = time.perf_counter()
+        try:
+            response = await client.post(url, json=payload)
+        except httpx.TransportError as e:
+            # Connection trouble is treated like throttling: back off and shrink.
+            throttled = True
+            status, body, reason = None, {"Exception": str(e)}, "transport"
+        else:
+            status = response.status_code
+            throttled = status in _THROTTLE_STATUSES
+            body = None if status == 200 else _response_body(response)
+            if throttled:
+                reason = "throttled"
+            elif status >= 500:
+                reason = "server_error"
+            else:
+                reason = None
+        finally:
+            await self._limiter.release(throttled=throttled)
+
+        if self._metrics is not None:
+            self._metrics.observe_request(
+                schema, str(status) if status else "error", time.perf_counter() - start
+            )
+            self._metrics.set_in_flight_limit(self._limiter.limit)
+        return status, body, reason
+
+    def _backoff(self, attempt: int) -> float:
+        return min(self._retry_max_delay, self._retry_base_delay * (2**attempt))
+
+    def _record_documents(self, schema: str, outcome: str) -> None:
+        if self._metrics is not None:
+            self._metrics.inc_documents(schema, outcome, 1)
+
+
+def _response_body(response: httpx.Response) -> Any:
+    try:
+        return response.json()
+    except ValueError:
+        return response.text
@@ -0,0 +1,216 @@
+"""Shared asyncio-native Vespa query client.
+
+Replaces pyvespa's synchronous ``Vespa.query`` (one ``requests`` call per
+search, run in the default thread pool) with direct ``/search/`` POSTs over
+one long-lived HTTP/1.1 keep-alive connection pool per process:
+
+- Every search (classic and agentic) and every delete-resolution query
+  reuses warm connections instead of paying a handshake per request.
+- A semaphore bounds in-flight queries so a burst of searches queues in
+  the event loop instead of exhausting threads or Vespa connections.
+- Slot waits, latency by status and the in-flight count are reported
+  through :class:`~airweave.core.protocols.metrics.VespaQueryMetrics`.
+
+The API process gets its instance from the container
+(``container.vespa_query_client``); the Temporal worker builds its own on
+the worker metrics registry and passes it down to sync destinations.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from airweave.core.config import settings
+from airweave.core.logging import ContextualLogger
+from airweave.core.logging import logger as default_logger
+from airweave.core.protocols.metrics import VespaQueryMetrics
+from airweave.core.protocols.vespa import VespaQueryClientProtocol
+from airweave.platform.destinations.vespa.config import (
+    QUERY_KEEPALIVE_EXPIRY,
+    QUERY_MAX_CONNECTIONS,
+    QUERY_MAX_IN_FLIGHT,
+)
+
+
+class VespaQueryResult:
+    """Response of one ``/search/`` request.
+
+    Mirrors the accessors of pyvespa's ``VespaQueryResponse`` that callers
+    rely on (``json``, ``hits``, ``is_successful``).
+    """
+
+    def __init__(self, status_code: int, json: Dict[str, Any]) -> None:
+        """Initialize the result.
+
+        Args:
+            status_code: HTTP status returned by Vespa.
+            json: Decoded response body (empty dict if it was not JSON).
+        """
+        self.status_code = status_code
+        self.json = json
+
+    @property
+    def hits(self) -> List[Dict[str, Any]]:
+        """Result hits (``root.children``)."""
+        return self.json.get("root", {}).get("children", []) or []
+
+    def is_successful(self) -> bool:
+        """Whether Vespa answered with HTTP 200."""
+        return self.status_code == 200
+
+    def __repr__(self) -> str:
+        """Compact representation used in error messages."""
+        return f"VespaQueryResult(status_code={self.status_code}, json={self.json})"
+
+
+class VespaQueryClient(VespaQueryClientProtocol):
+    """Runs Vespa queries over pooled keep-alive connections with bounded concurrency.
+
+    Usage::
+
+        client = VespaQueryClient(base_url="http://vespa:8081")
+        result = await client.query({"yql": "select * from sources * where true"})
+        await client.close()
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        http_client: Optional[httpx.AsyncClient] = None,
+        request_timeout: float = 60.0,
+        max_in_flight: int = QUERY_MAX_IN_FLIGHT,
+        max_connections: int = QUERY_MAX_CONNECTIONS,
+        keepalive_expiry: float = QUERY_KEEPALIVE_EXPIRY,
+        metrics: Optional[VespaQueryMetrics] = None,
+        logger: Optional[ContextualLogger] = None,
+    ) -> None:
+        """Initialize the client (the HTTP client is created on first query).
+
+        Args:
+            base_url: Vespa container URL including port.
+            http_client: Optional pre-built client (the query client will not close it).
+            request_timeout: Per-request timeout in seconds.
+            max_in_flight: Max concurrent queries; further queries wait for a slot.
+            max_connections: Pooled connections kept open to Vespa.
+            keepalive_expiry: Seconds an idle connection is kept alive.
+            metrics: Optional slot wait / latency / in-flight instrumentation.
+            logger: Optional logger.
+        """
+        self._search_url = f"{base_url.rstrip('/')}/search/"
+        self._client = http_client
+        self._owns_client = http_client is None
+        self._request_timeout = request_timeout
+        self._max_connections = max_connections
+        self._keepalive_expiry = keepalive_expiry
+        self._max_in_flight = max_in_flight
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._in_flight = 0
+        self._metrics = metrics
+        self._logger = logger or default_logger
+
+    @classmethod
+    def from_settings(
+        cls,
+        *,
+        metrics: Optional[VespaQueryMetrics] = None,
+        logger: Optional[ContextualLogger] = None,
+    ) -> VespaQueryClient:
+        """Build a client for the Vespa instance configured in settings."""
+        return cls(
+            base_url=f"{settings.VESPA_URL}:{settings.VESPA_PORT}",
+            request_timeout=settings.VESPA_TIMEOUT,
+            metrics=metrics,
+            logger=logger,
+        )
+
+    @property
+    def in_flight(self) -> int:
+        """Queries currently holding a slot."""
+        return self._in_flight
+
+    async def query(self, body: Dict[str, Any], *, caller: str = "search") -> VespaQueryResult:
+        """POST a query to Vespa's ``/search/`` endpoint.
+
+        Args:
+            body: Query parameters including ``yql``.
+            caller: Label identifying the caller in metrics.
+
+        Returns:
+            VespaQueryResult; non-200 answers are returned, not raised.
+
+        Raises:
+            httpx.HTTPError: On transport failures and timeouts.
+        """
+        self._bind_loop()
+        wait_start = time.perf_counter()
+        async with self._semaphore:
+            if self._metrics is not None:
+                self._metrics.observe_slot_wait(caller, time.perf_counter() - wait_start)
+            self._set_in_flight(self._in_flight + 1)
+            start = time.perf_counter()
+            status = "error"
+            try:
+                response = await self._get_client().post(self._search_url, json=body)
+                status = str(response.status_code)
+                return VespaQueryResult(response.status_code, _decode(response))
+            finally:
+                self._set_in_flight(self._in_flight - 1)
+                if self._metrics is not None:
+                    self._metrics.observe_query(caller, status, time.perf_counter() - start)
+
+    async def close(self) -> None:
+        """Close the HTTP client if this query client created it."""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+        self._client = None
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _bind_loop(self) -> None:
+        """Rebind loop-bound state when used from a new event loop.
+
+        The pool and the semaphore belong to the loop they were first used on;
+        successive ``asyncio.run`` calls (scripts, tests) get fresh ones.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        if self._loop is not None:
+            self._semaphore = asyncio.Semaphore(self._max_in_flight)
+            if self._owns_client:
+                self._client = None
+        self._loop = loop
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self._request_timeout,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections,
+                    keepalive_expiry=self._keepalive_expiry,
+                ),
+            )
+            self._owns_client = True
+        return self._client
+
+    def _set_in_flight(self, count: int) -> None:
+        self._in_flight = count
+        if self._metrics is not None:
+            self._metrics.set_in_flight(count)
+
+
+def _decode(response: httpx.Response) -> Dict[str, Any]:
+    try:
+        body = response.json()
+    except ValueError:
+        return {"error": response.text}
+    return body if isinstance(body, dict) else {"error": body}
@@ -5,14 +5,16 @@ Pure transformation logic with no I/O dependencies.
 
 from __future__ import annotations
 
-import json
 import re
 from collections import defaultdict
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
+import numpy as np
+
 from airweave.core.logging import ContextualLogger
 from airweave.core.logging import logger as default_logger
+from airweave.domains.embedders.types import as_dense_array
 from airweave.platform.destinations.vespa.types import VespaDocument
 from airweave.platform.entities._base import (
     AirweaveSystemMetadata,
@@ -22,6 +24,21 @@ from airweave.platform.entities._base import (
     FileEntity,
     WebEntity,
 )
+from airweave.platform.entities._serialization import entity_payload_json
+
+
+def _bfloat16_hex(vector: Any) -> str:
+    """Encode a dense vector as a Vespa hex string of bfloat16 cells.
+
+    Vespa accepts ``{"values": "<hex>"}`` for indexed tensors, where the hex
+    string holds each cell in the field's cell type, big-endian. bfloat16 is
+    the upper half of a float32, rounded to nearest even here so the stored
+    values match what Vespa's own float -> bfloat16 conversion produces.
+    That is 4 hex characters per dimension instead of a JSON float literal.
+    """
+    bits = as_dense_array(vector).view(np.uint32)
+    rounded = (bits + (0x7FFF + ((bits >> 16) & 1))) >> 16
+    return rounded.astype(">u2").tobytes().hex().upper()
 
 
 def _sanitize_for_vespa(text: str) -> str:
@@ -351,10 +368,11 @@ class EntityTransformer:
         """Add pre-computed embeddings from airweave_system_metadata.
 
         ChunkEmbedProcessor populates each chunk entity with:
-        - airweave_system_metadata.dense_embedding: 3072-dim float32 embedding
+        - airweave_system_metadata.dense_embedding: 3072-dim float32 array
         - airweave_system_metadata.sparse_embedding: FastEmbed BM25 sparse vector
 
-        Vespa auto-converts float32 to bfloat16 for dense embedding storage.
+        The dense field is a bfloat16 tensor, so the vector is sent already
+        converted, as a hex string (see ``_bfloat16_hex``).
         """
         meta = entity.airweave_system_metadata
         if meta is None:
@@ -365,8 +383,8 @@ class EntityTransformer:
 
         # Dense embedding (3072-dim for neural search)
         dense_emb = meta.dense_embedding
-        if dense_emb is not None and isinstance(dense_emb, list) and len(dense_emb) > 0:
-            fields["dense_embedding"] = {"values": dense_emb}
+        if dense_emb is not None and len(dense_emb) > 0:
+            fields["dense_embedding"] = {"values": _bfloat16_hex(dense_emb)}
             self._logger.debug(
                 f"[EntityTransformer] Added dense_embedding with {len(dense_emb)} dims"
             )
@@ -399,8 +417,8 @@ class EntityTransformer:
         - indices: numpy.ndarray[int] - token IDs
         - values: numpy.ndarray[float] - token weights
 
-        Vespa mapped tensor format:
-        - {"cells": [{"address": {"token": "123"}, "value": 0.5}, ...]}
+        Vespa mapped tensor short form (single mapped dimension):
+        - {"cells": {"123": 0.5, ...}}
 
         We use token IDs as strings since we don't need actual token text.
         This works because Vespa just needs consistent keys for matching.
@@ -429,10 +447,9 @@ class EntityTransformer:
             if not indices or not values:
                 return None
 
-            # Convert to Vespa cells format
-            cells = []
-            for idx, val in zip(indices, values, strict=False):
-                cells.append({"address": {"token": str(idx)}, "value": float(val)})
+            # Short form: one {label: value} entry per token instead of an
+            # address object per cell
+            cells = {str(idx): float(val) for idx, val in zip(indices, values, strict=False)}
 
             return {"cells": cells}
 
@@ -445,9 +462,8 @@ class EntityTransformer:
     def _add_payload_field(self, fields: Dict[str, Any], entity: BaseEntity) -> None:
         """Extract extra fields into payload JSON."""
         schema_fields = _get_schema_fields_for_entity(entity)
-        # Exclude airweave_system_metadata from dump to avoid serializing numpy arrays
-        # (sparse_embedding contains FastEmbed SparseEmbedding with numpy arrays)
-        entity_dict = entity.model_dump(mode="json", exclude={"airweave_system_metadata"})
-        payload = {k: v for k, v in entity_dict.items() if k not in schema_fields}
+        # Excludes airweave_system_metadata (embeddings); chunks of one parent
+        # share a single payload dump since they only differ in schema fields
+        payload = entity_payload_json(entity, schema_fields)
         if payload:
-            fields["payload"] = json.dumps(payload)
+            fields["payload"] = payload
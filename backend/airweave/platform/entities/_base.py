@@ -1,10 +1,10 @@
 from datetime import datetime
-from typing import ClassVar, List, Optional, Type
+from typing import Any, ClassVar, List, Optional, Type
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
-from airweave.domains.embedders.types import SparseEmbedding
+from airweave.domains.embedders.types import DenseVector, SparseEmbedding
 
 
 class Breadcrumb(BaseModel):
@@ -64,6 +64,10 @@ class AirweaveSystemMetadata(BaseModel):
 
     # Set during hash computation
     hash: Optional[str] = Field(None, description="Hash of the content used for change detection.")
+    legacy_hash: Optional[str] = Field(
+        None,
+        description="Legacy SHA-256 hash of the same content, set while migrating hash formats.",
+    )
 
     # Set during chunking
     chunk_index: Optional[int] = Field(None, description="Index of the chunk in the file.")
@@ -72,8 +76,8 @@ class AirweaveSystemMetadata(BaseModel):
     )
 
     # Set during embedding
-    dense_embedding: Optional[List[float]] = Field(
-        None, description="3072-dim dense embedding from text-embedding-3-large"
+    dense_embedding: Optional[DenseVector] = Field(
+        None, description="3072-dim float32 dense embedding from text-embedding-3-large"
     )
     sparse_embedding: Optional[SparseEmbedding] = Field(
         None, description="BM25 sparse embedding for hybrid search (Qdrant only)"
@@ -117,6 +121,10 @@ class BaseEntity(BaseModel):
         None, description="Access control - who can view this entity (not expanded)"
     )
 
+    # Serialization memo shared by the chunks of one parent
+    # (see airweave.platform.entities._serialization)
+    _json_cache: Any = PrivateAttr(default=None)
+
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     @model_validator(mode="after")
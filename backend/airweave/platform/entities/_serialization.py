@@ -0,0 +1,106 @@
+"""Memoized JSON serialization shared by a parent entity's chunks.
+
+Chunk entities are shallow copies of their parent that differ only in
+``CHUNK_FIELDS`` (plus system metadata, which is never serialized here).
+An :class:`EntityJsonCache` dumps the parent's remaining fields once and
+serves every chunk from that dump:
+
+- ``canonical_entity_json``: the sorted-keys JSON used as BM25 input,
+  byte-identical to ``json.dumps(model_dump(mode="json"), sort_keys=True)``.
+  Each top-level field is encoded once per parent; a chunk only encodes
+  its own fields and splices them in.
+- ``entity_payload_json``: the Vespa payload (fields without a schema
+  column), which is the same for every chunk of a parent.
+
+Entities without a cache (parents, single-chunk paths, tests) fall back
+to a direct dump, so callers never need to know which kind they hold.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, AbstractSet, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    from airweave.platform.entities._base import BaseEntity
+
+# Fields a chunk overrides; everything else is shared with the parent.
+CHUNK_FIELDS = ("entity_id", "textual_representation")
+
+_ALWAYS_EXCLUDED = frozenset({"airweave_system_metadata"})
+
+
+def _segment(key: str, value: Any) -> str:
+    """Encode one top-level ``"key": value`` pair as json.dumps(sort_keys=True) would."""
+    return f"{json.dumps(key)}: {json.dumps(value, sort_keys=True)}"
+
+
+class EntityJsonCache:
+    """Lazily computed JSON dumps of one parent entity, shared by its chunks."""
+
+    __slots__ = ("_source", "_segments", "_payloads")
+
+    def __init__(self, source: BaseEntity) -> None:
+        """Initialize the cache (nothing is dumped until first use).
+
+        Args:
+            source: The parent entity. Its non-chunk fields must not change
+                while chunks are being serialized.
+        """
+        self._source = source
+        self._segments: Optional[Dict[str, str]] = None
+        self._payloads: Dict[frozenset, Optional[str]] = {}
+
+    def canonical_json(self, entity: BaseEntity) -> str:
+        """Sorted-keys JSON of ``entity`` (a chunk of the source) without system metadata."""
+        if self._segments is None:
+            dump = self._source.model_dump(
+                mode="json", exclude=set(_ALWAYS_EXCLUDED | set(CHUNK_FIELDS))
+            )
+            self._segments = {key: _segment(key, value) for key, value in dump.items()}
+
+        segments = dict(self._segments)
+        for name in CHUNK_FIELDS:
+            segments[name] = _segment(name, getattr(entity, name))
+        return "{" + ", ".join(segments[key] for key in sorted(segments)) + "}"
+
+    def payload_json(self, schema_fields: frozenset) -> Optional[str]:
+        """JSON of the fields outside ``schema_fields``, or None if there are none.
+
+        Only valid when every chunk field is a schema field, i.e. the
+        payload cannot differ between chunks.
+        """
+        if schema_fields not in self._payloads:
+            payload = self._source.model_dump(
+                mode="json", exclude=set(_ALWAYS_EXCLUDED | schema_fields)
+            )
+            self._payloads[schema_fields] = json.dumps(payload) if payload else None
+        return self._payloads[schema_fields]
+
+
+def _get_cache(entity: Any) -> Optional[EntityJsonCache]:
+    cache = getattr(entity, "_json_cache", None)
+    return cache if isinstance(cache, EntityJsonCache) else None
+
+
+def canonical_entity_json(entity: BaseEntity) -> str:
+    """Sorted-keys JSON of an entity without system metadata (BM25 input)."""
+    cache = _get_cache(entity)
+    if cache is not None:
+        return cache.canonical_json(entity)
+    return json.dumps(
+        entity.model_dump(mode="json", exclude=set(_ALWAYS_EXCLUDED)),
+        sort_keys=True,
+    )
+
+
+def entity_payload_json(entity: BaseEntity, schema_fields: AbstractSet[str]) -> Optional[str]:
+    """JSON of the entity fields that have no schema column, or None if there are none."""
+    schema_fields = frozenset(schema_fields)
+    cache = _get_cache(entity)
+    if cache is not None and schema_fields.issuperset(CHUNK_FIELDS):
+        return cache.payload_json(schema_fields)
+
+    entity_dict = entity.model_dump(mode="json", exclude=set(_ALWAYS_EXCLUDED))
+    payload = {k: v for k, v in entity_dict.items() if k not in schema_fields}
+    return json.dumps(payload) if payload else None
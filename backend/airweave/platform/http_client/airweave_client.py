@@ -78,7 +78,13 @@ class AirweaveHttpClient:
             raise
 
     def _install_ssrf_hook(self, client: httpx.AsyncClient) -> None:
-        """Install an httpx event hook that validates redirect targets."""
+        """Install an httpx event hook that validates redirect targets.
+
+        Pooled clients are wrapped once per ``http_client()`` call, so the
+        hook is installed only the first time a client is seen.
+        """
+        if getattr(client, "_airweave_ssrf_hook", False):
+            return
         logger = self._logger
         source = self._source_short_name
 
@@ -91,6 +97,7 @@ class AirweaveHttpClient:
                 raise
 
         client.event_hooks.setdefault("request", []).append(ssrf_hook)
+        client._airweave_ssrf_hook = True
 
     async def _check_rate_limit_and_convert_to_429(self, method: str, url: str) -> None:
         """Check rate limits and convert exceptions to HTTP 429 if exceeded.
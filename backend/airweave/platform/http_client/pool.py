@@ -0,0 +1,203 @@
+"""Per-sync pooled HTTP clients for sources.
+
+``BaseSource.http_client()`` used to build (and tear down) a fresh
+``httpx.AsyncClient`` on every ``async with``, so sources that open it per
+page, folder or file paid a TCP + TLS handshake each time and never reused
+keep-alive connections or HTTP/2 streams.
+
+A :class:`SourceHttpClientPool` is created per sync by ``SyncFactory``,
+attached to the source and held by ``SyncRuntime``; the orchestrator closes
+it when the sync ends. All clients it hands out share ONE connection pool
+(an ``httpx.AsyncHTTPTransport``), so client-level options such as timeouts,
+headers or redirects may differ per call without losing connection reuse.
+
+Calls that pass connection-level options (TLS verification, proxies, a
+custom transport, ...) cannot share the transport; they get a dedicated
+client with the old per-call lifecycle.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import httpx
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+from airweave.core.protocols.metrics import HttpClientPoolMetrics
+
+# Client options that configure the connection pool itself.
+_TRANSPORT_OPTIONS = frozenset(
+    {
+        "verify",
+        "cert",
+        "trust_env",
+        "http1",
+        "http2",
+        "proxy",
+        "mounts",
+        "transport",
+        "limits",
+        "default_encoding",
+    }
+)
+
+
+class PooledAsyncClient(httpx.AsyncClient):
+    """An ``httpx.AsyncClient`` whose lifecycle belongs to its pool.
+
+    ``async with`` and ``aclose()`` are no-ops, so existing source code that
+    scopes a client per request keeps working without closing the shared
+    connections. The pool closes the transport at sync end.
+    """
+
+    async def __aenter__(self) -> "PooledAsyncClient":
+        """Return the shared client without opening or owning it."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Leave the shared client open."""
+
+    async def aclose(self) -> None:
+        """Leave the shared client open (the pool closes it)."""
+
+
+class _ConnectionTrace:
+    """httpcore ``trace`` callback counting handshakes and connection reuse."""
+
+    __slots__ = ("_metrics", "_source", "_new_connection")
+
+    def __init__(self, metrics: HttpClientPoolMetrics, source: str) -> None:
+        self._metrics = metrics
+        self._source = source
+        self._new_connection = False
+
+    async def __call__(self, event: str, info: Dict[str, Any]) -> None:
+        if event == "connection.connect_tcp.complete":
+            self._new_connection = True
+            self._metrics.inc_handshakes(self._source, "tcp")
+        elif event == "connection.start_tls.complete":
+            self._metrics.inc_handshakes(self._source, "tls")
+        elif event.endswith(".send_request_headers.started"):
+            protocol = event.split(".", 1)[0]  # "http11" or "http2"
+            connection = "new" if self._new_connection else "reused"
+            self._metrics.inc_requests(self._source, protocol, connection)
+            self._new_connection = False
+
+
+class SourceHttpClientPool:
+    """Pooled HTTP clients for one source during one sync.
+
+    Usage::
+
+        pool = SourceHttpClientPool(source_short_name="notion")
+        source.set_http_client_pool(pool)
+        ...
+        await pool.aclose()
+    """
+
+    # Distinct client configurations kept per pool (least recently used dropped)
+    MAX_CLIENTS = 32
+
+    def __init__(
+        self,
+        source_short_name: str = "",
+        *,
+        http2: Optional[bool] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        metrics: Optional[HttpClientPoolMetrics] = None,
+    ) -> None:
+        """Initialize the pool (the transport is created on first use).
+
+        Args:
+            source_short_name: Source label for metrics.
+            http2: Offer HTTP/2 via ALPN (defaults to SOURCE_HTTP_POOL_HTTP2).
+            max_connections: Connection cap (defaults to SOURCE_HTTP_POOL_MAX_CONNECTIONS).
+            max_keepalive_connections: Idle connections kept open
+                (defaults to SOURCE_HTTP_POOL_MAX_KEEPALIVE).
+            keepalive_expiry: Seconds an idle connection is kept
+                (defaults to SOURCE_HTTP_POOL_KEEPALIVE_EXPIRY).
+            metrics: Optional connection reuse / handshake instrumentation.
+        """
+        self._source = source_short_name
+        self._http2 = settings.SOURCE_HTTP_POOL_HTTP2 if http2 is None else http2
+        self._limits = httpx.Limits(
+            max_connections=max_connections or settings.SOURCE_HTTP_POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=(
+                max_keepalive_connections or settings.SOURCE_HTTP_POOL_MAX_KEEPALIVE
+            ),
+            keepalive_expiry=keepalive_expiry or settings.SOURCE_HTTP_POOL_KEEPALIVE_EXPIRY,
+        )
+        self._metrics = metrics
+        self._transport: Optional[httpx.AsyncHTTPTransport] = None
+        self._clients: "OrderedDict[str, PooledAsyncClient]" = OrderedDict()
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """Whether the pool has been closed."""
+        return self._closed
+
+    def client(self, **kwargs: Any) -> httpx.AsyncClient:
+        """Return an HTTP client for these ``httpx.AsyncClient`` options.
+
+        Clients with the same options are reused; all of them share the
+        pool's connections. Connection-level options (or a closed pool) get
+        a dedicated ``httpx.AsyncClient`` that the caller must close.
+        """
+        if self._closed or _TRANSPORT_OPTIONS.intersection(kwargs):
+            return httpx.AsyncClient(**kwargs)
+
+        key = _options_key(kwargs)
+        client = self._clients.get(key)
+        if client is not None:
+            self._clients.move_to_end(key)
+            return client
+
+        client = PooledAsyncClient(transport=self._get_transport(), **kwargs)
+        if self._metrics is not None:
+            client.event_hooks.setdefault("request", []).append(self._trace_request)
+        self._clients[key] = client
+        # Dropped clients hold no connections of their own, so no close is needed
+        if len(self._clients) > self.MAX_CLIENTS:
+            self._clients.popitem(last=False)
+        return client
+
+    async def aclose(self) -> None:
+        """Close all pooled connections. Later calls get dedicated clients."""
+        self._closed = True
+        self._clients.clear()
+        transport, self._transport = self._transport, None
+        if transport is not None:
+            try:
+                await transport.aclose()
+            except Exception as e:
+                logger.warning(f"[SourceHttpClientPool] Failed to close transport: {e}")
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _get_transport(self) -> httpx.AsyncHTTPTransport:
+        if self._transport is None:
+            self._transport = httpx.AsyncHTTPTransport(http2=self._http2, limits=self._limits)
+        return self._transport
+
+    async def _trace_request(self, request: httpx.Request) -> None:
+        request.extensions["trace"] = _ConnectionTrace(self._metrics, self._source)
+
+
+def _options_key(kwargs: Dict[str, Any]) -> str:
+    """Stable key for a set of client options (dicts compared by content)."""
+    return repr(sorted((name, _freeze(value)) for name, value in kwargs.items()))
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return sorted((str(k), _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return [_freeze(v) for v in value]
+    return repr(value)
@@ -22,6 +22,7 @@ from typing import (
 if TYPE_CHECKING:
     from airweave.domains.sources.token_providers.protocol import TokenProviderProtocol
     from airweave.platform.access_control.schemas import MembershipTuple
+    from airweave.platform.http_client.pool import SourceHttpClientPool
 
 import httpx
 from pydantic import BaseModel
@@ -66,6 +67,7 @@ class BaseSource:
         self._logger: Optional[Any] = None
         self._token_provider: Optional["TokenProviderProtocol"] = None
         self._http_client_factory: Optional[Callable] = None
+        self._http_client_pool: Optional["SourceHttpClientPool"] = None
         self._file_downloader: Optional[Any] = None
 
     @property
@@ -103,6 +105,28 @@ class BaseSource:
         if factory:
             self.logger.debug("HTTP client factory configured")
 
+    def set_http_client_pool(self, pool: Optional["SourceHttpClientPool"]) -> None:
+        """Share one connection pool across this source's HTTP clients.
+
+        Args:
+            pool: Per-sync pool owned (and closed) by the sync runtime,
+                or None for a fresh client per ``http_client()`` call
+        """
+        self._http_client_pool = pool
+
+    def create_base_http_client(self, **kwargs) -> httpx.AsyncClient:
+        """Create the plain httpx client behind ``http_client()``.
+
+        Returns a pooled client when a pool is set (entering and closing it
+        are no-ops), otherwise a new ``httpx.AsyncClient``.
+
+        Args:
+            **kwargs: Standard httpx.AsyncClient parameters
+        """
+        if self._http_client_pool is not None:
+            return self._http_client_pool.client(**kwargs)
+        return httpx.AsyncClient(**kwargs)
+
     @property
     def file_downloader(self):
         """Get the file downloader for this source."""
@@ -145,8 +169,8 @@ class BaseSource:
                     if hasattr(client, "aclose"):
                         await client.aclose()
         else:
-            # Use vanilla httpx
-            async with httpx.AsyncClient(**kwargs) as client:
+            # Use vanilla httpx (pooled when the sync provides a pool)
+            async with self.create_base_http_client(**kwargs) as client:
                 yield client
 
     def set_cursor(self, cursor) -> None:
@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING, List, Set, Tuple
 
 from airweave import crud
 from airweave.db.session import get_db_context
+from airweave.platform.access_control.broker import access_broker
 from airweave.platform.access_control.schemas import (
     ACLChangeType,
     MembershipTuple,
@@ -61,7 +62,10 @@ class AccessControlPipeline:
         """Process access control memberships from the source.
 
         Decides between full and incremental sync based on source capabilities
-        and cursor state, then delegates to the appropriate path.
+        and cursor state, then delegates to the appropriate path. Afterwards
+        (even on partial failure, since batches may already be persisted) the
+        organization's cached principal resolutions are invalidated so searches
+        see the new memberships.
 
         Args:
             source: Source instance (e.g. SharePoint2019V2Source)
@@ -71,10 +75,13 @@ class AccessControlPipeline:
         Returns:
             Number of memberships processed
         """
-        if self._should_do_incremental_sync(source, sync_context, runtime):
-            return await self._process_incremental(source, sync_context, runtime)
-        else:
-            return await self._process_full(source, sync_context, runtime)
+        try:
+            if self._should_do_incremental_sync(source, sync_context, runtime):
+                return await self._process_incremental(source, sync_context, runtime)
+            else:
+                return await self._process_full(source, sync_context, runtime)
+        finally:
+            await access_broker.invalidate_organization(sync_context.organization_id)
 
     # -------------------------------------------------------------------------
     # Sync mode decision
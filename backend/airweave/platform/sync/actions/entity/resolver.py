@@ -4,12 +4,14 @@ Resolves entities to their appropriate action (INSERT/UPDATE/DELETE/KEEP)
 by comparing content hashes against stored values in the database.
 """
 
+import asyncio
 import time
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-from airweave import crud, models
+from airweave import crud
+from airweave.crud.crud_entity import EntityIdHash
 from airweave.db.session import get_db_context
-from airweave.platform.entities._base import BaseEntity, DeletionEntity
+from airweave.platform.entities._base import AirweaveSystemMetadata, BaseEntity, DeletionEntity
 from airweave.platform.sync.actions.entity.types import (
     EntityActionBatch,
     EntityDeleteAction,
@@ -28,15 +30,24 @@ class EntityActionResolver:
 
     Compares entity hashes against stored values in the database to determine
     what operation is needed for each entity.
+
+    With ``use_hash_snapshot`` the sync's (entity_id, short_name) -> (id, hash)
+    map is loaded once on the first batch. Entities whose hash matches the
+    snapshot resolve to KEEP without a query; only the remaining keys are
+    looked up in the database.
     """
 
-    def __init__(self, entity_map: Dict[type, str]):
+    def __init__(self, entity_map: Dict[type, str], use_hash_snapshot: bool = False):
         """Initialize the action resolver.
 
         Args:
             entity_map: Mapping of entity class to entity_definition_short_name
+            use_hash_snapshot: Preload the sync's stored hashes on first resolve
         """
         self.entity_map = entity_map
+        self._use_hash_snapshot = use_hash_snapshot
+        self._hash_snapshot: Optional[Dict[Tuple[str, str], EntityIdHash]] = None
+        self._snapshot_lock = asyncio.Lock()
 
     # -------------------------------------------------------------------------
     # Public API
@@ -77,8 +88,13 @@ class EntityActionResolver:
         all_entities = non_delete_entities + delete_entities
         entity_requests = self._build_entity_requests(all_entities, sync_context)
 
-        # Step 3: Fetch existing entities from database
-        existing_map = await self._fetch_existing_entities(entity_requests, sync_context)
+        # Step 3: Fetch existing entities (snapshot hits first, then database)
+        if self._use_hash_snapshot:
+            existing_map = await self._lookup_with_snapshot(
+                non_delete_entities, entity_requests, sync_context
+            )
+        else:
+            existing_map = await self._fetch_existing_entities(entity_requests, sync_context)
 
         # Step 4: Create actions for each entity
         batch = self._create_actions(
@@ -88,6 +104,9 @@ class EntityActionResolver:
             sync_context,
         )
 
+        if self._hash_snapshot is not None:
+            self._forget_mutated(batch)
+
         # Log summary
         sync_context.logger.debug(f"Action resolution: {batch.summary()}")
 
@@ -173,7 +192,7 @@ class EntityActionResolver:
         self,
         entity_requests: List[Tuple[str, str]],
         sync_context: "SyncContext",
-    ) -> Dict[Tuple[str, str], models.Entity]:
+    ) -> Dict[Tuple[str, str], EntityIdHash]:
         """Bulk fetch existing entity records from database.
 
         Args:
@@ -181,7 +200,7 @@ class EntityActionResolver:
             sync_context: Sync context with logger
 
         Returns:
-            Dict mapping (entity_id, entity_definition_short_name) -> Entity model
+            Dict mapping (entity_id, entity_definition_short_name) -> EntityIdHash
 
         Raises:
             SyncFailureError: If database lookup fails
@@ -191,13 +210,14 @@ class EntityActionResolver:
 
         try:
             lookup_start = time.time()
-            num_chunks = (len(entity_requests) + 999) // 1000
+            chunk_size = crud.entity.LOOKUP_CHUNK_SIZE
+            num_chunks = (len(entity_requests) + chunk_size - 1) // chunk_size
             sync_context.logger.debug(
                 f"Bulk entity lookup for {len(entity_requests)} entities ({num_chunks} chunks)..."
             )
 
             async with get_db_context() as db:
-                existing_map = await crud.entity.bulk_get_by_entity_sync_and_definition(
+                existing_map = await crud.entity.bulk_get_id_hash_by_entity_sync_and_definition(
                     db,
                     sync_id=sync_context.sync.id,
                     entity_requests=entity_requests,
@@ -215,11 +235,68 @@ class EntityActionResolver:
             sync_context.logger.error(f"Failed to fetch existing entities: {e}")
             raise SyncFailureError(f"Failed to fetch existing entities: {e}") from e
 
+    async def _lookup_with_snapshot(
+        self,
+        non_delete_entities: List[BaseEntity],
+        entity_requests: List[Tuple[str, str]],
+        sync_context: "SyncContext",
+    ) -> Dict[Tuple[str, str], EntityIdHash]:
+        """Serve unchanged entities from the hash snapshot, query the rest.
+
+        ``entity_requests`` lists non-delete entities first, in order, so the
+        first ``len(non_delete_entities)`` keys line up with those entities.
+        """
+        snapshot = await self._get_hash_snapshot(sync_context)
+
+        existing_map: Dict[Tuple[str, str], EntityIdHash] = {}
+        pending: List[Tuple[str, str]] = []
+        for index, key in enumerate(entity_requests):
+            stored = snapshot.get(key)
+            if stored is not None and index < len(non_delete_entities):
+                metadata = non_delete_entities[index].airweave_system_metadata
+                if metadata and _hash_matches(metadata, stored.hash):
+                    existing_map[key] = stored
+                    continue
+            pending.append(key)
+
+        if pending:
+            existing_map.update(await self._fetch_existing_entities(pending, sync_context))
+        return existing_map
+
+    async def _get_hash_snapshot(
+        self, sync_context: "SyncContext"
+    ) -> Dict[Tuple[str, str], EntityIdHash]:
+        """Load the sync's hash snapshot once; concurrent batches wait for it."""
+        if self._hash_snapshot is not None:
+            return self._hash_snapshot
+
+        async with self._snapshot_lock:
+            if self._hash_snapshot is None:
+                load_start = time.time()
+                try:
+                    async with get_db_context() as db:
+                        self._hash_snapshot = await crud.entity.get_id_hash_map_by_sync_id(
+                            db, sync_context.sync.id
+                        )
+                except Exception as e:
+                    sync_context.logger.error(f"Failed to load entity hash snapshot: {e}")
+                    raise SyncFailureError(f"Failed to load entity hash snapshot: {e}") from e
+                sync_context.logger.info(
+                    f"Loaded hash snapshot of {len(self._hash_snapshot)} entities "
+                    f"in {time.time() - load_start:.2f}s"
+                )
+        return self._hash_snapshot
+
+    def _forget_mutated(self, batch: EntityActionBatch) -> None:
+        """Drop snapshot entries this batch will change so later lookups hit the DB."""
+        for action in (*batch.inserts, *batch.updates, *batch.deletes):
+            self._hash_snapshot.pop((action.entity_id, action.entity_definition_short_name), None)
+
     def _create_actions(
         self,
         non_delete_entities: List[BaseEntity],
         delete_entities: List[BaseEntity],
-        existing_map: Dict[Tuple[str, str], models.Entity],
+        existing_map: Dict[Tuple[str, str], EntityIdHash],
         sync_context: "SyncContext",
     ) -> EntityActionBatch:
         """Create action objects for all entities.
@@ -267,7 +344,7 @@ class EntityActionResolver:
     def _resolve_non_delete_action(
         self,
         entity: BaseEntity,
-        existing_map: Dict[Tuple[str, str], models.Entity],
+        existing_map: Dict[Tuple[str, str], EntityIdHash],
         sync_context: "SyncContext",
     ) -> EntityInsertAction | EntityUpdateAction | EntityKeepAction:
         """Resolve a non-delete entity to its action type.
@@ -290,8 +367,6 @@ class EntityActionResolver:
                 f"Hash should have been set during hash computation."
             )
 
-        entity_hash = entity.airweave_system_metadata.hash
-
         short_name = self.resolve_entity_definition_short_name(entity)
         if short_name is None:
             raise SyncFailureError(f"Entity type {entity.__class__.__name__} not in entity_map")
@@ -304,7 +379,7 @@ class EntityActionResolver:
                 entity=entity,
                 entity_definition_short_name=short_name,
             )
-        elif db_row.hash != entity_hash:
+        elif not _hash_matches(entity.airweave_system_metadata, db_row.hash):
             return EntityUpdateAction(
                 entity=entity,
                 entity_definition_short_name=short_name,
@@ -319,7 +394,7 @@ class EntityActionResolver:
     def _create_delete_action(
         self,
         entity: BaseEntity,
-        existing_map: Dict[Tuple[str, str], models.Entity],
+        existing_map: Dict[Tuple[str, str], EntityIdHash],
         sync_context: "SyncContext",
     ) -> EntityDeleteAction:
         """Create a delete action for a DeletionEntity.
@@ -386,3 +461,14 @@ class EntityActionResolver:
             keeps=[],
             deletes=deletes,
         )
+
+
+def _hash_matches(metadata: AirweaveSystemMetadata, stored_hash: Optional[str]) -> bool:
+    """Whether a stored hash matches the entity's hash or its legacy-format hash.
+
+    Rows written before a hash algorithm switch keep their legacy hash until
+    the entity changes, so they are matched against ``legacy_hash`` as well.
+    """
+    if metadata.hash == stored_hash:
+        return True
+    return metadata.legacy_hash is not None and metadata.legacy_hash == stored_hash
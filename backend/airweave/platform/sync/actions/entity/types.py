@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from uuid import UUID
 
 if TYPE_CHECKING:
-    from airweave import models
+    from airweave.crud.crud_entity import EntityIdHash
     from airweave.platform.entities._base import BaseEntity
 
 
@@ -108,8 +108,8 @@ class EntityActionBatch:
     deletes: List[EntityDeleteAction] = field(default_factory=list)
     keeps: List[EntityKeepAction] = field(default_factory=list)
 
-    # Map of (entity_id, entity_definition_short_name) -> DB entity for lookups
-    existing_map: Dict[Tuple[str, str], "models.Entity"] = field(default_factory=dict)
+    # Map of (entity_id, entity_definition_short_name) -> stored (id, hash)
+    existing_map: Dict[Tuple[str, str], "EntityIdHash"] = field(default_factory=dict)
 
     @property
     def has_mutations(self) -> bool:
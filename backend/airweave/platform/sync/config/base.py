@@ -47,6 +47,11 @@ class BehaviorConfig(BaseModel):
         False, description="Replay from ARF storage instead of calling source"
     )
     skip_guardrails: bool = Field(False, description="Skip usage guardrails (entity count checks)")
+    preload_hash_snapshot: bool = Field(
+        False,
+        description="Preload stored entity hashes once so unchanged entities resolve without "
+        "DB queries",
+    )
 
 
 class SyncConfig(BaseSettings):
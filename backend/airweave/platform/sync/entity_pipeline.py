@@ -13,7 +13,8 @@ Lifecycle:
 
 import time
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, Dict, List
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from airweave.core.events.sync import EntityBatchProcessedEvent, TypeActionCounts
 from airweave.core.shared_models import AirweaveFieldFlag
@@ -40,6 +41,11 @@ class EntityPipeline:
     Uses dependency injection for all major components, configured at factory time.
     """
 
+    # Stored entity keys read per page during orphan detection
+    ORPHAN_SCAN_PAGE_SIZE = 10_000
+    # Orphans handed to the dispatcher per cleanup call
+    ORPHAN_DISPATCH_BATCH_SIZE = 1_000
+
     def __init__(
         self,
         entity_tracker: EntityTracker,
@@ -105,22 +111,34 @@ class EntityPipeline:
     ) -> None:
         """Remove entities from database/destinations that were not encountered during sync.
 
+        Stored keys are streamed page by page and orphans are dispatched in
+        bounded batches, so memory stays flat regardless of sync size.
+
         Args:
             sync_context: Sync context
             runtime: Sync runtime
         """
-        orphans_by_definition = await self._identify_orphans(sync_context)
-        if not orphans_by_definition:
-            return
-
-        all_orphan_ids = [
-            entity_id for entity_ids in orphans_by_definition.values() for entity_id in entity_ids
-        ]
-
-        await self._dispatcher.dispatch_orphan_cleanup(all_orphan_ids, sync_context)
+        scanned = 0
+        total_orphans = 0
+        pending: List[Tuple[str, str]] = []
+
+        async for page in self._scan_stored_keys(sync_context):
+            scanned += len(page)
+            pending.extend(self._tracker.filter_unencountered(page, key=itemgetter(0)))
+            while len(pending) >= self.ORPHAN_DISPATCH_BATCH_SIZE:
+                batch = pending[: self.ORPHAN_DISPATCH_BATCH_SIZE]
+                pending = pending[self.ORPHAN_DISPATCH_BATCH_SIZE :]
+                await self._dispatch_orphan_batch(batch, sync_context)
+                total_orphans += len(batch)
+
+        if pending:
+            await self._dispatch_orphan_batch(pending, sync_context)
+            total_orphans += len(pending)
 
-        for definition_id, entity_ids in orphans_by_definition.items():
-            await self._tracker.record_deletes(definition_id, len(entity_ids))
+        if total_orphans:
+            sync_context.logger.info(
+                f"🔍 Cleaned up {total_orphans} orphaned entities out of {scanned} stored"
+            )
 
     async def cleanup_temp_files(self, sync_context: SyncContext, runtime: SyncRuntime) -> None:
         """Remove entire sync_job_id directory (final cleanup safety net).
@@ -304,33 +322,50 @@ class EntityPipeline:
         }
 
     # -------------------------------------------------------------------------
-    # Orphan Identification
+    # Orphan Identification (streamed)
     # -------------------------------------------------------------------------
 
-    async def _identify_orphans(self, sync_context: SyncContext) -> Dict[str, List[str]]:
-        """Identify orphaned entity IDs (in DB but not encountered), grouped by definition."""
+    async def _scan_stored_keys(
+        self, sync_context: SyncContext
+    ) -> AsyncIterator[List[Tuple[str, str]]]:
+        """Yield stored (entity_id, entity_definition_short_name) keys in keyset pages.
+
+        Each page uses its own short-lived session so no connection is held
+        while orphan batches are dispatched. Deleting orphans behind the cursor
+        does not affect later pages.
+        """
         from airweave import crud
         from airweave.db.session import get_db_context
 
-        encountered_ids = self._tracker.get_all_encountered_ids_flat()
-
-        async with get_db_context() as db:
-            stored_entities = await crud.entity.get_by_sync_id(db=db, sync_id=sync_context.sync.id)
-
-        orphans_by_definition: Dict[str, List[str]] = defaultdict(list)
-        for entity in stored_entities:
-            if entity.entity_id not in encountered_ids:
-                orphans_by_definition[entity.entity_definition_short_name].append(entity.entity_id)
-
-        total_orphans = sum(len(ids) for ids in orphans_by_definition.values())
-        if total_orphans:
-            sync_context.logger.info(
-                f"🔍 Identified {total_orphans} orphaned entities "
-                f"across {len(orphans_by_definition)} definitions "
-                f"out of {len(stored_entities)} stored"
-            )
+        after: Optional[Tuple[str, str]] = None
+        while True:
+            async with get_db_context() as db:
+                page = await crud.entity.get_keys_page_by_sync_id(
+                    db=db,
+                    sync_id=sync_context.sync.id,
+                    after=after,
+                    limit=self.ORPHAN_SCAN_PAGE_SIZE,
+                )
+            if not page:
+                return
+            yield page
+            if len(page) < self.ORPHAN_SCAN_PAGE_SIZE:
+                return
+            after = page[-1]
+
+    async def _dispatch_orphan_batch(
+        self, orphan_keys: List[Tuple[str, str]], sync_context: SyncContext
+    ) -> None:
+        """Clean up one batch of orphans and record deletes per definition."""
+        await self._dispatcher.dispatch_orphan_cleanup(
+            [entity_id for entity_id, _ in orphan_keys], sync_context
+        )
 
-        return dict(orphans_by_definition)
+        counts: Dict[str, int] = defaultdict(int)
+        for _, definition_id in orphan_keys:
+            counts[definition_id] += 1
+        for definition_id, count in counts.items():
+            await self._tracker.record_deletes(definition_id, count)
 
     # -------------------------------------------------------------------------
     # Temp File Cleanup
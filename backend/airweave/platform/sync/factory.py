@@ -18,10 +18,13 @@ from airweave import schemas
 from airweave.core import container as container_mod  # [code blue] todo
 from airweave.core.context import BaseContext
 from airweave.core.logging import LoggerConfigurator, logger
+from airweave.core.protocols.metrics import HttpClientPoolMetrics
+from airweave.core.protocols.vespa import VespaFeederProtocol, VespaQueryClientProtocol
 from airweave.domains.embedders.protocols import DenseEmbedderProtocol, SparseEmbedderProtocol
 from airweave.platform.builders import SyncContextBuilder
 from airweave.platform.builders.tracking import TrackingContextBuilder
 from airweave.platform.contexts.runtime import SyncRuntime
+from airweave.platform.http_client.pool import SourceHttpClientPool
 from airweave.platform.sync.access_control_pipeline import AccessControlPipeline
 from airweave.platform.sync.actions import (
     ACActionDispatcher,
@@ -60,6 +63,9 @@ class SyncFactory:
         access_token: Optional[str] = None,
         force_full_sync: bool = False,
         execution_config: Optional[SyncConfig] = None,
+        vespa_feeder: Optional[VespaFeederProtocol] = None,
+        http_client_pool_metrics: Optional[HttpClientPoolMetrics] = None,
+        vespa_query_client: Optional[VespaQueryClientProtocol] = None,
     ) -> SyncOrchestrator:
         """Create a dedicated orchestrator instance for a sync run."""
         init_start = time.time()
@@ -96,6 +102,8 @@ class SyncFactory:
                 collection=collection,
                 ctx=ctx,
                 execution_config=resolved_config,
+                feeder=vespa_feeder,
+                query_client=vespa_query_client,
             ),
             cls._build_tracking(
                 db=db,
@@ -108,6 +116,13 @@ class SyncFactory:
         source, cursor = source_result
         destinations, entity_map = destinations_result
 
+        # Share one connection pool across the source's HTTP clients (closed by the orchestrator)
+        http_client_pool = SourceHttpClientPool(
+            source_short_name=getattr(source, "short_name", ""),
+            metrics=http_client_pool_metrics,
+        )
+        source.set_http_client_pool(http_client_pool)
+
         # Step 3: Build SyncContext (data only)
         sync_context = await SyncContextBuilder.build(
             db=db,
@@ -133,6 +148,7 @@ class SyncFactory:
             entity_tracker=entity_tracker_result,
             event_bus=container_mod.container.event_bus,
             usage_checker=container_mod.container.usage_checker,
+            http_client_pool=http_client_pool,
         )
 
         logger.debug(f"Context + runtime built in {time.time() - init_start:.2f}s")
@@ -148,7 +164,10 @@ class SyncFactory:
             logger=sync_context.logger,
         )
 
-        action_resolver = EntityActionResolver(entity_map=sync_context.entity_map)
+        action_resolver = EntityActionResolver(
+            entity_map=sync_context.entity_map,
+            use_hash_snapshot=resolved_config.behavior.preload_hash_snapshot,
+        )
 
         entity_pipeline = EntityPipeline(
             entity_tracker=runtime.entity_tracker,
@@ -222,7 +241,9 @@ class SyncFactory:
         return source_ctx.source, source_ctx.cursor
 
     @classmethod
-    async def _build_destinations(cls, db, sync, collection, ctx, execution_config):
+    async def _build_destinations(
+        cls, db, sync, collection, ctx, execution_config, feeder=None, query_client=None
+    ):
         """Build destinations and entity map. Returns (destinations, entity_map) tuple."""
         from airweave.core.logging import LoggerConfigurator
         from airweave.platform.builders.destinations import DestinationsContextBuilder
@@ -242,6 +263,8 @@ class SyncFactory:
             ctx=ctx,
             logger=dest_logger,
             execution_config=execution_config,
+            feeder=feeder,
+            query_client=query_client,
         )
 
     @classmethod
@@ -23,13 +23,13 @@ from airweave.platform.sync.handlers.protocol import EntityActionHandler
 class ArfHandler(EntityActionHandler):
     """Handler for ARF (Airweave Raw Format) storage.
 
-    Stores entity JSON to the ARF store (entity-level files).
+    Stores entity JSON to the ARF store (one appended segment per batch).
     Enables replay of syncs and provides audit trail.
 
     Storage structure:
         raw/{sync_id}/
         ├── manifest.json
-        ├── entities/{entity_id}.json
+        ├── segments/{seq}-{token}.seg, .idx.json
         └── files/{entity_id}_{name}.{ext}
     """
 
@@ -215,7 +215,9 @@ class EntityPostgresHandler(EntityActionHandler):
 
         update_pairs.sort(key=lambda p: p[0])
         sync_context.logger.debug(f"[EntityPostgres] Updating {len(update_pairs)} hashes")
-        await crud.entity.bulk_update_hash(db, rows=update_pairs)
+        await crud.entity.bulk_update_hash(
+            db, rows=update_pairs, sync_job_id=sync_context.sync_job.id
+        )
 
     async def _do_deletes(
         self,
@@ -280,7 +282,7 @@ class EntityPostgresHandler(EntityActionHandler):
     ) -> Dict[Tuple[str, str], Any]:
         """Fetch existing DB records for update/delete actions."""
         entity_requests = [(a.entity_id, a.entity_definition_short_name) for a in actions]
-        return await crud.entity.bulk_get_by_entity_sync_and_definition(
+        return await crud.entity.bulk_get_id_hash_by_entity_sync_and_definition(
             db=db, sync_id=sync_context.sync.id, entity_requests=entity_requests
         )
 
@@ -16,6 +16,7 @@ from airweave.domains.usage.exceptions import (
     PaymentRequiredError,
     UsageLimitExceededError,
 )
+from airweave.domains.usage.lease import UsageBudgetLease
 from airweave.domains.usage.types import ActionType
 from airweave.platform.contexts import SyncContext
 from airweave.platform.contexts.runtime import SyncRuntime
@@ -60,6 +61,9 @@ class SyncOrchestrator:
         self.batch_size = sync_context.batch_size
         self.max_batch_latency_ms = sync_context.max_batch_latency_ms
 
+        # Entity allowances are reserved in blocks rather than checked per entity
+        self._usage_lease: Optional[UsageBudgetLease] = None
+
     async def run(self) -> schemas.Sync:
         """Execute the synchronization process."""
         # Register worker pool for metrics tracking (using sync_id and sync_job_id)
@@ -156,6 +160,16 @@ class SyncOrchestrator:
                     f"Failed to flush usage ledger: {flush_error}", exc_info=True
                 )
 
+            # Return leased entity allowances now that the ledger has recorded usage
+            if self._usage_lease is not None:
+                await self._usage_lease.close()
+                self._usage_lease = None
+
+            await self._close_http_client_pool()
+
+            # Release the tracker's spilled encountered-ID files
+            self.runtime.entity_tracker.close()
+
             # Always cleanup temp files to prevent pod eviction
             try:
                 self.sync_context.logger.info("Running final temp file cleanup...")
@@ -166,6 +180,16 @@ class SyncOrchestrator:
                     exc_info=True,
                 )
 
+    async def _close_http_client_pool(self) -> None:
+        """Close the source's pooled HTTP connections."""
+        pool = self.runtime.http_client_pool
+        if pool is None:
+            return
+        try:
+            await pool.aclose()
+        except Exception as e:
+            self.sync_context.logger.warning(f"Failed to close source HTTP client pool: {e}")
+
     async def _start_sync(self) -> None:
         """Initialize sync job and start all components."""
         self.sync_context.logger.info("Starting sync job")
@@ -199,16 +223,20 @@ class SyncOrchestrator:
         batch_buffer: list = []
         flush_deadline: Optional[float] = None  # event-loop time when we must flush
 
+        if not self.sync_context.execution_config.behavior.skip_guardrails:
+            self._usage_lease = UsageBudgetLease(
+                self.runtime.usage_checker,
+                self.sync_context.organization.id,
+                ActionType.ENTITIES,
+            )
+
         try:
             # Use the pre-created stream (already started in _start_sync)
             async for entity in self.stream.get_entities():
                 # Check guardrails unless explicitly skipped
-                if not self.sync_context.execution_config.behavior.skip_guardrails:
+                if self._usage_lease is not None:
                     try:
-                        async with get_db_context() as db:
-                            await self.runtime.usage_checker.is_allowed(
-                                db, self.sync_context.organization.id, ActionType.ENTITIES
-                            )
+                        await self._usage_lease.consume()
                     except (
                         UsageLimitExceededError,
                         PaymentRequiredError,
@@ -0,0 +1,216 @@
+"""Compact set of encountered entity IDs for EntityTracker.
+
+Keeping every encountered ``entity_id`` as a Python ``str`` costs roughly
+100+ bytes per entity (string object plus set slot), which adds up to
+gigabytes on multi-million entity syncs. :class:`EncounteredIdSet` stores
+a fixed-width 128-bit BLAKE2b digest per ID instead:
+
+- new digests go into a small in-memory buffer (a ``set`` of bytes);
+- when the buffer is full it is sorted into an immutable run of packed
+  16-byte digests; runs of similar size are merged (like an LSM tree), so
+  a lookup searches only O(log n) runs, each through a sparse fence index;
+- once the set holds more than ``spill_threshold`` digests, merged runs are
+  written to an anonymous temporary file and memory-mapped, so their pages
+  live in the OS page cache instead of the worker heap.
+
+Membership is exact up to digest collisions (~n²/2¹²⁹, negligible for any
+realistic sync). The original IDs cannot be recovered, so the set supports
+``in`` and ``len`` but not iteration.
+"""
+
+import bisect
+import hashlib
+import heapq
+import io
+import itertools
+import mmap
+import tempfile
+from typing import Collection, Iterator, List, Set, Union
+
+DIGEST_SIZE = 16
+
+# Digests buffered in memory before being sorted into a run
+_BUFFER_SIZE = 16_384
+
+# Digests per searchable block of a run (one fence entry per block)
+_BLOCK_SIZE = 64
+_BLOCK_BYTES = _BLOCK_SIZE * DIGEST_SIZE
+
+# Digests written per chunk while merging runs
+_WRITE_CHUNK = 4_096
+
+
+def entity_id_digest(entity_id: str) -> bytes:
+    """Fixed-width digest stored for ``entity_id``."""
+    return hashlib.blake2b(
+        str(entity_id).encode("utf-8", "surrogatepass"), digest_size=DIGEST_SIZE
+    ).digest()
+
+
+class _Run:
+    """Sorted, immutable block of packed digests (in memory or memory-mapped).
+
+    Every ``_BLOCK_SIZE``-th digest is kept in a fence list, so a lookup is
+    a C-level bisect over the fences plus a search of one block.
+    """
+
+    __slots__ = ("data", "count", "_fences", "_file")
+
+    def __init__(self, data: Union[bytes, mmap.mmap], count: int, file=None) -> None:
+        self.data = data
+        self.count = count
+        self._file = file
+        self._fences = [
+            data[offset : offset + DIGEST_SIZE]
+            for offset in range(0, count * DIGEST_SIZE, _BLOCK_BYTES)
+        ]
+
+    def __contains__(self, digest: bytes) -> bool:
+        block = bisect.bisect_right(self._fences, digest) - 1
+        if block < 0:
+            return False
+        start = block * _BLOCK_BYTES
+        end = min(start + _BLOCK_BYTES, self.count * DIGEST_SIZE)
+        pos = self.data.find(digest, start, end)
+        # Only matches on digest boundaries count
+        while pos >= 0 and pos % DIGEST_SIZE:
+            pos = self.data.find(digest, pos + 1, end)
+        return pos >= 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        return itertools.chain.from_iterable(self._chunks())
+
+    def _chunks(self) -> Iterator[List[bytes]]:
+        data = self.data
+        end = self.count * DIGEST_SIZE
+        step = _WRITE_CHUNK * DIGEST_SIZE
+        for start in range(0, end, step):
+            stop = min(start + step, end)
+            yield [
+                data[offset : offset + DIGEST_SIZE] for offset in range(start, stop, DIGEST_SIZE)
+            ]
+
+    @property
+    def spilled(self) -> bool:
+        return self._file is not None
+
+    def close(self) -> None:
+        if self._file is not None:
+            self.data.close()
+            self._file.close()
+            self._file = None
+
+
+class EncounteredIdSet:
+    """Insert-only set of entity IDs stored as 128-bit digests.
+
+    Not thread-safe; EntityTracker serializes writes with its lock.
+    """
+
+    def __init__(self, spill_threshold: int = 0) -> None:
+        """Initialize an empty set.
+
+        Args:
+            spill_threshold: Digest count above which merged runs are
+                memory-mapped from a temporary file (0 keeps everything in memory).
+        """
+        self._spill_threshold = spill_threshold
+        self._buffer: Set[bytes] = set()
+        self._runs: List[_Run] = []
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Number of distinct IDs added."""
+        return self._count
+
+    def __contains__(self, entity_id: object) -> bool:
+        """Whether ``entity_id`` has been added."""
+        return self.contains_digest(entity_id_digest(entity_id))
+
+    @property
+    def spilled(self) -> bool:
+        """Whether any run lives in a memory-mapped spill file."""
+        return any(run.spilled for run in self._runs)
+
+    def add(self, entity_id: str) -> bool:
+        """Add ``entity_id``. Returns True if it was not present yet."""
+        return self.add_digest(entity_id_digest(entity_id))
+
+    def add_digest(self, digest: bytes) -> bool:
+        """Add a precomputed digest. Returns True if it was not present yet."""
+        if self.contains_digest(digest):
+            return False
+        self._buffer.add(digest)
+        self._count += 1
+        if len(self._buffer) >= _BUFFER_SIZE:
+            self._flush()
+        return True
+
+    def contains_digest(self, digest: bytes) -> bool:
+        """Whether a precomputed digest is in the set."""
+        if digest in self._buffer:
+            return True
+        return any(digest in run for run in self._runs)
+
+    def close(self) -> None:
+        """Release spill files. The set is empty afterwards."""
+        for run in self._runs:
+            run.close()
+        self._runs = []
+        self._buffer = set()
+        self._count = 0
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _flush(self) -> None:
+        """Sort the buffer into a run and merge runs of similar size."""
+        digests = sorted(self._buffer)
+        self._buffer = set()
+        self._runs.append(_Run(b"".join(digests), len(digests)))
+        while len(self._runs) > 1 and self._runs[-2].count <= 2 * self._runs[-1].count:
+            newer = self._runs.pop()
+            older = self._runs.pop()
+            self._runs.append(self._merge(older, newer))
+
+    def _merge(self, older: _Run, newer: _Run) -> _Run:
+        # Runs are disjoint: a digest is only buffered if no run contains it.
+        # The merge is streamed so a large run is never materialized as objects.
+        spill = bool(self._spill_threshold) and self._count > self._spill_threshold
+        out = tempfile.TemporaryFile() if spill else io.BytesIO()
+        chunk: List[bytes] = []
+        for digest in heapq.merge(older, newer):
+            chunk.append(digest)
+            if len(chunk) >= _WRITE_CHUNK:
+                out.write(b"".join(chunk))
+                chunk = []
+        out.write(b"".join(chunk))
+
+        count = older.count + newer.count
+        if spill:
+            out.flush()
+            run = _Run(mmap.mmap(out.fileno(), 0, access=mmap.ACCESS_READ), count, out)
+        else:
+            run = _Run(out.getvalue(), count)
+
+        older.close()
+        newer.close()
+        return run
+
+
+class EncounteredIdsView:
+    """Read-only membership view across the per-type sets of a tracker."""
+
+    def __init__(self, sets: Collection[EncounteredIdSet]) -> None:
+        """Wrap the sets (not copied, so later additions are visible)."""
+        self._sets = sets
+
+    def __contains__(self, entity_id: object) -> bool:
+        """Whether ``entity_id`` is in any of the sets."""
+        digest = entity_id_digest(entity_id)
+        return any(s.contains_digest(digest) for s in self._sets)
+
+    def __len__(self) -> int:
+        """Total IDs across the sets (an ID under two types counts twice)."""
+        return sum(len(s) for s in self._sets)
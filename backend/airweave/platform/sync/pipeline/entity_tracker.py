@@ -1,7 +1,8 @@
 """Centralized entity state tracker for sync operations.
 
 EntityTracker is the single source of truth for entity state during sync:
-- Tracks entities encountered (for deduplication and orphan detection)
+- Tracks entities encountered (for deduplication and orphan detection), as
+  compact digests that spill to memory-mapped files on very large syncs
 - Tracks entity counts by definition (for state queries)
 - Tracks global operation counts (inserted, updated, deleted, kept, skipped)
 
@@ -10,16 +11,23 @@ Event publishing is handled by the per-sync EventBus via SyncProgressRelay.
 """
 
 import asyncio
-from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
 from uuid import UUID
 
+from airweave.core.config import settings
+from airweave.platform.sync.pipeline.encountered_ids import (
+    EncounteredIdSet,
+    EncounteredIdsView,
+    entity_id_digest,
+)
 from airweave.schemas.entity_count import EntityCountWithDefinition
 
 if TYPE_CHECKING:
     from airweave.core.logging import ContextualLogger
 
+T = TypeVar("T")
+
 
 @dataclass
 class SyncStats:
@@ -56,6 +64,7 @@ class EntityTracker:
         sync_id: UUID,
         logger: "ContextualLogger",
         initial_counts: Optional[List[EntityCountWithDefinition]] = None,
+        spill_threshold: Optional[int] = None,
     ):
         """Initialize the entity tracker.
 
@@ -64,6 +73,8 @@ class EntityTracker:
             sync_id: The sync ID
             logger: Contextual logger for debugging
             initial_counts: Initial entity counts from database (for existing syncs)
+            spill_threshold: Encountered IDs per entity type kept on the heap before
+                spilling to memory-mapped files (defaults to ENTITY_TRACKER_SPILL_THRESHOLD)
         """
         self.job_id = job_id
         self.sync_id = sync_id
@@ -73,7 +84,10 @@ class EntityTracker:
         self.stats = SyncStats()
 
         # Entity encounter tracking (for dedup + orphan detection)
-        self._encountered_by_type: Dict[str, Set[str]] = defaultdict(set)
+        self._spill_threshold = (
+            settings.ENTITY_TRACKER_SPILL_THRESHOLD if spill_threshold is None else spill_threshold
+        )
+        self._encountered_by_type: Dict[str, EncounteredIdSet] = {}
 
         # Entity count tracking keyed by entity_definition_short_name
         self._counts_by_definition: Dict[str, int] = {}
@@ -112,9 +126,8 @@ class EntityTracker:
             False if this is a duplicate (already encountered in this sync)
         """
         async with self._lock:
-            if entity_id in self._encountered_by_type[entity_type]:
+            if not self._encountered_set(entity_type).add(entity_id):
                 return False  # Duplicate
-            self._encountered_by_type[entity_type].add(entity_id)
             # Update stats directly
             self.stats.entities_encountered[entity_type] = (
                 self.stats.entities_encountered.get(entity_type, 0) + 1
@@ -135,8 +148,7 @@ class EntityTracker:
         new_entities = []
         async with self._lock:
             for entity_type, entity_id in entities:
-                if entity_id not in self._encountered_by_type[entity_type]:
-                    self._encountered_by_type[entity_type].add(entity_id)
+                if self._encountered_set(entity_type).add(entity_id):
                     # Update stats directly
                     self.stats.entities_encountered[entity_type] = (
                         self.stats.entities_encountered.get(entity_type, 0) + 1
@@ -144,20 +156,59 @@ class EntityTracker:
                     new_entities.append((entity_type, entity_id))
         return new_entities
 
-    def get_encountered_ids(self) -> Dict[str, Set[str]]:
-        """Get all encountered entity IDs by type (for orphan detection at sync end)."""
-        return dict(self._encountered_by_type)
+    def is_encountered(self, entity_id: str) -> bool:
+        """Whether an entity with this ID was encountered under any type."""
+        digest = entity_id_digest(entity_id)
+        return any(ids.contains_digest(digest) for ids in self._encountered_by_type.values())
+
+    def filter_unencountered(
+        self, items: Iterable[T], key: Optional[Callable[[T], str]] = None
+    ) -> Iterator[T]:
+        """Yield the items whose entity ID was not encountered (orphan diffing).
+
+        Streams ``items`` without materializing the encountered IDs.
+
+        Args:
+            items: Entity IDs, or records holding one
+            key: Extracts the entity ID from an item (defaults to the item itself)
+        """
+        for item in items:
+            if not self.is_encountered(key(item) if key else item):
+                yield item
+
+    def get_encountered_ids(self) -> Dict[str, EncounteredIdsView]:
+        """Get membership views of the encountered entity IDs by type.
+
+        IDs are stored as digests, so the views support ``in`` and ``len``
+        but cannot be iterated.
+        """
+        return {
+            entity_type: EncounteredIdsView([ids])
+            for entity_type, ids in self._encountered_by_type.items()
+        }
 
     def get_encountered_count(self) -> Dict[str, int]:
         """Get count of encountered entities by type."""
         return dict(self.stats.entities_encountered)
 
-    def get_all_encountered_ids_flat(self) -> Set[str]:
-        """Get all encountered entity IDs as a flat set."""
-        all_ids: Set[str] = set()
+    def get_all_encountered_ids_flat(self) -> EncounteredIdsView:
+        """Get a membership view of all encountered entity IDs, across types.
+
+        Prefer :meth:`filter_unencountered` for orphan diffing.
+        """
+        return EncounteredIdsView(self._encountered_by_type.values())
+
+    def close(self) -> None:
+        """Release the memory-mapped spill files of the encountered IDs."""
         for ids in self._encountered_by_type.values():
-            all_ids.update(ids)
-        return all_ids
+            ids.close()
+        self._encountered_by_type.clear()
+
+    def _encountered_set(self, entity_type: str) -> EncounteredIdSet:
+        ids = self._encountered_by_type.get(entity_type)
+        if ids is None:
+            ids = self._encountered_by_type[entity_type] = EncounteredIdSet(self._spill_threshold)
+        return ids
 
     # -------------------------------------------------------------------------
     # Entity Count Tracking & Global Stats
@@ -1,10 +1,24 @@
-"""Hash computation for entity change detection."""
+"""Hash computation for entity change detection.
+
+Each entity class gets a cached :class:`_HashPlan` (its excluded fields), so
+per-entity work is one ``model_dump`` of the hashed fields, one C-level JSON
+encode and one digest. The canonical bytes are identical to those of the
+original implementation, so SHA-256 hashes (the default) match stored rows.
+
+The digest is configurable via ``ENTITY_HASH_ALGORITHM``. Hashes other than
+SHA-256 are stored versioned as ``"<algorithm>:<hexdigest>"``; while
+``ENTITY_HASH_LEGACY_FALLBACK`` is on, the bare SHA-256 hash of the same bytes
+is kept in ``airweave_system_metadata.legacy_hash`` so that rows stored in the
+old format resolve to KEEP instead of UPDATE until their content changes.
+"""
 
 import asyncio
 import hashlib
 import json
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
+from airweave.core.config import settings
 from airweave.core.shared_models import AirweaveFieldFlag
 from airweave.platform.entities._base import BaseEntity, CodeFileEntity, FileEntity
 from airweave.platform.sync.async_helpers import run_in_thread_pool
@@ -19,11 +33,43 @@ class HashComputer:
     """Computes stable content hashes for entities to detect changes.
 
     Handles:
-    - Stable serialization of entity data
+    - Stable serialization of entity data, planned once per entity class
     - File content hashing for FileEntity/CodeFileEntity
     - Batch hash computation with semaphore-controlled concurrency
     """
 
+    def __init__(
+        self,
+        algorithm: Optional[str] = None,
+        legacy_fallback: Optional[bool] = None,
+    ):
+        """Initialize the hash computer.
+
+        Args:
+            algorithm: Digest algorithm (defaults to ``settings.ENTITY_HASH_ALGORITHM``)
+            legacy_fallback: Also compute the legacy SHA-256 hash when another
+                algorithm is used (defaults to ``settings.ENTITY_HASH_LEGACY_FALLBACK``)
+
+        Raises:
+            ValueError: If the algorithm is not supported
+        """
+        algorithm = (algorithm or settings.ENTITY_HASH_ALGORITHM).lower()
+        if algorithm not in _HASH_ALGORITHMS:
+            raise ValueError(
+                f"Unsupported entity hash algorithm '{algorithm}' "
+                f"(expected one of: {', '.join(sorted(_HASH_ALGORITHMS))})"
+            )
+        self._algorithm = algorithm
+        self._legacy_fallback = (
+            settings.ENTITY_HASH_LEGACY_FALLBACK if legacy_fallback is None else legacy_fallback
+        )
+        self._plans: Dict[type, _HashPlan] = {}
+
+    @property
+    def algorithm(self) -> str:
+        """Configured digest algorithm."""
+        return self._algorithm
+
     # ------------------------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------------------------
@@ -67,30 +113,28 @@ class HashComputer:
             entity: Entity to compute hash for
 
         Returns:
-            SHA256 hash hex digest, or None on failure
+            Hash in the configured (versioned) format, or None on failure
 
         Raises:
             EntityProcessingError: If file entity is missing local_path or file read fails
         """
-        try:
-            # Step 1: Get entity dict
-            entity_dict = entity.model_dump(mode="python", exclude_none=True)
+        entity_hash, _ = await self._compute_hashes(entity)
+        return entity_hash
 
-            # Step 2: For file entities, compute and add content hash
-            if isinstance(entity, (FileEntity, CodeFileEntity)):
-                content_hash = await self._compute_file_content_hash(entity)
-                entity_dict["_content_hash"] = content_hash
+    async def _compute_hashes(self, entity: BaseEntity) -> Tuple[str, Optional[str]]:
+        """Compute (hash, legacy_hash) for a single entity.
 
-            # Step 3: Exclude volatile fields
-            content_dict = self._exclude_volatile_fields(entity, entity_dict)
+        Raises:
+            EntityProcessingError: If file entity is missing local_path or file read fails
+        """
+        plan = self._get_plan(entity.__class__)
 
-            # Step 4: Stable serialize and hash
-            return self._compute_dict_hash(content_dict)
+        # For file entities, the content hash stands in for the file bytes
+        content_hash = None
+        if plan.hashes_file_content:
+            content_hash = await self._compute_file_content_hash(entity)
 
-        except EntityProcessingError:
-            raise
-        except Exception:
-            raise
+        return self._digest(self._canonical_bytes(entity, plan, content_hash))
 
     # ------------------------------------------------------------------------------------
     # Batch Processing
@@ -100,7 +144,7 @@ class HashComputer:
         self,
         entities: List[BaseEntity],
         sync_context: "SyncContext",
-    ) -> List[Tuple[Tuple[str, str], Optional[str]]]:
+    ) -> List[Tuple[Tuple[str, str], Optional[Tuple[str, Optional[str]]]]]:
         """Compute hashes for all entities concurrently with semaphore control.
 
         Args:
@@ -108,19 +152,19 @@ class HashComputer:
             sync_context: Sync context with logger
 
         Returns:
-            List of ((entity_type, entity_id), hash_value) tuples
+            List of ((entity_type, entity_id), (hash, legacy_hash) or None) tuples
         """
         # Limit concurrent file reads
         semaphore = asyncio.Semaphore(10)
 
         async def compute_with_semaphore(
             entity: BaseEntity,
-        ) -> Tuple[Tuple[str, str], Optional[str]]:
+        ) -> Tuple[Tuple[str, str], Optional[Tuple[str, Optional[str]]]]:
             async with semaphore:
                 entity_key = (entity.__class__.__name__, entity.entity_id)
                 try:
-                    hash_value = await self.compute_for_entity(entity)
-                    return entity_key, hash_value
+                    hashes = await self._compute_hashes(entity)
+                    return entity_key, hashes
                 except EntityProcessingError as e:
                     sync_context.logger.warning(
                         f"Hash computation failed for {entity.__class__.__name__}"
@@ -139,7 +183,7 @@ class HashComputer:
     async def _process_hash_results(
         self,
         entities: List[BaseEntity],
-        results: List[Tuple[Tuple[str, str], Optional[str]]],
+        results: List[Tuple[Tuple[str, str], Optional[Tuple[str, Optional[str]]]]],
         sync_context: "SyncContext",
         runtime: "SyncRuntime",
     ) -> None:
@@ -147,7 +191,7 @@ class HashComputer:
 
         Args:
             entities: Original entity list (modified in-place)
-            results: List of ((entity_type, entity_id), hash_value) tuples
+            results: List of ((entity_type, entity_id), (hash, legacy_hash) or None) tuples
             sync_context: Sync context for logging and progress tracking
             runtime: Sync runtime with live services
         """
@@ -155,9 +199,10 @@ class HashComputer:
         file_count = 0
         regular_count = 0
 
-        for entity, (_, hash_value) in zip(entities, results, strict=True):
-            if hash_value is not None:
-                entity.airweave_system_metadata.hash = hash_value
+        for entity, (_, hashes) in zip(entities, results, strict=True):
+            if hashes is not None:
+                metadata = entity.airweave_system_metadata
+                metadata.hash, metadata.legacy_hash = hashes
 
                 if isinstance(entity, (FileEntity, CodeFileEntity)):
                     file_count += 1
@@ -243,68 +288,88 @@ class HashComputer:
     # Serialization and Hashing
     # ------------------------------------------------------------------------------------
 
-    def _exclude_volatile_fields(self, entity: BaseEntity, entity_dict: dict) -> dict:
-        """Exclude volatile fields from entity dict for hashing.
-
-        Args:
-            entity: Original entity (for field metadata inspection)
-            entity_dict: Entity dict from model_dump
-
-        Returns:
-            Dict with volatile fields excluded
-        """
-        excluded_fields = {
-            "airweave_system_metadata",  # Not initialized yet
-            "breadcrumbs",  # Parent relationships are volatile
-            "local_path",  # Temp path changes per run
-            "url",  # Contains access tokens
-        }
-
-        # Add fields marked with unhashable=True
-        for field_name, field_info in entity.__class__.model_fields.items():
-            json_extra = field_info.json_schema_extra
-            if json_extra and isinstance(json_extra, dict):
-                flag_key = (
-                    AirweaveFieldFlag.UNHASHABLE.value
-                    if hasattr(AirweaveFieldFlag.UNHASHABLE, "value")
-                    else AirweaveFieldFlag.UNHASHABLE
-                )
-                if json_extra.get(flag_key):
-                    excluded_fields.add(field_name)
-
-        return {k: v for k, v in entity_dict.items() if k not in excluded_fields}
-
-    def _compute_dict_hash(self, content_dict: dict) -> str:
-        """Compute SHA256 hash of a dictionary with stable serialization.
-
-        Args:
-            content_dict: Dictionary to hash
-
-        Returns:
-            Hex digest of SHA256 hash
-        """
-        stable_data = self._stable_serialize(content_dict)
-        json_str = json.dumps(stable_data, sort_keys=True, separators=(",", ":"))
-        return hashlib.sha256(json_str.encode()).hexdigest()
+    def _get_plan(self, entity_class: type) -> "_HashPlan":
+        """Return the cached hashing plan for an entity class."""
+        plan = self._plans.get(entity_class)
+        if plan is None:
+            plan = _HashPlan.for_class(entity_class)
+            self._plans[entity_class] = plan
+        return plan
 
     @staticmethod
-    def _stable_serialize(obj: Any) -> Any:
-        """Recursively serialize object in a stable way for hashing.
+    def _canonical_bytes(
+        entity: BaseEntity, plan: "_HashPlan", content_hash: Optional[str]
+    ) -> bytes:
+        """Encode the hashed fields of an entity in the canonical form.
+
+        Excluded fields are never dumped, and the C JSON encoder (with ``str``
+        as fallback for non-JSON values) produces the same bytes as the former
+        ``_stable_serialize`` + ``json.dumps`` pass without an intermediate copy.
+        """
+        entity_dict = entity.model_dump(mode="python", exclude_none=True, exclude=plan.excluded)
+        if content_hash is not None:
+            entity_dict["_content_hash"] = content_hash
+        return _CANONICAL_ENCODER.encode(entity_dict).encode()
 
-        Args:
-            obj: Object to serialize
+    def _digest(self, payload: bytes) -> Tuple[str, Optional[str]]:
+        """Hash canonical bytes with the configured algorithm.
 
         Returns:
-            Serialized object with stable ordering
+            (hash, legacy_hash); legacy_hash is the unprefixed SHA-256 form, set
+            only while stored hashes in that format still need to match.
         """
-        if isinstance(obj, dict):
-            return {k: HashComputer._stable_serialize(v) for k, v in sorted(obj.items())}
-        elif isinstance(obj, (list, tuple)):
-            return [HashComputer._stable_serialize(x) for x in obj]
-        elif isinstance(obj, (str, int, float, bool, type(None))):
-            return obj
-        else:
-            return str(obj)
+        if self._algorithm == LEGACY_HASH_ALGORITHM:
+            return hashlib.sha256(payload).hexdigest(), None
+
+        hasher = _HASH_ALGORITHMS[self._algorithm]()
+        hasher.update(payload)
+        entity_hash = f"{self._algorithm}:{hasher.hexdigest()}"
+        legacy_hash = hashlib.sha256(payload).hexdigest() if self._legacy_fallback else None
+        return entity_hash, legacy_hash
+
+
+# Digest constructors by algorithm name. SHA-256 hashes are stored bare (the
+# format every existing row uses); every other algorithm is stored as
+# "<algorithm>:<hexdigest>" so the format identifies how it was computed.
+LEGACY_HASH_ALGORITHM = "sha256"
+_HASH_ALGORITHMS: Dict[str, Callable[[], Any]] = {
+    "sha256": hashlib.sha256,
+    "blake2b": lambda: hashlib.blake2b(digest_size=32),
+}
+
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), default=str)
+
+# Always excluded from hashing
+_VOLATILE_FIELDS = frozenset(
+    {
+        "airweave_system_metadata",  # Not initialized yet
+        "breadcrumbs",  # Parent relationships are volatile
+        "local_path",  # Temp path changes per run
+        "url",  # Contains access tokens
+    }
+)
+
+
+@dataclass(frozen=True)
+class _HashPlan:
+    """Per-class hashing plan, compiled once from the entity's field metadata."""
+
+    excluded: FrozenSet[str]
+    hashes_file_content: bool
+
+    @classmethod
+    def for_class(cls, entity_class: type) -> "_HashPlan":
+        """Compile the plan for an entity class."""
+        excluded = set(_VOLATILE_FIELDS)
+        flag_key = AirweaveFieldFlag.UNHASHABLE.value
+        for field_name, field_info in entity_class.model_fields.items():
+            json_extra = field_info.json_schema_extra
+            if isinstance(json_extra, dict) and json_extra.get(flag_key):
+                excluded.add(field_name)
+        return cls(
+            excluded=frozenset(excluded),
+            hashes_file_content=issubclass(entity_class, (FileEntity, CodeFileEntity)),
+        )
 
 
 # Singleton instance
@@ -419,12 +419,18 @@ class TextualRepresentationBuilder:
         Returns:
             List of entities that failed conversion
         """
+        from airweave.platform.converters._base import HybridDocumentConverter
+
         failed_entities = []
         keys = [key for _, key in sub_batch]
 
         try:
             # Batch convert returns Dict[key, text_content]
-            results = await converter.convert_batch(keys)
+            if isinstance(converter, HybridDocumentConverter):
+                # Hybrid converters report per-stage timings to the sync logger
+                results = await converter.convert_batch(keys, sync_logger=sync_context.logger)
+            else:
+                results = await converter.convert_batch(keys)
 
             # Append content to each entity
             for entity, key in sub_batch:
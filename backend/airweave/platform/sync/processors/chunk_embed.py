@@ -11,10 +11,12 @@ This ensures consistent keyword search behavior across both vector databases,
 with benefits of pre-trained vocabulary/IDF, stopword removal, and learned term weights.
 """
 
-import json
-from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+from airweave.domains.embedders.types import as_dense_array
 from airweave.platform.entities._base import BaseEntity, CodeFileEntity
+from airweave.platform.entities._serialization import EntityJsonCache, canonical_entity_json
+from airweave.platform.sync.async_helpers import run_in_thread_pool
 from airweave.platform.sync.exceptions import SyncFailureError
 from airweave.platform.sync.pipeline.text_builder import text_builder
 from airweave.platform.sync.processors.utils import filter_empty_representations
@@ -38,7 +40,7 @@ class ChunkEmbedProcessor:
         Chunk entities with:
         - entity_id: "{original_id}__chunk_{idx}"
         - textual_representation: chunk text
-        - airweave_system_metadata.dense_embedding: 3072-dim vector
+        - airweave_system_metadata.dense_embedding: 3072-dim float32 array
         - airweave_system_metadata.sparse_embedding: FastEmbed BM25 sparse vector
         - airweave_system_metadata.original_entity_id: original entity_id
         - airweave_system_metadata.chunk_index: chunk position
@@ -117,7 +119,7 @@ class ChunkEmbedProcessor:
         from airweave.platform.chunkers.code import CodeChunker
 
         # Filter unsupported languages
-        supported, unsupported = await self._filter_unsupported_languages(entities)
+        supported, languages, unsupported = await self._filter_unsupported_languages(entities)
         if unsupported:
             await runtime.entity_tracker.record_skipped(len(unsupported))
 
@@ -128,7 +130,7 @@ class ChunkEmbedProcessor:
         texts = [e.textual_representation for e in supported]
 
         try:
-            chunk_lists = await chunker.chunk_batch(texts)
+            chunk_lists = await chunker.chunk_batch(texts, languages=languages)
         except Exception as e:
             raise SyncFailureError(f"[ChunkEmbedProcessor] CodeChunker failed: {e}")
 
@@ -155,29 +157,34 @@ class ChunkEmbedProcessor:
     async def _filter_unsupported_languages(
         self,
         entities: List[BaseEntity],
-    ) -> Tuple[List[BaseEntity], List[BaseEntity]]:
-        """Filter code entities by tree-sitter support."""
-        try:
-            from magika import Magika
-            from tree_sitter_language_pack import get_parser
-        except ImportError:
-            return entities, []
+    ) -> Tuple[List[BaseEntity], Optional[List[str]], List[BaseEntity]]:
+        """Filter code entities by tree-sitter support.
+
+        Returns:
+            (supported entities, their detected languages, unsupported entities).
+            Languages are None when detection is unavailable in this environment.
+        """
+        from airweave.platform.chunkers.language import CodeLanguageDetector
+
+        detector = CodeLanguageDetector()
+        if not detector.available:
+            return entities, None, []
+
+        texts = [e.textual_representation for e in entities]
+        extensions = [detector.extension_of(getattr(e, "name", None)) for e in entities]
+        detected = await run_in_thread_pool(detector.detect_batch, texts, extensions)
 
-        magika = Magika()
         supported: List[BaseEntity] = []
+        languages: List[str] = []
         unsupported: List[BaseEntity] = []
-
-        for entity in entities:
-            try:
-                text_bytes = entity.textual_representation.encode("utf-8")
-                result = magika.identify_bytes(text_bytes)
-                lang = result.output.label.lower()
-                get_parser(lang)
-                supported.append(entity)
-            except (LookupError, Exception):
+        for entity, language in zip(entities, detected, strict=True):
+            if language is None:
                 unsupported.append(entity)
+            else:
+                supported.append(entity)
+                languages.append(language)
 
-        return supported, unsupported
+        return supported, languages, unsupported
 
     def _multiply_entities(
         self,
@@ -185,7 +192,14 @@ class ChunkEmbedProcessor:
         chunk_lists: List[List[Dict[str, Any]]],
         sync_context: "SyncContext",
     ) -> List[BaseEntity]:
-        """Create chunk entities from chunker output."""
+        """Create chunk entities from chunker output.
+
+        Chunks are shallow copies of their parent: field values (breadcrumbs,
+        access lists, large text fields, ...) are shared by reference, and a
+        chunk only owns its entity_id, textual_representation and a copy of
+        the system metadata, which embedding and persistence write to.
+        Shared values are treated as read-only from here on.
+        """
         chunk_entities: List[BaseEntity] = []
 
         for entity, chunks in zip(entities, chunk_lists, strict=True):
@@ -193,17 +207,21 @@ class ChunkEmbedProcessor:
                 continue
 
             original_id = entity.entity_id
+            parent_metadata = entity.airweave_system_metadata
+            json_cache = EntityJsonCache(entity)
 
             for idx, chunk in enumerate(chunks):
                 chunk_text = chunk.get("text", "")
                 if not chunk_text or not chunk_text.strip():
                     continue
 
-                chunk_entity = entity.model_copy(deep=True)
+                chunk_entity = entity.model_copy()
                 chunk_entity.textual_representation = chunk_text
                 chunk_entity.entity_id = f"{original_id}__chunk_{idx}"
+                chunk_entity.airweave_system_metadata = parent_metadata.model_copy()
                 chunk_entity.airweave_system_metadata.chunk_index = idx
                 chunk_entity.airweave_system_metadata.original_entity_id = original_id
+                chunk_entity._json_cache = json_cache
 
                 chunk_entities.append(chunk_entity)
 
@@ -235,7 +253,12 @@ class ChunkEmbedProcessor:
         # Dense embeddings (provider-specific dimensions for neural search)
         dense_texts = [e.textual_representation for e in chunk_entities]
         dense_results = await runtime.dense_embedder.embed_many(dense_texts)
-        dense_embeddings = [r.vector for r in dense_results]
+        # Pack each vector into a float32 array right away: chunk entities hold
+        # their embeddings until the destination write, and a list of boxed
+        # floats costs ~8x the memory. The array is handed to destinations as-is.
+        dense_embeddings = [
+            as_dense_array(r.vector) if r.vector is not None else None for r in dense_results
+        ]
         if (
             dense_embeddings
             and dense_embeddings[0] is not None
@@ -248,14 +271,9 @@ class ChunkEmbedProcessor:
             )
 
         # Sparse embeddings (FastEmbed Qdrant/bm25 for keyword search scoring)
-        # Uses full entity JSON (minus system metadata) to capture all searchable content
-        sparse_texts = [
-            json.dumps(
-                e.model_dump(mode="json", exclude={"airweave_system_metadata"}),
-                sort_keys=True,
-            )
-            for e in chunk_entities
-        ]
+        # Uses full entity JSON (minus system metadata) to capture all searchable content;
+        # chunks of one parent share the encoding of the parent's fields
+        sparse_texts = [canonical_entity_json(e) for e in chunk_entities]
         sparse_embeddings = await runtime.sparse_embedder.embed_many(sparse_texts)
 
         # Assign embeddings to entities
@@ -24,7 +24,8 @@ from temporalio import activity
 
 from airweave import schemas
 from airweave.core.context import BaseContext
-from airweave.core.protocols import EventBus
+from airweave.core.protocols import EventBus, VespaFeederProtocol, VespaQueryClientProtocol
+from airweave.core.protocols.metrics import HttpClientPoolMetrics
 from airweave.core.redis_client import redis_client
 from airweave.domains.collections.protocols import CollectionRepositoryProtocol
 from airweave.domains.connections.protocols import ConnectionRepositoryProtocol
@@ -51,6 +52,9 @@ class RunSyncActivity:
         event_bus: Publish sync lifecycle events (RUNNING, COMPLETED, FAILED, CANCELLED)
         sync_service: Build orchestrator and run sync
         sync_job_service: Update sync job status
+        vespa_feeder: Optional pooled Vespa document feeder for the syncs
+        http_client_pool_metrics: Optional source HTTP pool instrumentation for the syncs
+        vespa_query_client: Optional pooled Vespa query client for delete resolution
 
     Inputs:
         sync_dict, sync_job_dict, collection_dict, connection_dict, ctx_dict
@@ -66,6 +70,9 @@ class RunSyncActivity:
     sync_service: SyncServiceProtocol
     sync_job_service: SyncJobServiceProtocol
     collection_repo: CollectionRepositoryProtocol
+    vespa_feeder: Optional[VespaFeederProtocol] = None
+    http_client_pool_metrics: Optional[HttpClientPoolMetrics] = None
+    vespa_query_client: Optional[VespaQueryClientProtocol] = None
 
     @activity.defn(name="run_sync_activity")
     async def run(  # noqa: C901
@@ -449,6 +456,9 @@ class RunSyncActivity:
                 execution_config=execution_config,
                 dense_embedder=self.dense_embedder,
                 sparse_embedder=self.sparse_embedder,
+                vespa_feeder=self.vespa_feeder,
+                http_client_pool_metrics=self.http_client_pool_metrics,
+                vespa_query_client=self.vespa_query_client,
             )
         except NotFoundException as e:
             if "Source connection record not found" in str(e) or "Connection not found" in str(e):
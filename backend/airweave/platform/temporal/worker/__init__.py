@@ -56,7 +56,16 @@ class TemporalWorker:
         from prometheus_client import CollectorRegistry
         from temporalio.runtime import PrometheusConfig, Runtime, TelemetryConfig
 
-        from airweave.adapters.metrics import PrometheusMetricsRenderer, PrometheusWorkerMetrics
+        from airweave.adapters.metrics import (
+            PrometheusEmbeddingCacheMetrics,
+            PrometheusHttpClientPoolMetrics,
+            PrometheusMetricsRenderer,
+            PrometheusVespaFeedMetrics,
+            PrometheusVespaQueryMetrics,
+            PrometheusWorkerMetrics,
+        )
+        from airweave.platform.destinations.vespa.feeder import VespaFeeder
+        from airweave.platform.destinations.vespa.query_client import VespaQueryClient
         from airweave.platform.temporal.worker_metrics import worker_metrics as metrics_registry
 
         self._config = config
@@ -71,6 +80,14 @@ class TemporalWorker:
         self._state = WorkerState()
 
         registry = CollectorRegistry()
+        self._embedding_cache_metrics = PrometheusEmbeddingCacheMetrics(registry=registry)
+        self._vespa_feeder = VespaFeeder.from_settings(
+            metrics=PrometheusVespaFeedMetrics(registry=registry)
+        )
+        self._vespa_query_client = VespaQueryClient.from_settings(
+            metrics=PrometheusVespaQueryMetrics(registry=registry)
+        )
+        self._http_client_pool_metrics = PrometheusHttpClientPoolMetrics(registry=registry)
         self._control_server = WorkerControlServer(
             worker_state=self._state,
             config=config,
@@ -98,7 +115,12 @@ class TemporalWorker:
             client,
             task_queue=self._config.task_queue,
             workflows=get_workflows(),
-            activities=create_activities(),
+            activities=create_activities(
+                embedding_cache_metrics=self._embedding_cache_metrics,
+                vespa_feeder=self._vespa_feeder,
+                http_client_pool_metrics=self._http_client_pool_metrics,
+                vespa_query_client=self._vespa_query_client,
+            ),
             workflow_runner=self._get_sandbox_runner(),
             max_concurrent_workflow_task_polls=self._config.max_concurrent_workflow_polls,
             max_concurrent_activity_task_polls=self._config.max_concurrent_activity_polls,
@@ -131,6 +153,10 @@ class TemporalWorker:
 
         await self._control_server.stop()
 
+        # Close the Vespa connection pools shared by this worker's syncs
+        await self._vespa_feeder.close()
+        await self._vespa_query_client.close()
+
         # Close Temporal client
         from airweave.platform.temporal.client import temporal_client
 
@@ -185,8 +211,21 @@ async def main() -> None:
 
     # 3. Initialize converters with OCR from the container
     from airweave.platform.converters import initialize_converters
+    from airweave.platform.converters.process_pool import ExtractionProcessPool
+
+    extraction_pool = None
+    if settings.CONVERTER_PROCESS_POOL_ENABLED:
+        extraction_pool = ExtractionProcessPool(
+            max_workers=settings.CONVERTER_PROCESS_POOL_WORKERS or None,
+            task_timeout_seconds=settings.CONVERTER_TASK_TIMEOUT_SECONDS,
+            memory_limit_mb=settings.CONVERTER_TASK_MEMORY_LIMIT_MB,
+        )
+        await extraction_pool.start()
 
-    initialize_converters(ocr_provider=container_mod.container.ocr_provider)
+    initialize_converters(
+        ocr_provider=container_mod.container.ocr_provider,
+        extraction_pool=extraction_pool,
+    )
 
     # 4. Create worker with config
     config = WorkerConfig.from_settings()
@@ -207,6 +246,8 @@ async def main() -> None:
         logger.info("Received keyboard interrupt, shutting down...")
     finally:
         await worker.stop()
+        if extraction_pool is not None:
+            extraction_pool.shutdown()
 
 
 if __name__ == "__main__":
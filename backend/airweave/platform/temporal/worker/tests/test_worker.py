@@ -109,6 +109,8 @@ async def test_start_passes_runtime_to_get_client(
         mock_get_client.assert_awaited_once()
         _, kwargs = mock_get_client.call_args
         assert kwargs["runtime"] is runtime_instance
+        _, activity_kwargs = _mock_activities.call_args
+        assert activity_kwargs["vespa_feeder"] is worker._vespa_feeder
 
 
 # ── _get_sandbox_runner() tests ─────────────────────────────────────
@@ -168,6 +170,24 @@ async def test_stop_shuts_down_worker_and_control_server(mock_runtime_cls, mock_
     assert worker._state.running is False
 
 
+@patch("airweave.platform.temporal.client.TemporalClient.close", new_callable=AsyncMock)
+@patch("temporalio.runtime.Runtime")
+async def test_stop_closes_shared_vespa_feeder(mock_runtime_cls, mock_client_close):
+    """stop() closes the feeder pool every sync of this worker fed through."""
+    from airweave.platform.destinations.vespa.feeder import VespaFeeder
+    from airweave.platform.temporal.worker import TemporalWorker
+
+    worker = TemporalWorker(_make_config())
+    worker._control_server.stop = AsyncMock()
+    assert isinstance(worker._vespa_feeder, VespaFeeder)
+    http_client = worker._vespa_feeder._get_client()  # opened by the first feed
+
+    await worker.stop()
+
+    assert http_client.is_closed
+    assert worker._vespa_feeder._client is None
+
+
 @patch("airweave.platform.temporal.client.TemporalClient.close", new_callable=AsyncMock)
 @patch("temporalio.runtime.Runtime")
 async def test_stop_skips_shutdown_when_not_running(mock_runtime_cls, mock_client_close):
@@ -4,21 +4,48 @@ This module is the DI wiring point for Temporal.
 It connects activities to their dependencies from the container.
 """
 
+from typing import Optional
+
 from airweave.core.logging import logger
+from airweave.core.protocols.metrics import EmbeddingCacheMetrics, HttpClientPoolMetrics
+from airweave.core.protocols.vespa import VespaFeederProtocol, VespaQueryClientProtocol
 
 
-def create_activities() -> list:
+def create_activities(
+    embedding_cache_metrics: Optional[EmbeddingCacheMetrics] = None,
+    vespa_feeder: Optional[VespaFeederProtocol] = None,
+    http_client_pool_metrics: Optional[HttpClientPoolMetrics] = None,
+    vespa_query_client: Optional[VespaQueryClientProtocol] = None,
+) -> list:
     """Create activity instances with dependencies from the container.
 
     This is the DI wiring point for Temporal activities.
     Each activity class declares its dependencies in __init__.
 
+    When the container carries an embedding cache, the sync dense embedder
+    is wrapped in ``CachedDenseEmbedder`` so unchanged chunks skip the
+    provider call.
+
+    Args:
+        embedding_cache_metrics: Optional hit/miss counters for the
+            dense embedding cache (worker-process metrics registry).
+        vespa_feeder: Optional pooled Vespa document feeder (reporting to
+            the worker registry), passed through RunSyncActivity to the
+            destinations SyncFactory builds.
+        http_client_pool_metrics: Optional connection reuse / handshake
+            counters, passed through RunSyncActivity to the per-sync source
+            HTTP client pools SyncFactory builds.
+        vespa_query_client: Optional pooled Vespa query client (reporting to
+            the worker registry), passed through RunSyncActivity to the
+            destinations SyncFactory builds for resolving deletes.
+
     Returns:
         List of activity .run methods to register with the worker.
 
     Future: This will evolve as we add more protocols to the container.
     """
     from airweave.core.container import container
+    from airweave.domains.embedders.dense.cached import CachedDenseEmbedder
     from airweave.platform.temporal.activities import (
         CheckAndNotifyExpiringKeysActivity,
         CleanupStuckSyncJobsActivity,
@@ -31,6 +58,12 @@ def create_activities() -> list:
 
     event_bus = container.event_bus
     dense_embedder = container.dense_embedder
+    if container.embedding_cache is not None:
+        dense_embedder = CachedDenseEmbedder(
+            embedder=dense_embedder,
+            cache=container.embedding_cache,
+            metrics=embedding_cache_metrics,
+        )
     sparse_embedder = container.sparse_embedder
     email_service = container.email_service
     sync_service = container.sync_service
@@ -54,6 +87,9 @@ def create_activities() -> list:
             sync_service=sync_service,
             sync_job_service=sync_job_service,
             collection_repo=collection_repo,
+            vespa_feeder=vespa_feeder,
+            http_client_pool_metrics=http_client_pool_metrics,
+            vespa_query_client=vespa_query_client,
         ).run,
         CreateSyncJobActivity(
             event_bus=event_bus,
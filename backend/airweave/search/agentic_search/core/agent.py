@@ -19,6 +19,7 @@ from airweave.analytics.agentic_search_analytics import (
 )
 from airweave.api.context import ApiContext
 from airweave.core.protocols.metrics import AgenticSearchMetrics
+from airweave.domains.embedders.types import QueryEmbeddingStats
 from airweave.search.agentic_search.builders import (
     AgenticSearchCollectionMetadataBuilder,
     AgenticSearchCompletePlanBuilder,
@@ -213,6 +214,7 @@ class AgenticSearchAgent:
                 state.current_iteration.query_embeddings = await self._embed_query(
                     state.current_iteration.plan.query,
                     state.current_iteration.plan.retrieval_strategy,
+                    iter_stats,
                 )
                 t = self._lap(timings, f"{prefix}/embed", t)
 
@@ -395,23 +397,49 @@ class AgenticSearchAgent:
         self,
         query: AgenticSearchQuery,
         strategy: AgenticSearchRetrievalStrategy,
+        iter_stats: dict[str, int] | None = None,
     ) -> AgenticSearchQueryEmbeddings:
-        """Embed a query based on retrieval strategy."""
+        """Embed a query based on retrieval strategy.
+
+        Uses the shared query embedding cache when configured, so repeated
+        queries and variations skip the embedder; the cache outcome is
+        added to ``iter_stats`` for analytics.
+        """
         dense_embeddings = None
         sparse_embedding = None
+        cache = self.services.query_embedding_cache
+        cache_stats: list[QueryEmbeddingStats] = []
 
         if strategy in (
             AgenticSearchRetrievalStrategy.SEMANTIC,
             AgenticSearchRetrievalStrategy.HYBRID,
         ):
             texts = [query.primary] + list(query.variations)
-            dense_embeddings = await self.services.dense_embedder.embed_many(texts)
+            if cache is not None:
+                dense_embeddings, stats = await cache.embed_dense(
+                    self.services.dense_embedder, texts
+                )
+                cache_stats.append(stats)
+            else:
+                dense_embeddings = await self.services.dense_embedder.embed_many(texts)
 
         if strategy in (
             AgenticSearchRetrievalStrategy.KEYWORD,
             AgenticSearchRetrievalStrategy.HYBRID,
         ):
-            sparse_embedding = await self.services.sparse_embedder.embed(query.primary)
+            if cache is not None:
+                sparse_embeddings, stats = await cache.embed_sparse(
+                    self.services.sparse_embedder, [query.primary]
+                )
+                sparse_embedding = sparse_embeddings[0]
+                cache_stats.append(stats)
+            else:
+                sparse_embedding = await self.services.sparse_embedder.embed(query.primary)
+
+        if cache_stats and iter_stats is not None:
+            iter_stats["embed_cache_hits"] = sum(s.hits for s in cache_stats)
+            iter_stats["embed_cache_misses"] = sum(s.misses for s in cache_stats)
+            iter_stats["embed_cache_saved_ms"] = int(sum(s.saved_ms for s in cache_stats))
 
         return AgenticSearchQueryEmbeddings(
             dense_embeddings=dense_embeddings,
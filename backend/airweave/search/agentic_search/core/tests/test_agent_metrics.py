@@ -7,7 +7,10 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from airweave.adapters.cache.embedding import InMemoryEmbeddingCache
 from airweave.adapters.metrics import FakeAgenticSearchMetrics
+from airweave.domains.embedders.fakes.embedder import FakeDenseEmbedder, FakeSparseEmbedder
+from airweave.domains.embedders.query_cache import QueryEmbeddingCache
 from airweave.search.agentic_search.core.agent import (
     AgenticSearchAgent,
     _STEP_LABEL_MAP,
@@ -84,6 +87,7 @@ def mock_services():
         return_value=SparseEmbedding(indices=[1, 2], values=[0.5, 0.3])
     )
     svc.vector_db = AsyncMock()
+    svc.query_embedding_cache = None
     return svc
 
 
@@ -224,6 +228,34 @@ class TestRecordMetrics:
         mock_ctx.logger.debug.assert_called()
 
 
+class TestEmbedQueryCache:
+    """_embed_query() through the shared query embedding cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_query_served_from_cache_and_reported(
+        self, mock_ctx, mock_emitter, mock_services
+    ):
+        mock_services.query_embedding_cache = QueryEmbeddingCache(
+            dense_cache=InMemoryEmbeddingCache(max_entries=10), sparse_max_entries=10
+        )
+        mock_services.dense_embedder = FakeDenseEmbedder(dimensions=4)
+        mock_services.sparse_embedder = FakeSparseEmbedder()
+        agent = AgenticSearchAgent(mock_services, mock_ctx, mock_emitter, metrics=None)
+        query = AgenticSearchQuery(primary="test query")
+
+        first_stats: dict[str, int] = {}
+        await agent._embed_query(query, AgenticSearchRetrievalStrategy.HYBRID, first_stats)
+        second_stats: dict[str, int] = {}
+        embeddings = await agent._embed_query(
+            query, AgenticSearchRetrievalStrategy.HYBRID, second_stats
+        )
+
+        assert embeddings.dense_embeddings[0].vector == [0.0] * 4
+        assert embeddings.sparse_embedding is not None
+        assert (first_stats["embed_cache_hits"], first_stats["embed_cache_misses"]) == (0, 2)
+        assert (second_stats["embed_cache_hits"], second_stats["embed_cache_misses"]) == (2, 0)
+
+
 # ===================================================================
 # 2b. run() try/except/finally wrapper tests
 # ===================================================================
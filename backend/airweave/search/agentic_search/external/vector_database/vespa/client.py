@@ -5,7 +5,6 @@ Handles query compilation (plan + embeddings → YQL) and execution.
 
 from __future__ import annotations
 
-import asyncio
 import json
 import time
 from datetime import datetime
@@ -39,70 +38,72 @@ from airweave.search.agentic_search.schemas.search_result import (
 )
 
 if TYPE_CHECKING:
-    from vespa.application import Vespa
+    from airweave.core.protocols.vespa import VespaQueryClientProtocol
 
 
 class VespaVectorDB:
     """Vespa vector database for agentic search.
 
-    Compiles AgenticSearchPlan + embeddings into Vespa YQL and executes queries.
-    Uses pyvespa for query execution (synchronous, run in thread pool).
+    Compiles AgenticSearchPlan + embeddings into Vespa YQL and executes queries
+    over the container's pooled VespaQueryClient.
 
     Features:
     - Query-only (no feed/delete operations)
     - Fail-fast error handling
-    - Async via thread pool (pyvespa is synchronous)
+    - Native async HTTP/1.1 keep-alive with connections reused across searches
     """
 
     def __init__(
         self,
-        app: Vespa,
+        query_client: VespaQueryClientProtocol,
         logger: ContextualLogger,
         filter_translator: FilterTranslator,
     ) -> None:
         """Initialize the Vespa vector database.
 
         Args:
-            app: Connected pyvespa Vespa application instance.
+            query_client: Shared pooled Vespa query client.
             logger: Logger for debug/info messages.
             filter_translator: Translator for filter groups.
         """
-        self._app = app
+        self._query_client = query_client
+        self._owns_query_client = False
         self._logger = logger
         self._filter_translator = filter_translator
 
     @classmethod
     async def create(cls, ctx: ApiContext) -> VespaVectorDB:
-        """Create and connect to Vespa.
+        """Create a VespaVectorDB on the container's pooled query client.
 
-        Uses settings.VESPA_URL and settings.VESPA_PORT for connection.
+        The client is configured from settings.VESPA_URL and settings.VESPA_PORT
+        and its connection pool is reused across searches. Without an
+        initialized container a dedicated client is created and closed with
+        this instance.
 
         Args:
             ctx: API context for logging.
 
         Returns:
             Connected VespaVectorDB instance.
-
-        Raises:
-            RuntimeError: If connection fails.
         """
-        from vespa.application import Vespa
-
-        vespa_url = settings.VESPA_URL
-        vespa_port = settings.VESPA_PORT
+        from airweave.core import container as container_mod
+        from airweave.platform.destinations.vespa.query_client import VespaQueryClient
 
-        try:
-            app = Vespa(url=vespa_url, port=vespa_port)
-        except Exception as e:
-            raise RuntimeError(
-                f"Failed to connect to Vespa at {vespa_url}:{vespa_port}: {e}"
-            ) from e
-
-        ctx.logger.debug(f"[VespaVectorDB] Connected to Vespa at {vespa_url}:{vespa_port}")
+        ctx.logger.debug(
+            f"[VespaVectorDB] Using shared Vespa query client for "
+            f"{settings.VESPA_URL}:{settings.VESPA_PORT}"
+        )
 
-        filter_translator = FilterTranslator(logger=ctx.logger)
+        container = container_mod.container
+        query_client = container.vespa_query_client if container is not None else None
 
-        return cls(app=app, logger=ctx.logger, filter_translator=filter_translator)
+        instance = cls(
+            query_client=query_client or VespaQueryClient.from_settings(logger=ctx.logger),
+            logger=ctx.logger,
+            filter_translator=FilterTranslator(logger=ctx.logger),
+        )
+        instance._owns_query_client = query_client is None
+        return instance
 
     # =========================================================================
     # Public Interface
@@ -156,8 +157,6 @@ class VespaVectorDB:
     ) -> AgenticSearchResults:
         """Execute compiled query against Vespa.
 
-        Runs the query in a thread pool since pyvespa is synchronous.
-
         Args:
             compiled_query: AgenticSearchCompiledQuery from compile_query().
 
@@ -172,13 +171,12 @@ class VespaVectorDB:
         yql = raw["yql"]
         params = raw["params"]
 
-        # Merge YQL into params (pyvespa expects all in one dict)
+        # Merge YQL into params (the /search/ body carries everything in one dict)
         query_params = {**params, "yql": yql}
 
-        # Execute query in thread pool (pyvespa is synchronous)
         start_time = time.monotonic()
         try:
-            response = await asyncio.to_thread(self._app.query, body=query_params)
+            response = await self._query_client.query(query_params, caller="agentic_search")
         except Exception as e:
             self._logger.error(f"[VespaVectorDB] Query execution failed: {e}")
             raise RuntimeError(f"Vespa query failed: {e}") from e
@@ -186,16 +184,15 @@ class VespaVectorDB:
 
         # Check for errors
         if not response.is_successful():
-            error_msg = getattr(response, "json", {}).get("error", str(response))
+            error_msg = response.json.get("error", str(response))
             self._logger.error(f"[VespaVectorDB] Vespa returned error: {error_msg}")
             raise RuntimeError(f"Vespa query error: {error_msg}")
 
         # Extract metrics
-        raw_json = response.json if hasattr(response, "json") else {}
-        root = raw_json.get("root", {})
+        root = response.json.get("root", {})
         coverage = root.get("coverage", {})
         total_count = root.get("fields", {}).get("totalCount", 0)
-        hits = response.hits or []
+        hits = response.hits
 
         self._logger.debug(
             f"[VespaVectorDB] Query completed in {query_time_ms:.1f}ms, "
@@ -207,13 +204,14 @@ class VespaVectorDB:
         return self._convert_hits_to_results(hits)
 
     async def close(self) -> None:
-        """Close the Vespa connection.
+        """Release this instance.
 
-        Note: pyvespa doesn't require explicit cleanup, but we implement
-        this for interface compliance and future-proofing.
+        The container's query client stays open for other searches and is
+        closed on process shutdown; a dedicated one is closed here.
         """
+        if self._owns_query_client:
+            await self._query_client.close()
         self._logger.debug("[VespaVectorDB] Connection closed")
-        self._app = None  # type: ignore[assignment]
 
     # =========================================================================
     # YQL Building
@@ -5,10 +5,15 @@ This is the composition root - where external dependencies are wired together.
 
 from __future__ import annotations
 
+import airweave.core.container as _container_module
 from airweave.adapters.circuit_breaker import InMemoryCircuitBreaker
 from airweave.api.context import ApiContext
 from airweave.core.config import settings
-from airweave.domains.embedders.protocols import DenseEmbedderProtocol, SparseEmbedderProtocol
+from airweave.domains.embedders.protocols import (
+    DenseEmbedderProtocol,
+    QueryEmbeddingCacheProtocol,
+    SparseEmbedderProtocol,
+)
 from airweave.search.agentic_search.config import (
     DatabaseImpl,
     LLMProvider,
@@ -56,8 +61,11 @@ class AgenticSearchServices:
     - services.dense_embedder.embed_many() for semantic embeddings
     - services.sparse_embedder.embed() for keyword embeddings
     - services.vector_db.compile_query() and execute_query() for search
+    - services.query_embedding_cache (optional) to reuse query embeddings
     """
 
+    query_embedding_cache: QueryEmbeddingCacheProtocol | None = None
+
     def __init__(
         self,
         db: AgenticSearchDatabaseInterface,
@@ -66,6 +74,7 @@ class AgenticSearchServices:
         dense_embedder: DenseEmbedderProtocol,
         sparse_embedder: SparseEmbedderProtocol,
         vector_db: AgenticSearchVectorDBInterface,
+        query_embedding_cache: QueryEmbeddingCacheProtocol | None = None,
     ):
         """Initialize with external dependencies.
 
@@ -76,6 +85,8 @@ class AgenticSearchServices:
             dense_embedder: Dense embedder for semantic search.
             sparse_embedder: Sparse embedder for keyword search.
             vector_db: Vector database for query compilation and execution.
+            query_embedding_cache: Cache shared with classic search for query
+                embeddings (None disables caching).
         """
         self.db = db
         self.tokenizer = tokenizer
@@ -83,6 +94,7 @@ class AgenticSearchServices:
         self.dense_embedder = dense_embedder
         self.sparse_embedder = sparse_embedder
         self.vector_db = vector_db
+        self.query_embedding_cache = query_embedding_cache
 
     @classmethod
     async def create(
@@ -139,6 +151,11 @@ class AgenticSearchServices:
             dense_embedder=dense_embedder,
             sparse_embedder=sparse_embedder,
             vector_db=vector_db,
+            query_embedding_cache=(
+                _container_module.container.query_embedding_cache
+                if _container_module.container
+                else None
+            ),
         )
 
     @staticmethod
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 if TYPE_CHECKING:
     from airweave.core.protocols.pubsub import PubSub
@@ -35,6 +35,12 @@ class EventEmitter:
         self._pubsub = pubsub
         self._global_sequence = 0
         self._op_sequences: Dict[str, int] = {}
+        # Emitted payloads, kept only after start_recording() (result cache)
+        self.recorded: Optional[List[Dict[str, Any]]] = None
+
+    def start_recording(self) -> None:
+        """Keep a copy of every emitted event so it can be replayed later."""
+        self.recorded = []
 
     async def emit(
         self, event_type: str, data: Optional[Dict[str, Any]] = None, op_name: Optional[str] = None
@@ -70,6 +76,31 @@ class EventEmitter:
         if data:
             payload.update(data)
 
+        if self.recorded is not None:
+            self.recorded.append(dict(payload))
+
+        await self._publish(payload)
+
+    async def replay(self, events: List[Dict[str, Any]]) -> None:
+        """Re-publish previously recorded events under this emitter's request.
+
+        Timestamps are refreshed and any ``request_id`` field is rewritten so
+        subscribers of this request see a normal event stream.
+
+        Args:
+            events: Events captured by another emitter via start_recording()
+        """
+        if not self.stream:
+            return
+
+        for event in events:
+            payload = dict(event)
+            payload["ts"] = datetime.now(timezone.utc).isoformat()
+            if "request_id" in payload:
+                payload["request_id"] = self.request_id
+            await self._publish(payload)
+
+    async def _publish(self, payload: Dict[str, Any]) -> None:
         # Publish to Redis channel
         try:
             await self._pubsub.publish("search", self.request_id, payload)
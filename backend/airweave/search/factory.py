@@ -1,6 +1,6 @@
 """Search factory."""
 
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 from uuid import UUID
 
 from fastapi import HTTPException
@@ -30,6 +30,7 @@ from airweave.search.operations import (
     Retrieval,
     UserFilter,
 )
+from airweave.search.plan_cache import CollectionSearchPlan, FederatedSourceRef, SearchPlanKey
 from airweave.search.providers._base import BaseProvider
 from airweave.search.providers.cerebras import CerebrasProvider
 from airweave.search.providers.cohere import CohereProvider
@@ -75,6 +76,7 @@ class SearchFactory:
         destination_override: Optional[DestinationOverride] = None,
         user_principal_override: Optional[str] = None,
         skip_organization_check: bool = False,
+        record_events: bool = False,
     ) -> SearchContext:
         """Build SearchContext from request with validated YAML defaults.
 
@@ -95,6 +97,8 @@ class SearchFactory:
                 If None, uses ctx.user for ACL (normal behavior).
             skip_organization_check: If True, skip organization filtering when
                 fetching collection (for admin cross-org access).
+            record_events: If True, the emitter keeps every streamed event so
+                the search result cache can replay them.
 
         Returns:
             Configured SearchContext ready for orchestration
@@ -108,27 +112,23 @@ class SearchFactory:
         # Apply defaults and validate parameters
         params = self._apply_defaults_and_validate(search_request, ctx)
 
-        # Get collection - with or without organization filtering
-        if skip_organization_check:
-            from airweave.models.collection import Collection
-
-            result = await db.execute(sa_select(Collection).where(Collection.id == collection_id))
-            collection = result.scalar_one_or_none()
-        else:
-            assert _container_module.container is not None  # [code blue]
-            collection = await _container_module.container.collection_repo.get(
-                db, id=collection_id, ctx=ctx
-            )
-
-        if not collection:
-            raise ValueError(f"Collection {collection_id} not found")
-
-        federated_sources = await self.get_federated_sources(db, collection, ctx)
-        has_federated_sources = bool(federated_sources)
-        has_vector_sources = await self._has_vector_sources(db, collection, ctx)
-
-        # Resolve destination (may be overridden for admin search)
-        destination = await self._resolve_destination(db, collection, ctx, destination_override)
+        # Collection, sources and destination don't depend on the query: reuse them
+        plan = await self._get_search_plan(
+            db,
+            collection_id,
+            readable_collection_id,
+            ctx,
+            skip_organization_check=skip_organization_check,
+        )
+        # Handles carry this request's logger and credentials: never shared
+        federated_sources = await self.get_federated_sources(
+            db, plan.collection, ctx, source_connections=list(plan.federated_sources)
+        )
+        has_federated_sources = plan.has_federated_sources
+        has_vector_sources = plan.has_vector_sources
+        destination = await self._resolve_destination(
+            db, plan.collection, ctx, destination_override
+        )
         requires_embedding = getattr(destination, "requires_client_embedding", True)
 
         self._log_source_modes(ctx, federated_sources, has_vector_sources)
@@ -137,9 +137,6 @@ class SearchFactory:
             f"requires_client_embedding: {requires_embedding}"
         )
 
-        if not has_federated_sources and not has_vector_sources:
-            raise ValueError("Collection has no sources")
-
         vector_size = dense_embedder.dimensions
 
         # Select LLM providers for operations (embedding is handled by domain embedders)
@@ -154,6 +151,8 @@ class SearchFactory:
 
         # Create event emitter and emit skip notices if needed
         emitter = EventEmitter(request_id=request_id, stream=stream, pubsub=pubsub)
+        if record_events:
+            emitter.start_recording()
         await self._emit_skip_notices_if_needed(emitter, has_vector_sources, params, search_request)
 
         # Build operations with destination (destination-agnostic)
@@ -170,7 +169,7 @@ class SearchFactory:
             db=db,
             ctx=ctx,
             user_principal_override=user_principal_override,
-            organization_id=collection.organization_id,
+            organization_id=plan.organization_id,
         )
 
         search_context = SearchContext(
@@ -194,6 +193,110 @@ class SearchFactory:
 
         return search_context
 
+    async def _get_search_plan(
+        self,
+        db: AsyncSession,
+        collection_id: UUID,
+        readable_collection_id: str,
+        ctx: ApiContext,
+        *,
+        skip_organization_check: bool,
+    ) -> CollectionSearchPlan:
+        """Return the collection's search plan, building and caching it on a miss."""
+        container = _container_module.container
+        plan_cache = container.search_plan_cache if container else None
+        if plan_cache is None:
+            return await self._build_search_plan(db, collection_id, ctx, skip_organization_check)
+
+        key = SearchPlanKey(
+            collection_readable_id=readable_collection_id,
+            organization_id=ctx.organization.id,
+            skip_organization_check=skip_organization_check,
+        )
+        plan = plan_cache.get(key)
+        if plan is not None and plan.collection_id == collection_id:
+            ctx.logger.debug("[SearchFactory] Reusing cached search plan")
+            return plan
+
+        generation = plan_cache.generation(readable_collection_id)
+        plan = await self._build_search_plan(db, collection_id, ctx, skip_organization_check)
+        plan_cache.set(key, plan, generation)
+        return plan
+
+    async def _build_search_plan(
+        self,
+        db: AsyncSession,
+        collection_id: UUID,
+        ctx: ApiContext,
+        skip_organization_check: bool,
+    ) -> CollectionSearchPlan:
+        """Resolve the collection, its source connections and their capabilities."""
+        # Get collection - with or without organization filtering
+        if skip_organization_check:
+            from airweave.models.collection import Collection
+
+            result = await db.execute(sa_select(Collection).where(Collection.id == collection_id))
+            collection = result.scalar_one_or_none()
+        else:
+            assert _container_module.container is not None  # [code blue]
+            collection = await _container_module.container.collection_repo.get(
+                db, id=collection_id, ctx=ctx
+            )
+
+        if not collection:
+            raise ValueError(f"Collection {collection_id} not found")
+
+        try:
+            source_connections = await crud.source_connection.get_for_collection(
+                db, readable_collection_id=collection.readable_id, ctx=ctx
+            )
+        except Exception as e:
+            raise ValueError(f"Error getting source connections: {e}")
+
+        federated_sources = self._federated_source_refs(source_connections or [], ctx)
+        has_vector_sources = await self._has_vector_sources(
+            db, collection, ctx, source_connections=source_connections
+        )
+
+        if not federated_sources and not has_vector_sources:
+            raise ValueError("Collection has no sources")
+
+        return CollectionSearchPlan(
+            collection_id=collection.id,
+            organization_id=collection.organization_id,
+            readable_collection_id=collection.readable_id,
+            source_connection_ids=tuple(sc.id for sc in source_connections or []),
+            federated_sources=federated_sources,
+            has_vector_sources=has_vector_sources,
+        )
+
+    def _federated_source_refs(
+        self, source_connections: List, ctx: ApiContext
+    ) -> Tuple[FederatedSourceRef, ...]:
+        """Return the source connections searched live, without instantiating them."""
+        if _container_module.container is None:
+            raise RuntimeError("Container not initialized")
+        registry = _container_module.container.source_registry
+
+        refs = []
+        for source_connection in source_connections:
+            if not registry.get(source_connection.short_name).federated_search:
+                continue
+            if not source_connection.connection_id:
+                ctx.logger.warning(
+                    f"Skipping federated source {source_connection.short_name} "
+                    f"(id: {source_connection.id}): no connection_id"
+                )
+                continue
+            refs.append(
+                FederatedSourceRef(
+                    id=source_connection.id,
+                    short_name=source_connection.short_name,
+                    connection_id=source_connection.connection_id,
+                )
+            )
+        return tuple(refs)
+
     def _apply_defaults_and_validate(
         self, search_request: SearchRequest, ctx: Optional["ApiContext"] = None
     ) -> Dict[str, Any]:
@@ -379,6 +482,11 @@ class SearchFactory:
                     strategy=params["retrieval_strategy"],
                     dense_embedder=dense_embedder,
                     sparse_embedder=sparse_embedder,
+                    query_cache=(
+                        _container_module.container.query_embedding_cache
+                        if _container_module.container
+                        else None
+                    ),
                 )
                 if needs_embedding_ops
                 else None
@@ -545,12 +653,19 @@ class SearchFactory:
             f"[SearchFactory] Initialized {len(provider_list)} provider(s) for {operation_name}"
         )
 
-    async def _has_vector_sources(self, db: AsyncSession, collection, ctx: ApiContext) -> bool:
+    async def _has_vector_sources(
+        self,
+        db: AsyncSession,
+        collection,
+        ctx: ApiContext,
+        source_connections: Optional[List] = None,
+    ) -> bool:
         """Return True if collection has any non-federated (vector-backed) sources."""
         try:
-            source_connections = await crud.source_connection.get_for_collection(
-                db, readable_collection_id=collection.readable_id, ctx=ctx
-            )
+            if source_connections is None:
+                source_connections = await crud.source_connection.get_for_collection(
+                    db, readable_collection_id=collection.readable_id, ctx=ctx
+                )
             if not source_connections:
                 return False
 
@@ -810,7 +925,11 @@ class SearchFactory:
         return RerankModelConfig(**model_dict)
 
     async def get_federated_sources(
-        self, db: AsyncSession, collection, ctx: ApiContext
+        self,
+        db: AsyncSession,
+        collection,
+        ctx: ApiContext,
+        source_connections: Optional[List] = None,
     ) -> List[BaseSource]:
         """Get instantiated federated sources for a collection.
 
@@ -818,14 +937,17 @@ class SearchFactory:
             db: Database session
             collection: Collection object
             ctx: API context
+            source_connections: The collection's source connections, if already
+                loaded (otherwise they are queried)
 
         Returns:
             List of instantiated source objects that support federated search
         """
         try:
-            source_connections = await crud.source_connection.get_for_collection(
-                db, readable_collection_id=collection.readable_id, ctx=ctx
-            )
+            if source_connections is None:
+                source_connections = await crud.source_connection.get_for_collection(
+                    db, readable_collection_id=collection.readable_id, ctx=ctx
+                )
 
             if not source_connections:
                 return []
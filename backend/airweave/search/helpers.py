@@ -1,13 +1,13 @@
 """Helpers for search."""
 
 from pathlib import Path
+from typing import Any, Dict, Optional
 from uuid import UUID
 
 import yaml
 from fastapi import HTTPException
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from airweave import crud
+import airweave.core.container as _container_module
 from airweave.api.context import ApiContext
 from airweave.schemas.search import SearchResponse
 from airweave.schemas.search_query import SearchQueryCreate
@@ -17,77 +17,165 @@ from airweave.search.context import SearchContext
 class SearchHelpers:
     """Helpers for search."""
 
-    async def persist_search_data(
+    def record_search_data(
         self,
-        db: AsyncSession,
         search_context: SearchContext,
         search_response: SearchResponse,
         ctx: ApiContext,
         duration_ms: float,
+        organization_id: Optional[UUID] = None,
     ) -> None:
-        """Persist search data for analytics and user experience.
+        """Queue search data for analytics and user experience.
 
         Args:
-            db: Database session
             search_context: The search context with actual executed configuration
             search_response: The search response
             ctx: API context
             duration_ms: Search execution time in milliseconds
+            organization_id: Organization owning the collection, when it is not
+                the caller's (admin searches)
         """
-        try:
-            # Extract API key ID from auth metadata if available
-            api_key_id = None
-            if ctx.is_api_key_auth and ctx.auth_metadata:
-                api_key_id = ctx.auth_metadata.get("api_key_id")
-
-            # Extract filter from user_filter operation if it was configured
-            filter_dict = None
-            if search_context.user_filter and search_context.user_filter.filter:
-                f = search_context.user_filter.filter
-                if isinstance(f, dict):
-                    filter_dict = f
-                elif hasattr(f, "model_dump"):
-                    filter_dict = f.model_dump(exclude_none=True)
-                else:
-                    filter_dict = dict(f)
-
-            # Create search query schema using actual values from SearchContext
-            # (which has defaults applied via factory)
-            search_query_create = SearchQueryCreate(
-                collection_id=search_context.collection_id,
-                organization_id=ctx.organization.id,
-                user_id=ctx.user.id if ctx.user else None,
-                api_key_id=UUID(api_key_id) if api_key_id else None,
-                query_text=search_context.query,
-                query_length=len(search_context.query),
-                is_streaming=search_context.stream,
-                retrieval_strategy=search_context.retrieval.strategy.value,
-                limit=search_context.retrieval.limit,
-                offset=search_context.retrieval.offset,
-                temporal_relevance=0.0,
-                filter=filter_dict,
-                duration_ms=int(duration_ms),
-                results_count=len(search_response.results),
-                expand_query=search_context.query_expansion is not None,
-                interpret_filters=search_context.query_interpretation is not None,
-                rerank=search_context.reranking is not None,
-                generate_answer=search_context.generate_answer is not None,
-            )
+        self.record_search_query(
+            query_fields=self.search_query_fields(search_context),
+            is_streaming=search_context.stream,
+            results_count=len(search_response.results),
+            ctx=ctx,
+            duration_ms=duration_ms,
+            organization_id=organization_id,
+        )
 
-            # Create search query record using standard CRUD pattern
-            await crud.search_query.create(db=db, obj_in=search_query_create, ctx=ctx)
+    @staticmethod
+    def search_query_fields(search_context: SearchContext) -> Dict[str, Any]:
+        """Extract the executed search configuration to persist.
 
-            ctx.logger.debug(
-                f"[SearchHelpers] Search data persisted successfully for query: "
-                f"'{search_context.query[:50]}...'"
-            )
+        Uses the actual values from SearchContext (which has defaults applied
+        via factory). The result is JSON-serializable so cached searches can
+        replay it.
+
+        Args:
+            search_context: The search context with actual executed configuration
+
+        Returns:
+            SearchQueryCreate fields that do not depend on the individual request
+        """
+        # Extract filter from user_filter operation if it was configured
+        filter_dict = None
+        if search_context.user_filter and search_context.user_filter.filter:
+            f = search_context.user_filter.filter
+            if isinstance(f, dict):
+                filter_dict = f
+            elif hasattr(f, "model_dump"):
+                filter_dict = f.model_dump(exclude_none=True)
+            else:
+                filter_dict = dict(f)
+
+        retrieval = search_context.retrieval
+        return {
+            "collection_id": str(search_context.collection_id),
+            "query_text": search_context.query,
+            "query_length": len(search_context.query),
+            "retrieval_strategy": retrieval.strategy.value if retrieval else "none",
+            "limit": retrieval.limit if retrieval else 0,
+            "offset": retrieval.offset if retrieval else 0,
+            "temporal_relevance": 0.0,
+            "filter": filter_dict,
+            "expand_query": search_context.query_expansion is not None,
+            "interpret_filters": search_context.query_interpretation is not None,
+            "rerank": search_context.reranking is not None,
+            "generate_answer": search_context.generate_answer is not None,
+        }
+
+    def record_search_query(
+        self,
+        query_fields: Dict[str, Any],
+        is_streaming: bool,
+        results_count: int,
+        ctx: ApiContext,
+        duration_ms: float,
+        organization_id: Optional[UUID] = None,
+    ) -> None:
+        """Hand one search query record to the background writer.
+
+        Never waits on the database: the row is queued and inserted in a
+        later batch by the container's SearchQueryWriter.
+
+        Args:
+            query_fields: Output of ``search_query_fields``
+            is_streaming: Whether the search was streamed
+            results_count: Number of results returned
+            ctx: API context
+            duration_ms: Search execution time in milliseconds
+            organization_id: Organization owning the collection, when it is not
+                the caller's (admin searches)
+        """
+        container = _container_module.container
+        writer = container.search_query_writer if container else None
+        if writer is None:
+            ctx.logger.debug("[SearchHelpers] No search query writer; search data not saved")
+            return
 
+        try:
+            row = self.search_query_row(
+                query_fields,
+                is_streaming=is_streaming,
+                results_count=results_count,
+                ctx=ctx,
+                duration_ms=duration_ms,
+                organization_id=organization_id,
+            )
         except Exception as e:
-            # Don't fail the search if persistence fails
+            # Don't fail the search if the record is malformed
             ctx.logger.error(
-                f"[SearchHelpers] Failed to persist search data: {str(e)}. "
+                f"[SearchHelpers] Failed to build search data: {str(e)}. "
                 f"Search completed successfully but analytics data was not saved."
             )
+            return
+
+        writer.submit(row)
+
+    @staticmethod
+    def search_query_row(
+        query_fields: Dict[str, Any],
+        *,
+        is_streaming: bool,
+        results_count: int,
+        ctx: ApiContext,
+        duration_ms: float,
+        organization_id: Optional[UUID] = None,
+    ) -> Dict[str, Any]:
+        """Build the ``search_queries`` column values for one search.
+
+        Mirrors what ``crud.search_query.create`` would store: the validated
+        SearchQueryCreate fields plus organization and audit columns.
+
+        Args:
+            query_fields: Output of ``search_query_fields``
+            is_streaming: Whether the search was streamed
+            results_count: Number of results returned
+            ctx: API context
+            duration_ms: Search execution time in milliseconds
+            organization_id: Owning organization; defaults to the caller's
+
+        Returns:
+            Column values ready for a multi-row insert
+        """
+        # Extract API key ID from auth metadata if available
+        api_key_id = None
+        if ctx.is_api_key_auth and ctx.auth_metadata:
+            api_key_id = ctx.auth_metadata.get("api_key_id")
+
+        row = SearchQueryCreate(
+            **query_fields,
+            user_id=ctx.user.id if ctx.user else None,
+            api_key_id=UUID(api_key_id) if api_key_id else None,
+            is_streaming=is_streaming,
+            duration_ms=int(duration_ms),
+            results_count=results_count,
+        ).model_dump()
+        row["organization_id"] = organization_id or ctx.organization.id
+        row["created_by_email"] = ctx.tracking_email if ctx.has_user_context else None
+        row["modified_by_email"] = row["created_by_email"]
+        return row
 
     @staticmethod
     def load_defaults() -> dict:
@@ -107,7 +107,9 @@ class AccessControlFilter(SearchOperation):
         # Build filter - destination will translate to appropriate format (YQL for Vespa, etc.)
         access_filter = self._build_access_control_filter(principals)
 
-        # Merge with any existing filter in state (e.g., from QueryInterpretation)
+        # Merge with any existing filter in state (e.g., from QueryInterpretation, which
+        # may run concurrently). No await between read and write keeps this atomic.
+        state.acl_filter = access_filter
         existing_filter = state.filter
         merged_filter = self._merge_with_existing_filter(access_filter, existing_filter)
 
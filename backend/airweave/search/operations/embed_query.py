@@ -5,10 +5,16 @@ Generates dense neural embeddings and/or sparse BM25 embeddings based on
 the retrieval strategy (hybrid, neural, or keyword).
 """
 
-from typing import TYPE_CHECKING, List, Optional
+import asyncio
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from airweave.api.context import ApiContext
-from airweave.domains.embedders.protocols import DenseEmbedderProtocol, SparseEmbedderProtocol
+from airweave.domains.embedders.protocols import (
+    DenseEmbedderProtocol,
+    QueryEmbeddingCacheProtocol,
+    SparseEmbedderProtocol,
+)
+from airweave.domains.embedders.types import QueryEmbeddingStats
 from airweave.schemas.search import RetrievalStrategy
 from airweave.search.context import SearchContext
 
@@ -18,6 +24,11 @@ if TYPE_CHECKING:
     from airweave.search.state import SearchState
 
 
+async def _none() -> Tuple[None, None]:
+    """Placeholder for an embedding kind the strategy does not need."""
+    return None, None
+
+
 class EmbedQuery(SearchOperation):
     """Generate vector embeddings for queries."""
 
@@ -26,11 +37,13 @@ class EmbedQuery(SearchOperation):
         strategy: RetrievalStrategy,
         dense_embedder: DenseEmbedderProtocol,
         sparse_embedder: SparseEmbedderProtocol,
+        query_cache: Optional[QueryEmbeddingCacheProtocol] = None,
     ) -> None:
-        """Initialize with retrieval strategy and domain embedders."""
+        """Initialize with retrieval strategy, domain embedders and optional cache."""
         self.strategy = strategy
         self.dense_embedder = dense_embedder
         self.sparse_embedder = sparse_embedder
+        self.query_cache = query_cache
 
     def depends_on(self) -> List[str]:
         """Depends on query expansion to get all queries to embed."""
@@ -55,18 +68,13 @@ class EmbedQuery(SearchOperation):
         # Determine queries to embed (expanded + original, or just original)
         queries = self._get_queries_to_embed(context, state)
 
-        # Generate dense embeddings if needed
-        if self.strategy in (RetrievalStrategy.HYBRID, RetrievalStrategy.NEURAL):
-            dense_embeddings = await self._generate_dense_embeddings(queries, ctx)
-        else:
-            # Keyword-only doesn't need dense embeddings
-            dense_embeddings = None
-
-        # Generate sparse BM25 embeddings if needed
-        if self.strategy in (RetrievalStrategy.HYBRID, RetrievalStrategy.KEYWORD):
-            sparse_embeddings = await self._generate_sparse_embeddings(queries, ctx)
-        else:
-            sparse_embeddings = None
+        # Generate dense and/or sparse embeddings concurrently, based on strategy
+        needs_dense = self.strategy in (RetrievalStrategy.HYBRID, RetrievalStrategy.NEURAL)
+        needs_sparse = self.strategy in (RetrievalStrategy.HYBRID, RetrievalStrategy.KEYWORD)
+        (dense_embeddings, dense_stats), (sparse_embeddings, sparse_stats) = await asyncio.gather(
+            self._generate_dense_embeddings(queries, ctx) if needs_dense else _none(),
+            self._generate_sparse_embeddings(queries, ctx) if needs_sparse else _none(),
+        )
 
         # Write to state - embeddings are REQUIRED, never write None
         if dense_embeddings is None and sparse_embeddings is None:
@@ -85,6 +93,7 @@ class EmbedQuery(SearchOperation):
             has_sparse=sparse_embeddings is not None,
             strategy=self.strategy.value,
         )
+        self._report_cache_metrics(state, [dense_stats, sparse_stats])
 
         # Emit embedding done with stats
         await self._emit_embedding_done(dense_embeddings, sparse_embeddings, context.emitter)
@@ -104,13 +113,17 @@ class EmbedQuery(SearchOperation):
 
     async def _generate_dense_embeddings(
         self, queries: List[str], ctx: ApiContext
-    ) -> List[List[float]]:
+    ) -> Tuple[List[List[float]], Optional[QueryEmbeddingStats]]:
         """Generate dense neural embeddings using the domain embedder."""
         ctx.logger.debug(
             f"[EmbedQuery] Generating {self.dense_embedder.dimensions}-dim embeddings "
             f"for {len(queries)} queries"
         )
-        results = await self.dense_embedder.embed_many(queries)
+        stats = None
+        if self.query_cache is not None:
+            results, stats = await self.query_cache.embed_dense(self.dense_embedder, queries)
+        else:
+            results = await self.dense_embedder.embed_many(queries)
 
         # Validate we got embeddings for all queries
         if len(results) != len(queries):
@@ -126,11 +139,18 @@ class EmbedQuery(SearchOperation):
             f"{len(dense_embeddings[0]) if dense_embeddings else 0}-dim"
         )
 
-        return dense_embeddings
+        return dense_embeddings, stats
 
-    async def _generate_sparse_embeddings(self, queries: List[str], ctx: ApiContext) -> List:
+    async def _generate_sparse_embeddings(
+        self, queries: List[str], ctx: ApiContext
+    ) -> Tuple[List, Optional[QueryEmbeddingStats]]:
         """Generate sparse BM25 embeddings for keyword search."""
-        if len(queries) == 1:
+        stats = None
+        if self.query_cache is not None:
+            sparse_embeddings, stats = await self.query_cache.embed_sparse(
+                self.sparse_embedder, queries
+            )
+        elif len(queries) == 1:
             sparse_embedding = await self.sparse_embedder.embed(queries[0])
             sparse_embeddings = [sparse_embedding]
         else:
@@ -145,7 +165,25 @@ class EmbedQuery(SearchOperation):
 
         ctx.logger.debug(f"[EmbedQuery] Sparse embeddings generated: {len(sparse_embeddings)}")
 
-        return sparse_embeddings
+        return sparse_embeddings, stats
+
+    def _report_cache_metrics(
+        self, state: "SearchState", stats: List[Optional[QueryEmbeddingStats]]
+    ) -> None:
+        """Report query embedding cache hits and avoided latency, if the cache is on."""
+        stats = [s for s in stats if s is not None]
+        if not stats:
+            return
+
+        hits = sum(s.hits for s in stats)
+        misses = sum(s.misses for s in stats)
+        self._report_metrics(
+            state,
+            cache_hits=hits,
+            cache_misses=misses,
+            cache_hit_rate=hits / (hits + misses) if hits + misses else 0.0,
+            cache_saved_ms=round(sum(s.saved_ms for s in stats), 2),
+        )
 
     async def _emit_embedding_done(
         self,
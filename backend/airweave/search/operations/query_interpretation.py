@@ -203,8 +203,12 @@ class QueryInterpretation(SearchOperation):
         filter_dict = self._build_qdrant_filter(validated_filters)
         ctx.logger.debug(f"[QueryInterpretation] Filter dict: {filter_dict}")
 
-        # Write to state (UserFilter will merge with this if it runs)
-        state.filter = filter_dict
+        # Write to state (UserFilter will merge with this if it runs). AccessControlFilter
+        # may run concurrently and have written state.filter already, so AND-merge with
+        # it instead of overwriting. No await between read and write keeps this atomic.
+        state.interpreted_filter = filter_dict
+        existing_filter = state.filter
+        state.filter = {"must": [existing_filter, filter_dict]} if existing_filter else filter_dict
 
         # Report metrics for analytics
         self._report_metrics(
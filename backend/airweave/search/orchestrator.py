@@ -3,11 +3,13 @@
 The orchestrator is responsible for:
 1. Extracting enabled operations from the search context
 2. Determining execution order based on dependencies
-3. Executing operations sequentially, passing state between them
+3. Executing the dependency DAG concurrently: each operation starts as soon
+   as all of its enabled dependencies have finished
 4. Using the emitter from context for streaming updates
 5. Automatically capturing timing metrics for each operation
 """
 
+import asyncio
 import time
 from typing import Any, Dict, List, Set
 
@@ -22,7 +24,13 @@ class SearchOrchestrator:
     """Orchestrates search operation execution.
 
     The orchestrator uses topological sort to determine execution order
-    based on declared dependencies, then executes operations sequentially.
+    based on declared dependencies, then schedules every operation as a task
+    that waits only for its own dependencies. Independent operations (e.g.
+    AccessControlFilter and QueryExpansion) therefore run concurrently.
+
+    Operations share one SearchState. Concurrent operations write disjoint
+    fields, and operations that merge into a shared field (``filter``) do
+    the read-merge-write without awaiting in between, so no update is lost.
     """
 
     async def run(
@@ -56,37 +64,8 @@ class SearchOrchestrator:
         # Resolve execution order
         execution_order = self._resolve_execution_order(context, ctx)
 
-        # Execute operations in order with automatic timing
-        for operation in execution_order:
-            op_name = operation.__class__.__name__
-
-            # Emit operator_start
-            await emitter.emit("operator_start", {"name": op_name}, op_name=op_name)
-
-            try:
-                # Capture start time
-                start_time = time.monotonic()
-
-                # Execute operation (emitter is now in context)
-                await operation.execute(context, state, ctx)
-
-                # Capture end time and calculate duration
-                duration_ms = (time.monotonic() - start_time) * 1000
-
-                # Store timing metric automatically
-                if op_name not in state.operation_metrics:
-                    state.operation_metrics[op_name] = {}
-                state.operation_metrics[op_name]["duration_ms"] = duration_ms
-
-                # Emit operator_end
-                await emitter.emit("operator_end", {"name": op_name}, op_name=op_name)
-
-            except Exception as e:
-                # Emit error event
-                await emitter.emit(
-                    "error", {"operation": op_name, "message": str(e)}, op_name=op_name
-                )
-                raise
+        # Execute the dependency DAG with automatic timing
+        await self._execute_dag(execution_order, context, state, ctx)
 
         # Emit results event
         await emitter.emit("results", {"results": state.results})
@@ -99,6 +78,79 @@ class SearchOrchestrator:
         state_dict = state.model_dump()
         return response, state_dict
 
+    async def _execute_dag(
+        self,
+        execution_order: List[SearchOperation],
+        context: SearchContext,
+        state: SearchState,
+        ctx: ApiContext,
+    ) -> None:
+        """Run each operation as soon as its enabled dependencies complete.
+
+        Tasks are created in topological order, so every dependency task
+        already exists when its dependents are scheduled. If any operation
+        fails, all unfinished operations are cancelled and the error is raised.
+        """
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_after_dependencies(operation: SearchOperation) -> None:
+            dependencies = [tasks[name] for name in operation.depends_on() if name in tasks]
+            if dependencies:
+                await asyncio.gather(*dependencies)
+            await self._execute_operation(operation, context, state, ctx)
+
+        for operation in execution_order:
+            op_name = operation.__class__.__name__
+            tasks[op_name] = asyncio.create_task(run_after_dependencies(operation))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+    async def _execute_operation(
+        self,
+        operation: SearchOperation,
+        context: SearchContext,
+        state: SearchState,
+        ctx: ApiContext,
+    ) -> None:
+        """Execute one operation, emitting lifecycle events and recording its duration."""
+        op_name = operation.__class__.__name__
+        emitter = context.emitter
+
+        # Emit operator_start
+        await emitter.emit("operator_start", {"name": op_name}, op_name=op_name)
+
+        try:
+            # Capture start time
+            start_time = time.monotonic()
+
+            # Execute operation (emitter is now in context)
+            await operation.execute(context, state, ctx)
+
+            # Capture end time and calculate duration
+            duration_ms = (time.monotonic() - start_time) * 1000
+
+            # Store timing metric automatically
+            if op_name not in state.operation_metrics:
+                state.operation_metrics[op_name] = {}
+            state.operation_metrics[op_name]["duration_ms"] = duration_ms
+
+            # Emit operator_end
+            await emitter.emit("operator_end", {"name": op_name}, op_name=op_name)
+
+        except asyncio.CancelledError:
+            # Cancelled because another operation failed - that one reports the error
+            raise
+        except Exception as e:
+            # Emit error event
+            await emitter.emit("error", {"operation": op_name, "message": str(e)}, op_name=op_name)
+            raise
+
     def _resolve_execution_order(
         self, context: SearchContext, ctx: ApiContext
     ) -> List[SearchOperation]:
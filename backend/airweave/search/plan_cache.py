@@ -0,0 +1,141 @@
+"""Per-collection search plans and their in-process cache.
+
+Building a search used to repeat the same lookups on every request: load
+the collection, list its source connections (twice) and check each source's
+capabilities in the registry. None of that depends on the query, so
+SearchFactory resolves it once into a CollectionSearchPlan and reuses it
+until:
+
+- a collection or source connection event for the collection arrives
+  (``SearchPlanCacheInvalidator``),
+- a federated source fails authentication during a search, or
+- the TTL elapses (bounds staleness for changes made on other pods).
+
+Plans only hold ids and flags. Federated source and destination handles
+carry the request's logger, token provider and HTTP client, so SearchFactory
+builds them per request from the plan and never shares them.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from airweave.search.protocols import SearchPlanCacheProtocol
+
+SEARCH_PLAN_TTL = 300
+
+
+class SearchPlanKey(NamedTuple):
+    """Identifies a plan.
+
+    The source connection lookups are scoped to the caller's organization,
+    so plans built for admin (cross-organization) searches never serve
+    regular searches and vice versa.
+    """
+
+    collection_readable_id: str
+    organization_id: UUID
+    skip_organization_check: bool
+
+
+class CollectionRef(NamedTuple):
+    """Collection fields needed to connect its destination."""
+
+    id: UUID
+    organization_id: UUID
+    readable_id: str
+
+
+class FederatedSourceRef(NamedTuple):
+    """Source connection of a federated source, instantiated per search."""
+
+    id: UUID
+    short_name: str
+    connection_id: UUID
+
+
+@dataclass(frozen=True)
+class CollectionSearchPlan:
+    """Query-independent, immutable setup of searches over one collection.
+
+    Attributes:
+        collection_id: Collection UUID.
+        organization_id: Organization owning the collection.
+        readable_collection_id: Collection readable id.
+        source_connection_ids: Every source connection of the collection.
+        federated_sources: Source connections searched live at query time.
+        has_vector_sources: Whether any source is indexed in the destination.
+    """
+
+    collection_id: UUID
+    organization_id: UUID
+    readable_collection_id: str = ""
+    source_connection_ids: Tuple[UUID, ...] = ()
+    federated_sources: Tuple[FederatedSourceRef, ...] = ()
+    has_vector_sources: bool = False
+
+    @property
+    def collection(self) -> CollectionRef:
+        """The collection fields needed to connect its destination."""
+        return CollectionRef(self.collection_id, self.organization_id, self.readable_collection_id)
+
+    @property
+    def has_federated_sources(self) -> bool:
+        """Whether any source is searched live."""
+        return bool(self.federated_sources)
+
+
+class SearchPlanCache(SearchPlanCacheProtocol):
+    """Bounded LRU of search plans with TTL, local to this process."""
+
+    def __init__(self, max_entries: int, ttl_seconds: int = SEARCH_PLAN_TTL) -> None:
+        """Initialize SearchPlanCache.
+
+        Args:
+            max_entries: Maximum number of plans kept before evicting the
+                least recently used one.
+            ttl_seconds: Seconds a plan stays valid after it was built.
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[SearchPlanKey, tuple[float, CollectionSearchPlan]] = (
+            OrderedDict()
+        )
+        self._generations: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Number of cached plans (including expired ones not yet evicted)."""
+        return len(self._entries)
+
+    def get(self, key: SearchPlanKey) -> Optional[CollectionSearchPlan]:
+        """Return the cached plan or None on miss or expiry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, plan = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return plan
+
+    def generation(self, collection_readable_id: str) -> int:
+        """Return how often the collection has been invalidated."""
+        return self._generations.get(collection_readable_id, 0)
+
+    def set(self, key: SearchPlanKey, plan: CollectionSearchPlan, generation: int) -> None:
+        """Store a plan, evicting least recently used entries over capacity."""
+        if self._max_entries <= 0 or generation != self.generation(key.collection_readable_id):
+            return
+        self._entries[key] = (time.monotonic() + self._ttl, plan)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, collection_readable_id: str) -> None:
+        """Drop every plan of the collection and reject plans still being built."""
+        self._generations[collection_readable_id] = self.generation(collection_readable_id) + 1
+        for key in [k for k in self._entries if k.collection_readable_id == collection_readable_id]:
+            del self._entries[key]
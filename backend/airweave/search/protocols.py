@@ -0,0 +1,64 @@
+"""Search protocols.
+
+SearchQueryWriter: Singleton that persists search analytics off the request path.
+SearchPlanCache: Singleton that reuses resolved per-collection search setup.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Optional, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    from airweave.search.plan_cache import CollectionSearchPlan, SearchPlanKey
+
+
+@runtime_checkable
+class SearchQueryWriterProtocol(Protocol):
+    """Singleton that queues search query records and writes them in batches.
+
+    ``submit`` never waits on the database: records are buffered in a
+    bounded in-process queue and inserted by a background task.
+    """
+
+    def submit(self, row: Dict[str, Any]) -> bool:
+        """Queue one ``search_queries`` row for insertion.
+
+        Returns False if the record was dropped because the queue is full.
+        """
+        ...
+
+    async def flush(self) -> None:
+        """Write every queued record now."""
+        ...
+
+    async def close(self) -> None:
+        """Stop the background task and write what is still queued."""
+        ...
+
+
+@runtime_checkable
+class SearchPlanCacheProtocol(Protocol):
+    """Per-process cache of resolved collection search plans.
+
+    Plans hold only ids and capability flags; source and destination
+    handles are built per request. Entries expire by TTL and are dropped by
+    collection and source connection events.
+    """
+
+    def get(self, key: "SearchPlanKey") -> Optional["CollectionSearchPlan"]:
+        """Return the cached plan or None on miss or expiry."""
+        ...
+
+    def generation(self, collection_readable_id: str) -> int:
+        """Return the invalidation counter of a collection.
+
+        Read it before building a plan and pass it to ``set`` so a plan built
+        while the collection was invalidated is not stored.
+        """
+        ...
+
+    def set(self, key: "SearchPlanKey", plan: "CollectionSearchPlan", generation: int) -> None:
+        """Store a plan unless the collection was invalidated since ``generation``."""
+        ...
+
+    def invalidate(self, collection_readable_id: str) -> None:
+        """Drop every plan of a collection."""
+        ...
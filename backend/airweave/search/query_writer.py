@@ -0,0 +1,172 @@
+"""Search query writer — persists search analytics off the request path.
+
+One instance lives in the container. Search endpoints ``submit()`` one
+``search_queries`` row per request and return immediately; a background
+task drains the bounded in-process queue and inserts rows in multi-row
+batches, either once ``batch_size`` records are waiting or every
+``flush_interval_seconds``, whichever comes first.
+
+When the database cannot keep up and the queue is full, new records are
+dropped (and counted) instead of slowing searches down. ``close()`` writes
+whatever is still queued on graceful shutdown.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from airweave.core.protocols.metrics import SearchQueryWriterMetrics
+from airweave.search.protocols import SearchQueryWriterProtocol
+
+logger = logging.getLogger(__name__)
+
+
+class SearchQueryWriter(SearchQueryWriterProtocol):
+    """Bounded queue of search query rows with size- and time-based batch inserts.
+
+    Only one batch is written at a time, so a slow database lets the queue
+    grow (up to ``max_queue_size``) rather than piling up connections.
+
+    The background task is started lazily on the first ``submit()`` call so
+    no external wiring is needed beyond calling ``close()`` on shutdown.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 10_000,
+        batch_size: int = 200,
+        flush_interval_seconds: float = 1.0,
+        metrics: Optional[SearchQueryWriterMetrics] = None,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            max_queue_size: Records kept waiting before new ones are dropped.
+            batch_size: Rows per INSERT; a full batch triggers an immediate write.
+            flush_interval_seconds: Max time a record waits before it is written.
+            metrics: Optional flush / drop / queue depth instrumentation.
+        """
+        self._max_queue_size = max_queue_size
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = flush_interval_seconds
+        self._metrics = metrics
+
+        self._pending: Deque[Dict[str, Any]] = deque()
+        self._batch_ready = asyncio.Event()
+        self._write_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._closed = False
+        self._overloaded = False
+
+    @property
+    def queue_depth(self) -> int:
+        """Records waiting to be written."""
+        return len(self._pending)
+
+    def submit(self, row: Dict[str, Any]) -> bool:
+        """Queue one ``search_queries`` row without waiting on the database."""
+        if len(self._pending) >= self._max_queue_size:
+            if not self._overloaded:
+                self._overloaded = True
+                logger.warning(
+                    "Search query queue full (%d records); dropping analytics records",
+                    self._max_queue_size,
+                )
+            if self._metrics is not None:
+                self._metrics.inc_dropped("queue_full", 1)
+            return False
+
+        self._pending.append(row)
+        self._report_depth()
+        if len(self._pending) >= self._batch_size:
+            self._batch_ready.set()
+        self._ensure_flush_task()
+        return True
+
+    async def flush(self) -> None:
+        """Write every queued record in batches of ``batch_size``."""
+        async with self._write_lock:
+            while self._pending:
+                count = min(self._batch_size, len(self._pending))
+                batch = [self._pending.popleft() for _ in range(count)]
+                self._report_depth()
+                await self._write_batch(batch)
+            self._overloaded = False
+
+    async def close(self) -> None:
+        """Stop the background task, then write what is still queued."""
+        self._closed = True
+        task, self._flush_task = self._flush_task, None
+        if task is not None and not task.done():
+            self._batch_ready.set()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _ensure_flush_task(self) -> None:
+        """Lazily start the background flush task."""
+        if self._closed or (self._flush_task is not None and not self._flush_task.done()):
+            return
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        logger.info(
+            "SearchQueryWriter started (batch_size=%d, interval=%ss, max_queue=%d)",
+            self._batch_size,
+            self._flush_interval,
+            self._max_queue_size,
+        )
+
+    async def _flush_loop(self) -> None:
+        """Write queued records whenever a batch fills up or the interval elapses.
+
+        On cancellation (e.g. event-loop shutdown) does a final flush so
+        queued records are not lost.
+        """
+        try:
+            while not self._closed:
+                try:
+                    await asyncio.wait_for(self._batch_ready.wait(), timeout=self._flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._batch_ready.clear()
+                try:
+                    await self.flush()
+                except Exception:
+                    logger.error("Search query flush failed", exc_info=True)
+        except asyncio.CancelledError:
+            try:
+                await self.flush()
+            except Exception:
+                logger.error("Search query final flush failed on shutdown", exc_info=True)
+            raise
+
+    async def _write_batch(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert one batch; failures are logged and counted, never raised."""
+        from airweave import crud
+        from airweave.db.session import get_db_context
+
+        start = time.perf_counter()
+        status = "success"
+        try:
+            async with get_db_context() as db:
+                await crud.search_query.create_many(db, rows=rows)
+            logger.debug("Persisted %d search queries", len(rows))
+        except Exception:
+            status = "error"
+            logger.error("Failed to persist %d search queries", len(rows), exc_info=True)
+            if self._metrics is not None:
+                self._metrics.inc_dropped("write_failed", len(rows))
+        finally:
+            if self._metrics is not None:
+                self._metrics.observe_flush(status, len(rows), time.perf_counter() - start)
+
+    def _report_depth(self) -> None:
+        if self._metrics is not None:
+            self._metrics.set_queue_depth(len(self._pending))
@@ -0,0 +1,99 @@
+"""Search result caching: request fingerprints and cached payloads.
+
+A cache key combines the collection, its current data version, and a
+fingerprint of everything that changes the answer: the normalized search
+request, the destination and the caller's resolved access principals.
+Syncs bump the data version when they write, so stale entries are never
+looked up again and simply expire.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from pydantic import ValidationError
+
+from airweave.schemas.search import SearchRequest, SearchResponse
+
+# Bump when the payload layout or the key fingerprint changes.
+CACHE_FORMAT_VERSION = 1
+
+
+def build_cache_key(
+    readable_collection_id: str,
+    data_version: int,
+    search_request: SearchRequest,
+    destination: Optional[str],
+    access_principals: Optional[Iterable[str]],
+) -> str:
+    """Build the cache key for one search.
+
+    Args:
+        readable_collection_id: Collection being searched.
+        data_version: Current data version of the collection.
+        search_request: The request as received (before filter injection).
+        destination: Destination override, if any.
+        access_principals: Resolved principals of the caller, or None when
+            the collection is not access-controlled.
+
+    Returns:
+        Key of the form ``{collection}:v{version}:{format}:{digest}``.
+    """
+    request = search_request.model_dump(mode="json", exclude_none=True)
+    request["query"] = " ".join(search_request.query.split())
+    fingerprint = json.dumps(
+        {
+            "request": request,
+            "destination": destination,
+            "principals": sorted(access_principals) if access_principals is not None else None,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    digest = hashlib.sha256(fingerprint.encode()).hexdigest()
+    return f"{readable_collection_id}:v{data_version}:{CACHE_FORMAT_VERSION}:{digest}"
+
+
+@dataclass
+class CachedSearch:
+    """A search response plus what is needed to account for a cache hit.
+
+    Attributes:
+        response: The response returned to the caller.
+        search_query: Persistable query fields (``search_helpers.search_query_fields``).
+        search_config: Executed configuration reported to analytics.
+        events: Streaming events emitted while computing the response, or None
+            if the search was not streamed.
+    """
+
+    response: SearchResponse
+    search_query: Dict[str, Any]
+    search_config: Dict[str, Any]
+    events: Optional[List[Dict[str, Any]]] = field(default=None)
+
+    def dumps(self) -> str:
+        """Serialize to the opaque string stored by SearchResultCache adapters."""
+        return json.dumps(
+            {
+                "response": self.response.model_dump(mode="json"),
+                "search_query": self.search_query,
+                "search_config": self.search_config,
+                "events": self.events,
+            },
+            default=str,
+        )
+
+    @classmethod
+    def loads(cls, payload: str) -> Optional["CachedSearch"]:
+        """Deserialize a payload, returning None if it is unreadable."""
+        try:
+            data = json.loads(payload)
+            return cls(
+                response=SearchResponse.model_validate(data["response"]),
+                search_query=data["search_query"],
+                search_config=data["search_config"],
+                events=data.get("events"),
+            )
+        except (ValueError, KeyError, TypeError, ValidationError):
+            return None
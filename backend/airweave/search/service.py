@@ -6,22 +6,27 @@ and executed in a flexible pipeline.
 """
 
 import time
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, List, Literal, Optional
 from uuid import UUID
 
 from sqlalchemy import select as sa_select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import airweave.core.container as _container_module
 from airweave import crud
 from airweave.api.context import ApiContext
 from airweave.core.exceptions import NotFoundException
+from airweave.core.protocols.cache import SearchResultCache
 from airweave.core.protocols.pubsub import PubSub
 from airweave.domains.embedders.protocols import DenseEmbedderProtocol, SparseEmbedderProtocol
 from airweave.models.source_connection import SourceConnection
+from airweave.platform.access_control.broker import access_broker
 from airweave.schemas.search import SearchRequest, SearchResponse
+from airweave.search.emitter import EventEmitter
 from airweave.search.factory import factory
 from airweave.search.helpers import search_helpers
 from airweave.search.orchestrator import orchestrator
+from airweave.search.result_cache import CachedSearch, build_cache_key
 
 # Type alias for destination
 SearchDestination = Literal["qdrant", "vespa"]
@@ -70,6 +75,22 @@ class SearchService:
         if not collection:
             raise NotFoundException(message=f"Collection '{readable_collection_id}' not found")
 
+        # Look up the result cache before the request is mutated below
+        result_cache = self._get_result_cache()
+        cache_key = None
+        if result_cache is not None:
+            cache_key = await self._result_cache_key(
+                result_cache, db, readable_collection_id, search_request, destination_override, ctx
+            )
+        if cache_key is not None:
+            payload = await result_cache.get(cache_key)
+            cached = CachedSearch.loads(payload) if payload is not None else None
+            # A streamed request needs the recorded events to replay
+            if cached is not None and (not stream or cached.events is not None):
+                return await self._serve_cached(
+                    cached, request_id, readable_collection_id, stream, ctx, pubsub, start_time
+                )
+
         # Inject sync_id filter when source_connection_ids are specified
         if search_request.source_connection_ids:
             await self._inject_sync_id_filter(db, search_request, ctx)
@@ -87,6 +108,7 @@ class SearchService:
             dense_embedder=dense_embedder,
             sparse_embedder=sparse_embedder,
             destination_override=destination_override,
+            record_events=cache_key is not None and stream,
         )
 
         ctx.logger.debug("Executing search")
@@ -94,6 +116,9 @@ class SearchService:
 
         # Handle any federated source auth failures (mark connections as unauthenticated)
         await self._handle_failed_federated_auth(db, state, ctx)
+        if state.get("failed_federated_auth"):
+            # The cached plan holds the failing source handles; rebuild it next time
+            self._invalidate_search_plan(readable_collection_id)
 
         duration_ms = (time.monotonic() - start_time) * 1000
         ctx.logger.debug(f"Search completed in {duration_ms:.2f}ms")
@@ -130,16 +155,28 @@ class SearchService:
             **search_config,
         )
 
-        # Persist search data to database
-        # TODO: use background task to persist search data, not blocking the response
-        await search_helpers.persist_search_data(
-            db=db,
+        # Queue search data for the background writer (not on the response path)
+        search_helpers.record_search_data(
             search_context=search_context,
             search_response=response,
             ctx=ctx,
             duration_ms=duration_ms,
         )
 
+        # Federated sources are queried live, so their results are never cached
+        if (
+            cache_key is not None
+            and search_context.federated_search is None
+            and not state.get("failed_federated_auth")
+        ):
+            cached = CachedSearch(
+                response=response,
+                search_query=search_helpers.search_query_fields(search_context),
+                search_config=search_config,
+                events=search_context.emitter.recorded,
+            )
+            await result_cache.set(cache_key, cached.dumps())
+
         return response
 
     async def search_admin(
@@ -218,6 +255,14 @@ class SearchService:
             f"{len(response.results)} results in {duration_ms:.2f}ms"
         )
 
+        search_helpers.record_search_data(
+            search_context=search_context,
+            search_response=response,
+            ctx=ctx,
+            duration_ms=duration_ms,
+            organization_id=collection.organization_id,
+        )
+
         return response
 
     async def search_as_user(
@@ -323,8 +368,110 @@ class SearchService:
             f"{len(response.results)} results in {duration_ms:.2f}ms"
         )
 
+        search_helpers.record_search_data(
+            search_context=search_context,
+            search_response=response,
+            ctx=ctx,
+            duration_ms=duration_ms,
+            organization_id=collection.organization_id,
+        )
+
         return response
 
+    @staticmethod
+    def _get_result_cache() -> Optional[SearchResultCache]:
+        """Return the search result cache from the container, if enabled."""
+        container = _container_module.container
+        return container.search_result_cache if container else None
+
+    @staticmethod
+    def _invalidate_search_plan(readable_collection_id: str) -> None:
+        """Drop the collection's cached search plans, if plan caching is enabled."""
+        container = _container_module.container
+        plan_cache = container.search_plan_cache if container else None
+        if plan_cache is not None:
+            plan_cache.invalidate(readable_collection_id)
+
+    async def _result_cache_key(
+        self,
+        result_cache: SearchResultCache,
+        db: AsyncSession,
+        readable_collection_id: str,
+        search_request: SearchRequest,
+        destination_override: Optional[SearchDestination],
+        ctx: ApiContext,
+    ) -> Optional[str]:
+        """Build the result cache key, or None if the cache must be bypassed.
+
+        The key includes the caller's resolved access principals, mirroring
+        the AccessControlFilter the factory builds for logged-in users.
+        """
+        data_version = await result_cache.get_data_version(readable_collection_id)
+        if data_version is None:
+            return None
+
+        principals = None
+        if ctx.user is not None:
+            access_context = await access_broker.resolve_access_context_for_collection(
+                db=db,
+                user_principal=ctx.user.email,
+                readable_collection_id=readable_collection_id,
+                organization_id=ctx.organization.id,
+            )
+            if access_context is not None:
+                principals = access_context.all_principals
+
+        return build_cache_key(
+            readable_collection_id,
+            data_version,
+            search_request,
+            destination_override,
+            principals,
+        )
+
+    async def _serve_cached(
+        self,
+        cached: CachedSearch,
+        request_id: str,
+        readable_collection_id: str,
+        stream: bool,
+        ctx: ApiContext,
+        pubsub: PubSub,
+        start_time: float,
+    ) -> SearchResponse:
+        """Return a cached response, replaying its events and recording analytics."""
+        if stream:
+            emitter = EventEmitter(request_id=request_id, stream=True, pubsub=pubsub)
+            await emitter.replay(cached.events or [])
+
+        duration_ms = (time.monotonic() - start_time) * 1000
+        ctx.logger.debug(f"Search served from result cache in {duration_ms:.2f}ms")
+
+        from airweave.analytics.search_analytics import track_search_completion
+
+        track_search_completion(
+            ctx=ctx,
+            query=cached.search_query["query_text"],
+            collection_slug=readable_collection_id,
+            duration_ms=duration_ms,
+            results=cached.response.results,
+            completion=cached.response.completion,
+            search_type="streaming" if stream else "regular",
+            status="success",
+            cache_hit=True,
+            **cached.search_config,
+        )
+
+        search_helpers.record_search_query(
+            query_fields=cached.search_query,
+            is_streaming=stream,
+            results_count=len(cached.response.results),
+            ctx=ctx,
+            duration_ms=duration_ms,
+        )
+
+        return cached.response
+
     async def _inject_sync_id_filter(
         self,
         db: AsyncSession,
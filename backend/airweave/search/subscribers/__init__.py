@@ -0,0 +1,6 @@
+"""Search event subscribers."""
+
+from airweave.search.subscribers.plan_cache_invalidator import SearchPlanCacheInvalidator
+from airweave.search.subscribers.result_cache_invalidator import SearchResultCacheInvalidator
+
+__all__ = ["SearchPlanCacheInvalidator", "SearchResultCacheInvalidator"]
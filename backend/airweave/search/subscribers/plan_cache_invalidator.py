@@ -0,0 +1,40 @@
+"""Search plan cache invalidator — EventBus subscriber for collection setup changes."""
+
+import logging
+from typing import List
+
+from airweave.core.events.base import DomainEvent
+from airweave.core.events.collection import CollectionLifecycleEvent
+from airweave.core.events.source_connection import SourceConnectionLifecycleEvent
+from airweave.core.protocols.event_bus import EventSubscriber
+from airweave.search.protocols import SearchPlanCacheProtocol
+
+logger = logging.getLogger(__name__)
+
+
+class SearchPlanCacheInvalidator(EventSubscriber):
+    """Drops cached search plans when a collection or its source connections change.
+
+    Any collection or source connection lifecycle event may change which
+    sources a search fans out to (or their credentials), so every event
+    type invalidates the collection's plans.
+    """
+
+    EVENT_PATTERNS: List[str] = ["collection.*", "source_connection.*"]
+
+    def __init__(self, cache: SearchPlanCacheProtocol) -> None:
+        """Initialize with the search plan cache to invalidate."""
+        self._cache = cache
+
+    async def handle(self, event: DomainEvent) -> None:
+        """Invalidate the plans of the collection the event touched."""
+        try:
+            if isinstance(event, (CollectionLifecycleEvent, SourceConnectionLifecycleEvent)):
+                self._cache.invalidate(event.collection_readable_id)
+        except Exception as e:
+            logger.error(
+                "SearchPlanCacheInvalidator failed for org %s: %s",
+                event.organization_id,
+                e,
+                exc_info=True,
+            )
@@ -0,0 +1,67 @@
+"""Search result cache invalidator — EventBus subscriber for data-changing events."""
+
+import logging
+from typing import List
+
+from airweave.core.events.base import DomainEvent
+from airweave.core.events.collection import CollectionLifecycleEvent
+from airweave.core.events.enums import (
+    CollectionEventType,
+    SourceConnectionEventType,
+    SyncEventType,
+)
+from airweave.core.events.source_connection import SourceConnectionLifecycleEvent
+from airweave.core.events.sync import SyncLifecycleEvent
+from airweave.core.protocols.cache import SearchResultCache
+from airweave.core.protocols.event_bus import EventSubscriber
+
+logger = logging.getLogger(__name__)
+
+
+class SearchResultCacheInvalidator(EventSubscriber):
+    """Bumps a collection's search data version when its indexed data changes.
+
+    Cached search responses are keyed on the data version, so a bump makes
+    every entry for the collection unreachable; they then age out via TTL.
+    Completed syncs only bump when they wrote something. Failed and
+    cancelled syncs always bump, since they may have written partially.
+    """
+
+    EVENT_PATTERNS: List[str] = ["sync.*", "collection.deleted", "source_connection.deleted"]
+
+    _PARTIAL_SYNC_TYPES = frozenset({SyncEventType.FAILED, SyncEventType.CANCELLED})
+
+    def __init__(self, cache: SearchResultCache) -> None:
+        """Initialize with the search result cache to invalidate."""
+        self._cache = cache
+
+    async def handle(self, event: DomainEvent) -> None:
+        """Bump the data version of the collection the event touched."""
+        try:
+            readable_id = self._changed_collection(event)
+            if readable_id:
+                await self._cache.bump_data_version(readable_id)
+        except Exception as e:
+            logger.error(
+                "SearchResultCacheInvalidator failed for org %s: %s",
+                event.organization_id,
+                e,
+                exc_info=True,
+            )
+
+    def _changed_collection(self, event: DomainEvent) -> str:
+        """Return the readable ID of the collection whose data changed, or ''."""
+        if isinstance(event, SyncLifecycleEvent):
+            if event.event_type in self._PARTIAL_SYNC_TYPES:
+                return event.collection_readable_id
+            if event.event_type == SyncEventType.COMPLETED and (
+                event.entities_inserted + event.entities_updated + event.entities_deleted > 0
+            ):
+                return event.collection_readable_id
+        elif isinstance(event, CollectionLifecycleEvent):
+            if event.event_type == CollectionEventType.DELETED:
+                return event.collection_readable_id
+        elif isinstance(event, SourceConnectionLifecycleEvent):
+            if event.event_type == SourceConnectionEventType.DELETED:
+                return event.collection_readable_id
+        return ""
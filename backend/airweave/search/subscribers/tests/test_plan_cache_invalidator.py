@@ -0,0 +1,86 @@
+"""Unit tests for SearchPlanCacheInvalidator."""
+
+from uuid import UUID, uuid4
+
+import pytest
+
+from airweave.core.events.collection import CollectionLifecycleEvent
+from airweave.core.events.source_connection import SourceConnectionLifecycleEvent
+from airweave.core.events.sync import SyncLifecycleEvent
+from airweave.search.plan_cache import CollectionSearchPlan, SearchPlanCache, SearchPlanKey
+from airweave.search.subscribers import SearchPlanCacheInvalidator
+
+ORG_ID = UUID("00000000-0000-0000-0000-000000000001")
+COLLECTION = "test-col"
+
+
+def _make_invalidator():
+    cache = SearchPlanCache(max_entries=10)
+    key = SearchPlanKey(COLLECTION, ORG_ID, False)
+    cache.set(key, CollectionSearchPlan(collection_id=uuid4(), organization_id=ORG_ID), 0)
+    return SearchPlanCacheInvalidator(cache=cache), cache, key
+
+
+class TestSearchPlanCacheInvalidator:
+    @pytest.mark.asyncio
+    async def test_source_connection_events_drop_plans(self):
+        for make in (
+            SourceConnectionLifecycleEvent.created,
+            SourceConnectionLifecycleEvent.auth_completed,
+            SourceConnectionLifecycleEvent.deleted,
+        ):
+            invalidator, cache, key = _make_invalidator()
+
+            await invalidator.handle(
+                make(
+                    organization_id=ORG_ID,
+                    source_connection_id=uuid4(),
+                    source_type="stub",
+                    collection_readable_id=COLLECTION,
+                )
+            )
+
+            assert cache.get(key) is None
+
+    @pytest.mark.asyncio
+    async def test_collection_events_drop_plans(self):
+        for make in (CollectionLifecycleEvent.updated, CollectionLifecycleEvent.deleted):
+            invalidator, cache, key = _make_invalidator()
+
+            await invalidator.handle(
+                make(
+                    organization_id=ORG_ID,
+                    collection_id=uuid4(),
+                    collection_name="test",
+                    collection_readable_id=COLLECTION,
+                )
+            )
+
+            assert cache.get(key) is None
+
+    @pytest.mark.asyncio
+    async def test_other_collections_and_events_are_untouched(self):
+        invalidator, cache, key = _make_invalidator()
+
+        await invalidator.handle(
+            CollectionLifecycleEvent.updated(
+                organization_id=ORG_ID,
+                collection_id=uuid4(),
+                collection_name="other",
+                collection_readable_id="other-col",
+            )
+        )
+        await invalidator.handle(
+            SyncLifecycleEvent.running(
+                organization_id=ORG_ID,
+                sync_id=uuid4(),
+                sync_job_id=uuid4(),
+                collection_id=uuid4(),
+                source_connection_id=uuid4(),
+                source_type="stub",
+                collection_name="test",
+                collection_readable_id=COLLECTION,
+            )
+        )
+
+        assert cache.get(key) is not None
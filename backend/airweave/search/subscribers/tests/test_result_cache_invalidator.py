@@ -0,0 +1,90 @@
+"""Unit tests for SearchResultCacheInvalidator."""
+
+from uuid import UUID, uuid4
+
+import pytest
+
+from airweave.adapters.cache.search_result import InMemorySearchResultCache
+from airweave.core.events.collection import CollectionLifecycleEvent
+from airweave.core.events.source_connection import SourceConnectionLifecycleEvent
+from airweave.core.events.sync import SyncLifecycleEvent
+from airweave.search.subscribers import SearchResultCacheInvalidator
+
+ORG_ID = UUID("00000000-0000-0000-0000-000000000001")
+COLLECTION = "test-col"
+
+
+def _sync_kwargs() -> dict:
+    return dict(
+        organization_id=ORG_ID,
+        sync_id=uuid4(),
+        sync_job_id=uuid4(),
+        collection_id=uuid4(),
+        source_connection_id=uuid4(),
+        source_type="stub",
+        collection_name="test",
+        collection_readable_id=COLLECTION,
+    )
+
+
+def _make_invalidator():
+    cache = InMemorySearchResultCache(max_entries=10)
+    return SearchResultCacheInvalidator(cache=cache), cache
+
+
+class TestSearchResultCacheInvalidator:
+    @pytest.mark.asyncio
+    async def test_completed_sync_with_writes_bumps_version(self):
+        invalidator, cache = _make_invalidator()
+
+        await invalidator.handle(SyncLifecycleEvent.completed(**_sync_kwargs(), entities_updated=3))
+
+        assert await cache.get_data_version(COLLECTION) == 1
+
+    @pytest.mark.asyncio
+    async def test_completed_sync_without_writes_keeps_version(self):
+        invalidator, cache = _make_invalidator()
+
+        await invalidator.handle(SyncLifecycleEvent.completed(**_sync_kwargs(), entities_skipped=7))
+
+        assert await cache.get_data_version(COLLECTION) == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_and_cancelled_syncs_bump_version(self):
+        invalidator, cache = _make_invalidator()
+
+        await invalidator.handle(SyncLifecycleEvent.failed(**_sync_kwargs(), error="boom"))
+        await invalidator.handle(SyncLifecycleEvent.cancelled(**_sync_kwargs()))
+
+        assert await cache.get_data_version(COLLECTION) == 2
+
+    @pytest.mark.asyncio
+    async def test_running_sync_keeps_version(self):
+        invalidator, cache = _make_invalidator()
+
+        await invalidator.handle(SyncLifecycleEvent.running(**_sync_kwargs()))
+
+        assert await cache.get_data_version(COLLECTION) == 0
+
+    @pytest.mark.asyncio
+    async def test_deletions_bump_version(self):
+        invalidator, cache = _make_invalidator()
+
+        await invalidator.handle(
+            CollectionLifecycleEvent.deleted(
+                organization_id=ORG_ID,
+                collection_id=uuid4(),
+                collection_name="test",
+                collection_readable_id=COLLECTION,
+            )
+        )
+        await invalidator.handle(
+            SourceConnectionLifecycleEvent.deleted(
+                organization_id=ORG_ID,
+                source_connection_id=uuid4(),
+                source_type="stub",
+                collection_readable_id=COLLECTION,
+            )
+        )
+
+        assert await cache.get_data_version(COLLECTION) == 2
@@ -16,6 +16,8 @@ if TYPE_CHECKING:
         FakeAgenticSearchMetrics,
         FakeDbPoolMetrics,
         FakeHttpMetrics,
+        FakeSearchQueryWriterMetrics,
+        FakeVespaQueryMetrics,
     )
     from airweave.core.fakes.metrics_service import FakeMetricsService
     from airweave.core.health.fakes import FakeHealthService
@@ -135,6 +137,22 @@ def fake_db_pool_metrics() -> FakeDbPoolMetrics:
     return FakeDbPoolMetrics()
 
 
+@pytest.fixture
+def fake_vespa_query_metrics() -> FakeVespaQueryMetrics:
+    """Fake VespaQueryMetrics that records calls in memory."""
+    from airweave.adapters.metrics import FakeVespaQueryMetrics
+
+    return FakeVespaQueryMetrics()
+
+
+@pytest.fixture
+def fake_search_query_writer_metrics() -> FakeSearchQueryWriterMetrics:
+    """Fake SearchQueryWriterMetrics that records calls in memory."""
+    from airweave.adapters.metrics import FakeSearchQueryWriterMetrics
+
+    return FakeSearchQueryWriterMetrics()
+
+
 @pytest.fixture
 def fake_source_service():
     """Fake SourceService that returns canned source schemas."""
@@ -180,6 +198,8 @@ def fake_metrics_service(
     fake_http_metrics,
     fake_agentic_search_metrics,
     fake_db_pool_metrics,
+    fake_vespa_query_metrics,
+    fake_search_query_writer_metrics,
 ) -> FakeMetricsService:
     """FakeMetricsService wrapping individual metric fakes."""
     from airweave.core.fakes.metrics_service import FakeMetricsService
@@ -188,6 +208,8 @@ def fake_metrics_service(
         http=fake_http_metrics,
         agentic_search=fake_agentic_search_metrics,
         db_pool=fake_db_pool_metrics,
+        vespa_query=fake_vespa_query_metrics,
+        search_query_writer=fake_search_query_writer_metrics,
     )
 
 
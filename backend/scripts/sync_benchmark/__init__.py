@@ -0,0 +1,4 @@
+"""End-to-end sync throughput benchmark built on StubSource.
+
+Run ``python -m scripts.sync_benchmark --help`` from the backend directory.
+"""
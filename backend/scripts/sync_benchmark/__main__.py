@@ -0,0 +1,83 @@
+"""Run sync throughput benchmarks and emit a JSON report.
+
+Usage:
+    # All scenarios with the production chunkers
+    python -m scripts.sync_benchmark --output sync_benchmark.json
+
+    # Quick CI run without chunking models, 50 ms simulated Postgres latency
+    python -m scripts.sync_benchmark --scenario small --scenario incremental
+        --entities 500 --chunker passthrough --db-latency-ms 50
+
+Settings are read from the environment like the backend itself (.env or
+exported variables), but no database, Vespa or embedding API is contacted.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+
+from .harness import BenchmarkOptions, run_benchmark
+from .scenarios import SCENARIOS
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="Scenario to run (repeatable, default: all)",
+    )
+    parser.add_argument("--entities", type=int, help="Entities per pass (default: per scenario)")
+    parser.add_argument("--seed", type=int, default=42, help="StubSource seed")
+    parser.add_argument(
+        "--chunker",
+        choices=("real", "passthrough"),
+        default="real",
+        help="Production chunkers, or model-free fixed windows for offline runs",
+    )
+    parser.add_argument("--db-latency-ms", type=float, default=0.0)
+    parser.add_argument("--destination-latency-ms", type=float, default=0.0)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--embedding-dimensions", type=int, default=1536)
+    parser.add_argument("--log-level", default="WARNING")
+    parser.add_argument("--output", "-o", help="Write the JSON report here instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """CLI entry point."""
+    args = _parse_args(argv)
+    options = BenchmarkOptions(
+        entity_count=args.entities,
+        seed=args.seed,
+        chunker=args.chunker,
+        db_latency_ms=args.db_latency_ms,
+        destination_latency_ms=args.destination_latency_ms,
+        embedding_dimensions=args.embedding_dimensions,
+        batch_size=args.batch_size,
+        log_level=logging.getLevelName(args.log_level.upper()),
+    )
+    scenarios = [SCENARIOS[name] for name in (args.scenario or SCENARIOS)]
+
+    report = asyncio.run(run_benchmark(scenarios, options))
+
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(payload + "\n")
+        for result in report["scenarios"]:
+            print(
+                f"{result['scenario']:<12} {result['entities_per_sec']:>10.1f} entities/s  "
+                f"peak RSS {result['memory']['peak_rss_mb']:.0f} MiB",
+                file=sys.stderr,
+            )
+    else:
+        print(payload)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,383 @@
+"""Wire a StubSource sync end to end and measure it.
+
+The orchestrator, entity pipeline, action resolver, handlers, chunk/embed
+processor and Vespa transformer are the production classes; only the edges
+(Postgres, Vespa HTTP, embedding APIs, job bookkeeping) are faked. See
+``fakes.py`` for what is replaced and how.
+"""
+
+import asyncio
+import logging
+import platform
+import shutil
+import time
+import uuid
+from contextlib import ExitStack
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+from unittest.mock import AsyncMock, patch
+
+import airweave.core.container  # noqa: F401  (resolves the sources registry import cycle)
+from airweave import crud, schemas
+from airweave.adapters.event_bus.in_memory import InMemoryEventBus
+from airweave.core.logging import LoggerConfigurator
+from airweave.core.shared_models import ConnectionStatus, IntegrationType, SyncStatus
+from airweave.domains.arf.service import ArfService
+from airweave.domains.embedders.fakes.embedder import FakeDenseEmbedder, FakeSparseEmbedder
+from airweave.domains.entities.registry import EntityDefinitionRegistry
+from airweave.domains.storage.fakes import FakeStorageBackend
+from airweave.domains.usage.fakes.ledger import FakeUsageLedger
+from airweave.domains.usage.fakes.limit_checker import FakeUsageLimitChecker
+from airweave.platform.chunkers.code import CodeChunker
+from airweave.platform.chunkers.semantic import SemanticChunker
+from airweave.platform.contexts import SyncContext
+from airweave.platform.contexts.runtime import SyncRuntime
+from airweave.platform.converters import initialize_converters
+from airweave.platform.destinations.vespa.destination import VespaDestination
+from airweave.platform.sources.stub import StubSource
+from airweave.platform.sync.access_control_pipeline import AccessControlPipeline
+from airweave.platform.sync.actions import (
+    ACActionDispatcher,
+    ACActionResolver,
+    EntityActionResolver,
+    EntityDispatcherBuilder,
+)
+from airweave.platform.sync.config import SyncConfig
+from airweave.platform.sync.cursor import SyncCursor
+from airweave.platform.sync.entity_pipeline import EntityPipeline
+from airweave.platform.sync.handlers import (
+    ACPostgresHandler,
+    ArfHandler,
+    DestinationHandler,
+    EntityPostgresHandler,
+)
+from airweave.platform.sync.orchestrator import SyncOrchestrator
+from airweave.platform.sync.pipeline.acl_membership_tracker import ACLMembershipTracker
+from airweave.platform.sync.pipeline.entity_tracker import EntityTracker
+from airweave.platform.sync.pipeline.text_builder import text_builder
+from airweave.platform.sync.processors import ChunkEmbedProcessor
+from airweave.platform.sync.stream import AsyncSourceStream
+from airweave.platform.sync.worker_pool import AsyncWorkerPool
+
+from .fakes import (
+    InMemoryEntityCrud,
+    build_benchmark_destination,
+    fake_db_context,
+    passthrough_chunk_batch,
+)
+from .metrics import RssSampler, StageRecorder
+from .scenarios import Scenario, with_changes
+
+# Modules that bind get_db_context at import time
+_DB_CONTEXT_TARGETS = (
+    "airweave.db.session.get_db_context",
+    "airweave.platform.sync.actions.entity.resolver.get_db_context",
+    "airweave.platform.sync.handlers.entity_postgres.get_db_context",
+    "airweave.platform.sync.orchestrator.get_db_context",
+)
+
+
+@dataclass
+class BenchmarkOptions:
+    """Knobs shared by all scenarios of one benchmark run.
+
+    Attributes:
+        entity_count: Entities per pass (None = scenario default).
+        seed: StubSource seed.
+        chunker: ``"real"`` for the production chunkers, ``"passthrough"`` for
+            fixed-size windows when chunking models are unavailable.
+        db_latency_ms: Simulated latency of each CRUD call.
+        destination_latency_ms: Simulated latency of each Vespa feed/delete.
+        embedding_dimensions: Dense vector size produced by the fake embedder.
+        batch_size: Orchestrator micro-batch size.
+        log_level: Level for the sync loggers (the pipeline is chatty at INFO).
+    """
+
+    entity_count: Optional[int] = None
+    seed: int = 42
+    chunker: str = "real"
+    db_latency_ms: float = 0.0
+    destination_latency_ms: float = 0.0
+    embedding_dimensions: int = 1536
+    batch_size: int = 64
+    log_level: int = logging.WARNING
+
+
+def _stages() -> List[tuple]:
+    """Pipeline stages to time, as (name, owner, async attribute)."""
+    return [
+        ("pipeline.process", EntityPipeline, "process"),
+        ("pipeline.track_and_dedupe", EntityPipeline, "_track_and_dedupe"),
+        ("pipeline.prepare_entities", EntityPipeline, "_prepare_entities"),
+        ("pipeline.orphan_cleanup", EntityPipeline, "cleanup_orphaned_entities"),
+        ("resolver.resolve", EntityActionResolver, "resolve"),
+        ("handler.destination", DestinationHandler, "handle_batch"),
+        ("handler.arf", ArfHandler, "handle_batch"),
+        ("handler.postgres", EntityPostgresHandler, "handle_batch"),
+        ("processor.text_build", text_builder, "build_for_batch"),
+        ("processor.chunk", ChunkEmbedProcessor, "_chunk_entities"),
+        ("processor.embed", ChunkEmbedProcessor, "_embed_entities"),
+        ("destination.bulk_insert", VespaDestination, "bulk_insert"),
+    ]
+
+
+async def _discard_event(event: Any) -> None:
+    pass
+
+
+def _entity_map() -> Dict[type, str]:
+    registry = EntityDefinitionRegistry()
+    registry.build()
+    return {entry.entity_class_ref: entry.short_name for entry in registry.list_all()}
+
+
+class _SyncFixture:
+    """Identity and long-lived fakes shared by all passes of one scenario."""
+
+    def __init__(self, options: BenchmarkOptions) -> None:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        self.options = options
+        self.organization = schemas.Organization(
+            id=uuid.uuid4(), name="Sync Benchmark", created_at=now, modified_at=now
+        )
+        self.collection = schemas.CollectionRecord(
+            id=uuid.uuid4(),
+            name="Sync Benchmark",
+            readable_id=f"sync-benchmark-{uuid.uuid4().hex[:8]}",
+            vector_db_deployment_metadata_id=uuid.uuid4(),
+            organization_id=self.organization.id,
+            created_at=now,
+            modified_at=now,
+        )
+        self.connection = schemas.Connection(
+            id=uuid.uuid4(),
+            name="Stub",
+            readable_id=f"stub-{uuid.uuid4().hex[:8]}",
+            integration_type=IntegrationType.SOURCE,
+            status=ConnectionStatus.ACTIVE,
+            short_name="stub",
+            created_at=now,
+            modified_at=now,
+        )
+        self.source_connection_id = uuid.uuid4()
+        self.sync = schemas.Sync(
+            id=uuid.uuid4(),
+            name="Sync Benchmark",
+            source_connection_id=self.source_connection_id,
+            destination_connection_ids=[],
+            status=SyncStatus.ACTIVE,
+            organization_id=self.organization.id,
+            created_at=now,
+            modified_at=now,
+        )
+        self.entity_map = _entity_map()
+        self.entity_crud = InMemoryEntityCrud(latency_ms=options.db_latency_ms)
+        self.arf_service = ArfService(storage=FakeStorageBackend())
+        self.logger = LoggerConfigurator.configure_logger(
+            "airweave.sync_benchmark", dimensions={"sync_id": str(self.sync.id)}
+        )
+        self.logger.logger.setLevel(options.log_level)
+        self.destination, self.vespa_client = build_benchmark_destination(
+            self.collection.id,
+            self.organization.id,
+            self.logger,
+            latency_ms=options.destination_latency_ms,
+        )
+
+    async def build_orchestrator(self, source: StubSource, change_percent: Optional[float]):
+        """Assemble a fresh orchestrator for one pass, mirroring SyncFactory."""
+        sync_job = schemas.SyncJob(
+            id=uuid.uuid4(), sync_id=self.sync.id, organization_id=self.organization.id
+        )
+        config = SyncConfig()
+        config.behavior.skip_guardrails = True
+
+        context = SyncContext(
+            self.organization,
+            logger=self.logger,
+            sync_id=self.sync.id,
+            sync_job_id=sync_job.id,
+            collection_id=self.collection.id,
+            source_connection_id=self.source_connection_id,
+            sync=self.sync,
+            sync_job=sync_job,
+            collection=self.collection,
+            connection=self.connection,
+            execution_config=config,
+            batch_size=self.options.batch_size,
+            entity_map=self.entity_map,
+            source_short_name="stub",
+        )
+        cursor = SyncCursor(sync_id=self.sync.id)
+        source.set_logger(self.logger)
+        source.set_cursor(cursor)
+
+        tracker = EntityTracker(job_id=sync_job.id, sync_id=self.sync.id, logger=self.logger)
+        event_bus = InMemoryEventBus()
+        # Production syncs always have progress subscribers; stand in with a no-op
+        event_bus.subscribe("*", _discard_event)
+        runtime = SyncRuntime(
+            source=source,
+            cursor=cursor,
+            entity_tracker=tracker,
+            event_bus=event_bus,
+            usage_checker=FakeUsageLimitChecker(),
+            dense_embedder=FakeDenseEmbedder(dimensions=self.options.embedding_dimensions),
+            sparse_embedder=FakeSparseEmbedder(),
+            destinations=[self.destination],
+        )
+
+        dispatcher = EntityDispatcherBuilder.build(
+            destinations=[self.destination],
+            arf_service=self.arf_service,
+            execution_config=config,
+            logger=self.logger,
+        )
+        resolver = EntityActionResolver(
+            entity_map=self.entity_map,
+            use_hash_snapshot=config.behavior.preload_hash_snapshot,
+        )
+        pipeline = EntityPipeline(
+            entity_tracker=tracker,
+            event_bus=event_bus,
+            action_resolver=resolver,
+            action_dispatcher=dispatcher,
+        )
+        access_control_pipeline = AccessControlPipeline(
+            resolver=ACActionResolver(),
+            dispatcher=ACActionDispatcher(handlers=[ACPostgresHandler()]),
+            tracker=ACLMembershipTracker(
+                source_connection_id=self.source_connection_id,
+                organization_id=self.organization.id,
+                logger=self.logger,
+            ),
+        )
+
+        entities = source.generate_entities()
+        if change_percent:
+            entities = with_changes(entities, change_percent)
+
+        return SyncOrchestrator(
+            entity_pipeline=pipeline,
+            worker_pool=AsyncWorkerPool(logger=self.logger),
+            stream=AsyncSourceStream(source_generator=entities, logger=self.logger),
+            sync_context=context,
+            runtime=runtime,
+            access_control_pipeline=access_control_pipeline,
+        )
+
+
+def _edge_patches(fixture: _SyncFixture, options: BenchmarkOptions) -> ExitStack:
+    """Replace persistence and bookkeeping edges for the duration of a run."""
+    stack = ExitStack()
+    for target in _DB_CONTEXT_TARGETS:
+        stack.enter_context(patch(target, new=fake_db_context))
+    stack.enter_context(patch.object(crud, "entity", fixture.entity_crud))
+    stack.enter_context(
+        patch(
+            "airweave.platform.sync.orchestrator.sync_job_service",
+            new=SimpleNamespace(update_status=AsyncMock()),
+        )
+    )
+    stack.enter_context(
+        patch("airweave.analytics.business_events.track_sync_completed", new=lambda **_: None)
+    )
+    stack.enter_context(
+        patch(
+            "airweave.core.container.container",
+            new=SimpleNamespace(usage_ledger=FakeUsageLedger()),
+        )
+    )
+    if options.chunker == "passthrough":
+        stack.enter_context(patch.object(SemanticChunker, "chunk_batch", passthrough_chunk_batch))
+        stack.enter_context(patch.object(CodeChunker, "chunk_batch", passthrough_chunk_batch))
+    return stack
+
+
+async def _run_pass(
+    fixture: _SyncFixture,
+    scenario: Scenario,
+    entity_count: int,
+    change_percent: Optional[float],
+) -> Dict[str, Any]:
+    """Run one full sync of the scenario and return its measurements."""
+    source = await StubSource.create(
+        config=scenario.source_config(entity_count, fixture.options.seed)
+    )
+    orchestrator = await fixture.build_orchestrator(source, change_percent)
+    recorder = StageRecorder()
+    rss = RssSampler()
+    fed_before = fixture.vespa_client.documents_fed
+
+    with _edge_patches(fixture, fixture.options), recorder.instrument(_stages()):
+        rss.start()
+        start = time.perf_counter()
+        try:
+            await orchestrator.run()
+        finally:
+            elapsed = time.perf_counter() - start
+            await rss.stop()
+            if source._temp_dir:
+                shutil.rmtree(source._temp_dir, ignore_errors=True)
+
+    stats = orchestrator.runtime.entity_tracker.get_stats()
+    return {
+        "entities": entity_count,
+        "change_percent": change_percent,
+        "duration_s": round(elapsed, 3),
+        "entities_per_sec": round(entity_count / elapsed, 1) if elapsed else 0.0,
+        "actions": {
+            "inserted": stats.inserted,
+            "updated": stats.updated,
+            "deleted": stats.deleted,
+            "kept": stats.kept,
+            "skipped": stats.skipped,
+        },
+        "documents_fed": fixture.vespa_client.documents_fed - fed_before,
+        "memory": rss.to_dict(),
+        "stages": recorder.to_dict(),
+    }
+
+
+async def run_scenario(scenario: Scenario, options: BenchmarkOptions) -> Dict[str, Any]:
+    """Run a scenario (one pass, or a baseline plus a changed pass) and report it."""
+    entity_count = options.entity_count or scenario.entity_count
+    fixture = _SyncFixture(options)
+
+    passes = [await _run_pass(fixture, scenario, entity_count, None)]
+    if scenario.change_percent is not None:
+        passes.append(await _run_pass(fixture, scenario, entity_count, scenario.change_percent))
+
+    # Incremental scenarios report the changed pass; the baseline is kept for reference
+    report = {"scenario": scenario.name, "description": scenario.description, **passes[-1]}
+    if len(passes) > 1:
+        report["baseline_pass"] = passes[0]
+    return report
+
+
+async def run_benchmark(scenarios: List[Scenario], options: BenchmarkOptions) -> Dict[str, Any]:
+    """Run scenarios sequentially and build the JSON report."""
+    # Same startup step as the worker, without OCR (stub files are plain text/code)
+    initialize_converters(ocr_provider=None)
+
+    results = []
+    for scenario in scenarios:
+        results.append(await run_scenario(scenario, options))
+        # Let the previous scenario's garbage go before the next RSS baseline
+        await asyncio.sleep(0)
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "options": {
+            "seed": options.seed,
+            "chunker": options.chunker,
+            "db_latency_ms": options.db_latency_ms,
+            "destination_latency_ms": options.destination_latency_ms,
+            "embedding_dimensions": options.embedding_dimensions,
+            "batch_size": options.batch_size,
+        },
+        "scenarios": results,
+    }
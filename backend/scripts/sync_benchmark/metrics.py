@@ -0,0 +1,162 @@
+"""Per-stage latency histograms and peak RSS sampling for sync benchmarks."""
+
+import asyncio
+import functools
+import os
+import resource
+import sys
+import time
+from bisect import bisect_left
+from contextlib import ExitStack, contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from unittest.mock import patch
+
+# Upper bounds (ms) of the histogram buckets; the last bucket is open-ended.
+BUCKETS_MS: Tuple[float, ...] = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class StageHistogram:
+    """Latency samples of one pipeline stage."""
+
+    def __init__(self) -> None:
+        """Initialize with no samples."""
+        self._samples_ms: List[float] = []
+
+    def observe(self, duration_ms: float) -> None:
+        """Record one call duration."""
+        self._samples_ms.append(duration_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary statistics plus fixed-bucket counts, JSON-serialisable."""
+        samples = sorted(self._samples_ms)
+        count = len(samples)
+        buckets: Dict[str, int] = {f"le_{bound:g}": 0 for bound in BUCKETS_MS}
+        buckets["le_inf"] = 0
+        for sample in samples:
+            index = bisect_left(BUCKETS_MS, sample)
+            key = f"le_{BUCKETS_MS[index]:g}" if index < len(BUCKETS_MS) else "le_inf"
+            buckets[key] += 1
+        return {
+            "count": count,
+            "total_ms": round(sum(samples), 3),
+            "mean_ms": round(sum(samples) / count, 3) if count else 0.0,
+            "p50_ms": _percentile(samples, 0.50),
+            "p90_ms": _percentile(samples, 0.90),
+            "p99_ms": _percentile(samples, 0.99),
+            "max_ms": round(samples[-1], 3) if count else 0.0,
+            "buckets": buckets,
+        }
+
+
+def _percentile(sorted_samples: Sequence[float], q: float) -> float:
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, int(round(q * (len(sorted_samples) - 1))))
+    return round(sorted_samples[index], 3)
+
+
+class StageRecorder:
+    """Times async methods of pipeline classes by wrapping them in place.
+
+    Stages are ``(name, owner, attribute)`` triples; the wrapper is installed
+    on the owner (class or module-level singleton) for the duration of
+    :meth:`instrument` and records one sample per awaited call.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no stages."""
+        self.stages: Dict[str, StageHistogram] = {}
+
+    @contextmanager
+    def instrument(self, stages: Sequence[Tuple[str, Any, str]]) -> Iterator["StageRecorder"]:
+        """Install timing wrappers for ``stages`` until the context exits."""
+        with ExitStack() as stack:
+            for name, owner, attribute in stages:
+                histogram = self.stages.setdefault(name, StageHistogram())
+                wrapped = _timed(getattr(owner, attribute), histogram)
+                stack.enter_context(patch.object(owner, attribute, wrapped))
+            yield self
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Histograms of all stages that saw at least one call."""
+        return {name: h.to_dict() for name, h in self.stages.items() if h._samples_ms}
+
+
+def _timed(func: Any, histogram: StageHistogram) -> Any:
+    """Wrap an async function or bound method so each await is recorded.
+
+    The wrapper is a plain function, so on a class it binds like the original
+    method and on an instance it shadows the bound method.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            histogram.observe((time.perf_counter() - start) * 1000)
+
+    return wrapper
+
+
+class RssSampler:
+    """Samples resident set size while a benchmark runs.
+
+    ``ru_maxrss`` is a process-lifetime high-water mark, so it cannot isolate
+    one scenario; on Linux the sampler polls ``/proc/self/statm`` instead and
+    reports the peak seen between :meth:`start` and :meth:`stop`.
+
+    Args:
+        interval_s: Polling interval.
+    """
+
+    def __init__(self, interval_s: float = 0.05) -> None:
+        """Initialize an idle sampler."""
+        self._interval = interval_s
+        self._task: Optional[asyncio.Task] = None
+        self._page_size = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+        self.start_bytes = 0
+        self.peak_bytes = 0
+
+    def start(self) -> None:
+        """Begin polling on the running event loop."""
+        self.start_bytes = self.peak_bytes = self._current_rss()
+        self._task = asyncio.get_running_loop().create_task(self._poll())
+
+    async def stop(self) -> None:
+        """Stop polling and take a final sample."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._sample()
+
+    def to_dict(self) -> Dict[str, float]:
+        """Start and peak RSS in MiB."""
+        mib = 1024 * 1024
+        return {
+            "start_rss_mb": round(self.start_bytes / mib, 2),
+            "peak_rss_mb": round(self.peak_bytes / mib, 2),
+            "peak_rss_delta_mb": round((self.peak_bytes - self.start_bytes) / mib, 2),
+        }
+
+    async def _poll(self) -> None:
+        while True:
+            self._sample()
+            await asyncio.sleep(self._interval)
+
+    def _sample(self) -> None:
+        self.peak_bytes = max(self.peak_bytes, self._current_rss())
+
+    def _current_rss(self) -> int:
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * self._page_size
+        except (OSError, ValueError, IndexError):
+            # Non-Linux fallback: lifetime high-water mark (KiB on Linux, bytes on macOS)
+            maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return maxrss if sys.platform == "darwin" else maxrss * 1024
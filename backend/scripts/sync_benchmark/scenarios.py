@@ -0,0 +1,121 @@
+"""Fixed benchmark scenarios over StubSource.
+
+Each scenario pins the StubSource seed and entity-type weights so runs are
+comparable across commits. ``change_percent`` turns a scenario into an
+incremental benchmark: the same entities are synced twice and a stable
+subset is modified before the second pass.
+"""
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, Dict, Optional
+
+from airweave.platform.entities._base import BaseEntity, FileEntity
+
+_ZERO_WEIGHTS = {
+    "small_entity_weight": 0,
+    "medium_entity_weight": 0,
+    "large_entity_weight": 0,
+    "small_file_weight": 0,
+    "large_file_weight": 0,
+    "code_file_weight": 0,
+}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One benchmark configuration.
+
+    Attributes:
+        name: Scenario identifier used on the command line and in the report.
+        description: Human-readable summary.
+        weights: StubSource entity-type weights (unset types are 0).
+        entity_count: Default number of entities, overridable from the CLI.
+        change_percent: Percent of entities modified before a second sync pass
+            (None for single-pass scenarios).
+    """
+
+    name: str
+    description: str
+    weights: Dict[str, int] = field(default_factory=dict)
+    entity_count: int = 1000
+    change_percent: Optional[float] = None
+
+    def source_config(self, entity_count: int, seed: int) -> Dict[str, Any]:
+        """StubSource config for this scenario."""
+        return {**_ZERO_WEIGHTS, **self.weights, "entity_count": entity_count, "seed": seed}
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario(
+            name="small",
+            description="Small structured entities (short title + content)",
+            weights={"small_entity_weight": 1},
+            entity_count=5000,
+        ),
+        Scenario(
+            name="large",
+            description="Large structured entities (multi-paragraph content)",
+            weights={"large_entity_weight": 1},
+            entity_count=500,
+        ),
+        Scenario(
+            name="files",
+            description="Small and large text files written to local temp storage",
+            weights={"small_file_weight": 3, "large_file_weight": 1},
+            entity_count=500,
+        ),
+        Scenario(
+            name="code",
+            description="Source code files routed through the code chunker",
+            weights={"code_file_weight": 1},
+            entity_count=500,
+        ),
+        Scenario(
+            name="incremental",
+            description="Mixed entities synced twice with 10% modified on the second pass",
+            weights={
+                "small_entity_weight": 3,
+                "medium_entity_weight": 3,
+                "large_entity_weight": 1,
+                "small_file_weight": 2,
+                "code_file_weight": 1,
+            },
+            entity_count=2000,
+            change_percent=10.0,
+        ),
+    )
+}
+
+
+def is_changed(entity_id: str, change_percent: float) -> bool:
+    """Stable selection of ``change_percent`` percent of entity IDs."""
+    bucket = int.from_bytes(hashlib.blake2b(entity_id.encode(), digest_size=4).digest(), "big")
+    return bucket % 10_000 < change_percent * 100
+
+
+def mutate_entity(entity: BaseEntity) -> None:
+    """Change an entity's content so its hash (and hence its action) becomes UPDATE."""
+    if isinstance(entity, FileEntity) and entity.local_path:
+        with open(entity.local_path, "a", encoding="utf-8") as f:
+            f.write("\n# revised\n")
+        return
+    for attribute in ("content", "notes", "description", "title"):
+        value = getattr(entity, attribute, None)
+        if isinstance(value, str):
+            setattr(entity, attribute, f"{value} (revised)")
+            return
+
+
+async def with_changes(
+    entities: AsyncGenerator[BaseEntity, None], change_percent: float
+) -> AsyncGenerator[BaseEntity, None]:
+    """Wrap a source stream, modifying a stable subset of its entities."""
+    async for entity in entities:
+        # entity_id is filled in from flagged fields later, inside the pipeline
+        key = entity.entity_id or getattr(entity, "stub_id", None)
+        if key and is_changed(key, change_percent):
+            mutate_entity(entity)
+        yield entity
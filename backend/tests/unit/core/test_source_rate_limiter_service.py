@@ -3,14 +3,20 @@
 Tests the Redis-backed sliding window rate limiting for external source API calls.
 """
 
+import asyncio
 import time
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
 
+from airweave.adapters.pubsub.fake import FakePubSub
 from airweave.core.exceptions import SourceRateLimitExceededException
-from airweave.core.source_rate_limiter_service import SourceRateLimiter
+from airweave.core.source_rate_limiter_service import (
+    LUA_LEASE_PERMITS,
+    PermitPool,
+    SourceRateLimiter,
+)
 
 
 @pytest.fixture
@@ -45,9 +51,7 @@ def mock_redis():
 async def test_source_rate_limiter_skips_when_no_level():
     """Test that rate limiter skips check when source has no rate_limit_level."""
     # Mock source with no rate limiting
-    with patch.object(
-        SourceRateLimiter, "_get_source_rate_limit_level", return_value=None
-    ):
+    with patch.object(SourceRateLimiter, "_get_source_rate_limit_level", return_value=None):
         # Should return immediately without any Redis calls
         await SourceRateLimiter.check_and_increment(
             org_id=uuid4(),
@@ -60,9 +64,10 @@ async def test_source_rate_limiter_skips_when_no_level():
 async def test_source_rate_limiter_no_config_allows_request(org_id, mock_redis):
     """Test that requests are allowed when no rate limit is configured."""
     # Mock source has rate_limit_level but no config in DB
-    with patch.object(
-        SourceRateLimiter, "_get_source_rate_limit_level", return_value="org"
-    ), patch.object(SourceRateLimiter, "_get_limit_config", return_value=None):
+    with (
+        patch.object(SourceRateLimiter, "_get_source_rate_limit_level", return_value="org"),
+        patch.object(SourceRateLimiter, "_get_limit_config", return_value=None),
+    ):
         # Should return immediately without checking Redis
         await SourceRateLimiter.check_and_increment(
             org_id=org_id,
@@ -112,3 +117,243 @@ async def test_config_cache_key_format(org_id):
     expected = f"source_rate_limit_config:{org_id}:google_drive"
     assert key == expected
 
+
+# ---------------------------------------------------------------------------
+# Permit leasing
+# ---------------------------------------------------------------------------
+
+
+class _LocalRedis:
+    """In-memory stand-in for Redis running the permit-lease script's logic."""
+
+    def __init__(self):
+        self.zsets = {}
+        self.eval_calls = 0
+
+    async def eval(self, script, numkeys, key, *args):
+        assert script == LUA_LEASE_PERMITS
+        self.eval_calls += 1
+        limit, window_start, now, window = int(args[0]), args[1], args[2], args[3]
+        lease_id, requested, lease_end, returned = args[5], int(args[6]), args[7], int(args[8])
+        zset = self.zsets.setdefault(key, {})
+
+        for member in args[9 : 9 + returned]:
+            zset.pop(member, None)
+        for member in [m for m, score in zset.items() if score <= window_start]:
+            del zset[member]
+
+        available = limit - sum(1 for score in zset.values() if score >= window_start)
+        if available <= 0:
+            return [0, str(max(0.1, min(zset.values()) + window - now))]
+
+        granted = min(requested, available)
+        for i in range(1, granted + 1):
+            zset[f"{lease_id}:{i}"] = lease_end
+        return [granted, "0"]
+
+
+class _Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _pool(redis, clock, lease_size=10):
+    return PermitPool(redis_getter=lambda: redis, lease_size=lease_size, clock=clock)
+
+
+@pytest.mark.asyncio
+async def test_permit_pool_spends_leased_block_locally():
+    redis, clock = _LocalRedis(), _Clock()
+    pool = _pool(redis, clock)
+
+    for _ in range(10):
+        assert await pool.acquire("k", limit=800, window_seconds=60) is None
+
+    assert redis.eval_calls == 1
+    assert len(redis.zsets["k"]) == 10
+
+
+@pytest.mark.asyncio
+async def test_permit_pool_returns_unused_permits_on_renewal():
+    redis, clock = _LocalRedis(), _Clock()
+    pool = _pool(redis, clock)
+
+    await pool.acquire("k", limit=800, window_seconds=60)  # leases 10, spends 1
+    clock.now += PermitPool.MAX_LEASE_SECONDS  # lease expires
+    await pool.acquire("k", limit=800, window_seconds=60)
+
+    # 1 spent from the first lease + a fresh block of 10; the 9 unused were returned
+    assert redis.eval_calls == 2
+    assert len(redis.zsets["k"]) == 11
+
+
+@pytest.mark.asyncio
+async def test_permit_pool_small_limits_lease_one_permit():
+    redis, clock = _LocalRedis(), _Clock()
+    pool = _pool(redis, clock)
+
+    assert await pool.acquire("k", limit=2, window_seconds=1) is None
+    assert await pool.acquire("k", limit=2, window_seconds=1) is None
+    retry_after = await pool.acquire("k", limit=2, window_seconds=1)
+
+    assert retry_after is not None and retry_after > 0
+    assert redis.eval_calls == 3
+
+
+@pytest.mark.asyncio
+async def test_permit_pool_remembers_refusal_until_retry_after():
+    redis, clock = _LocalRedis(), _Clock()
+    pool = _pool(redis, clock)
+    for _ in range(10):
+        await pool.acquire("k", limit=10, window_seconds=10)
+
+    first = await pool.acquire("k", limit=10, window_seconds=10)
+    second = await pool.acquire("k", limit=10, window_seconds=10)
+    calls = redis.eval_calls
+
+    assert first is not None and second is not None
+    assert calls == 11  # one lease per permit at this limit; second refusal answered locally
+    clock.now += first + 0.01
+    assert await pool.acquire("k", limit=10, window_seconds=10) is None
+
+
+@pytest.mark.asyncio
+async def test_permit_pool_prunes_idle_keys_after_their_window():
+    redis, clock = _LocalRedis(), _Clock()
+    pool = _pool(redis, clock)
+    for i in range(50):
+        await pool.acquire(f"conn-{i}", limit=800, window_seconds=60)
+    assert len(pool._leases) == len(pool._locks) == 50
+
+    # Still inside the window: the leases' permits may yet be returned
+    clock.now += PermitPool.PRUNE_INTERVAL_SECONDS - 1
+    await pool.acquire("active", limit=800, window_seconds=60)
+    assert len(pool._leases) == 51
+
+    clock.now += PermitPool.PRUNE_INTERVAL_SECONDS + 1
+    await pool.acquire("active", limit=800, window_seconds=60)
+
+    assert set(pool._leases) == set(pool._locks) == {"active"}
+
+
+@pytest.mark.asyncio
+async def test_permit_leasing_load_honours_global_limit():
+    """Four pods hammer one org-level window; no window may exceed the limit."""
+    redis, clock = _LocalRedis(), _Clock()
+    pods = [_pool(redis, clock) for _ in range(4)]
+    limit, window = 100, 10.0
+    allowed = []
+
+    async def pod_requests(pod):
+        for _ in range(5):
+            if await pod.acquire("k", limit=limit, window_seconds=window) is None:
+                allowed.append(clock.now)
+
+    for _ in range(3000):  # 30 simulated seconds in 10ms steps
+        await asyncio.gather(*(pod_requests(pod) for pod in pods))
+        clock.now += 0.01
+
+    allowed.sort()
+    start = 0
+    for end, t in enumerate(allowed):
+        while allowed[start] <= t - window:
+            start += 1
+        assert end - start + 1 <= limit
+    assert len(allowed) >= 2 * limit  # the limit is used, not starved
+    assert redis.eval_calls < 3000 * 4 * 5 / 10
+
+
+# ---------------------------------------------------------------------------
+# In-process config cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def clean_local_cache():
+    SourceRateLimiter._local_configs.clear()
+    with patch.object(SourceRateLimiter, "_ensure_invalidation_listener"):
+        yield
+    SourceRateLimiter._local_configs.clear()
+
+
+@pytest.mark.asyncio
+async def test_limit_config_is_cached_in_process(org_id, clean_local_cache):
+    fetch = AsyncMock(return_value={"limit": 800, "window_seconds": 60})
+    with patch.object(SourceRateLimiter, "_fetch_limit_config", fetch):
+        await SourceRateLimiter._get_limit_config(org_id, "google_drive")
+        config = await SourceRateLimiter._get_limit_config(org_id, "google_drive")
+
+    assert config == {"limit": 800, "window_seconds": 60}
+    fetch.assert_awaited_once()
+
+
+@pytest.fixture
+def fake_pubsub():
+    pubsub = FakePubSub()
+    with patch("airweave.core.container.container", MagicMock(pubsub=pubsub)):
+        yield pubsub
+
+
+@pytest.mark.asyncio
+async def test_invalidate_config_drops_caches_and_broadcasts(
+    org_id, mock_redis, fake_pubsub, clean_local_cache
+):
+    mock_redis.client.delete = AsyncMock()
+    fetch = AsyncMock(side_effect=[{"limit": 800, "window_seconds": 60}, None])
+    with patch.object(SourceRateLimiter, "_fetch_limit_config", fetch):
+        await SourceRateLimiter._get_limit_config(org_id, "google_drive")
+        await SourceRateLimiter.invalidate_config(org_id, "google_drive")
+        config = await SourceRateLimiter._get_limit_config(org_id, "google_drive")
+
+    assert config is None
+    mock_redis.client.delete.assert_awaited_once_with(
+        f"source_rate_limit_config:{org_id}:google_drive"
+    )
+    assert fake_pubsub.published == {
+        ("source_rate_limit", "config_invalidation"): [f"{org_id}:google_drive"]
+    }
+
+
+@pytest.mark.asyncio
+async def test_listener_evicts_named_config_and_closes_subscription(
+    org_id, fake_pubsub, clean_local_cache
+):
+    other_org = uuid4()
+    SourceRateLimiter._local_configs[(org_id, "google_drive")] = (time.monotonic(), None)
+    SourceRateLimiter._local_configs[(other_org, "google_drive")] = (time.monotonic(), None)
+    fake_pubsub.queued_messages = [
+        {"type": "subscribe", "data": 1},
+        {"type": "message", "data": "not-a-uuid:google_drive"},
+        {"type": "message", "data": f"{org_id}:google_drive"},
+    ]
+    closed = []
+    subscribe = fake_pubsub.subscribe
+
+    async def tracking_subscribe(namespace, id_value):
+        subscription = await subscribe(namespace, id_value)
+        subscription.close = AsyncMock(side_effect=lambda: closed.append(True))
+        return subscription
+
+    with patch.object(fake_pubsub, "subscribe", tracking_subscribe):
+        await SourceRateLimiter._listen_for_invalidations()
+
+    assert fake_pubsub.subscriptions == [("source_rate_limit", "config_invalidation")]
+    assert (org_id, "google_drive") not in SourceRateLimiter._local_configs
+    assert (other_org, "google_drive") in SourceRateLimiter._local_configs
+    assert closed == [True]
+
+
+@pytest.mark.asyncio
+async def test_listener_failure_still_releases_subscription(fake_pubsub, clean_local_cache):
+    fake_pubsub.listen_error = ConnectionError("connection lost")
+    fake_pubsub.close_error = RuntimeError("close failed")
+
+    with patch("airweave.core.source_rate_limiter_service.logger") as log:
+        await SourceRateLimiter._listen_for_invalidations()
+
+    messages = [call.args[0] for call in log.warning.call_args_list]
+    assert any("listener stopped" in m for m in messages)
+    assert any("Failed to close" in m for m in messages)
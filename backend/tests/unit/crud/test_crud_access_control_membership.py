@@ -0,0 +1,194 @@
+"""Unit tests for the recursive group-closure CTE in CRUDAccessControlMembership.
+
+The statement is compiled against the postgresql dialect to pin its shape, and
+executed on an in-memory SQLite database (which shares ``WITH RECURSIVE``
+semantics) to check the closure it resolves.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from airweave.crud.crud_access_control_membership import CRUDAccessControlMembership
+from airweave.models.access_control_membership import AccessControlMembership
+from airweave.models.source_connection import SourceConnection
+
+ORG_ID = uuid4()
+OTHER_ORG_ID = uuid4()
+
+
+async def _compiled_closure_sql(**kwargs) -> str:
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock())
+    await CRUDAccessControlMembership(AccessControlMembership).get_group_closure(
+        db, member_id="alice@acme.com", member_type="user", organization_id=ORG_ID, **kwargs
+    )
+    return str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+async def db():
+    """In-memory database holding only the membership and source connection tables."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: AccessControlMembership.metadata.create_all(
+                sync_conn,
+                tables=[SourceConnection.__table__, AccessControlMembership.__table__],
+            )
+        )
+    async with AsyncSession(engine) as session:
+        yield session
+    await engine.dispose()
+
+
+async def _add_connection(db, readable_collection_id: str):
+    connection_id = uuid4()
+    await db.execute(
+        insert(SourceConnection).values(
+            id=connection_id,
+            name=readable_collection_id,
+            short_name="sharepoint",
+            organization_id=ORG_ID,
+            readable_collection_id=readable_collection_id,
+        )
+    )
+    return connection_id
+
+
+async def _add_memberships(db, connection_id, *edges, organization_id=ORG_ID):
+    """Insert (member_id, member_type, group_id) edges."""
+    await db.execute(
+        insert(AccessControlMembership),
+        [
+            {
+                "member_id": member_id,
+                "member_type": member_type,
+                "group_id": group_id,
+                "source_name": "sharepoint",
+                "source_connection_id": connection_id,
+                "organization_id": organization_id,
+            }
+            for member_id, member_type, group_id in edges
+        ],
+    )
+
+
+async def _closure(db, member_id="alice@acme.com", **kwargs):
+    return await CRUDAccessControlMembership(AccessControlMembership).get_group_closure(
+        db, member_id=member_id, member_type="user", organization_id=ORG_ID, **kwargs
+    )
+
+
+class TestGroupClosureSql:
+    """Shape of the statement as PostgreSQL receives it."""
+
+    @pytest.mark.asyncio
+    async def test_single_recursive_cte_deduplicating_rows(self):
+        sql = await _compiled_closure_sql()
+
+        assert sql.startswith("WITH RECURSIVE group_closure")
+        assert " UNION SELECT" in sql  # UNION (not UNION ALL) dedupes (group, depth)
+        assert "UNION ALL" not in sql
+        assert "group_closure.depth < " in sql
+        assert "SELECT DISTINCT group_closure.group_id" in sql
+
+    @pytest.mark.asyncio
+    async def test_collection_scope_applies_to_first_hop_only(self):
+        sql = await _compiled_closure_sql(readable_collection_id="finance")
+        anchor, recursive = sql.split(" UNION ", 1)
+
+        assert "JOIN source_connection" in anchor
+        assert "source_connection.readable_collection_id" in anchor
+        assert "source_connection" not in recursive
+
+    @pytest.mark.asyncio
+    async def test_unscoped_closure_skips_source_connection_join(self):
+        sql = await _compiled_closure_sql()
+
+        assert "source_connection" not in sql
+
+
+class TestGroupClosureResolution:
+    """Closure resolved by the CTE over real rows."""
+
+    @pytest.mark.asyncio
+    async def test_direct_and_nested_groups(self, db):
+        conn = await _add_connection(db, "finance")
+        await _add_memberships(
+            db,
+            conn,
+            ("alice@acme.com", "user", "frontend"),
+            ("alice@acme.com", "user", "oncall"),
+            ("frontend", "group", "engineering"),
+            ("engineering", "group", "all-staff"),
+            ("bob@acme.com", "user", "sales"),
+        )
+
+        assert await _closure(db) == {"frontend", "oncall", "engineering", "all-staff"}
+
+    @pytest.mark.asyncio
+    async def test_cycle_terminates(self, db):
+        conn = await _add_connection(db, "finance")
+        await _add_memberships(
+            db,
+            conn,
+            ("alice@acme.com", "user", "a"),
+            ("a", "group", "b"),
+            ("b", "group", "c"),
+            ("c", "group", "a"),
+        )
+
+        assert await _closure(db) == {"a", "b", "c"}
+
+    @pytest.mark.asyncio
+    async def test_max_depth_cuts_off_deeper_levels(self, db):
+        conn = await _add_connection(db, "finance")
+        chain = ["g1", "g2", "g3", "g4", "g5"]
+        await _add_memberships(
+            db,
+            conn,
+            ("alice@acme.com", "user", chain[0]),
+            *[(child, "group", parent) for child, parent in zip(chain, chain[1:], strict=False)],
+        )
+
+        assert await _closure(db, max_depth=1) == {"g1"}
+        assert await _closure(db, max_depth=3) == {"g1", "g2", "g3"}
+        assert await _closure(db) == set(chain)
+
+    @pytest.mark.asyncio
+    async def test_collection_scope_limits_direct_groups_not_nesting(self, db):
+        finance = await _add_connection(db, "finance")
+        legal = await _add_connection(db, "legal")
+        await _add_memberships(db, finance, ("alice@acme.com", "user", "accounts"))
+        await _add_memberships(
+            db,
+            legal,
+            ("alice@acme.com", "user", "contracts"),
+            # Group-to-group edge synced by another collection's connection
+            ("accounts", "group", "back-office"),
+        )
+
+        assert await _closure(db, readable_collection_id="finance") == {
+            "accounts",
+            "back-office",
+        }
+        assert await _closure(db, readable_collection_id="legal") == {"contracts"}
+
+    @pytest.mark.asyncio
+    async def test_other_organizations_are_ignored(self, db):
+        conn = await _add_connection(db, "finance")
+        await _add_memberships(db, conn, ("alice@acme.com", "user", "frontend"))
+        await _add_memberships(
+            db,
+            conn,
+            ("alice@acme.com", "user", "intruder"),
+            ("frontend", "group", "leaked"),
+            organization_id=OTHER_ORG_ID,
+        )
+
+        assert await _closure(db) == {"frontend"}
@@ -0,0 +1,170 @@
+"""Unit tests for CRUDEntity bulk hash updates and (id, hash) lookups."""
+
+import math
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from airweave.crud.crud_entity import CRUDEntity, EntityIdHash
+
+
+class _RoundTripSession:
+    """Stand-in AsyncSession that records every executed statement."""
+
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+
+
+def _rows(n):
+    return [(uuid4(), f"hash-{i}") for i in range(n)]
+
+
+def _compile(stmt):
+    return stmt.compile(dialect=postgresql.dialect())
+
+
+class TestBulkUpdateHash:
+    """bulk_update_hash issues one set-based UPDATE per chunk."""
+
+    @pytest.mark.asyncio
+    async def test_empty_rows_is_noop(self):
+        db = _RoundTripSession()
+
+        await CRUDEntity().bulk_update_hash(db, rows=[])
+
+        assert db.statements == []
+
+    @pytest.mark.asyncio
+    async def test_single_update_from_values_statement(self):
+        db = _RoundTripSession()
+        rows = _rows(3)
+        sync_job_id = uuid4()
+
+        await CRUDEntity().bulk_update_hash(db, rows=rows, sync_job_id=sync_job_id)
+
+        assert len(db.statements) == 1
+        compiled = _compile(db.statements[0])
+        sql = str(compiled)
+        assert sql.startswith("UPDATE entity SET")
+        assert "FROM (VALUES" in sql
+        assert "WHERE entity.id = new_hashes.id" in sql
+        assert "sync_job_id" in sql and "modified_at" in sql
+        params = compiled.params
+        assert params["sync_job_id"] == sync_job_id
+        assert [v for k, v in params.items() if k.startswith("param_")] == [
+            value for row in rows for value in row
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sync_job_id_is_optional(self):
+        db = _RoundTripSession()
+
+        await CRUDEntity().bulk_update_hash(db, rows=_rows(2))
+
+        assert "sync_job_id" not in str(_compile(db.statements[0]))
+
+    @pytest.mark.asyncio
+    async def test_large_batches_are_chunked(self):
+        crud = CRUDEntity()
+        crud.BULK_UPDATE_CHUNK_SIZE = 4
+        db = _RoundTripSession()
+
+        await crud.bulk_update_hash(db, rows=_rows(10))
+
+        chunk_params = [len(_compile(stmt).params) for stmt in db.statements]
+        # 2 params per row + modified_at
+        assert chunk_params == [9, 9, 5]
+
+
+class TestBulkUpdateHashRoundTrips:
+    """One statement per chunk, however many rows are updated."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("batch_size", [1, 10, 100, 1_000, 10_000])
+    async def test_round_trips_by_batch_size(self, batch_size):
+        crud = CRUDEntity()
+        db = _RoundTripSession()
+
+        await crud.bulk_update_hash(db, rows=_rows(batch_size))
+
+        assert len(db.statements) == math.ceil(batch_size / crud.BULK_UPDATE_CHUNK_SIZE)
+
+
+class _ResultSession:
+    """Stand-in AsyncSession returning canned (entity_id, short_name, id, hash) rows."""
+
+    def __init__(self, rows):
+        self.statements = []
+        self._rows = rows
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        result = MagicMock()
+        result.all.return_value = self._rows
+        return result
+
+
+class TestIdHashLookups:
+    """Lookups join unnested key arrays and return (id, hash) tuples."""
+
+    @pytest.mark.asyncio
+    async def test_lookup_joins_unnested_arrays(self):
+        db_id = uuid4()
+        db = _ResultSession([("a", "doc", db_id, "h-a")])
+
+        result = await CRUDEntity().bulk_get_id_hash_by_entity_sync_and_definition(
+            db, sync_id=uuid4(), entity_requests=[("a", "doc"), ("b", "page")]
+        )
+
+        assert result == {("a", "doc"): EntityIdHash(db_id, "h-a")}
+        assert result[("a", "doc")].id == db_id
+        compiled = _compile(db.statements[0])
+        sql = str(compiled)
+        assert "JOIN unnest(" in sql
+        assert " OR " not in sql
+        assert compiled.params["param_1"] == ["a", "b"]
+        assert compiled.params["param_2"] == ["doc", "page"]
+
+    @pytest.mark.asyncio
+    async def test_lookup_chunks_keys(self):
+        crud = CRUDEntity()
+        crud.LOOKUP_CHUNK_SIZE = 2
+        db = _ResultSession([])
+
+        await crud.bulk_get_id_hash_by_entity_sync_and_definition(
+            db, sync_id=uuid4(), entity_requests=[(str(i), "doc") for i in range(5)]
+        )
+
+        assert len(db.statements) == 3
+
+    @pytest.mark.asyncio
+    async def test_empty_lookup_skips_query(self):
+        db = _ResultSession([])
+
+        result = await CRUDEntity().bulk_get_id_hash_by_entity_sync_and_definition(
+            db, sync_id=uuid4(), entity_requests=[]
+        )
+
+        assert result == {}
+        assert db.statements == []
+
+    @pytest.mark.asyncio
+    async def test_snapshot_map_selects_compact_columns(self):
+        db_id = uuid4()
+        db = _ResultSession([("a", "doc", db_id, "h-a"), ("a", "page", db_id, "h-b")])
+
+        result = await CRUDEntity().get_id_hash_map_by_sync_id(db, uuid4())
+
+        assert result == {
+            ("a", "doc"): EntityIdHash(db_id, "h-a"),
+            ("a", "page"): EntityIdHash(db_id, "h-b"),
+        }
+        sql = str(_compile(db.statements[0]))
+        assert sql.startswith(
+            "SELECT entity.entity_id, entity.entity_definition_short_name, entity.id, entity.hash"
+        )
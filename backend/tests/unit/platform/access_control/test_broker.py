@@ -4,6 +4,7 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+from airweave.adapters.cache.fake import FakeAccessPrincipalCache
 from airweave.platform.access_control.broker import AccessBroker
 from airweave.platform.access_control.schemas import AccessContext
 from airweave.platform.entities._base import AccessControl
@@ -36,7 +37,7 @@ class TestAccessBrokerBasicResolution:
     ):
         """Test resolution for user with no group memberships."""
         with patch("airweave.platform.access_control.broker.crud") as mock_crud:
-            mock_crud.access_control_membership.get_by_member = AsyncMock(return_value=[])
+            mock_crud.access_control_membership.get_group_closure = AsyncMock(return_value=set())
 
             result = await broker.resolve_access_context(
                 db=mock_db, user_principal="john@acme.com", organization_id=organization_id
@@ -54,16 +55,9 @@ class TestAccessBrokerBasicResolution:
     ):
         """Test resolution for user with direct group memberships."""
         with patch("airweave.platform.access_control.broker.crud") as mock_crud:
-            # Mock membership data
-            membership1 = MagicMock()
-            membership1.group_id = "sp:engineering"
-            membership1.group_name = "Engineering"
-
-            membership2 = MagicMock()
-            membership2.group_id = "ad:frontend"
-            membership2.group_name = "Frontend Team"
-
-            mock_crud.access_control_membership.get_by_member = AsyncMock(return_value=[membership1, membership2])
+            mock_crud.access_control_membership.get_group_closure = AsyncMock(
+                return_value={"sp:engineering", "ad:frontend"}
+            )
 
             result = await broker.resolve_access_context(
                 db=mock_db, user_principal="john@acme.com", organization_id=organization_id
@@ -82,9 +76,9 @@ class TestAccessBrokerBasicResolution:
     ):
         """Test that all_principals property combines user and group principals."""
         with patch("airweave.platform.access_control.broker.crud") as mock_crud:
-            membership = MagicMock()
-            membership.group_id = "sp:site_owners"
-            mock_crud.access_control_membership.get_by_member = AsyncMock(return_value=[membership])
+            mock_crud.access_control_membership.get_group_closure = AsyncMock(
+                return_value={"sp:site_owners"}
+            )
 
             result = await broker.resolve_access_context(
                 db=mock_db, user_principal="admin@acme.com", organization_id=organization_id
@@ -105,12 +99,9 @@ class TestAccessBrokerCollectionScoping:
     ):
         """Test that collection resolution filters by readable_collection_id."""
         with patch("airweave.platform.access_control.broker.crud") as mock_crud:
-            membership = MagicMock()
-            membership.group_id = "sp:engineering"
-            mock_crud.access_control_membership.get_by_member_and_collection = AsyncMock(return_value=[membership])
-            
-            # Mock get_by_member for group expansion (returns empty for simplicity)
-            mock_crud.access_control_membership.get_by_member = AsyncMock(return_value=[])
+            mock_crud.access_control_membership.get_group_closure = AsyncMock(
+                return_value={"sp:engineering"}
+            )
 
             # Mock _collection_has_ac_sources to return True
             with patch.object(broker, "_collection_has_ac_sources", new=AsyncMock(return_value=True)):
@@ -122,12 +113,13 @@ class TestAccessBrokerCollectionScoping:
                 )
 
                 # Verify CRUD was called with collection filter
-                mock_crud.access_control_membership.get_by_member_and_collection.assert_called_once_with(
+                mock_crud.access_control_membership.get_group_closure.assert_called_once_with(
                     db=mock_db,
                     member_id="john@acme.com",
                     member_type="user",
-                    readable_collection_id="my-collection",
                     organization_id=organization_id,
+                    readable_collection_id="my-collection",
+                    max_depth=AccessBroker.MAX_GROUP_NESTING_DEPTH,
                 )
 
                 assert isinstance(result, AccessContext)
@@ -187,93 +179,128 @@ class TestAccessBrokerCollectionScoping:
 
 
 class TestAccessBrokerGroupExpansion:
-    """Test recursive group membership expansion."""
+    """Test group expansion via the recursive closure query and the principal cache."""
 
     @pytest.mark.asyncio
-    async def test_expand_group_memberships_handles_nested_groups(
-        self, broker, mock_db, organization_id
-    ):
-        """Test expansion of nested group-to-group relationships."""
+    async def test_expansion_is_a_single_closure_query(self, broker, mock_db, organization_id):
+        """Nested groups come back from one CRUD call, bounded by nesting levels."""
         with patch("airweave.platform.access_control.broker.crud") as mock_crud:
-            # Mock nested groups: frontend -> engineering -> all-staff
-            async def mock_get_by_member(db, member_id, member_type, organization_id):
-                if member_id == "frontend" and member_type == "group":
-                    parent = MagicMock()
-                    parent.group_id = "engineering"
-                    return [parent]
-                elif member_id == "engineering" and member_type == "group":
-                    parent = MagicMock()
-                    parent.group_id = "all-staff"
-                    return [parent]
-                return []
-
-            mock_crud.access_control_membership.get_by_member = AsyncMock(side_effect=mock_get_by_member)
-
-            result = await broker._expand_group_memberships(
-                db=mock_db, group_ids=["frontend"], organization_id=organization_id
+            mock_crud.access_control_membership.get_group_closure = AsyncMock(
+                return_value={"frontend", "engineering", "all-staff"}
             )
 
-            # Should include all levels: frontend, engineering, all-staff
-            assert "frontend" in result
-            assert "engineering" in result
-            assert "all-staff" in result
-            assert len(result) == 3
+            result = await broker.resolve_access_context(
+                db=mock_db, user_principal="john@acme.com", organization_id=organization_id
+            )
+
+            mock_crud.access_control_membership.get_group_closure.assert_awaited_once_with(
+                db=mock_db,
+                member_id="john@acme.com",
+                member_type="user",
+                organization_id=organization_id,
+                readable_collection_id=None,
+                max_depth=10,
+            )
+            assert result.group_principals == [
+                "group:all-staff",
+                "group:engineering",
+                "group:frontend",
+            ]
 
     @pytest.mark.asyncio
-    async def test_expand_group_memberships_handles_circular_references(
-        self, broker, mock_db, organization_id
-    ):
-        """Test that circular group references don't cause infinite loops."""
+    async def test_cache_hit_skips_database(self, mock_db, organization_id):
+        """A cached resolution is served without querying memberships."""
+        cache = FakeAccessPrincipalCache()
+        broker = AccessBroker(principal_cache=cache)
         with patch("airweave.platform.access_control.broker.crud") as mock_crud:
+            mock_crud.access_control_membership.get_group_closure = AsyncMock(
+                return_value={"engineering"}
+            )
 
-            async def mock_get_by_member(db, member_id, member_type, organization_id):
-                # Create circular reference: group-a -> group-b -> group-a
-                if member_id == "group-a" and member_type == "group":
-                    parent = MagicMock()
-                    parent.group_id = "group-b"
-                    return [parent]
-                elif member_id == "group-b" and member_type == "group":
-                    parent = MagicMock()
-                    parent.group_id = "group-a"
-                    return [parent]
-                return []
-
-            mock_crud.access_control_membership.get_by_member = AsyncMock(side_effect=mock_get_by_member)
-
-            result = await broker._expand_group_memberships(
-                db=mock_db, group_ids=["group-a"], organization_id=organization_id
+            first = await broker.resolve_access_context(
+                db=mock_db, user_principal="john@acme.com", organization_id=organization_id
+            )
+            second = await broker.resolve_access_context(
+                db=mock_db, user_principal="john@acme.com", organization_id=organization_id
             )
 
-            # Should handle circular reference gracefully
-            assert "group-a" in result
-            assert "group-b" in result
-            assert len(result) == 2
+            assert mock_crud.access_control_membership.get_group_closure.await_count == 1
+            assert first.group_principals == second.group_principals == ["group:engineering"]
 
     @pytest.mark.asyncio
-    async def test_expand_group_memberships_respects_max_depth(
-        self, broker, mock_db, organization_id
-    ):
-        """Test that expansion stops at max depth to prevent abuse."""
+    async def test_cache_is_scoped_per_collection(self, mock_db, organization_id):
+        """Organization-wide and collection-scoped resolutions are cached separately."""
+        cache = FakeAccessPrincipalCache()
+        broker = AccessBroker(principal_cache=cache)
+        with patch("airweave.platform.access_control.broker.crud") as mock_crud, patch.object(
+            broker, "_collection_has_ac_sources", new=AsyncMock(return_value=True)
+        ):
+            mock_crud.access_control_membership.get_group_closure = AsyncMock(
+                side_effect=[{"org-wide"}, {"scoped"}]
+            )
+
+            org_ctx = await broker.resolve_access_context(
+                db=mock_db, user_principal="john@acme.com", organization_id=organization_id
+            )
+            col_ctx = await broker.resolve_access_context_for_collection(
+                db=mock_db,
+                user_principal="john@acme.com",
+                readable_collection_id="docs",
+                organization_id=organization_id,
+            )
+
+            assert org_ctx.group_principals == ["group:org-wide"]
+            assert col_ctx.group_principals == ["group:scoped"]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_organization_forces_requery(self, mock_db, organization_id):
+        """After invalidation the next resolution goes back to the database."""
+        cache = FakeAccessPrincipalCache()
+        broker = AccessBroker(principal_cache=cache)
         with patch("airweave.platform.access_control.broker.crud") as mock_crud:
+            mock_crud.access_control_membership.get_group_closure = AsyncMock(
+                side_effect=[{"engineering"}, {"engineering", "admins"}]
+            )
 
-            call_count = 0
+            await broker.resolve_access_context(
+                db=mock_db, user_principal="john@acme.com", organization_id=organization_id
+            )
+            await broker.invalidate_organization(organization_id)
+            result = await broker.resolve_access_context(
+                db=mock_db, user_principal="john@acme.com", organization_id=organization_id
+            )
+
+            assert cache.invalidated == [organization_id]
+            assert result.group_principals == ["group:admins", "group:engineering"]
+
+    @pytest.mark.asyncio
+    async def test_resolution_overtaken_by_invalidation_is_not_cached(
+        self, mock_db, organization_id
+    ):
+        """A closure read mid-sync is not stored once the sync has invalidated."""
+        cache = FakeAccessPrincipalCache()
+        broker = AccessBroker(principal_cache=cache)
 
-            async def mock_get_by_member(db, member_id, member_type, organization_id):
-                nonlocal call_count
-                call_count += 1
-                # Always return a new parent group (infinite nesting)
-                parent = MagicMock()
-                parent.group_id = f"level-{call_count}"
-                return [parent]
+        async def closure_read_during_sync(**kwargs):
+            if not cache.invalidated:
+                await broker.invalidate_organization(organization_id)  # sync finishes
+                return {"stale"}
+            return {"fresh"}
 
-            mock_crud.access_control_membership.get_by_member = AsyncMock(side_effect=mock_get_by_member)
+        with patch("airweave.platform.access_control.broker.crud") as mock_crud:
+            mock_crud.access_control_membership.get_group_closure = AsyncMock(
+                side_effect=closure_read_during_sync
+            )
 
-            result = await broker._expand_group_memberships(
-                db=mock_db, group_ids=["level-0"], organization_id=organization_id
+            stale = await broker.resolve_access_context(
+                db=mock_db, user_principal="john@acme.com", organization_id=organization_id
+            )
+            fresh = await broker.resolve_access_context(
+                db=mock_db, user_principal="john@acme.com", organization_id=organization_id
             )
 
-            # Should stop at max depth (10 in implementation)
-            assert len(result) <= 12  # initial + 10 levels + some tolerance
+            assert stale.group_principals == ["group:stale"]
+            assert fresh.group_principals == ["group:fresh"]
 
 
 class TestAccessBrokerEntityAccess:
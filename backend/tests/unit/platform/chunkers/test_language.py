@@ -0,0 +1,116 @@
+"""Unit tests for CodeLanguageDetector and per-language code chunking."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from airweave.platform.chunkers.code import CodeChunker
+from airweave.platform.chunkers.language import CodeLanguageDetector
+
+
+class _FakeMagika:
+    """Labels by the first line of the input and records every call."""
+
+    def __init__(self):
+        self.inputs: list[bytes] = []
+
+    def identify_bytes(self, data: bytes):
+        self.inputs.append(data)
+        label = data.split(b"\n", 1)[0].decode().lstrip("# ")
+        return SimpleNamespace(output=SimpleNamespace(label=label))
+
+
+@pytest.fixture
+def detector(monkeypatch):
+    monkeypatch.setattr(CodeLanguageDetector, "_instance", None)
+    detector = CodeLanguageDetector()
+    magika = _FakeMagika()
+    parser_loads: list[str] = []
+
+    def load_parser(language):
+        parser_loads.append(language)
+        if language not in {"python", "go"}:
+            raise LookupError(language)
+        return f"parser:{language}"
+
+    monkeypatch.setattr(detector, "_load_magika", lambda: magika)
+    monkeypatch.setattr(detector, "_load_parser", load_parser)
+    detector.magika = magika
+    detector.parser_loads = parser_loads
+    yield detector
+    monkeypatch.setattr(CodeLanguageDetector, "_instance", None)
+
+
+class TestCodeLanguageDetector:
+    def test_is_a_pod_singleton(self, detector):
+        assert CodeLanguageDetector() is detector
+
+    def test_detects_supported_and_rejects_unsupported(self, detector):
+        assert detector.detect("# Python\nprint(1)\n", ".py") == "python"
+        assert detector.detect("# COBOL\nDISPLAY 'HI'.\n", ".cbl") is None
+
+    def test_identifies_from_bounded_prefix(self, detector):
+        text = "# python\n" + "x = 1\n" * 100_000
+
+        detector.detect(text)
+
+        assert len(detector.magika.inputs[0]) == CodeLanguageDetector.PREFIX_BYTES
+
+    def test_caches_by_extension_and_prefix(self, detector):
+        text = "# python\nimport os\n"
+
+        detector.detect_batch([text, text, text], [".py", ".py", ".pyi"])
+
+        assert len(detector.magika.inputs) == 2
+
+    def test_parser_registry_caches_negative_results(self, detector):
+        for _ in range(3):
+            detector.detect("# rust\nfn main() {}\n" + "/" * _)
+
+        assert detector.parser_loads == ["rust"]
+        assert detector.get_parser("python") == "parser:python"
+        assert detector.get_parser("python") == "parser:python"
+        assert detector.parser_loads == ["rust", "python"]
+
+    def test_model_loads_once(self, detector, monkeypatch):
+        loads = []
+        magika = detector.magika
+        monkeypatch.setattr(detector, "_load_magika", lambda: loads.append(1) or magika)
+
+        detector.detect_batch([f"# go\n// {i}" for i in range(5)])
+
+        assert loads == [1]
+
+    def test_extension_of(self):
+        assert CodeLanguageDetector.extension_of("src/Main.PY") == ".py"
+        assert CodeLanguageDetector.extension_of(None) == ""
+
+
+class TestChunkByLanguage:
+    def test_groups_by_language_and_keeps_order(self, monkeypatch):
+        monkeypatch.setattr(CodeChunker, "_instance", None)
+        chunker = CodeChunker()
+        auto = MagicMock()
+        auto.chunk_batch.side_effect = lambda texts: [[f"auto:{t}"] for t in texts]
+        chunker._code_chunker = auto
+        per_language = {}
+
+        def language_chunker(language):
+            if language == "cobol":
+                return None
+            mock = per_language.setdefault(language, MagicMock())
+            mock.chunk_batch.side_effect = lambda texts, lang=language: [
+                [f"{lang}:{t}"] for t in texts
+            ]
+            return mock
+
+        monkeypatch.setattr(chunker, "_get_language_chunker", language_chunker)
+
+        results = chunker._chunk_by_language(
+            ["a", "b", "c", "d", "e"], ["python", "go", "python", None, "cobol"]
+        )
+
+        assert results == [["python:a"], ["go:b"], ["python:c"], ["auto:d"], ["auto:e"]]
+        per_language["python"].chunk_batch.assert_called_once_with(["a", "c"])
+        monkeypatch.setattr(CodeChunker, "_instance", None)
@@ -0,0 +1,138 @@
+"""Unit tests for HybridDocumentConverter.convert_batch orchestration."""
+
+import asyncio
+from typing import Dict, List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from airweave.adapters.ocr.fake import FakeOcrProvider
+from airweave.platform.converters._base import HybridDocumentConverter
+
+
+class _StubConverter(HybridDocumentConverter):
+    """Converter whose extraction result is looked up per path."""
+
+    def __init__(
+        self,
+        extracted: Dict[str, Optional[str]],
+        ocr_provider=None,
+        delay: float = 0.0,
+    ):
+        super().__init__(ocr_provider=ocr_provider)
+        self._extracted = extracted
+        self._delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.finished: List[str] = []
+
+    async def _try_extract(self, path: str) -> Optional[str]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self._delay)
+            result = self._extracted.get(path)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        finally:
+            self.in_flight -= 1
+            self.finished.append(path)
+
+
+class _RecordingOcr(FakeOcrProvider):
+    """Fake OCR that records how many files had finished extracting per call."""
+
+    def __init__(self, converter_ref: list):
+        super().__init__()
+        self._converter_ref = converter_ref
+        self.finished_at_call: List[int] = []
+
+    async def convert_batch(self, file_paths: List[str]) -> Dict[str, Optional[str]]:
+        self.finished_at_call.append(len(self._converter_ref[0].finished))
+        return await super().convert_batch(file_paths)
+
+
+class TestConvertBatch:
+    """Extraction concurrency, OCR pipelining and timing reports."""
+
+    @pytest.mark.asyncio
+    async def test_extraction_is_concurrent_and_bounded(self):
+        paths = [f"/tmp/doc{i}.pdf" for i in range(10)]
+        converter = _StubConverter({p: f"text {p}" for p in paths}, delay=0.01)
+
+        results = await converter.convert_batch(paths)
+
+        assert results == {p: f"text {p}" for p in paths}
+        assert converter.max_in_flight == HybridDocumentConverter.EXTRACTION_CONCURRENCY
+
+    @pytest.mark.asyncio
+    async def test_ocr_groups_submitted_before_extraction_finishes(self):
+        paths = [f"/nonexistent/scan{i}.pdf" for i in range(12)]
+        ref: list = []
+        ocr = _RecordingOcr(ref)
+        converter = _StubConverter({}, ocr_provider=ocr, delay=0.01)
+        ref.append(converter)
+
+        results = await converter.convert_batch(paths)
+
+        assert results == {p: "# Fake OCR output" for p in paths}
+        assert [len(call) for call in ocr.calls] == [5, 5, 2]
+        assert sorted(p for call in ocr.calls for p in call) == sorted(paths)
+        # First OCR group went out while other files were still extracting
+        assert ocr.finished_at_call[0] < len(paths)
+
+    @pytest.mark.asyncio
+    async def test_mixed_batch_only_sends_failures_to_ocr(self):
+        ocr = FakeOcrProvider(default_markdown="# ocr")
+        converter = _StubConverter(
+            {"/x/a.pdf": "# a", "/x/b.pdf": None, "/x/c.pdf": RuntimeError("boom")},
+            ocr_provider=ocr,
+        )
+
+        results = await converter.convert_batch(["/x/a.pdf", "/x/b.pdf", "/x/c.pdf"])
+
+        assert results == {"/x/a.pdf": "# a", "/x/b.pdf": "# ocr", "/x/c.pdf": "# ocr"}
+        assert sorted(ocr.calls[0]) == ["/x/b.pdf", "/x/c.pdf"]
+
+    @pytest.mark.asyncio
+    async def test_plain_text_fallback_skips_ocr(self, tmp_path):
+        path = tmp_path / "really_text.docx"
+        path.write_text("This is plain text with a misleading extension.")
+        ocr = FakeOcrProvider()
+        converter = _StubConverter({}, ocr_provider=ocr)
+
+        results = await converter.convert_batch([str(path)])
+
+        assert results == {str(path): "This is plain text with a misleading extension."}
+        assert ocr.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_without_ocr_provider_returns_none(self):
+        converter = _StubConverter({})
+
+        results = await converter.convert_batch(["/nonexistent/a.pdf"])
+
+        assert results == {"/nonexistent/a.pdf": None}
+
+    @pytest.mark.asyncio
+    async def test_ocr_failure_propagates(self):
+        ocr = FakeOcrProvider(should_raise=RuntimeError("ocr down"))
+        converter = _StubConverter({}, ocr_provider=ocr)
+
+        with pytest.raises(RuntimeError, match="ocr down"):
+            await converter.convert_batch(["/nonexistent/a.pdf"])
+
+    @pytest.mark.asyncio
+    async def test_reports_stage_timings_to_sync_logger(self):
+        sync_logger = MagicMock()
+        converter = _StubConverter(
+            {"/x/a.pdf": "# a"}, ocr_provider=FakeOcrProvider(default_markdown="# ocr")
+        )
+
+        await converter.convert_batch(["/x/a.pdf", "/nonexistent/b.pdf"], sync_logger=sync_logger)
+
+        summary = sync_logger.info.call_args_list[-1].args[0]
+        assert "_StubConverter: converted 2 files" in summary
+        assert "text layer 1" in summary
+        assert "OCR 1" in summary
@@ -0,0 +1,113 @@
+"""Unit tests for ExtractionProcessPool and pool routing in converters."""
+
+import os
+import time
+from typing import Optional
+
+import pytest
+
+from airweave.platform.converters.pdf_converter import PdfConverter
+from airweave.platform.converters.process_pool import (
+    ExtractionProcessError,
+    ExtractionProcessPool,
+)
+
+
+# Module-level so they can be pickled into spawned workers.
+def _upper_basename(path: str) -> str:
+    return os.path.basename(path).upper()
+
+
+def _crash(path: str) -> str:
+    os._exit(1)
+
+
+def _sleep(path: str) -> str:
+    time.sleep(5)
+    return path
+
+
+def _raise_value_error(path: str) -> str:
+    raise ValueError(f"bad file {path}")
+
+
+@pytest.fixture
+async def pool():
+    pool = ExtractionProcessPool(max_workers=2, task_timeout_seconds=60, memory_limit_mb=0)
+    yield pool
+    pool.shutdown()
+
+
+class TestExtractionProcessPool:
+    """Tests that spawn real worker processes."""
+
+    @pytest.mark.asyncio
+    async def test_runs_function_and_returns_string(self, pool):
+        await pool.start()
+
+        assert await pool.run(_upper_basename, "/tmp/report.pdf") == "REPORT.PDF"
+
+    @pytest.mark.asyncio
+    async def test_crash_raises_and_pool_recovers(self, pool):
+        with pytest.raises(ExtractionProcessError, match="crashed"):
+            await pool.run(_crash, "/tmp/bad.pdf")
+
+        assert await pool.run(_upper_basename, "/tmp/ok.pdf") == "OK.PDF"
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises(self):
+        pool = ExtractionProcessPool(max_workers=1, task_timeout_seconds=1, memory_limit_mb=0)
+        try:
+            await pool.start()
+            with pytest.raises(ExtractionProcessError, match="exceeded"):
+                await pool.run(_sleep, "/tmp/slow.pdf")
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_extractor_exceptions_propagate(self, pool):
+        with pytest.raises(ValueError, match="bad file"):
+            await pool.run(_raise_value_error, "/tmp/x.pdf")
+
+
+class _RecordingPool:
+    """In-process stand-in that records routed calls."""
+
+    max_workers = 2
+
+    def __init__(self, result: Optional[str] = None, error: Optional[Exception] = None):
+        self.calls: list[tuple[object, str]] = []
+        self._result = result
+        self._error = error
+
+    async def run(self, func, path):
+        self.calls.append((func, path))
+        if self._error:
+            raise self._error
+        return self._result
+
+
+class TestHybridConverterRouting:
+    """convert_batch routes extraction through the pool when configured."""
+
+    @pytest.mark.asyncio
+    async def test_uses_pool_extractor(self):
+        pool = _RecordingPool(result="# extracted")
+        converter = PdfConverter(extraction_pool=pool)
+
+        results = await converter.convert_batch(["/tmp/a.pdf"])
+
+        assert results == {"/tmp/a.pdf": "# extracted"}
+        assert pool.calls == [(PdfConverter._process_extractor, "/tmp/a.pdf")]
+
+    @pytest.mark.asyncio
+    async def test_pool_failure_falls_back_to_ocr_path(self, tmp_path):
+        path = str(tmp_path / "scan.pdf")
+        with open(path, "wb") as f:
+            f.write(b"\x00\x01\x02binary")
+        pool = _RecordingPool(error=ExtractionProcessError("crashed"))
+        converter = PdfConverter(extraction_pool=pool)
+
+        results = await converter.convert_batch([path])
+
+        assert results == {path: None}
@@ -1,26 +1,40 @@
 """Unit tests for VespaClient (with mocked I/O)."""
 
+import json
+from types import SimpleNamespace
+
+import httpx
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID
 
 from airweave.platform.destinations.vespa.client import VespaClient
+from airweave.platform.destinations.vespa.feeder import VespaFeeder
 from airweave.platform.destinations.vespa.types import VespaDocument
 
 
+def _mock_feeder(handler):
+    """Build a VespaFeeder whose HTTP client is served by ``handler``."""
+    return VespaFeeder(
+        base_url="http://vespa:8081",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        max_retries=0,
+    )
+
+
 @pytest.fixture
-def mock_vespa_app():
-    """Create mock Vespa application."""
-    app = MagicMock()
-    app.feed_iterable = MagicMock()
-    app.query = MagicMock()
-    return app
+def mock_query_client():
+    """Create mock VespaQueryClient."""
+    query_client = MagicMock()
+    query_client.query = AsyncMock()
+    query_client.close = AsyncMock()
+    return query_client
 
 
 @pytest.fixture
-def client(mock_vespa_app):
-    """Create VespaClient with mocked app."""
-    return VespaClient(app=mock_vespa_app)
+def client(mock_query_client):
+    """Create VespaClient with mocked query client."""
+    return VespaClient(query_client=mock_query_client)
 
 
 @pytest.fixture
@@ -41,61 +55,111 @@ class TestVespaClient:
     """Test VespaClient I/O operations."""
 
     @pytest.mark.asyncio
-    async def test_connect_creates_vespa_client(self):
-        """Test connect method initializes VespaClient."""
-        # Skip actual Vespa connection (requires real Vespa instance)
-        # Just test that we can create a client with an app
-        mock_app = MagicMock()
-        client = VespaClient(app=mock_app)
+    async def test_connect_uses_container_query_client(self):
+        """Test connect reuses the container's pooled query client."""
+        shared = MagicMock()
+        with patch("airweave.core.container.container", SimpleNamespace(vespa_query_client=shared)):
+            first = await VespaClient.connect()
+            second = await VespaClient.connect()
+
+        assert first._query_client is shared
+        assert second._query_client is shared
+        assert not first._owns_query_client
+
+    @pytest.mark.asyncio
+    async def test_connect_prefers_injected_query_client(self, mock_query_client):
+        """Test an injected query client (the worker's) wins over the container's."""
+        with patch(
+            "airweave.core.container.container", SimpleNamespace(vespa_query_client=MagicMock())
+        ):
+            client = await VespaClient.connect(query_client=mock_query_client)
+
+        assert client._query_client is mock_query_client
+        await client.close()
+        mock_query_client.close.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_connect_without_container_owns_a_dedicated_client(self):
+        """Test a dedicated query client is created and closed without a container."""
+        with patch("airweave.core.container.container", None):
+            client = await VespaClient.connect()
+
+        assert client._owns_query_client
+        with patch.object(client._query_client, "close", AsyncMock()) as close:
+            await client.close()
+        close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_syncs_share_the_injected_feeder(self, mock_query_client, sample_vespa_document):
+        """Test clients fed through the worker's feeder open and close no feeder of their own."""
+        shared = _mock_feeder(lambda request: httpx.Response(200, json={"id": "ok"}))
+        docs_by_schema = {"base_entity": [sample_vespa_document]}
+
+        with patch.object(VespaFeeder, "from_settings") as dedicated:
+            for _ in range(2):  # two syncs, each with its own destination client
+                client = await VespaClient.connect(query_client=mock_query_client, feeder=shared)
+                assert (await client.feed_documents(docs_by_schema)).success_count == 1
+                await client.close()
 
-        assert client.app == mock_app
+        dedicated.assert_not_called()
+        assert not shared._client.is_closed  # left to worker shutdown
+        await shared.close()
 
     @pytest.mark.asyncio
-    async def test_close_clears_app(self, client):
-        """Test close method clears app reference."""
+    async def test_dedicated_feeder_is_closed_with_the_client(
+        self, client, sample_vespa_document
+    ):
+        """Test a feeder the client created is closed on close."""
+        feeder = _mock_feeder(lambda request: httpx.Response(200, json={"id": "ok"}))
+        with patch.object(VespaFeeder, "from_settings", return_value=feeder):
+            await client.feed_documents({"base_entity": [sample_vespa_document]})
+
+        with patch.object(feeder, "close", AsyncMock()) as close:
+            await client.close()
+
+        close.assert_awaited_once()
+        assert client._feeder is None
+
+    @pytest.mark.asyncio
+    async def test_close_keeps_shared_query_client_open(self, client, mock_query_client):
+        """Test close leaves the shared query client to process shutdown."""
         await client.close()
-        assert client.app is None
+        mock_query_client.close.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_feed_documents_calls_feed_iterable(self, client, mock_vespa_app, sample_vespa_document):
-        """Test feed_documents uses feed_iterable."""
+    async def test_feed_documents_puts_each_document(self, client, sample_vespa_document):
+        """Test feed_documents PUTs documents to /document/v1 via the feeder."""
         docs_by_schema = {"base_entity": [sample_vespa_document]}
+        requests = []
 
-        # Mock feed_iterable to simulate successful feeding
-        def mock_feed_iterable(iter, schema, namespace, callback, **kwargs):
-            for doc in iter:
-                # Simulate successful response
-                response = MagicMock()
-                response.is_successful = MagicMock(return_value=True)
-                callback(response, doc["id"])
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"id": "ok"})
 
-        mock_vespa_app.feed_iterable = mock_feed_iterable
+        client._feeder = _mock_feeder(handler)
 
         result = await client.feed_documents(docs_by_schema)
 
         assert result.success_count == 1
         assert len(result.failed_docs) == 0
+        assert requests[0].url.path == "/document/v1/airweave/base_entity/docid/test_entity_123"
+        assert json.loads(requests[0].content) == {"fields": sample_vespa_document.fields}
 
     @pytest.mark.asyncio
-    async def test_feed_documents_tracks_failures(self, client, mock_vespa_app, sample_vespa_document):
+    async def test_feed_documents_tracks_failures(self, client, sample_vespa_document):
         """Test feed_documents tracks failed documents."""
         docs_by_schema = {"base_entity": [sample_vespa_document]}
 
-        def mock_feed_iterable(iter, schema, namespace, callback, **kwargs):
-            for doc in iter:
-                response = MagicMock()
-                response.is_successful = MagicMock(return_value=False)
-                response.status_code = 500
-                response.json = {"error": "Internal error"}
-                callback(response, doc["id"])
+        def handler(request):
+            return httpx.Response(400, json={"message": "Bad field"})
 
-        mock_vespa_app.feed_iterable = mock_feed_iterable
+        client._feeder = _mock_feeder(handler)
 
         result = await client.feed_documents(docs_by_schema)
 
         assert result.success_count == 0
         assert len(result.failed_docs) == 1
-        assert result.failed_docs[0][1] == 500  # status_code
+        assert result.failed_docs[0][1] == 400  # status_code
 
     @pytest.mark.asyncio
     async def test_feed_documents_empty_schema(self, client):
@@ -105,6 +169,18 @@ class TestVespaClient:
         assert result.success_count == 0
         assert len(result.failed_docs) == 0
 
+    @pytest.mark.asyncio
+    async def test_close_closes_feeder(self, client):
+        """Test close releases the feeder's HTTP client."""
+        feeder = MagicMock()
+        feeder.close = AsyncMock()
+        client._feeder = feeder
+
+        await client.close()
+
+        feeder.close.assert_awaited_once()
+        assert client._feeder is None
+
     @pytest.mark.asyncio
     async def test_delete_by_selection_builds_url_correctly(self, client):
         """Test delete by selection builds correct URL."""
@@ -173,7 +249,7 @@ class TestVespaClient:
             mock_d.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_execute_query_success(self, client, mock_vespa_app):
+    async def test_execute_query_success(self, client, mock_query_client):
         """Test query execution with successful response."""
         query_params = {"yql": "select * from base_entity", "hits": 10}
 
@@ -191,17 +267,17 @@ class TestVespaClient:
             }
         }
 
-        with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_to_thread:
-            mock_to_thread.return_value = mock_response
+        mock_query_client.query.return_value = mock_response
 
-            result = await client.execute_query(query_params)
+        result = await client.execute_query(query_params)
 
-            assert len(result.hits) == 2
-            assert result.total_count == 2
-            assert result.coverage_percent == 100.0
+        assert len(result.hits) == 2
+        assert result.total_count == 2
+        assert result.coverage_percent == 100.0
+        mock_query_client.query.assert_awaited_once_with(query_params, caller="search")
 
     @pytest.mark.asyncio
-    async def test_execute_query_error(self, client):
+    async def test_execute_query_error(self, client, mock_query_client):
         """Test query execution with error response."""
         query_params = {"yql": "invalid query"}
 
@@ -209,13 +285,12 @@ class TestVespaClient:
         mock_response.is_successful = MagicMock(return_value=False)
         mock_response.json = {"error": "Invalid YQL"}
 
-        with patch('asyncio.to_thread', new_callable=AsyncMock) as mock_to_thread:
-            mock_to_thread.return_value = mock_response
+        mock_query_client.query.return_value = mock_response
 
-            with pytest.raises(RuntimeError) as exc_info:
-                await client.execute_query(query_params)
+        with pytest.raises(RuntimeError) as exc_info:
+            await client.execute_query(query_params)
 
-            assert "Vespa search error" in str(exc_info.value)
+        assert "Vespa search error" in str(exc_info.value)
 
     def test_convert_hits_to_results(self, client):
         """Test converting Vespa hits to AirweaveSearchResult."""
@@ -25,10 +25,10 @@ COLLECTION_ID = UUID("22222222-2222-2222-2222-222222222222")
 
 @pytest.fixture
 def client():
-    """VespaClient with mocked pyvespa app."""
-    app = MagicMock()
-    app.query = MagicMock()
-    return VespaClient(app=app)
+    """VespaClient with a mocked query client."""
+    query_client = MagicMock()
+    query_client.query = AsyncMock()
+    return VespaClient(query_client=query_client)
 
 
 # ---------------------------------------------------------------------------
@@ -115,11 +115,9 @@ class TestQueryDocIdsByOriginalEntityIds:
             {"id": "id:airweave:base_entity::base_entity_def__chunk_0"},
         ]
         mock_response.json = {"root": {"fields": {"totalCount": 3}}}
-        client.app.query = MagicMock(return_value=mock_response)
 
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_thread.return_value = mock_response
-            result = await client._query_doc_ids_by_original_entity_ids(["abc", "def"], COLLECTION_ID)
+        client._query_client.query.return_value = mock_response
+        result = await client._query_doc_ids_by_original_entity_ids(["abc", "def"], COLLECTION_ID)
 
         assert len(result) == 3
         assert result[0] == ("file_entity", "file_entity_abc__chunk_0")
@@ -133,11 +131,9 @@ class TestQueryDocIdsByOriginalEntityIds:
         mock_response.is_successful.return_value = True
         mock_response.hits = []
         mock_response.json = {"root": {"fields": {"totalCount": 0}}}
-        client.app.query = MagicMock(return_value=mock_response)
 
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_thread.return_value = mock_response
-            result = await client._query_doc_ids_by_original_entity_ids(["nonexistent"], COLLECTION_ID)
+        client._query_client.query.return_value = mock_response
+        result = await client._query_doc_ids_by_original_entity_ids(["nonexistent"], COLLECTION_ID)
 
         assert result == []
 
@@ -148,10 +144,9 @@ class TestQueryDocIdsByOriginalEntityIds:
         mock_response.is_successful.return_value = False
         mock_response.json = {"root": {"errors": [{"message": "bad query"}]}}
 
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_thread.return_value = mock_response
-            with pytest.raises(RuntimeError, match="Doc ID query failed"):
-                await client._query_doc_ids_by_original_entity_ids(["x"], COLLECTION_ID)
+        client._query_client.query.return_value = mock_response
+        with pytest.raises(RuntimeError, match="Doc ID query failed"):
+            await client._query_doc_ids_by_original_entity_ids(["x"], COLLECTION_ID)
 
     @pytest.mark.asyncio
     async def test_escapes_single_quotes_in_ids(self, client):
@@ -161,12 +156,10 @@ class TestQueryDocIdsByOriginalEntityIds:
         mock_response.hits = []
         mock_response.json = {"root": {"fields": {"totalCount": 0}}}
 
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_thread.return_value = mock_response
-            await client._query_doc_ids_by_original_entity_ids(["it's", "normal"], COLLECTION_ID)
+        client._query_client.query.return_value = mock_response
+        await client._query_doc_ids_by_original_entity_ids(["it's", "normal"], COLLECTION_ID)
 
-        call_kwargs = mock_thread.call_args
-        body = call_kwargs.kwargs.get("body") or call_kwargs.args[1]
+        body = client._query_client.query.call_args.args[0]
         yql_sent = body["yql"]
         assert r"it\'s" in yql_sent
         assert "'normal'" in yql_sent
@@ -179,10 +172,9 @@ class TestQueryDocIdsByOriginalEntityIds:
         mock_response.hits = [{"id": "id:airweave:base_entity::be_x__chunk_0"}]
         mock_response.json = {"root": {"fields": {"totalCount": 15000}}}
 
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_thread.return_value = mock_response
-            with pytest.raises(RuntimeError, match="exceeds DELETE_QUERY_HITS_LIMIT"):
-                await client._query_doc_ids_by_original_entity_ids(["x"], COLLECTION_ID)
+        client._query_client.query.return_value = mock_response
+        with pytest.raises(RuntimeError, match="exceeds DELETE_QUERY_HITS_LIMIT"):
+            await client._query_doc_ids_by_original_entity_ids(["x"], COLLECTION_ID)
 
     @pytest.mark.asyncio
     async def test_skips_unparseable_ids(self, client):
@@ -196,9 +188,8 @@ class TestQueryDocIdsByOriginalEntityIds:
         ]
         mock_response.json = {"root": {"fields": {"totalCount": 3}}}
 
-        with patch("asyncio.to_thread", new_callable=AsyncMock) as mock_thread:
-            mock_thread.return_value = mock_response
-            result = await client._query_doc_ids_by_original_entity_ids(["ok", "ok2"], COLLECTION_ID)
+        client._query_client.query.return_value = mock_response
+        result = await client._query_doc_ids_by_original_entity_ids(["ok", "ok2"], COLLECTION_ID)
 
         assert len(result) == 2
 
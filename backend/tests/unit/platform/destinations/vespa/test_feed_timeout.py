@@ -1,17 +1,18 @@
 """Unit tests for Vespa feed timeout behavior.
 
-Verifies that feed_documents raises asyncio.TimeoutError when the underlying
-pyvespa feed_iterable takes longer than VESPA_TIMEOUT, preventing silent hangs
+Verifies that feed_documents raises asyncio.TimeoutError when a schema's
+feed stream takes longer than VESPA_TIMEOUT, preventing silent hangs
 that block worker pool semaphore slots indefinitely.
 """
 
 import asyncio
-import time
 
+import httpx
 import pytest
 from unittest.mock import MagicMock, patch
 
 from airweave.platform.destinations.vespa.client import VespaClient
+from airweave.platform.destinations.vespa.feeder import VespaFeeder
 from airweave.platform.destinations.vespa.types import VespaDocument
 
 
@@ -29,20 +30,33 @@ def sample_docs():
     }
 
 
+async def _hanging_handler(request):
+    """Simulate a Vespa container that never answers in time."""
+    await asyncio.sleep(5)
+    return httpx.Response(200, json={})
+
+
+async def _fast_handler(request):
+    return httpx.Response(200, json={})
+
+
+def _client_with_handler(handler, logger=None):
+    client = VespaClient(query_client=MagicMock(), logger=logger)
+    client._feeder = VespaFeeder(
+        base_url="http://vespa:8081",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        logger=logger,
+    )
+    return client
+
+
 class TestFeedTimeout:
     """Test that feed_documents respects VESPA_TIMEOUT."""
 
     @pytest.mark.asyncio
-    async def test_feed_raises_timeout_when_feed_iterable_hangs(self, sample_docs):
-        """When feed_iterable blocks longer than VESPA_TIMEOUT, asyncio.TimeoutError is raised."""
-        mock_app = MagicMock()
-
-        # Simulate a feed_iterable that blocks for 5 seconds (simulating a hang)
-        def slow_feed_iterable(**kwargs):
-            time.sleep(5)
-
-        mock_app.feed_iterable = slow_feed_iterable
-        client = VespaClient(app=mock_app)
+    async def test_feed_raises_timeout_when_vespa_hangs(self, sample_docs):
+        """When a feed stream outlasts VESPA_TIMEOUT, asyncio.TimeoutError is raised."""
+        client = _client_with_handler(_hanging_handler)
 
         # Patch VESPA_TIMEOUT to 0.1s so the test completes quickly
         with patch("airweave.platform.destinations.vespa.client.settings") as mock_settings:
@@ -53,35 +67,21 @@ class TestFeedTimeout:
 
     @pytest.mark.asyncio
     async def test_feed_succeeds_within_timeout(self, sample_docs):
-        """When feed_iterable completes within VESPA_TIMEOUT, no error is raised."""
-        mock_app = MagicMock()
-
-        # Simulate a fast feed
-        def fast_feed_iterable(**kwargs):
-            pass  # Returns immediately
-
-        mock_app.feed_iterable = fast_feed_iterable
-        client = VespaClient(app=mock_app)
+        """When the feed completes within VESPA_TIMEOUT, no error is raised."""
+        client = _client_with_handler(_fast_handler)
 
         with patch("airweave.platform.destinations.vespa.client.settings") as mock_settings:
             mock_settings.VESPA_TIMEOUT = 5.0
 
             result = await client.feed_documents(sample_docs)
-            assert result.success_count == 0  # No callback was invoked
+            assert result.success_count == 1
             assert result.failed_docs == []
 
     @pytest.mark.asyncio
     async def test_feed_timeout_logs_error(self, sample_docs):
         """When timeout fires, an error is logged with schema name and doc count."""
-        mock_app = MagicMock()
-
-        def slow_feed_iterable(**kwargs):
-            time.sleep(5)
-
-        mock_app.feed_iterable = slow_feed_iterable
-
         mock_logger = MagicMock()
-        client = VespaClient(app=mock_app, logger=mock_logger)
+        client = _client_with_handler(_hanging_handler, logger=mock_logger)
 
         with patch("airweave.platform.destinations.vespa.client.settings") as mock_settings:
             mock_settings.VESPA_TIMEOUT = 0.1
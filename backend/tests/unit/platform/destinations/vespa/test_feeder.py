@@ -0,0 +1,211 @@
+"""Unit tests for the asyncio-native VespaFeeder."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from airweave.adapters.metrics import FakeVespaFeedMetrics
+from airweave.platform.destinations.vespa.feeder import AdaptiveLimiter, VespaFeeder
+from airweave.platform.destinations.vespa.types import VespaDocument
+
+
+def _docs(schema, count):
+    return [VespaDocument(schema=schema, id=f"{schema}-{i}", fields={"n": i}) for i in range(count)]
+
+
+def _feeder(handler, **kwargs):
+    kwargs.setdefault("retry_base_delay", 0)
+    return VespaFeeder(
+        base_url="http://vespa:8081",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        **kwargs,
+    )
+
+
+def _schema_of(request):
+    return request.url.path.split("/")[4]
+
+
+class TestAdaptiveLimiter:
+    """AIMD limit adaptation."""
+
+    @pytest.mark.asyncio
+    async def test_success_grows_and_throttle_halves(self):
+        limiter = AdaptiveLimiter(initial=8, minimum=2, maximum=16)
+
+        # Roughly +1 per limit's worth of successes
+        for _ in range(9):
+            await limiter.acquire()
+            await limiter.release(throttled=False)
+        assert limiter.limit == 9
+
+        await limiter.acquire()
+        await limiter.release(throttled=True)
+        assert limiter.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_burst_of_throttles_halves_once(self):
+        limiter = AdaptiveLimiter(initial=16, minimum=2, maximum=16)
+
+        for _ in range(4):
+            await limiter.acquire()
+        for _ in range(4):
+            await limiter.release(throttled=True)
+
+        assert limiter.limit == 8
+
+    @pytest.mark.asyncio
+    async def test_limit_respects_floor(self):
+        limiter = AdaptiveLimiter(initial=3, minimum=2, maximum=16)
+        limiter.DECREASE_COOLDOWN_SECONDS = 0
+
+        for _ in range(3):
+            await limiter.acquire()
+            await limiter.release(throttled=True)
+
+        assert limiter.limit == 2
+
+
+class TestVespaFeeder:
+    """Concurrent feeding, retries and metrics."""
+
+    @pytest.mark.asyncio
+    async def test_schemas_are_fed_concurrently(self):
+        in_flight = {"base_entity": 0, "file_entity": 0}
+        overlap = []
+
+        async def handler(request):
+            schema = _schema_of(request)
+            in_flight[schema] += 1
+            overlap.append(all(in_flight.values()))
+            await asyncio.sleep(0.01)
+            in_flight[schema] -= 1
+            return httpx.Response(200, json={})
+
+        feeder = _feeder(handler)
+
+        result = await feeder.feed(
+            {"base_entity": _docs("base_entity", 5), "file_entity": _docs("file_entity", 5)}
+        )
+
+        assert result.success_count == 10
+        assert any(overlap)
+
+    @pytest.mark.asyncio
+    async def test_in_flight_requests_stay_under_limit(self):
+        state = {"current": 0, "peak": 0}
+
+        async def handler(request):
+            state["current"] += 1
+            state["peak"] = max(state["peak"], state["current"])
+            await asyncio.sleep(0.005)
+            state["current"] -= 1
+            return httpx.Response(200, json={})
+
+        feeder = _feeder(handler, initial_in_flight=3, min_in_flight=1, max_in_flight=3)
+
+        result = await feeder.feed({"base_entity": _docs("base_entity", 20)})
+
+        assert result.success_count == 20
+        assert state["peak"] == 3
+
+    @pytest.mark.asyncio
+    async def test_throttled_document_is_retried_and_limit_shrinks(self):
+        attempts = {}
+
+        def handler(request):
+            doc = request.url.path.rsplit("/", 1)[-1]
+            attempts[doc] = attempts.get(doc, 0) + 1
+            if doc == "base_entity-0" and attempts[doc] < 3:
+                return httpx.Response(429, json={"message": "busy"})
+            return httpx.Response(200, json={})
+
+        metrics = FakeVespaFeedMetrics()
+        feeder = _feeder(handler, initial_in_flight=8, metrics=metrics)
+
+        result = await feeder.feed({"base_entity": _docs("base_entity", 3)})
+
+        assert result.success_count == 3
+        assert result.failed_docs == []
+        assert attempts["base_entity-0"] == 3
+        assert metrics.retries == [("base_entity", "throttled")] * 2
+        assert min(metrics.in_flight_limits) < 8
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(400, json={"message": "bad field"})
+
+        feeder = _feeder(handler)
+
+        result = await feeder.feed({"base_entity": _docs("base_entity", 1)})
+
+        assert len(calls) == 1
+        assert result.failed_docs == [("base_entity-0", 400, {"message": "bad field"})]
+
+    @pytest.mark.asyncio
+    async def test_server_errors_fail_after_max_retries(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(500, text="boom")
+
+        metrics = FakeVespaFeedMetrics()
+        feeder = _feeder(handler, max_retries=2, metrics=metrics)
+
+        result = await feeder.feed({"base_entity": _docs("base_entity", 1)})
+
+        assert len(calls) == 3
+        assert result.failed_docs == [("base_entity-0", 500, "boom")]
+        assert metrics.documents == {("base_entity", "failure"): 1}
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_are_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.ConnectError("connection reset")
+            return httpx.Response(200, json={})
+
+        metrics = FakeVespaFeedMetrics()
+        feeder = _feeder(handler, metrics=metrics)
+
+        result = await feeder.feed({"base_entity": _docs("base_entity", 1)})
+
+        assert result.success_count == 1
+        assert metrics.retries == [("base_entity", "transport")]
+
+    @pytest.mark.asyncio
+    async def test_metrics_record_throughput_and_latency(self):
+        def handler(request):
+            return httpx.Response(200, json={})
+
+        metrics = FakeVespaFeedMetrics()
+        feeder = _feeder(handler, metrics=metrics)
+
+        await feeder.feed(
+            {"base_entity": _docs("base_entity", 4), "web_entity": _docs("web_entity", 1)}
+        )
+
+        assert metrics.documents == {("base_entity", "success"): 4, ("web_entity", "success"): 1}
+        assert len(metrics.requests) == 5
+        assert {status for _, status, _ in metrics.requests} == {"200"}
+
+    @pytest.mark.asyncio
+    async def test_close_leaves_injected_client_open(self):
+        http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda r: httpx.Response(200))
+        )
+        feeder = VespaFeeder(base_url="http://vespa:8081", http_client=http_client)
+
+        await feeder.close()
+
+        assert not http_client.is_closed
+        await http_client.aclose()
@@ -0,0 +1,124 @@
+"""Unit tests for the shared pooled VespaQueryClient."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from airweave.adapters.metrics import FakeVespaQueryMetrics
+from airweave.platform.destinations.vespa.query_client import VespaQueryClient
+
+
+def _query_client(handler, **kwargs):
+    """Build a VespaQueryClient whose HTTP client is served by ``handler``."""
+    return VespaQueryClient(
+        base_url="http://vespa:8081",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        **kwargs,
+    )
+
+
+class TestVespaQueryClient:
+    """Query execution, error surfacing, concurrency bound and metrics."""
+
+    @pytest.mark.asyncio
+    async def test_posts_body_to_search_endpoint(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json={"root": {"fields": {"totalCount": 1}, "children": [{"id": "a"}]}},
+            )
+
+        metrics = FakeVespaQueryMetrics()
+        client = _query_client(handler, metrics=metrics)
+
+        result = await client.query({"yql": "select * from sources * where true"})
+
+        assert requests[0].method == "POST"
+        assert requests[0].url.path == "/search/"
+        assert json.loads(requests[0].content) == {"yql": "select * from sources * where true"}
+        assert result.is_successful()
+        assert result.hits == [{"id": "a"}]
+        assert metrics.queries[0][:2] == ("search", "200")
+        assert metrics.in_flight == [1, 0]
+
+    @pytest.mark.asyncio
+    async def test_error_status_is_returned_not_raised(self):
+        def handler(request):
+            return httpx.Response(400, json={"root": {"errors": [{"message": "bad yql"}]}})
+
+        metrics = FakeVespaQueryMetrics()
+        client = _query_client(handler, metrics=metrics)
+
+        result = await client.query({"yql": "nonsense"}, caller="agentic_search")
+
+        assert not result.is_successful()
+        assert result.hits == []
+        assert result.json["root"]["errors"][0]["message"] == "bad yql"
+        assert metrics.queries[0][:2] == ("agentic_search", "400")
+
+    @pytest.mark.asyncio
+    async def test_transport_error_raises_and_is_recorded(self):
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        metrics = FakeVespaQueryMetrics()
+        client = _query_client(handler, metrics=metrics)
+
+        with pytest.raises(httpx.ConnectError):
+            await client.query({"yql": "select * from sources * where true"})
+
+        assert metrics.queries[0][:2] == ("search", "error")
+        assert client.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_in_flight_queries_are_bounded(self):
+        active = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(200, json={"root": {}})
+
+        client = _query_client(handler, max_in_flight=2)
+
+        await asyncio.gather(*(client.query({"yql": "q"}) for _ in range(6)))
+
+        assert peak == 2
+
+
+class TestEventLoopRebinding:
+    """Loop-bound state is recreated when the client moves to a new loop."""
+
+    def test_bounded_queries_work_on_successive_loops(self):
+        async def handler(request):
+            await asyncio.sleep(0.001)
+            return httpx.Response(200, json={"root": {}})
+
+        client = _query_client(handler, max_in_flight=1)
+
+        async def burst():
+            return await asyncio.gather(*(client.query({"yql": "q"}) for _ in range(3)))
+
+        for _ in range(2):
+            assert all(result.is_successful() for result in asyncio.run(burst()))
+
+    def test_owned_http_client_is_replaced_on_a_new_loop(self):
+        client = VespaQueryClient(base_url="http://vespa:8081")
+
+        async def bound_client():
+            client._bind_loop()
+            return client._get_client()
+
+        first = asyncio.run(bound_client())
+        second = asyncio.run(bound_client())
+
+        assert second is not first
@@ -1,5 +1,6 @@
 """Unit tests for EntityTransformer (with simplified mocking)."""
 
+import numpy as np
 import pytest
 from unittest.mock import MagicMock
 from uuid import UUID
@@ -7,6 +8,7 @@ from datetime import datetime
 
 from airweave.platform.destinations.vespa.transformer import (
     EntityTransformer,
+    _bfloat16_hex,
     _sanitize_for_vespa,
     _validate_text_quality,
 )
@@ -663,3 +665,50 @@ class TestEntityTransformerWithValidation:
         assert isinstance(result, VespaDocument)
         assert result.fields["textual_representation"] == "This is clean text without any corruption."
 
+
+class TestEmbeddingFields:
+    """Dense vectors are fed as bfloat16 hex, sparse vectors in mapped short form."""
+
+    def test_bfloat16_hex_known_values(self):
+        assert _bfloat16_hex(np.array([1.0, -2.0, 0.0], dtype=np.float32)) == "3F80C0000000"
+
+    def test_bfloat16_hex_rounds_to_nearest_even(self):
+        # 1 + 2^-8 sits exactly between two bfloat16 values -> ties to even (1.0)
+        # 1 + 3*2^-8 is also a tie -> rounds up to the even neighbour 1 + 2^-6
+        vector = np.array([1 + 2**-8, 1 + 3 * 2**-8, 1 + 2**-7], dtype=np.float32)
+
+        assert _bfloat16_hex(vector) == "3F803F823F81"
+
+    def test_bfloat16_hex_accepts_lists(self):
+        assert _bfloat16_hex([0.5, 0.25]) == _bfloat16_hex(np.array([0.5, 0.25], np.float32))
+
+    def test_dense_embedding_round_trips_within_bfloat16_precision(self, transformer):
+        rng = np.random.default_rng(0)
+        vector = rng.standard_normal(3072).astype(np.float32)
+        meta = MagicMock()
+        meta.dense_embedding = vector
+        meta.sparse_embedding = None
+        entity = MagicMock(entity_id="e1", airweave_system_metadata=meta)
+        fields = {}
+
+        transformer._add_embedding_fields(fields, entity)
+
+        encoded = fields["dense_embedding"]["values"]
+        assert isinstance(encoded, str) and len(encoded) == 3072 * 4
+        decoded = (
+            np.frombuffer(bytes.fromhex(encoded), dtype=">u2").astype(np.uint32) << 16
+        ).view(np.float32)
+        np.testing.assert_allclose(decoded, vector, rtol=2**-8)
+
+    def test_sparse_embedding_uses_mapped_short_form(self, transformer):
+        meta = MagicMock()
+        meta.dense_embedding = None
+        meta.sparse_embedding = MagicMock(
+            indices=np.array([7, 42]), values=np.array([0.5, 1.25], dtype=np.float32)
+        )
+        entity = MagicMock(entity_id="e1", airweave_system_metadata=meta)
+        fields = {}
+
+        transformer._add_embedding_fields(fields, entity)
+
+        assert fields["sparse_embedding"] == {"cells": {"7": 0.5, "42": 1.25}}
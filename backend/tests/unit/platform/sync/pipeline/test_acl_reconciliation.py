@@ -385,3 +385,46 @@ class TestProcessIncremental:
         # Only the 1 ADD — no reconciliation removals
         assert total == 1
         mock_crud.access_control_membership.get_memberships_by_groups.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Tests: principal cache invalidation
+# ---------------------------------------------------------------------------
+
+
+class TestPrincipalCacheInvalidation:
+    """process() invalidates the org's cached principal resolutions."""
+
+    @pytest.mark.asyncio
+    async def test_invalidates_after_sync(self):
+        pipeline = _make_pipeline()
+        ctx = FakeSyncContext()
+        pipeline._should_do_incremental_sync = MagicMock(return_value=True)
+        pipeline._process_incremental = AsyncMock(return_value=3)
+
+        with patch(
+            "airweave.platform.sync.access_control_pipeline.access_broker"
+        ) as mock_broker:
+            mock_broker.invalidate_organization = AsyncMock()
+
+            total = await pipeline.process(MagicMock(), ctx, FakeRuntime())
+
+        assert total == 3
+        mock_broker.invalidate_organization.assert_awaited_once_with(ctx.organization_id)
+
+    @pytest.mark.asyncio
+    async def test_invalidates_even_when_sync_fails(self):
+        pipeline = _make_pipeline()
+        ctx = FakeSyncContext()
+        pipeline._should_do_incremental_sync = MagicMock(return_value=False)
+        pipeline._process_full = AsyncMock(side_effect=RuntimeError("db down"))
+
+        with patch(
+            "airweave.platform.sync.access_control_pipeline.access_broker"
+        ) as mock_broker:
+            mock_broker.invalidate_organization = AsyncMock()
+
+            with pytest.raises(RuntimeError):
+                await pipeline.process(MagicMock(), ctx, FakeRuntime())
+
+        mock_broker.invalidate_organization.assert_awaited_once_with(ctx.organization_id)
@@ -0,0 +1,114 @@
+"""Unit tests for compact encountered-ID tracking in EntityTracker."""
+
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from airweave.platform.sync.pipeline import encountered_ids
+from airweave.platform.sync.pipeline.encountered_ids import EncounteredIdSet
+from airweave.platform.sync.pipeline.entity_tracker import EntityTracker
+
+
+@pytest.fixture
+def small_buffer():
+    """Flush runs after a few digests so merges and spills happen in small tests."""
+    with patch.object(encountered_ids, "_BUFFER_SIZE", 4):
+        yield
+
+
+def _tracker(spill_threshold: int = 0) -> EntityTracker:
+    return EntityTracker(
+        job_id=uuid4(), sync_id=uuid4(), logger=MagicMock(), spill_threshold=spill_threshold
+    )
+
+
+class TestEncounteredIdSet:
+    """Digest set semantics match a plain set of strings."""
+
+    def test_add_reports_new_and_duplicate(self):
+        ids = EncounteredIdSet()
+        assert ids.add("a") is True
+        assert ids.add("a") is False
+        assert "a" in ids
+        assert "b" not in ids
+        assert len(ids) == 1
+
+    def test_membership_across_merged_runs(self, small_buffer):
+        ids = EncounteredIdSet()
+        added = [f"entity-{i}" for i in range(103)]
+        assert all(ids.add(eid) for eid in added)
+        assert not any(ids.add(eid) for eid in added)
+        assert len(ids) == len(added)
+        assert all(eid in ids for eid in added)
+        assert "entity-103" not in ids
+        # Tiered merging keeps the number of runs logarithmic
+        assert len(ids._runs) <= 6
+        assert not ids.spilled
+
+    def test_spills_to_mmap_above_threshold(self, small_buffer):
+        ids = EncounteredIdSet(spill_threshold=10)
+        added = [f"entity-{i}" for i in range(64)]
+        for eid in added:
+            ids.add(eid)
+
+        assert ids.spilled
+        assert all(eid in ids for eid in added)
+        assert not ids.add("entity-5")
+        assert ids.add("entity-64")
+
+        ids.close()
+        assert len(ids) == 0
+        assert "entity-5" not in ids
+
+
+class TestEntityTrackerEncountered:
+    """Dedup and orphan diffing through the tracker."""
+
+    @pytest.mark.asyncio
+    async def test_dedup_is_per_entity_type(self):
+        tracker = _tracker()
+        assert await tracker.track_entity("DocEntity", "x") is True
+        assert await tracker.track_entity("DocEntity", "x") is False
+        assert await tracker.track_entity("FolderEntity", "x") is True
+        assert tracker.get_encountered_count() == {"DocEntity": 1, "FolderEntity": 1}
+
+    @pytest.mark.asyncio
+    async def test_track_entities_batch_returns_new_only(self):
+        tracker = _tracker()
+        await tracker.track_entity("DocEntity", "a")
+        new = await tracker.track_entities_batch(
+            [("DocEntity", "a"), ("DocEntity", "b"), ("DocEntity", "b"), ("TagEntity", "a")]
+        )
+        assert new == [("DocEntity", "b"), ("TagEntity", "a")]
+
+    @pytest.mark.asyncio
+    async def test_filter_unencountered_streams_orphans(self, small_buffer):
+        tracker = _tracker(spill_threshold=8)
+        for i in range(0, 40, 2):
+            await tracker.track_entity("DocEntity", f"e{i}")
+        await tracker.track_entity("TagEntity", "e1")
+
+        stored = [(f"e{i}", "doc") for i in range(40)]
+        orphans = list(tracker.filter_unencountered(stored, key=lambda k: k[0]))
+
+        assert [k[0] for k in orphans] == [f"e{i}" for i in range(3, 40, 2)]
+        assert list(tracker.filter_unencountered(["e0", "e1", "e3"])) == ["e3"]
+
+    @pytest.mark.asyncio
+    async def test_compat_views_support_membership(self):
+        tracker = _tracker()
+        await tracker.track_entity("DocEntity", "a")
+        await tracker.track_entity("TagEntity", "b")
+
+        flat = tracker.get_all_encountered_ids_flat()
+        assert "a" in flat and "b" in flat and "c" not in flat
+        assert len(flat) == 2
+
+        by_type = tracker.get_encountered_ids()
+        assert "a" in by_type["DocEntity"]
+        assert "b" not in by_type["DocEntity"]
+
+        # The flat view is live
+        await tracker.track_entity("NoteEntity", "c")
+        assert "c" in flat
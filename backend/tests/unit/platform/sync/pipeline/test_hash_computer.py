@@ -0,0 +1,212 @@
+"""Unit tests for HashComputer canonical encoding and versioned digests.
+
+``test_hash_throughput`` benchmarks the hashing path across entity sizes. It is
+deselected by default; run it with ``pytest -m benchmark --junitxml=...`` to
+get the numbers. It only asserts that the new and legacy implementations agree,
+so it never flakes on slow machines.
+"""
+
+import hashlib
+import json
+import time
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, List, Optional
+from uuid import UUID
+
+import pytest
+
+from airweave.platform.entities._airweave_field import AirweaveField
+from airweave.platform.entities._base import AirweaveSystemMetadata, BaseEntity, FileEntity
+from airweave.platform.sync.actions.entity.resolver import _hash_matches
+from airweave.platform.sync.pipeline.hash_computer import HashComputer
+
+VOLATILE = {"airweave_system_metadata", "breadcrumbs", "local_path", "url"}
+
+
+class _Status(Enum):
+    OPEN = "open"
+
+
+class _TicketEntity(BaseEntity):
+    """Entity with nested, non-JSON and unhashable values."""
+
+    ticket_id: str = AirweaveField(..., description="Ticket ID", is_entity_id=True)
+    title: str = AirweaveField(..., description="Ticket title", is_name=True)
+    body: str = AirweaveField("", description="Body")
+    status: _Status = AirweaveField(_Status.OPEN, description="Status")
+    owner: Optional[UUID] = AirweaveField(None, description="Owner")
+    due_at: Optional[datetime] = AirweaveField(None, description="Due date")
+    labels: List[str] = AirweaveField(default_factory=list, description="Labels")
+    extra: dict = AirweaveField(default_factory=dict, description="Nested data")
+    score: float = AirweaveField(0.0, description="Score")
+    view_count: int = AirweaveField(0, description="Views", unhashable=True)
+
+
+class _AttachmentEntity(FileEntity):
+    """File entity for content-hash tests."""
+
+    attachment_id: str = AirweaveField(..., description="Attachment ID", is_entity_id=True)
+    file_name: str = AirweaveField(..., description="File name", is_name=True)
+
+
+def _legacy_stable(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return {k: _legacy_stable(v) for k, v in sorted(obj.items())}
+    if isinstance(obj, (list, tuple)):
+        return [_legacy_stable(x) for x in obj]
+    if isinstance(obj, (str, int, float, bool, type(None))):
+        return obj
+    return str(obj)
+
+
+def _legacy_hash(entity: BaseEntity, content_hash: Optional[str] = None) -> str:
+    """Hash as computed before hashing plans (kept here as the reference)."""
+    entity_dict = entity.model_dump(mode="python", exclude_none=True)
+    if content_hash is not None:
+        entity_dict["_content_hash"] = content_hash
+    excluded = set(VOLATILE)
+    for name, info in entity.__class__.model_fields.items():
+        if isinstance(info.json_schema_extra, dict) and info.json_schema_extra.get("unhashable"):
+            excluded.add(name)
+    content = {k: v for k, v in entity_dict.items() if k not in excluded}
+    json_str = json.dumps(_legacy_stable(content), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(json_str.encode()).hexdigest()
+
+
+def _ticket(**overrides) -> _TicketEntity:
+    fields = {
+        "ticket_id": "T-1",
+        "title": "Printer on fire",
+        "breadcrumbs": [],
+        "body": "It is, in fact, on fire. ünïcode ✓",
+        "owner": UUID("12345678-1234-5678-1234-567812345678"),
+        "due_at": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "labels": ["hardware", "urgent"],
+        "extra": {"b": [1, 2.5, None, {"z": True, "a": (1, 2)}], "a": frozenset({3})},
+        "score": float("nan"),
+        "view_count": 42,
+    }
+    fields.update(overrides)
+    return _TicketEntity(**fields)
+
+
+class TestLegacyCompatibility:
+    @pytest.mark.asyncio
+    async def test_sha256_matches_legacy_hash(self):
+        entity = _ticket()
+        assert await HashComputer(algorithm="sha256").compute_for_entity(entity) == _legacy_hash(
+            entity
+        )
+
+    @pytest.mark.asyncio
+    async def test_file_entity_matches_legacy_hash(self, tmp_path):
+        path = tmp_path / "report.pdf"
+        path.write_bytes(b"%PDF-1.7 content")
+        entity = _AttachmentEntity(
+            attachment_id="A-1",
+            file_name="report.pdf",
+            breadcrumbs=[],
+            url="https://example.com/report.pdf?token=secret",
+            size=16,
+            file_type="pdf",
+            local_path=str(path),
+        )
+        content_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+
+        assert await HashComputer(algorithm="sha256").compute_for_entity(entity) == _legacy_hash(
+            entity, content_hash
+        )
+
+    @pytest.mark.asyncio
+    async def test_volatile_and_unhashable_fields_are_ignored(self):
+        computer = HashComputer(algorithm="sha256")
+        first = _ticket(view_count=1)
+        second = _ticket(view_count=2)
+        second.airweave_system_metadata = AirweaveSystemMetadata(source_name="other")
+
+        assert await computer.compute_for_entity(first) == await computer.compute_for_entity(second)
+        assert await computer.compute_for_entity(first) != await computer.compute_for_entity(
+            _ticket(body="changed")
+        )
+
+
+class TestVersionedHashes:
+    @pytest.mark.asyncio
+    async def test_blake2b_hash_is_prefixed(self):
+        entity_hash = await HashComputer(algorithm="blake2b").compute_for_entity(_ticket())
+
+        algorithm, _, digest = entity_hash.partition(":")
+        assert algorithm == "blake2b"
+        assert len(digest) == 64
+
+    def test_unknown_algorithm_is_rejected(self):
+        with pytest.raises(ValueError, match="md5"):
+            HashComputer(algorithm="md5")
+
+    @pytest.mark.asyncio
+    async def test_legacy_rows_still_match_after_switch(self):
+        entity = _ticket()
+        stored = _legacy_hash(entity)
+        metadata = AirweaveSystemMetadata()
+        metadata.hash, metadata.legacy_hash = await HashComputer(
+            algorithm="blake2b", legacy_fallback=True
+        )._compute_hashes(entity)
+
+        assert metadata.hash != stored
+        assert _hash_matches(metadata, stored)
+        assert not _hash_matches(metadata, "0" * 64)
+
+    @pytest.mark.asyncio
+    async def test_no_legacy_hash_without_fallback(self):
+        _, legacy_hash = await HashComputer(
+            algorithm="blake2b", legacy_fallback=False
+        )._compute_hashes(_ticket())
+
+        assert legacy_hash is None
+
+
+# (label, body characters, nested items, iterations)
+SIZES = [
+    ("small", 200, 5, 500),
+    ("medium", 10_000, 100, 50),
+    ("large", 200_000, 2_000, 5),
+]
+
+
+def _entity(body_chars: int, items: int):
+    return _ticket(
+        body="x" * body_chars,
+        labels=[f"label-{i}" for i in range(items)],
+        extra={f"key-{i}": {"value": i, "tags": ["a", "b"], "ratio": i / 3} for i in range(items)},
+    )
+
+
+def _throughput(fn, entity, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(entity)
+    return iterations / (time.perf_counter() - start)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("label,body_chars,items,iterations", SIZES, ids=[s[0] for s in SIZES])
+@pytest.mark.asyncio
+async def test_hash_throughput(label, body_chars, items, iterations, record_property):
+    entity = _entity(body_chars, items)
+    results = {}
+    for algorithm in ("sha256", "blake2b"):
+        computer = HashComputer(algorithm=algorithm, legacy_fallback=False)
+        plan = computer._get_plan(type(entity))
+        results[algorithm] = _throughput(
+            lambda e, c=computer, p=plan: c._digest(c._canonical_bytes(e, p, None)),
+            entity,
+            iterations,
+        )
+    results["legacy"] = _throughput(_legacy_hash, entity, iterations)
+
+    sha256 = HashComputer(algorithm="sha256")
+    assert await sha256.compute_for_entity(entity) == _legacy_hash(entity)
+
+    for name, entities_per_second in results.items():
+        record_property(f"{name}_entities_per_s", round(entities_per_second))
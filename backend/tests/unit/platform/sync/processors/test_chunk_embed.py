@@ -1,12 +1,34 @@
 """Unit tests for ChunkEmbedProcessor (simplified with mocks)."""
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 
+from airweave.platform.entities._airweave_field import AirweaveField
+from airweave.platform.entities._base import (
+    AccessControl,
+    AirweaveSystemMetadata,
+    BaseEntity,
+    Breadcrumb,
+)
+from airweave.platform.entities._serialization import (
+    canonical_entity_json,
+    entity_payload_json,
+)
 from airweave.platform.sync.processors.chunk_embed import ChunkEmbedProcessor
 
 
+class _DocEntity(BaseEntity):
+    """Minimal entity with a large field, for chunk multiplication tests."""
+
+    doc_id: str = AirweaveField(..., description="Doc ID", is_entity_id=True)
+    title: str = AirweaveField(..., description="Doc title", is_name=True)
+    body: str = AirweaveField("", description="Large body")
+    tags: dict = AirweaveField(default_factory=dict, description="Nested extra data")
+
+
 @pytest.fixture
 def processor():
     """Create ChunkEmbedProcessor instance."""
@@ -168,6 +190,60 @@ class TestChunkEmbedProcessor:
         # Should only have 2 chunks (empty ones filtered)
         assert len(result) == 2
 
+    def test_multiply_entities_shares_parent_fields(self, processor, mock_sync_context):
+        """Chunks share parent field values but own their per-chunk fields."""
+        parent = _DocEntity(
+            doc_id="doc-1",
+            title="Doc",
+            body="x" * 100_000,
+            entity_id="doc-1",
+            breadcrumbs=[Breadcrumb(entity_id="f", name="Folder", entity_type="Folder")],
+            access=AccessControl(viewers=["user:a"]),
+            airweave_system_metadata=AirweaveSystemMetadata(hash="h"),
+        )
+
+        chunks = processor._multiply_entities(
+            [parent], [[{"text": "first"}, {"text": "second"}]], mock_sync_context
+        )
+
+        first, second = chunks
+        assert isinstance(first, _DocEntity)
+        assert first.body is parent.body
+        assert first.breadcrumbs is parent.breadcrumbs
+        assert first.access is parent.access
+        assert (first.entity_id, first.textual_representation) == ("doc-1__chunk_0", "first")
+        assert (second.entity_id, second.textual_representation) == ("doc-1__chunk_1", "second")
+        assert first.airweave_system_metadata is not second.airweave_system_metadata
+        assert first.airweave_system_metadata.chunk_index == 0
+        assert second.airweave_system_metadata.chunk_index == 1
+        assert second.airweave_system_metadata.hash == "h"
+        assert parent.entity_id == "doc-1"
+        assert parent.airweave_system_metadata.chunk_index is None
+        assert first.model_dump(mode="json")["body"] == parent.body
+
+    def test_chunk_serialization_matches_direct_dump(self, processor, mock_sync_context):
+        """Memoized chunk JSON is byte-identical to dumping each chunk directly."""
+        parent = _DocEntity(
+            doc_id="doc-1",
+            title="Rapport über Ölpreise",
+            body="long body " * 1000,
+            tags={"z": [1, 2.5, None], "a": {"nested": "✓"}},
+            entity_id="doc-1",
+            breadcrumbs=[],
+            access=AccessControl(viewers=["user:a"]),
+            airweave_system_metadata=AirweaveSystemMetadata(hash="h"),
+        )
+        chunks = processor._multiply_entities(
+            [parent], [[{"text": "first"}, {"text": "second \"quoted\""}]], mock_sync_context
+        )
+        schema_fields = set(BaseEntity.model_fields) | {"doc_id", "title"}
+
+        for chunk in chunks:
+            direct = chunk.model_dump(mode="json", exclude={"airweave_system_metadata"})
+            assert canonical_entity_json(chunk) == json.dumps(direct, sort_keys=True)
+            expected_payload = {k: v for k, v in direct.items() if k not in schema_fields}
+            assert entity_payload_json(chunk, schema_fields) == json.dumps(expected_payload)
+
     @pytest.mark.asyncio
     async def test_embed_entities_calls_both_embedders(
         self, processor, mock_runtime
@@ -216,8 +292,11 @@ class TestChunkEmbedProcessor:
 
         await processor._embed_entities(chunk_entities, mock_runtime)
 
-        # Check embeddings assigned
-        assert mock_entity.airweave_system_metadata.dense_embedding == dense_vector
+        # Check embeddings assigned (dense packed as a float32 array)
+        assigned = mock_entity.airweave_system_metadata.dense_embedding
+        assert isinstance(assigned, np.ndarray)
+        assert assigned.dtype == np.float32
+        np.testing.assert_array_equal(assigned, np.asarray(dense_vector, dtype=np.float32))
         assert mock_entity.airweave_system_metadata.sparse_embedding == sparse_embedding
 
     @pytest.mark.asyncio
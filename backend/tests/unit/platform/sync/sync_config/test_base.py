@@ -82,6 +82,7 @@ class TestBehaviorConfig:
         config = BehaviorConfig()
         assert config.skip_hash_comparison is False
         assert config.replay_from_arf is False
+        assert config.preload_hash_snapshot is False
 
     def test_with_custom_values(self):
         """Test behavior config with custom values."""
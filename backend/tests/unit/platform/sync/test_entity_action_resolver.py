@@ -0,0 +1,131 @@
+"""Unit tests for EntityActionResolver lookups and the hash snapshot mode."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from airweave import crud
+from airweave.crud.crud_entity import EntityIdHash
+from airweave.platform.entities._base import AirweaveSystemMetadata
+from airweave.platform.sync.actions.entity.resolver import EntityActionResolver
+
+_RESOLVER_MODULE = "airweave.platform.sync.actions.entity.resolver"
+
+
+class _Doc:
+    """Minimal entity stand-in: resolver only reads id, class and hash."""
+
+    def __init__(self, entity_id: str, entity_hash: str):
+        self.entity_id = entity_id
+        self.airweave_system_metadata = AirweaveSystemMetadata(hash=entity_hash)
+
+
+@asynccontextmanager
+async def _fake_db_context():
+    yield MagicMock()
+
+
+def _make_context():
+    return SimpleNamespace(
+        sync=SimpleNamespace(id=uuid4()), logger=MagicMock(), execution_config=None
+    )
+
+
+@pytest.fixture
+def stored():
+    return {
+        ("a", "doc"): EntityIdHash(uuid4(), "h-a"),
+        ("b", "doc"): EntityIdHash(uuid4(), "h-b"),
+    }
+
+
+@pytest.fixture
+def db_mocks(stored):
+    async def lookup(db, *, sync_id, entity_requests):
+        return {key: stored[key] for key in entity_requests if key in stored}
+
+    snapshot = AsyncMock(side_effect=lambda db, sync_id: dict(stored))
+    lookup_mock = AsyncMock(side_effect=lookup)
+    with (
+        patch.object(crud.entity, "get_id_hash_map_by_sync_id", new=snapshot),
+        patch.object(
+            crud.entity, "bulk_get_id_hash_by_entity_sync_and_definition", new=lookup_mock
+        ),
+        patch(f"{_RESOLVER_MODULE}.get_db_context", new=_fake_db_context),
+    ):
+        yield SimpleNamespace(snapshot=snapshot, lookup=lookup_mock)
+
+
+class TestResolveWithoutSnapshot:
+    """Default mode looks every key up in the database."""
+
+    @pytest.mark.asyncio
+    async def test_resolves_insert_update_keep(self, db_mocks, stored):
+        resolver = EntityActionResolver(entity_map={_Doc: "doc"})
+        entities = [_Doc("a", "h-a"), _Doc("b", "changed"), _Doc("c", "h-c")]
+
+        batch = await resolver.resolve(entities, _make_context())
+
+        assert [a.entity_id for a in batch.keeps] == ["a"]
+        assert [(a.entity_id, a.db_id) for a in batch.updates] == [("b", stored[("b", "doc")].id)]
+        assert [a.entity_id for a in batch.inserts] == ["c"]
+        db_mocks.snapshot.assert_not_called()
+        db_mocks.lookup.assert_awaited_once()
+
+
+class TestResolveWithSnapshot:
+    """Snapshot mode serves unchanged entities without per-batch queries."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_batch_needs_no_lookup(self, db_mocks):
+        resolver = EntityActionResolver(entity_map={_Doc: "doc"}, use_hash_snapshot=True)
+        context = _make_context()
+
+        first = await resolver.resolve([_Doc("a", "h-a")], context)
+        second = await resolver.resolve([_Doc("b", "h-b")], context)
+
+        assert [a.entity_id for a in first.keeps] == ["a"]
+        assert [a.entity_id for a in second.keeps] == ["b"]
+        db_mocks.snapshot.assert_awaited_once()
+        db_mocks.lookup.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_only_changed_and_new_keys_hit_the_database(self, db_mocks, stored):
+        resolver = EntityActionResolver(entity_map={_Doc: "doc"}, use_hash_snapshot=True)
+        entities = [_Doc("a", "h-a"), _Doc("b", "changed"), _Doc("c", "h-c")]
+
+        batch = await resolver.resolve(entities, _make_context())
+
+        assert [a.entity_id for a in batch.keeps] == ["a"]
+        assert [(a.entity_id, a.db_id) for a in batch.updates] == [("b", stored[("b", "doc")].id)]
+        assert [a.entity_id for a in batch.inserts] == ["c"]
+        requested = db_mocks.lookup.call_args.kwargs["entity_requests"]
+        assert requested == [("b", "doc"), ("c", "doc")]
+
+    @pytest.mark.asyncio
+    async def test_mutated_keys_are_dropped_from_snapshot(self, db_mocks):
+        resolver = EntityActionResolver(entity_map={_Doc: "doc"}, use_hash_snapshot=True)
+        context = _make_context()
+
+        await resolver.resolve([_Doc("a", "new-hash")], context)
+        db_mocks.lookup.reset_mock()
+        # Same entity seen again with its old hash must be checked against the DB
+        await resolver.resolve([_Doc("a", "h-a")], context)
+
+        db_mocks.lookup.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_batches_load_snapshot_once(self, db_mocks):
+        resolver = EntityActionResolver(entity_map={_Doc: "doc"}, use_hash_snapshot=True)
+        context = _make_context()
+
+        await asyncio.gather(
+            resolver.resolve([_Doc("a", "h-a")], context),
+            resolver.resolve([_Doc("b", "h-b")], context),
+        )
+
+        db_mocks.snapshot.assert_awaited_once()
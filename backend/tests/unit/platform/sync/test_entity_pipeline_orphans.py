@@ -0,0 +1,110 @@
+"""Unit tests for streamed orphan cleanup in EntityPipeline."""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from airweave import crud
+from airweave.platform.sync.entity_pipeline import EntityPipeline
+
+
+@asynccontextmanager
+async def _fake_db_context():
+    yield MagicMock()
+
+
+def _make_pipeline(encountered):
+    tracker = MagicMock()
+    encountered = set(encountered)
+    tracker.filter_unencountered = MagicMock(
+        side_effect=lambda items, key: (i for i in items if key(i) not in encountered)
+    )
+    tracker.record_deletes = AsyncMock()
+    dispatcher = MagicMock()
+    dispatcher.dispatch_orphan_cleanup = AsyncMock()
+    pipeline = EntityPipeline(
+        entity_tracker=tracker,
+        event_bus=MagicMock(),
+        action_resolver=MagicMock(),
+        action_dispatcher=dispatcher,
+    )
+    return pipeline, tracker, dispatcher
+
+
+def _make_context():
+    return SimpleNamespace(sync=SimpleNamespace(id=uuid4()), logger=MagicMock())
+
+
+def _paged_store(keys):
+    """Fake keyset pagination over a sorted list of keys; records requested cursors."""
+    keys = sorted(keys)
+    cursors = []
+
+    async def get_page(db, sync_id, after=None, limit=10_000):
+        cursors.append(after)
+        remaining = [k for k in keys if after is None or k > after]
+        return remaining[:limit]
+
+    return get_page, cursors
+
+
+class TestStreamedOrphanCleanup:
+    """cleanup_orphaned_entities scans keys page by page and dispatches in batches."""
+
+    @pytest.mark.asyncio
+    async def test_dispatches_orphans_in_bounded_batches(self):
+        stored = [(f"e{i:03d}", "doc") for i in range(25)]
+        encountered = {f"e{i:03d}" for i in range(0, 25, 5)}  # 5 kept, 20 orphans
+        pipeline, tracker, dispatcher = _make_pipeline(encountered)
+        pipeline.ORPHAN_SCAN_PAGE_SIZE = 7
+        pipeline.ORPHAN_DISPATCH_BATCH_SIZE = 8
+        get_page, cursors = _paged_store(stored)
+
+        with (
+            patch.object(crud.entity, "get_keys_page_by_sync_id", new=get_page),
+            patch("airweave.db.session.get_db_context", new=_fake_db_context),
+        ):
+            await pipeline.cleanup_orphaned_entities(_make_context(), MagicMock())
+
+        batches = [c.args[0] for c in dispatcher.dispatch_orphan_cleanup.call_args_list]
+        assert [len(b) for b in batches] == [8, 8, 4]
+        dispatched = [entity_id for batch in batches for entity_id in batch]
+        assert sorted(dispatched) == sorted(k[0] for k in stored if k[0] not in encountered)
+        # Keyset cursor advances by the last key of each full page
+        assert cursors == [None, stored[6], stored[13], stored[20]]
+        assert sum(c.args[1] for c in tracker.record_deletes.call_args_list) == 20
+
+    @pytest.mark.asyncio
+    async def test_records_deletes_per_definition(self):
+        stored = [("a", "doc"), ("b", "doc"), ("b", "page"), ("c", "page")]
+        pipeline, tracker, dispatcher = _make_pipeline({"c"})
+        get_page, _ = _paged_store(stored)
+
+        with (
+            patch.object(crud.entity, "get_keys_page_by_sync_id", new=get_page),
+            patch("airweave.db.session.get_db_context", new=_fake_db_context),
+        ):
+            await pipeline.cleanup_orphaned_entities(_make_context(), MagicMock())
+
+        dispatcher.dispatch_orphan_cleanup.assert_awaited_once()
+        assert dispatcher.dispatch_orphan_cleanup.call_args.args[0] == ["a", "b", "b"]
+        recorded = {c.args[0]: c.args[1] for c in tracker.record_deletes.call_args_list}
+        assert recorded == {"doc": 2, "page": 1}
+
+    @pytest.mark.asyncio
+    async def test_no_orphans_dispatches_nothing(self):
+        stored = [("a", "doc"), ("b", "doc")]
+        pipeline, tracker, dispatcher = _make_pipeline({"a", "b"})
+        get_page, _ = _paged_store(stored)
+
+        with (
+            patch.object(crud.entity, "get_keys_page_by_sync_id", new=get_page),
+            patch("airweave.db.session.get_db_context", new=_fake_db_context),
+        ):
+            await pipeline.cleanup_orphaned_entities(_make_context(), MagicMock())
+
+        dispatcher.dispatch_orphan_cleanup.assert_not_called()
+        tracker.record_deletes.assert_not_called()
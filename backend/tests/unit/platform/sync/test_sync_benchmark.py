@@ -0,0 +1,55 @@
+"""Smoke tests for the StubSource sync benchmark harness."""
+
+import pytest
+
+import airweave.core.container  # noqa: F401  (resolves the sources registry import cycle)
+from airweave.platform.converters import initialize_converters
+from scripts.sync_benchmark.harness import BenchmarkOptions, run_scenario
+from scripts.sync_benchmark.metrics import StageHistogram
+from scripts.sync_benchmark.scenarios import SCENARIOS
+
+
+def _options(entity_count: int) -> BenchmarkOptions:
+    return BenchmarkOptions(entity_count=entity_count, chunker="passthrough")
+
+
+class TestSyncBenchmark:
+    """A tiny end-to-end run exercises the real pipeline against the fakes."""
+
+    @pytest.mark.asyncio
+    async def test_single_pass_reports_throughput_and_stages(self):
+        initialize_converters(ocr_provider=None)
+        result = await run_scenario(SCENARIOS["small"], _options(20))
+
+        assert result["actions"]["inserted"] == 20
+        assert result["documents_fed"] == 20
+        assert result["entities_per_sec"] > 0
+        assert result["memory"]["peak_rss_mb"] >= result["memory"]["start_rss_mb"] > 0
+        for stage in ("pipeline.process", "resolver.resolve", "destination.bulk_insert"):
+            assert result["stages"][stage]["count"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_incremental_pass_updates_changed_entities_only(self):
+        initialize_converters(ocr_provider=None)
+        result = await run_scenario(SCENARIOS["incremental"], _options(60))
+
+        assert result["baseline_pass"]["actions"]["inserted"] == 60
+        actions = result["actions"]
+        assert actions["inserted"] == 0
+        assert 0 < actions["updated"] < 60
+        assert actions["updated"] + actions["kept"] == 60
+
+
+def test_histogram_buckets_and_percentiles():
+    histogram = StageHistogram()
+    for duration_ms in (0.5, 3, 3, 40, 20_000):
+        histogram.observe(duration_ms)
+
+    summary = histogram.to_dict()
+    assert summary["count"] == 5
+    assert summary["p50_ms"] == 3
+    assert summary["max_ms"] == 20_000
+    assert summary["buckets"]["le_1"] == 1
+    assert summary["buckets"]["le_5"] == 2
+    assert summary["buckets"]["le_50"] == 1
+    assert summary["buckets"]["le_inf"] == 1
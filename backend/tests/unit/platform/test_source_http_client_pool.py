@@ -0,0 +1,142 @@
+"""Tests for the per-sync pooled source HTTP clients."""
+
+import asyncio
+from uuid import uuid4
+
+import httpx
+import pytest
+
+import airweave.core.container  # noqa: F401  (resolves the sources registry import cycle)
+from airweave.adapters.metrics import FakeHttpClientPoolMetrics
+from airweave.platform.http_client.airweave_client import AirweaveHttpClient
+from airweave.platform.http_client.pool import PooledAsyncClient, SourceHttpClientPool
+from airweave.platform.sources._base import BaseSource
+
+
+class _KeepAliveServer:
+    """Minimal HTTP/1.1 keep-alive server counting accepted TCP connections."""
+
+    def __init__(self):
+        self.connections = 0
+        self._server = None
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *args):
+        self._server.close()
+        await self._server.wait_closed()
+
+    @property
+    def url(self) -> str:
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+class TestClientReuse:
+    def test_same_options_share_one_client(self):
+        pool = SourceHttpClientPool()
+
+        first = pool.client(timeout=30.0, headers={"a": "1"})
+        second = pool.client(headers={"a": "1"}, timeout=30.0)
+
+        assert first is second
+        assert isinstance(first, PooledAsyncClient)
+
+    def test_different_options_share_the_transport(self):
+        pool = SourceHttpClientPool()
+
+        first = pool.client(timeout=30.0)
+        second = pool.client(timeout=5.0)
+
+        assert first is not second
+        assert first._transport is second._transport
+
+    def test_connection_options_get_a_dedicated_client(self):
+        pool = SourceHttpClientPool()
+
+        client = pool.client(verify=False)
+
+        assert not isinstance(client, PooledAsyncClient)
+
+    @pytest.mark.asyncio
+    async def test_context_exit_keeps_the_client_open(self):
+        pool = SourceHttpClientPool()
+        client = pool.client()
+
+        async with client as entered:
+            assert entered is client
+        await client.aclose()
+
+        assert not client.is_closed
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_closed_pool_hands_out_dedicated_clients(self):
+        pool = SourceHttpClientPool()
+        pool.client()
+        await pool.aclose()
+
+        assert pool.closed
+        assert not isinstance(pool.client(), PooledAsyncClient)
+
+
+class TestConnectionReuse:
+    @pytest.mark.asyncio
+    async def test_per_call_clients_reuse_one_connection(self):
+        metrics = FakeHttpClientPoolMetrics()
+        pool = SourceHttpClientPool("test_source", http2=False, metrics=metrics)
+        source = BaseSource()
+        source.set_http_client_pool(pool)
+
+        async with _KeepAliveServer() as server:
+            for _ in range(5):
+                async with source.http_client(timeout=5.0) as client:
+                    response = await client.get(server.url)
+                    assert response.text == "ok"
+            await pool.aclose()
+
+        assert server.connections == 1
+        assert metrics.handshakes == {("test_source", "tcp"): 1}
+        assert metrics.requests == {
+            ("test_source", "http11", "new"): 1,
+            ("test_source", "http11", "reused"): 4,
+        }
+
+    @pytest.mark.asyncio
+    async def test_without_pool_every_call_connects(self):
+        source = BaseSource()
+
+        async with _KeepAliveServer() as server:
+            for _ in range(3):
+                async with source.http_client(timeout=5.0) as client:
+                    await client.get(server.url)
+
+        assert server.connections == 3
+
+
+class TestSsrfHook:
+    def test_hook_installed_once_per_pooled_client(self):
+        pool = SourceHttpClientPool()
+        base = pool.client()
+        for _ in range(3):
+            AirweaveHttpClient(
+                wrapped_client=pool.client(),
+                org_id=uuid4(),
+                source_short_name="test_source",
+            )
+
+        assert len(base.event_hooks["request"]) == 1
+        assert isinstance(pool.client(), httpx.AsyncClient)
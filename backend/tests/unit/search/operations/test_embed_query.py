@@ -0,0 +1,78 @@
+"""Unit tests for EmbedQuery operation."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from airweave.adapters.cache.embedding import InMemoryEmbeddingCache
+from airweave.domains.embedders.fakes.embedder import FakeDenseEmbedder, FakeSparseEmbedder
+from airweave.domains.embedders.query_cache import QueryEmbeddingCache
+from airweave.schemas.search import RetrievalStrategy
+from airweave.search.operations.embed_query import EmbedQuery
+from airweave.search.state import SearchState
+
+
+@pytest.fixture
+def mock_context():
+    """Create mock SearchContext."""
+    context = MagicMock()
+    context.query = "test query"
+    context.emitter = AsyncMock()
+    return context
+
+
+@pytest.fixture
+def mock_api_context():
+    """Create mock ApiContext."""
+    ctx = MagicMock()
+    ctx.logger = MagicMock()
+    return ctx
+
+
+@pytest.fixture
+def query_cache():
+    """Create an in-process query embedding cache."""
+    return QueryEmbeddingCache(
+        dense_cache=InMemoryEmbeddingCache(max_entries=10), sparse_max_entries=10
+    )
+
+
+def _embed_query(query_cache=None):
+    return EmbedQuery(
+        strategy=RetrievalStrategy.HYBRID,
+        dense_embedder=FakeDenseEmbedder(dimensions=4),
+        sparse_embedder=FakeSparseEmbedder(),
+        query_cache=query_cache,
+    )
+
+
+class TestEmbedQuery:
+    """Test EmbedQuery embeds queries and reports cache usage."""
+
+    @pytest.mark.asyncio
+    async def test_without_cache_reports_no_cache_metrics(self, mock_context, mock_api_context):
+        """Test embeddings are generated and no cache metrics are reported."""
+        state = SearchState()
+
+        await _embed_query().execute(mock_context, state, mock_api_context)
+
+        assert len(state.dense_embeddings) == 1
+        assert len(state.sparse_embeddings) == 1
+        assert "cache_hits" not in state.operation_metrics["EmbedQuery"]
+
+    @pytest.mark.asyncio
+    async def test_expanded_queries_reuse_cached_embeddings(
+        self, mock_context, mock_api_context, query_cache
+    ):
+        """Test a repeated query is served from cache and reported in metrics."""
+        await _embed_query(query_cache).execute(mock_context, SearchState(), mock_api_context)
+
+        state = SearchState(expanded_queries=["other query"])
+        await _embed_query(query_cache).execute(mock_context, state, mock_api_context)
+
+        metrics = state.operation_metrics["EmbedQuery"]
+        assert len(state.dense_embeddings) == 2
+        assert len(state.sparse_embeddings) == 2
+        assert metrics["cache_hits"] == 2  # original query, dense + sparse
+        assert metrics["cache_misses"] == 2  # expanded query, dense + sparse
+        assert metrics["cache_hit_rate"] == 0.5
+        assert "cache_saved_ms" in metrics
@@ -1,5 +1,8 @@
 """Unit tests for SearchOrchestrator."""
 
+import asyncio
+import time
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -259,3 +262,108 @@ class TestSearchOrchestrator:
         
         assert "results" in event_names
 
+
+
+def _timed_op(name, depends_on, log, delay=0.02, error=None):
+    """Create a mock operation that records start/end times into ``log``."""
+    op = MagicMock()
+    op.__class__.__name__ = name
+    op.depends_on = MagicMock(return_value=depends_on)
+
+    async def execute(context, state, ctx):
+        log.append((name, "start", time.monotonic()))
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        log.append((name, "end", time.monotonic()))
+
+    op.execute = execute
+    return op
+
+
+class TestSearchOrchestratorConcurrency:
+    """Test dependency-aware concurrent execution of the operation DAG."""
+
+    @pytest.mark.asyncio
+    async def test_independent_operations_run_concurrently(
+        self, orchestrator, mock_context, mock_api_context
+    ):
+        """Operations without mutual dependencies overlap in time."""
+        log = []
+        mock_context.access_control_filter = _timed_op("AccessControlFilter", [], log)
+        mock_context.query_expansion = _timed_op("QueryExpansion", [], log)
+
+        await orchestrator.run(mock_api_context, mock_context)
+
+        starts = [entry for entry in log if entry[1] == "start"]
+        ends = [entry for entry in log if entry[1] == "end"]
+        # Both started before either finished
+        assert max(s[2] for s in starts) < min(e[2] for e in ends)
+
+    @pytest.mark.asyncio
+    async def test_dependents_wait_for_all_dependencies(
+        self, orchestrator, mock_context, mock_api_context
+    ):
+        """An operation starts only after every enabled dependency has finished."""
+        log = []
+        mock_context.query_expansion = _timed_op("QueryExpansion", [], log)
+        mock_context.access_control_filter = _timed_op("AccessControlFilter", [], log, delay=0.05)
+        mock_context.query_interpretation = _timed_op(
+            "QueryInterpretation", ["QueryExpansion"], log
+        )
+        mock_context.user_filter = _timed_op(
+            "UserFilter", ["QueryInterpretation", "AccessControlFilter"], log
+        )
+
+        await orchestrator.run(mock_api_context, mock_context)
+
+        times = {(name, kind): t for name, kind, t in log}
+        assert times[("QueryInterpretation", "start")] >= times[("QueryExpansion", "end")]
+        assert times[("UserFilter", "start")] >= times[("QueryInterpretation", "end")]
+        assert times[("UserFilter", "start")] >= times[("AccessControlFilter", "end")]
+        # Interpretation did not wait for the unrelated, slower ACL lookup
+        assert times[("QueryInterpretation", "start")] < times[("AccessControlFilter", "end")]
+
+    @pytest.mark.asyncio
+    async def test_each_operation_gets_start_end_events_and_duration(
+        self, orchestrator, mock_context, mock_api_context
+    ):
+        """Concurrent operations still emit paired events and record their own duration."""
+        log = []
+        mock_context.access_control_filter = _timed_op("AccessControlFilter", [], log)
+        mock_context.query_expansion = _timed_op("QueryExpansion", [], log, delay=0.05)
+
+        _, state_dict = await orchestrator.run(mock_api_context, mock_context)
+
+        for name in ("AccessControlFilter", "QueryExpansion"):
+            mock_context.emitter.emit.assert_any_call(
+                "operator_start", {"name": name}, op_name=name
+            )
+            mock_context.emitter.emit.assert_any_call("operator_end", {"name": name}, op_name=name)
+        metrics = state_dict["operation_metrics"]
+        assert metrics["QueryExpansion"]["duration_ms"] >= 50
+        # Its own duration, not the wall time of the concurrent batch
+        assert (
+            metrics["AccessControlFilter"]["duration_ms"] < metrics["QueryExpansion"]["duration_ms"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_other_operations(
+        self, orchestrator, mock_context, mock_api_context
+    ):
+        """A failing operation cancels the rest and is the only one reporting an error."""
+        log = []
+        mock_context.access_control_filter = _timed_op(
+            "AccessControlFilter", [], log, delay=0.01, error=RuntimeError("db down")
+        )
+        mock_context.query_expansion = _timed_op("QueryExpansion", [], log, delay=1.0)
+        mock_context.retrieval = _timed_op("Retrieval", ["AccessControlFilter"], log)
+
+        with pytest.raises(RuntimeError, match="db down"):
+            await orchestrator.run(mock_api_context, mock_context)
+
+        error_calls = [c for c in mock_context.emitter.emit.call_args_list if c.args[0] == "error"]
+        assert len(error_calls) == 1
+        assert error_calls[0].args[1]["operation"] == "AccessControlFilter"
+        assert ("QueryExpansion", "end") not in {(n, k) for n, k, _ in log}
+        assert ("Retrieval", "start") not in {(n, k) for n, k, _ in log}
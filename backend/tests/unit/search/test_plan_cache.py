@@ -0,0 +1,192 @@
+"""Unit tests for cached collection search plans."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from airweave.search.factory import SearchFactory
+from airweave.search.plan_cache import CollectionSearchPlan, SearchPlanCache, SearchPlanKey
+
+ORG_ID = uuid4()
+
+
+def _key(collection="col", **overrides):
+    fields = {
+        "collection_readable_id": collection,
+        "organization_id": ORG_ID,
+        "skip_organization_check": False,
+    }
+    fields.update(overrides)
+    return SearchPlanKey(**fields)
+
+
+def _plan():
+    return CollectionSearchPlan(collection_id=uuid4(), organization_id=ORG_ID)
+
+
+class TestSearchPlanCache:
+    """LRU, TTL and invalidation behaviour."""
+
+    def test_get_returns_stored_plan(self):
+        cache = SearchPlanCache(max_entries=10)
+        plan = _plan()
+
+        cache.set(_key(), plan, cache.generation("col"))
+
+        assert cache.get(_key()) is plan
+        assert cache.get(_key(skip_organization_check=True)) is None
+
+    def test_expired_plan_is_a_miss(self):
+        cache = SearchPlanCache(max_entries=10, ttl_seconds=0)
+
+        cache.set(_key(), _plan(), 0)
+
+        assert cache.get(_key()) is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_plan_is_evicted(self):
+        cache = SearchPlanCache(max_entries=2)
+        cache.set(_key("a"), _plan(), 0)
+        cache.set(_key("b"), _plan(), 0)
+        cache.get(_key("a"))
+
+        cache.set(_key("c"), _plan(), 0)
+
+        assert cache.get(_key("a")) is not None
+        assert cache.get(_key("b")) is None
+
+    def test_invalidate_drops_every_plan_of_the_collection(self):
+        cache = SearchPlanCache(max_entries=10)
+        cache.set(_key(), _plan(), 0)
+        cache.set(_key(skip_organization_check=True), _plan(), 0)
+        cache.set(_key("other"), _plan(), 0)
+
+        cache.invalidate("col")
+
+        assert cache.get(_key()) is None
+        assert cache.get(_key(skip_organization_check=True)) is None
+        assert cache.get(_key("other")) is not None
+
+    def test_plan_built_across_an_invalidation_is_not_stored(self):
+        cache = SearchPlanCache(max_entries=10)
+        generation = cache.generation("col")
+
+        cache.invalidate("col")
+        cache.set(_key(), _plan(), generation)
+
+        assert cache.get(_key()) is None
+
+
+class TestSearchFactoryPlan:
+    """SearchFactory resolves collection setup once per plan, handles per request."""
+
+    @pytest.fixture
+    def ctx(self):
+        ctx = MagicMock()
+        ctx.organization.id = ORG_ID
+        return ctx
+
+    @pytest.fixture
+    def setup(self):
+        collection = SimpleNamespace(id=uuid4(), organization_id=ORG_ID, readable_id="col")
+        connections = [
+            SimpleNamespace(id=uuid4(), short_name="stub", connection_id=uuid4()),
+            SimpleNamespace(id=uuid4(), short_name="live", connection_id=uuid4()),
+        ]
+        cache = SearchPlanCache(max_entries=10)
+        container = SimpleNamespace(
+            search_plan_cache=cache,
+            collection_repo=SimpleNamespace(get=AsyncMock(return_value=collection)),
+            source_registry=SimpleNamespace(
+                get=lambda short_name: SimpleNamespace(federated_search=short_name == "live")
+            ),
+            source_lifecycle_service=SimpleNamespace(
+                create=AsyncMock(side_effect=lambda **kwargs: MagicMock())
+            ),
+        )
+        destination = MagicMock(requires_client_embedding=True)
+        with (
+            patch("airweave.search.factory._container_module.container", container),
+            patch(
+                "airweave.search.factory.crud.source_connection.get_for_collection",
+                AsyncMock(return_value=connections),
+            ) as get_for_collection,
+            patch.object(
+                SearchFactory, "_resolve_destination", AsyncMock(return_value=destination)
+            ) as resolve_destination,
+        ):
+            yield SimpleNamespace(
+                collection=collection,
+                cache=cache,
+                container=container,
+                destination=destination,
+                get_for_collection=get_for_collection,
+                resolve_destination=resolve_destination,
+            )
+
+    async def _plan(self, ctx, setup):
+        return await SearchFactory()._get_search_plan(
+            AsyncMock(), setup.collection.id, "col", ctx, skip_organization_check=False
+        )
+
+    @pytest.mark.asyncio
+    async def test_setup_runs_once_for_repeated_searches(self, ctx, setup):
+        first = await self._plan(ctx, setup)
+        second = await self._plan(ctx, setup)
+
+        assert second is first
+        assert first.has_vector_sources and first.has_federated_sources
+        assert [ref.short_name for ref in first.federated_sources] == ["live"]
+        assert first.collection.readable_id == "col"
+        setup.container.collection_repo.get.assert_awaited_once()
+        setup.get_for_collection.assert_awaited_once()
+        setup.resolve_destination.assert_not_awaited()
+        setup.container.source_lifecycle_service.create.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_each_request_gets_its_own_source_handles(self, ctx, setup):
+        plan = await self._plan(ctx, setup)
+        factory = SearchFactory()
+
+        first = await factory.get_federated_sources(
+            AsyncMock(), plan.collection, ctx, source_connections=list(plan.federated_sources)
+        )
+        second = await factory.get_federated_sources(
+            AsyncMock(), plan.collection, ctx, source_connections=list(plan.federated_sources)
+        )
+
+        assert len(first) == len(second) == 1
+        assert first[0] is not second[0]
+        create = setup.container.source_lifecycle_service.create
+        assert [call.kwargs["ctx"] for call in create.await_args_list] == [ctx, ctx]
+
+    @pytest.mark.asyncio
+    async def test_invalidation_forces_rebuild(self, ctx, setup):
+        first = await self._plan(ctx, setup)
+        setup.cache.invalidate("col")
+        second = await self._plan(ctx, setup)
+
+        assert second is not first
+        assert setup.get_for_collection.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_collection_without_sources_is_not_cached(self, ctx, setup):
+        setup.get_for_collection.return_value = []
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="no sources"):
+                await self._plan(ctx, setup)
+
+        assert len(setup.cache) == 0
+        setup.resolve_destination.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_without_cache_every_search_resolves_setup(self, ctx, setup):
+        setup.container.search_plan_cache = None
+
+        await self._plan(ctx, setup)
+        await self._plan(ctx, setup)
+
+        assert setup.get_for_collection.await_count == 2
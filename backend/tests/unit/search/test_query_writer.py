@@ -0,0 +1,184 @@
+"""Unit tests for the background search query writer and the helpers that feed it."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from airweave.adapters.metrics import FakeSearchQueryWriterMetrics
+from airweave.search.helpers import search_helpers
+from airweave.search.query_writer import SearchQueryWriter
+
+
+@asynccontextmanager
+async def _fake_db_context():
+    yield AsyncMock()
+
+
+@pytest.fixture
+def create_many():
+    """Patch the DB session and the multi-row insert used by the writer."""
+    create_many = AsyncMock(side_effect=lambda db, rows: len(rows))
+    with (
+        patch("airweave.db.session.get_db_context", _fake_db_context),
+        patch("airweave.crud.search_query.create_many", create_many),
+    ):
+        yield create_many
+
+
+def _rows(create_many):
+    return [call.kwargs["rows"] for call in create_many.await_args_list]
+
+
+class TestSearchQueryWriter:
+    """Batching, thresholds, overload handling and shutdown."""
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_in_batches(self, create_many):
+        writer = SearchQueryWriter(batch_size=2, flush_interval_seconds=60)
+        for i in range(5):
+            assert writer.submit({"query_text": str(i)})
+
+        await writer.flush()
+
+        assert [len(rows) for rows in _rows(create_many)] == [2, 2, 1]
+        assert writer.queue_depth == 0
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_written_without_waiting_for_interval(self, create_many):
+        writer = SearchQueryWriter(batch_size=2, flush_interval_seconds=60)
+        writer.submit({"query_text": "a"})
+        writer.submit({"query_text": "b"})
+
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert _rows(create_many) == [[{"query_text": "a"}, {"query_text": "b"}]]
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_is_written_after_interval(self, create_many):
+        writer = SearchQueryWriter(batch_size=100, flush_interval_seconds=0.01)
+        writer.submit({"query_text": "a"})
+
+        await asyncio.sleep(0.05)
+
+        assert _rows(create_many) == [[{"query_text": "a"}]]
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_records_dropped_when_queue_is_full(self, create_many):
+        metrics = FakeSearchQueryWriterMetrics()
+        writer = SearchQueryWriter(
+            max_queue_size=2, batch_size=100, flush_interval_seconds=60, metrics=metrics
+        )
+
+        results = [writer.submit({"query_text": str(i)}) for i in range(4)]
+
+        assert results == [True, True, False, False]
+        assert metrics.dropped == {"queue_full": 2}
+        assert metrics.queue_depth == 2
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_write_failure_is_counted_not_raised(self, create_many):
+        create_many.side_effect = RuntimeError("db down")
+        metrics = FakeSearchQueryWriterMetrics()
+        writer = SearchQueryWriter(batch_size=10, flush_interval_seconds=60, metrics=metrics)
+        writer.submit({"query_text": "a"})
+        writer.submit({"query_text": "b"})
+
+        await writer.flush()
+
+        assert metrics.dropped == {"write_failed": 2}
+        assert [(status, rows) for status, rows, _ in metrics.flushes] == [("error", 2)]
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_close_writes_queued_records_and_stops(self, create_many):
+        writer = SearchQueryWriter(batch_size=100, flush_interval_seconds=60)
+        writer.submit({"query_text": "a"})
+        task = writer._flush_task
+
+        await writer.close()
+
+        assert _rows(create_many) == [[{"query_text": "a"}]]
+        assert task.done()
+
+
+class TestRecordSearchQuery:
+    """SearchHelpers builds rows and hands them to the container's writer."""
+
+    @pytest.fixture
+    def ctx(self):
+        ctx = MagicMock()
+        ctx.is_api_key_auth = False
+        ctx.user = SimpleNamespace(id=uuid4(), email="ada@example.com")
+        ctx.has_user_context = True
+        ctx.tracking_email = "ada@example.com"
+        ctx.organization.id = uuid4()
+        return ctx
+
+    @pytest.fixture
+    def query_fields(self):
+        return {
+            "collection_id": str(uuid4()),
+            "query_text": "hello",
+            "query_length": 5,
+            "retrieval_strategy": "hybrid",
+            "limit": 10,
+            "offset": 0,
+            "temporal_relevance": 0.0,
+            "filter": None,
+            "expand_query": False,
+            "interpret_filters": False,
+            "rerank": False,
+            "generate_answer": False,
+        }
+
+    def test_row_is_submitted_to_container_writer(self, ctx, query_fields):
+        writer = MagicMock()
+        owner = uuid4()
+
+        with patch(
+            "airweave.search.helpers._container_module.container",
+            SimpleNamespace(search_query_writer=writer),
+        ):
+            search_helpers.record_search_query(
+                query_fields=query_fields,
+                is_streaming=False,
+                results_count=3,
+                ctx=ctx,
+                duration_ms=12.7,
+                organization_id=owner,
+            )
+
+        row = writer.submit.call_args.args[0]
+        assert row["organization_id"] == owner
+        assert row["user_id"] == ctx.user.id
+        assert row["created_by_email"] == row["modified_by_email"] == "ada@example.com"
+        assert row["duration_ms"] == 12
+        assert row["results_count"] == 3
+        assert str(row["collection_id"]) == query_fields["collection_id"]
+
+    def test_organization_defaults_to_caller(self, ctx, query_fields):
+        row = search_helpers.search_query_row(
+            query_fields, is_streaming=True, results_count=0, ctx=ctx, duration_ms=1.0
+        )
+
+        assert row["organization_id"] == ctx.organization.id
+        assert row["is_streaming"] is True
+
+    def test_no_writer_is_a_noop(self, ctx, query_fields):
+        with patch("airweave.search.helpers._container_module.container", None):
+            search_helpers.record_search_query(
+                query_fields=query_fields,
+                is_streaming=False,
+                results_count=0,
+                ctx=ctx,
+                duration_ms=1.0,
+            )
@@ -0,0 +1,203 @@
+"""Unit tests for search result caching: keys, payloads, replay and the service path."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from airweave.adapters.cache.search_result import InMemorySearchResultCache
+from airweave.adapters.pubsub.fake import FakePubSub
+from airweave.schemas.search import SearchRequest, SearchResponse
+from airweave.search.emitter import EventEmitter
+from airweave.search.result_cache import CachedSearch, build_cache_key
+from airweave.search.service import SearchService
+
+
+def _key(request: SearchRequest, version: int = 0, principals=None, destination="vespa") -> str:
+    return build_cache_key("col", version, request, destination, principals)
+
+
+class TestBuildCacheKey:
+    """Fingerprint normalization and the inputs that must change the key."""
+
+    def test_query_whitespace_is_normalized(self):
+        assert _key(SearchRequest(query="reset  password ")) == _key(
+            SearchRequest(query="reset password")
+        )
+
+    def test_data_version_changes_key(self):
+        request = SearchRequest(query="q")
+
+        assert _key(request, version=1) != _key(request, version=2)
+
+    def test_request_parameters_change_key(self):
+        assert _key(SearchRequest(query="q", limit=10)) != _key(SearchRequest(query="q", limit=20))
+
+    def test_principals_are_order_insensitive_and_scoped(self):
+        request = SearchRequest(query="q")
+
+        assert _key(request, principals={"user:a", "group:x"}) == _key(
+            request, principals=["group:x", "user:a"]
+        )
+        assert _key(request, principals={"user:a"}) != _key(request, principals={"user:b"})
+        assert _key(request, principals=None) != _key(request, principals=set())
+
+    def test_destination_changes_key(self):
+        request = SearchRequest(query="q")
+
+        assert _key(request, destination="vespa") != _key(request, destination=None)
+
+
+class TestCachedSearch:
+    """Payload serialization."""
+
+    def test_roundtrip(self):
+        cached = CachedSearch(
+            response=SearchResponse(results=[{"entity_id": "e1", "score": 0.9}], completion="hi"),
+            search_query={"query_text": "q"},
+            search_config={"limit": 10},
+            events=[{"type": "done", "request_id": "r1"}],
+        )
+
+        restored = CachedSearch.loads(cached.dumps())
+
+        assert restored == cached
+
+    def test_corrupt_payload_is_none(self):
+        assert CachedSearch.loads("{not json") is None
+        assert CachedSearch.loads('{"response": {}}') is None
+
+
+class TestEventReplay:
+    """Recording on one emitter and replaying on another."""
+
+    @pytest.mark.asyncio
+    async def test_replay_rewrites_request_id(self):
+        pubsub = FakePubSub()
+        original = EventEmitter(request_id="r1", stream=True, pubsub=pubsub)
+        original.start_recording()
+        await original.emit("start", {"request_id": "r1", "query": "q"})
+        await original.emit("done", {"request_id": "r1"})
+
+        await EventEmitter(request_id="r2", stream=True, pubsub=pubsub).replay(original.recorded)
+
+        replayed = pubsub.published[("search", "r2")]
+        assert [e["type"] for e in replayed] == ["start", "done"]
+        assert all(e["request_id"] == "r2" for e in replayed)
+        assert replayed[0]["seq"] == 1
+
+    @pytest.mark.asyncio
+    async def test_not_recording_by_default(self):
+        emitter = EventEmitter(request_id="r1", stream=True, pubsub=FakePubSub())
+        await emitter.emit("start")
+
+        assert emitter.recorded is None
+
+
+class TestSearchServiceResultCache:
+    """Hit/miss behavior of SearchService.search with the cache enabled."""
+
+    @pytest.fixture
+    def cache(self):
+        return InMemorySearchResultCache(max_entries=10)
+
+    @pytest.fixture
+    def ctx(self):
+        ctx = MagicMock()
+        ctx.user = None
+        return ctx
+
+    @pytest.fixture
+    def pipeline(self, cache):
+        """Patch everything SearchService.search calls around the cache."""
+        search_context = MagicMock()
+        search_context.query = "q"
+        search_context.retrieval = None
+        search_context.federated_search = None
+        search_context.emitter.recorded = None
+        response = SearchResponse(results=[{"entity_id": "e1"}])
+        helpers = MagicMock()
+        helpers.search_query_fields.return_value = {"query_text": "q"}
+
+        with (
+            patch(
+                "airweave.search.service._container_module.container",
+                SimpleNamespace(search_result_cache=cache),
+            ),
+            patch(
+                "airweave.search.service.crud.collection.get_by_readable_id",
+                AsyncMock(return_value=MagicMock()),
+            ),
+            patch(
+                "airweave.search.service.factory.build", AsyncMock(return_value=search_context)
+            ) as build,
+            patch(
+                "airweave.search.service.orchestrator.run",
+                AsyncMock(return_value=(response, {})),
+            ) as run,
+            patch("airweave.search.service.search_helpers", helpers),
+            patch("airweave.analytics.search_analytics.track_search_completion") as track,
+        ):
+            yield SimpleNamespace(
+                context=search_context, build=build, run=run, helpers=helpers, track=track
+            )
+
+    async def _search(self, ctx, *, query="q", stream=False, pubsub=None, request_id="r1"):
+        return await SearchService().search(
+            request_id=request_id,
+            readable_collection_id="col",
+            search_request=SearchRequest(query=query),
+            stream=stream,
+            db=AsyncMock(),
+            ctx=ctx,
+            pubsub=pubsub or FakePubSub(),
+            dense_embedder=MagicMock(),
+            sparse_embedder=MagicMock(),
+            destination_override="vespa",
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeat_search_is_served_from_cache(self, ctx, pipeline):
+        first = await self._search(ctx)
+        second = await self._search(ctx)
+
+        assert second == first
+        assert pipeline.run.await_count == 1
+        pipeline.helpers.record_search_query.assert_called_once()
+        assert pipeline.track.call_args.kwargs["cache_hit"] is True
+
+    @pytest.mark.asyncio
+    async def test_version_bump_invalidates(self, ctx, pipeline, cache):
+        await self._search(ctx)
+        await cache.bump_data_version("col")
+        await self._search(ctx)
+
+        assert pipeline.run.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_federated_results_are_not_cached(self, ctx, pipeline):
+        pipeline.context.federated_search = MagicMock()
+
+        await self._search(ctx)
+        await self._search(ctx)
+
+        assert pipeline.run.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_streamed_hit_replays_recorded_events(self, ctx, pipeline):
+        pipeline.context.emitter.recorded = [{"type": "done", "seq": 1, "request_id": "r1"}]
+        pubsub = FakePubSub()
+
+        await self._search(ctx, stream=True, pubsub=pubsub, request_id="r1")
+        await self._search(ctx, stream=True, pubsub=pubsub, request_id="r2")
+
+        assert pipeline.run.await_count == 1
+        assert pipeline.build.await_args.kwargs["record_events"] is True
+        assert pubsub.published[("search", "r2")][0]["request_id"] == "r2"
+
+    @pytest.mark.asyncio
+    async def test_non_streamed_entry_does_not_serve_streams(self, ctx, pipeline):
+        await self._search(ctx)
+        await self._search(ctx, stream=True)
+
+        assert pipeline.run.await_count == 2